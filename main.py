@@ -34,12 +34,14 @@ except Exception as e:
     logging.warning(f"Could not log system info: {e}")
 
 # Import all services
+from server.src.event_bus import EventBus
 from server.src.services.settings_service import SettingsService
 from server.src.services.database_service import DatabaseService
 from server.src.services.thumbnail_service import ThumbnailService
 from server.src.services.clipboard_service import ClipboardService
 from server.src.services.ipc_service import IPCService
 from server.src.services.screenshot_service import ScreenshotService
+from server.src.maintenance import MaintenanceScheduler
 
 
 class TFCBMServer:
@@ -53,16 +55,29 @@ class TFCBMServer:
         self.settings_service = SettingsService()
         self.database_service = DatabaseService(settings_service=self.settings_service)
         self.thumbnail_service = ThumbnailService(self.database_service)
-        self.clipboard_service = ClipboardService(self.database_service, self.thumbnail_service)
+        # Ingest publishes item events here; the IPC service pushes them to the UI
+        self.event_bus = EventBus()
+        self.clipboard_service = ClipboardService(
+            self.database_service, self.thumbnail_service, event_bus=self.event_bus
+        )
+        # Database housekeeping runs while no UI request comes in
+        self.maintenance = MaintenanceScheduler(
+            self.database_service.maintenance_tasks(),
+            self.database_service
+        )
         self.ipc_service = IPCService(
             self.database_service,
             self.settings_service,
-            self.clipboard_service
+            self.clipboard_service,
+            maintenance=self.maintenance,
+            event_bus=self.event_bus,
+            thumbnail_service=self.thumbnail_service
         )
         self.screenshot_service = ScreenshotService(
             self.database_service,
             self.thumbnail_service,
-            enabled=False  # Disabled by default
+            enabled=False,  # Disabled by default
+            event_bus=self.event_bus
         )
 
         # Enforce retention on startup (prune items left over from previous session)
@@ -72,6 +87,35 @@ class TFCBMServer:
             if deleted_ids:
                 logging.info(f"Startup retention cleanup: removed {len(deleted_ids)} items (limit: {max_items})")
 
+        # Move payloads stored inline by older versions into the blob store
+        threading.Thread(
+            target=self.database_service.migrate_inline_blobs,
+            name="blob-migration",
+            daemon=True
+        ).start()
+
+        # Precompute previews, lengths and chunks of text rows from older versions
+        threading.Thread(
+            target=self.database_service.backfill_text_columns,
+            name="text-backfill",
+            daemon=True
+        ).start()
+
+        # Compress text, HTML and inline file payloads stored uncompressed
+        threading.Thread(
+            target=self.database_service.recompress_items,
+            name="recompression",
+            daemon=True
+        ).start()
+
+        # Databases from older versions need one full VACUUM before the idle-time
+        # maintenance can return free pages a few at a time
+        threading.Thread(
+            target=self.database_service.enable_incremental_vacuum,
+            name="vacuum-conversion",
+            daemon=True
+        ).start()
+
         logging.info("All services initialized successfully")
 
     async def start_ipc_server(self):
@@ -96,39 +140,6 @@ class TFCBMServer:
         async with server:
             await server.serve_forever()
 
-    def watch_for_new_items(self, loop):
-        """Background thread to watch for new database items and broadcast to IPC clients"""
-        logging.info("Starting database watcher for IPC broadcasts...")
-
-        while True:
-            try:
-                latest_id = self.database_service.get_latest_id()
-
-                if latest_id and latest_id > self.ipc_service.last_known_id:
-                    # New items detected
-                    logging.info(f"📢 Broadcasting new items {self.ipc_service.last_known_id + 1} to {latest_id}")
-                    for item_id in range(self.ipc_service.last_known_id + 1, latest_id + 1):
-                        item = self.database_service.get_item(item_id)
-                        if item:
-                            ui_item = self.ipc_service.prepare_item_for_ui(item)
-
-                            # Broadcast to all clients
-                            message = {"type": "new_item", "item": ui_item}
-
-                            # Schedule broadcast in async loop
-                            asyncio.run_coroutine_threadsafe(
-                                self.ipc_service.broadcast(message),
-                                loop
-                            )
-                            logging.info(f"  → Broadcast item {item_id} ({item['type']}) to {len(self.ipc_service.clients)} clients")
-
-                    self.ipc_service.last_known_id = latest_id
-
-            except Exception as e:
-                logging.error(f"Error in database watcher: {e}")
-
-            time.sleep(0.5)
-
     def signal_handler(self, signum, frame):
         """Handle shutdown signals and cleanup"""
         logging.info(f"\nReceived signal {signum}, shutting down...")
@@ -144,12 +155,24 @@ class TFCBMServer:
             except Exception as e:
                 logging.error(f"Error killing UI process: {e}")
 
+        # Stop idle-time maintenance after its current step
+        try:
+            self.maintenance.stop(timeout=5)
+        except Exception as e:
+            logging.error(f"Error stopping maintenance: {e}")
+
         # Shutdown thumbnail executor
         try:
             self.thumbnail_service.shutdown()
         except Exception as e:
             logging.error(f"Error shutting down thumbnail service: {e}")
 
+        # Finish the IPC work already running (an ingest, a query)
+        try:
+            self.ipc_service.pool.shutdown(wait=True)
+        except Exception as e:
+            logging.error(f"Error shutting down IPC work pool: {e}")
+
         # Clean up IPC socket
         try:
             os.unlink(self.ipc_service.socket_path)
@@ -173,19 +196,14 @@ class TFCBMServer:
         # Start screenshot service if enabled
         self.screenshot_service.start()
 
+        # Start idle-time database maintenance
+        self.maintenance.start()
+
         # Start IPC server in separate thread with its own event loop
         def run_ipc_server():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-            # Start database watcher
-            watcher_thread = threading.Thread(
-                target=self.watch_for_new_items,
-                args=(loop,),
-                daemon=True
-            )
-            watcher_thread.start()
-
             # Start IPC server
             loop.run_until_complete(self.start_ipc_server())
 
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
-One-time maintenance script to clean up orphaned recently_pasted records.
+Maintenance script to clean up orphaned records.
+
+The server also runs this cleanup on its own while idle (see
+server/src/maintenance.py); the script runs it on demand.
 
 This script fixes the issue where the pasted tab shows "2 out of 647 items"
 because 645 orphaned records exist that reference deleted clipboard items.
@@ -40,7 +43,7 @@ def main():
 
     # Run the cleanup
     print("Running cleanup...")
-    orphaned_count = db._cleanup_orphaned_pasted_records()
+    orphaned_count = db.cleanup_orphans()
 
     print()
     print("=== Results ===")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Content-addressed blob store for TFCBM
+Keeps large clipboard payloads (images, file contents) outside SQLite
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+class BlobStore:
+    """
+    Sharded on-disk store of immutable payloads named by their SHA256.
+
+    A blob with key ``abcdef...`` lives at ``<root>/ab/cd/abcdef...``.
+    Identical payloads map to the same file, so each is stored once.
+    Reference counting is the database's job: the store only writes,
+    reads and unlinks files.
+    """
+
+    # Bytes read per step when copying a file into the store
+    COPY_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(data: bytes) -> str:
+        """Return the blob key (SHA256 hex digest of the full content)"""
+        return hashlib.sha256(data).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Return the sharded path of a blob"""
+        if len(key) != 64 or not all(c in "0123456789abcdef" for c in key):
+            raise ValueError(f"Invalid blob key: {key!r}")
+        return self.root / key[:2] / key[2:4] / key
+
+    def exists(self, key: str) -> bool:
+        """Check whether a blob is present on disk"""
+        return self.path(key).exists()
+
+    def put(self, data: bytes, key: str = None) -> str:
+        """
+        Store a payload and return its key.
+
+        The file is written to a temporary name, fsynced and renamed into
+        place, so a blob either exists completely or not at all. Storing a
+        payload that is already present is a no-op.
+
+        Args:
+            data: Payload bytes
+            key: key_for(data) if the caller already computed it
+
+        Returns:
+            The blob key
+        """
+        if key is None:
+            key = self.key_for(data)
+        path = self.path(key)
+        if path.exists():
+            return key
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        logging.info(f"Stored blob {key[:16]}... ({len(data)} bytes)")
+        return key
+
+    def put_file(self, source: str | Path) -> str:
+        """
+        Store the content of a file and return its key.
+
+        The file is copied in COPY_CHUNK_SIZE pieces and hashed on the way,
+        so it is read once and never held in memory. Like put(), the copy
+        is fsynced before it is renamed into place; content that is already
+        present is not stored again.
+
+        Args:
+            source: Path of a regular file
+
+        Returns:
+            The blob key
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as out, open(source, "rb") as f:
+                while chunk := f.read(self.COPY_CHUNK_SIZE):
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+                out.flush()
+                os.fsync(out.fileno())
+
+            key = digest.hexdigest()
+            path = self.path(key)
+            if path.exists():
+                Path(tmp_path).unlink()
+                return key
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        logging.info(f"Stored blob {key[:16]}... ({size} bytes)")
+        return key
+
+    @contextmanager
+    def open(self, key: str):
+        """
+        Map a blob into memory read-only.
+
+        Yields:
+            An mmap (or empty bytes for a zero-length blob)
+
+        Raises:
+            FileNotFoundError: If the blob does not exist
+        """
+        with open(self.path(key), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def read(self, key: str) -> bytes:
+        """Read a whole blob through mmap"""
+        with self.open(key) as mapped:
+            return bytes(mapped)
+
+    def size(self, key: str) -> int:
+        """Return the size of a blob in bytes"""
+        return self.path(key).stat().st_size
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a blob from disk.
+
+        Returns:
+            True if a file was removed, False if it did not exist
+        """
+        path = self.path(key)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+
+        # Drop empty shard directories
+        for shard in (path.parent, path.parent.parent):
+            try:
+                shard.rmdir()
+            except OSError:
+                break
+        return True
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over the keys of all blobs on disk"""
+        for path in self.root.glob("??/??/*"):
+            if path.is_file() and not path.name.startswith(".tmp-"):
+                yield path.name
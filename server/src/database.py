@@ -8,13 +8,27 @@ import hashlib
 import json
 import logging
 import math
+import mmap
 import os
 import random
+import queue
 import re
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+try:
+    from server.src.blob_store import BlobStore
+    from server.src.payload_codec import PayloadCodec
+    from server.src.timestamps import now_us, to_epoch_us
+except ImportError:
+    # Imported as a top-level module (tests, maintenance scripts)
+    from blob_store import BlobStore
+    from payload_codec import PayloadCodec
+    from timestamps import now_us, to_epoch_us
 
 
 class ClipboardDB:
@@ -49,7 +63,87 @@ class ClipboardDB:
         "file": "#c061cb",  # Purple
     }
 
-    def __init__(self, db_path: str | Path | None = None):
+    # Number of read-only connections opened next to the writer connection
+    DEFAULT_READ_POOL_SIZE = 4
+
+    # Separator between the JSON metadata and the content of file items
+    FILE_SEPARATOR = b"\n---FILE_CONTENT---\n"
+
+    # Image and file payloads at least this large are kept in the blob store
+    BLOB_MIN_SIZE = 16 * 1024
+
+    # Bytes read per step when streaming a payload (a multiple of 3, so
+    # base64-encoded chunks can be concatenated)
+    PAYLOAD_CHUNK_SIZE = 192 * 1024
+
+    # Characters of text in the stored preview; also the page size used
+    # for the stored page count
+    PREVIEW_LENGTH = 500
+
+    # Bytes handed to hashlib per update when hashing payloads and files
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    # Smallest payload compressed, per kind of content (data of inline file
+    # rows; formatted_content as "html" or "formatted"). Images are already
+    # compressed. The data of text and URL rows stays plain: the full-text
+    # indexes read it directly, so the schema needs no SQL function and
+    # other SQLite clients can still update and delete rows.
+    COMPRESS_MIN_SIZE = {
+        "file": 1024,
+        "html": 256,
+        "formatted": 1024,
+    }
+
+    # Texts longer than TEXT_CHUNK_SIZE characters are also stored as
+    # compressed chunks of that many characters, so a page or a match can
+    # be found without decoding the whole document
+    TEXT_CHUNK_SIZE = 64 * 1024
+
+    # HTML samples needed before a compression dictionary is trained, and
+    # the most recent HTML payloads used for training
+    HTML_DICT_MIN_SAMPLES = 50
+    HTML_DICT_MAX_SAMPLES = 1000
+
+    # Indexes of earlier versions, superseded by the composite indexes
+    # created in _init_db()
+    OBSOLETE_INDEXES = (
+        "idx_timestamp",
+        "idx_kind_timestamp",
+        "idx_extension_timestamp",
+        "idx_is_favorite",
+        "idx_pasted_timestamp",
+        "idx_pasted_timestamp_id",
+        "idx_item_tags_item",
+        "idx_item_tags_tag",
+    )
+
+    # Paste events kept in recently_pasted; the pasted tab reads the
+    # per-item rollup (last_pasted, paste_count), so older events are
+    # dropped as new ones come in
+    PASTE_LOG_MAX_ROWS = 10_000
+
+    # Work done per call of the idle-time maintenance steps: FTS segment
+    # pages merged, items checked against the FTS indexes (and the words of
+    # each item looked up) and free pages returned by incremental vacuum
+    FTS_MERGE_PAGES = 64
+    FTS_CHECK_ITEMS = 200
+    FTS_CHECK_WORDS = 8
+    VACUUM_PAGES = 256
+
+    # Free pages (as a share of the file) that justify the one-time VACUUM
+    # switching a database from before incremental vacuum to it
+    VACUUM_CONVERT_MIN_FREE = 0.1
+
+    # Blob files with no row are only removed once they are this old, so a
+    # payload being stored by a concurrent write is never touched
+    ORPHAN_BLOB_MIN_AGE = 3600
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        blob_dir: str | Path | None = None,
+    ):
         if db_path is None:
             # Flatpak / XDG-compliant data directory
             xdg_data_home = Path(
@@ -64,37 +158,192 @@ class ClipboardDB:
             db_dir.mkdir(parents=True, exist_ok=True)
 
             db_path = db_dir / "clipboard.db"
+            if blob_dir is None:
+                blob_dir = db_dir / "blobs"
         else:
             db_path = Path(db_path)
 
         self.db_path = str(db_path)
 
+        # Large payloads live next to the database; in-memory databases
+        # keep everything inline
+        self.blob_store: Optional[BlobStore] = None
+        if self.db_path != ":memory:":
+            self.blob_store = BlobStore(blob_dir or db_path.with_suffix(".blobs"))
+
+        self.codec = PayloadCodec()
+
         self.conn = sqlite3.connect(
             self.db_path,
             check_same_thread=False,
         )
         self.conn.row_factory = sqlite3.Row
 
+        # Set by group_commit(): commits are deferred to the end of the group
+        # and post-commit actions (like unlinking blob files) wait for it
+        self._grouping = False
+        self._post_commit = []
+
         # Required for ON DELETE CASCADE
         self.conn.execute("PRAGMA foreign_keys = ON")
 
+        # Lets idle-time maintenance return free pages a few at a time.
+        # Takes effect for new databases; older ones are converted by
+        # enable_incremental_vacuum().
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
+        # In-memory databases are private to their connection, so they can
+        # neither use WAL nor share data with a pool of readers.
+        self._local = threading.local()
+        self._read_pool: queue.Queue = queue.Queue()
+        self.read_pool_size = 0
+        if self.db_path != ":memory:":
+            self._enable_wal()
+
+        # Set when the full-text indexes were recreated while opening
+        self.fts_rebuilt = False
         self._init_db()
 
+        if self.db_path != ":memory:":
+            self._open_read_pool(read_pool_size)
+
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(levelname)s - %(message)s",
         )
 
+    def _enable_wal(self):
+        """
+        Switch the database to write-ahead logging.
+
+        With WAL, readers work on the last committed snapshot and are never
+        blocked by the writer (and vice versa), so list and search queries
+        keep running while an item or thumbnail is being committed.
+        """
+        mode = self.conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        if mode.lower() != "wal":
+            logging.warning(f"Could not enable WAL mode (journal_mode={mode})")
+            return
+        # NORMAL is durable across application crashes in WAL mode and
+        # avoids an fsync on every commit
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+
+    def _commit(self):
+        """Commit the writer connection, unless writes are being grouped"""
+        if self._grouping:
+            return
+        self.conn.commit()
+        self._run_post_commit()
+
+    def _after_commit(self, action):
+        """Run action once the current writes are committed (now, outside a group)"""
+        self._post_commit.append(action)
+        if not self._grouping:
+            self._run_post_commit()
+
+    def _run_post_commit(self):
+        actions, self._post_commit = self._post_commit, []
+        for action in actions:
+            try:
+                action()
+            except Exception as e:
+                logging.error(f"Post-commit action failed: {e}")
+
+    @contextmanager
+    def group_commit(self):
+        """
+        Apply the writes made inside the block in a single transaction.
+
+        The commits of the methods called inside are deferred to one commit
+        (one fsync) at the end of the block. Combine with savepoint() to
+        keep a failing write from affecting the others. If the block
+        raises, everything is rolled back.
+        """
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self._grouping = True
+        try:
+            yield
+        except BaseException:
+            self._grouping = False
+            self._post_commit.clear()
+            self.conn.rollback()
+            raise
+        self._grouping = False
+        self._commit()
+
+    @contextmanager
+    def savepoint(self):
+        """Undo the writes made inside the block if it raises"""
+        pending = len(self._post_commit)
+        self.conn.execute("SAVEPOINT write")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK TO write")
+            self.conn.execute("RELEASE write")
+            del self._post_commit[pending:]
+            raise
+        self.conn.execute("RELEASE write")
+
+    def _open_read_pool(self, size: int):
+        """
+        Open the pool of read-only connections used by the query methods.
+
+        Args:
+            size: Number of read connections (0 routes reads to the writer)
+        """
+        for _ in range(max(0, size)):
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            self._read_pool.put(conn)
+            self.read_pool_size += 1
+
+    @contextmanager
+    def _reader(self):
+        """
+        Check out a connection for read-only queries.
+
+        Nested reads on the same thread reuse the connection that is already
+        checked out, so helpers like get_tags_for_item can be called while
+        iterating a page. Without a pool, reads go to the writer connection.
+        """
+        conn = getattr(self._local, "read_conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        if not self.read_pool_size:
+            yield self.conn
+            return
+
+        conn = self._read_pool.get()
+        self._local.read_conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.read_conn = None
+            self._read_pool.put(conn)
+
     def _init_db(self):
         """
-        Initialize database schema - FINAL VERSION (no migrations needed).
+        Initialize database schema.
+
+        Tables are created if missing; columns added after the first release
+        are added to existing databases by _migrate_schema().
 
         SCHEMA:
         - clipboard_items: Main table for clipboard history
-        - recently_pasted: Tracks paste events
+        - recently_pasted: Log of the latest PASTE_LOG_MAX_ROWS paste events
         - clipboard_fts: Full-text search index
         - tags: User-defined tags
         - item_tags: Many-to-many relationship between items and tags
+        - counters: Row counts kept exact by triggers
+        - compression_dicts: Trained dictionaries for payload compression
+        - text_chunks: Long texts split into fixed-size character chunks
+        - blobs: Reference counts of payloads kept in the blob store
+        - maintenance_runs: When each idle-time maintenance task last completed
         """
         cursor = self.conn.cursor()
 
@@ -103,7 +352,7 @@ class ClipboardDB:
             """
             CREATE TABLE IF NOT EXISTS clipboard_items (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
                 type TEXT NOT NULL,
                 data BLOB NOT NULL,
                 thumbnail BLOB,
@@ -112,16 +361,66 @@ class ClipboardDB:
                 format_type TEXT,
                 formatted_content BLOB,
                 is_favorite INTEGER DEFAULT 0,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                blob_key TEXT,
+                preview TEXT,
+                text_length INTEGER,
+                page_count INTEGER,
+                kind TEXT,
+                extension TEXT,
+                file_name TEXT,
+                file_size INTEGER,
+                mime_type TEXT,
+                original_path TEXT,
+                is_directory INTEGER,
+                tag_names TEXT,
+                dedup_key TEXT,
+                copy_count INTEGER DEFAULT 1,
+                data_codec TEXT,
+                formatted_codec TEXT,
+                last_pasted INTEGER,
+                paste_count INTEGER DEFAULT 0
             )
         """
         )
 
-        # Create indices for clipboard_items (optimized for common queries)
+        self._migrate_schema(cursor)
+
+        # Indexes are shaped after the list queries: each filter seeks on
+        # its column and reads rows already in (timestamp, id) order, so a
+        # page never sorts. Indexes they replace are dropped.
+        for obsolete in self.OBSOLETE_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {obsolete}")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_timestamp_id
+            ON clipboard_items(timestamp, id)
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_kind_timestamp_id
+            ON clipboard_items(kind, timestamp, id)
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_extension_timestamp_id
+            ON clipboard_items(extension, timestamp, id)
+            """
+        )
+        # Pasted tab: pasted items in order of their last paste
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_last_pasted_id
+            ON clipboard_items(last_pasted, id) WHERE last_pasted IS NOT NULL
+            """
+        )
+        # Favorites filter, and retention reading the oldest non-favorites
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_timestamp
-            ON clipboard_items(timestamp DESC)
+            CREATE INDEX IF NOT EXISTS idx_favorite_timestamp_id
+            ON clipboard_items(is_favorite, timestamp, id)
             """
         )
         cursor.execute(
@@ -130,10 +429,11 @@ class ClipboardDB:
             ON clipboard_items(hash)
             """
         )
+        # One row per content; add_item upserts on this key
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_is_favorite
-            ON clipboard_items(is_favorite)
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_dedup_key
+            ON clipboard_items(dedup_key)
             """
         )
 
@@ -143,20 +443,14 @@ class ClipboardDB:
             CREATE TABLE IF NOT EXISTS recently_pasted (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 clipboard_item_id INTEGER NOT NULL,
-                pasted_timestamp TEXT NOT NULL,
+                pasted_timestamp INTEGER NOT NULL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (clipboard_item_id) REFERENCES clipboard_items(id) ON DELETE CASCADE
             )
         """
         )
 
-        # Create indices for recently_pasted
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_pasted_timestamp
-            ON recently_pasted(pasted_timestamp DESC)
-            """
-        )
+        # Log rows of an item are found by this when the item is deleted
         cursor.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_clipboard_item_id
@@ -164,15 +458,6 @@ class ClipboardDB:
             """
         )
 
-        # Create FTS5 virtual table for full-text search with name support
-        # Use unicode61 with custom separators for better URL tokenization
-        cursor.execute(
-            """
-            CREATE VIRTUAL TABLE IF NOT EXISTS clipboard_fts
-            USING fts5(content, name, tokenize="unicode61 separators './:?=&#@'")
-            """
-        )
-
         # Create tags table for user-defined tags
         cursor.execute(
             """
@@ -200,136 +485,1628 @@ class ClipboardDB:
             """
         )
 
-        # Create indices for tag queries
+        # Timestamp of the tagged item, kept by triggers, so a tag filter
+        # reads its items in history order from the index below
+        cursor.execute("PRAGMA table_info(item_tags)")
+        if "item_timestamp" not in {row["name"] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE item_tags ADD COLUMN item_timestamp INTEGER")
+            cursor.execute(
+                """
+                UPDATE item_tags SET item_timestamp = (
+                    SELECT timestamp FROM clipboard_items WHERE id = item_tags.item_id
+                )
+                """
+            )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS item_tags_timestamp_insert
+            AFTER INSERT ON item_tags
+            BEGIN
+                UPDATE item_tags SET item_timestamp = (
+                    SELECT timestamp FROM clipboard_items WHERE id = new.item_id
+                )
+                WHERE item_id = new.item_id AND tag_id = new.tag_id;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS item_tags_item_timestamp_update
+            AFTER UPDATE OF timestamp ON clipboard_items
+            WHEN old.timestamp IS NOT new.timestamp
+            BEGIN
+                UPDATE item_tags SET item_timestamp = new.timestamp WHERE item_id = new.id;
+            END
+            """
+        )
+
+        # Tag filters in history order, and get_items_by_tags in ID order;
+        # lookups by item use the primary key
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_item_tags_tag_timestamp
+            ON item_tags(tag_id, item_timestamp, item_id)
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_item_tags_tag_item
+            ON item_tags(tag_id, item_id)
+            """
+        )
+
+        # Create blobs table: one row per payload in the blob store. The
+        # refcount is maintained by triggers on clipboard_items.blob_key,
+        # so every way of deleting items (retention, cascades) releases it.
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                refcount INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_blob_insert
+            AFTER INSERT ON clipboard_items
+            WHEN new.blob_key IS NOT NULL
+            BEGIN
+                UPDATE blobs SET refcount = refcount + 1 WHERE key = new.blob_key;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_blob_delete
+            AFTER DELETE ON clipboard_items
+            WHEN old.blob_key IS NOT NULL
+            BEGIN
+                UPDATE blobs SET refcount = refcount - 1 WHERE key = old.blob_key;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_blob_update
+            AFTER UPDATE OF blob_key ON clipboard_items
+            WHEN old.blob_key IS NOT new.blob_key
+            BEGIN
+                UPDATE blobs SET refcount = refcount - 1 WHERE key = old.blob_key;
+                UPDATE blobs SET refcount = refcount + 1 WHERE key = new.blob_key;
+            END
+            """
+        )
+
+        # Dictionaries referenced by data_codec / formatted_codec
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS compression_dicts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                algorithm TEXT NOT NULL,
+                data BLOB NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+        cursor.execute("SELECT id, algorithm, data FROM compression_dicts")
+        for row in cursor.fetchall():
+            self.codec.add_dictionary(row["id"], row["algorithm"], row["data"])
+
+        # Long texts in TEXT_CHUNK_SIZE character chunks; chunk seq covers
+        # characters [seq * TEXT_CHUNK_SIZE, (seq + 1) * TEXT_CHUNK_SIZE).
+        # length (in characters) precedes data so it is read without the payload.
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS text_chunks (
+                item_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                codec TEXT,
+                PRIMARY KEY (item_id, seq),
+                FOREIGN KEY (item_id) REFERENCES clipboard_items(id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+            """
+        )
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS maintenance_runs (
+                task TEXT PRIMARY KEY,
+                last_run REAL NOT NULL
+            )
+            """
+        )
+
+        self._init_fts(cursor)
+        self._init_counters(cursor)
+
+        self._commit()
+        logging.info(
+            f"Database initialized or already exists at: {self.db_path}"
+        )
+        self.reconcile_counters()
+
+    # Full-text indexes: table -> (content view, tokenizer, max indexed chars).
+    # Words for ranked token search, trigrams for substring search.
+    # unicode61 uses custom separators for better URL tokenization.
+    # Trigram indexing costs grow with distinct trigrams, so substring
+    # search only covers the head of very long texts.
+    FTS_INDEXES = {
+        "clipboard_fts": ("clipboard_fts_source", "unicode61 separators './:?=&#@'", None),
+        "clipboard_fts_trigram": ("clipboard_fts_trigram_source", "trigram", 32 * 1024),
+    }
+    SEARCH_MODES = ("token", "substring")
+
+    # Triggers that keep the full-text indexes and clipboard_items.tag_names current
+    FTS_TRIGGERS = (
+        "clipboard_items_fts_insert",
+        "clipboard_items_fts_delete",
+        "clipboard_items_fts_update",
+        "item_tags_fts_insert",
+        "item_tags_fts_delete",
+        "tags_fts_rename",
+    )
+
+    @classmethod
+    def _fts_content(cls, table: str, row: str) -> str:
+        """SQL for the text an index stores in its content column for a row alias"""
+        content = (
+            f"CASE WHEN {row}.type IN ('text', 'url') AND coalesce({row}.data_codec, 'raw') = 'raw' "
+            f"THEN CAST({row}.data AS TEXT) "
+            f"WHEN {row}.type = 'file' THEN coalesce({row}.file_name, '') ELSE '' END"
+        )
+        max_chars = cls.FTS_INDEXES[table][2]
+        return f"substr({content}, 1, {max_chars})" if max_chars else content
+
+    @staticmethod
+    def _fts_name(row: str) -> str:
+        """SQL for the text indexed in the name column: custom name and tag names"""
+        return f"trim(coalesce({row}.name, '') || ' ' || coalesce({row}.tag_names, ''))"
+
+    @staticmethod
+    def _tag_names_of(item_id: str) -> str:
+        """SQL computing the space-separated tag names of an item"""
+        return f"""(
+            SELECT group_concat(tag_name, ' ') FROM (
+                SELECT t.name AS tag_name FROM item_tags it
+                INNER JOIN tags t ON t.id = it.tag_id
+                WHERE it.item_id = {item_id}
+                ORDER BY t.name
+            )
+        )"""
+
+    def _fts_insert(self, row: str) -> str:
+        """Trigger statements adding a row alias to every full-text index"""
+        return "".join(
+            f"INSERT INTO {table} (rowid, content, name) "
+            f"VALUES ({row}.id, {self._fts_content(table, row)}, {self._fts_name(row)});\n"
+            for table in self.FTS_INDEXES
+        )
+
+    def _fts_delete(self, row: str) -> str:
+        """Trigger statements removing a row alias from every full-text index"""
+        return "".join(
+            f"INSERT INTO {table} ({table}, rowid, content, name) "
+            f"VALUES ('delete', {row}.id, {self._fts_content(table, row)}, {self._fts_name(row)});\n"
+            for table in self.FTS_INDEXES
+        )
+
+    def _init_fts(self, cursor):
+        """
+        Create the full-text indexes and the triggers that keep them in sync.
+
+        clipboard_fts (word tokens) and clipboard_fts_trigram (substrings)
+        are external-content FTS5 tables over views of clipboard_items,
+        so indexed text is not stored again. Triggers on
+        clipboard_items update them on insert, delete and rename; triggers
+        on item_tags and tags keep the denormalized clipboard_items.tag_names
+        column current, which in turn updates the indexes. Databases with
+        an older or missing index are rebuilt once.
+
+        Args:
+            cursor: Cursor on the writer connection
+        """
+        cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name IN ({})".format(
+                ", ".join("?" * len(self.FTS_INDEXES))
+            ),
+            tuple(self.FTS_INDEXES),
+        )
+        existing = {row["name"]: row["sql"] for row in cursor.fetchall()}
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'view'")
+        views = {row["name"]: row["sql"] for row in cursor.fetchall()}
+        # Rebuild when a table or view is missing or indexes other content
+        needs_rebuild = any(
+            f"content='{view}'" not in existing.get(table, "")
+            or self._fts_content(table, "ci") not in views.get(view, "")
+            for table, (view, _, _) in self.FTS_INDEXES.items()
+        )
+        self.fts_rebuilt = needs_rebuild
+        if needs_rebuild:
+            if existing:
+                logging.info("Recreating full-text indexes as external-content tables")
+            for trigger in self.FTS_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            for table in existing:
+                cursor.execute(f"DROP TABLE {table}")
+            for view, _, _ in self.FTS_INDEXES.values():
+                cursor.execute(f"DROP VIEW IF EXISTS {view}")
+            self._decompress_text_rows(cursor)
+            cursor.execute(f"UPDATE clipboard_items SET tag_names = {self._tag_names_of('clipboard_items.id')}")
+
+        for table, (view, tokenize, _) in self.FTS_INDEXES.items():
+            cursor.execute(
+                f"""
+                CREATE VIEW IF NOT EXISTS {view} AS
+                SELECT id, {self._fts_content(table, 'ci')} AS content, {self._fts_name('ci')} AS name
+                FROM clipboard_items ci
+                """
+            )
+            cursor.execute(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {table}
+                USING fts5(content, name, content='{view}', content_rowid='id',
+                           tokenize="{tokenize}")
+                """
+            )
+
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_fts_insert
+            AFTER INSERT ON clipboard_items
+            BEGIN
+                {self._fts_insert('new')}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_fts_delete
+            AFTER DELETE ON clipboard_items
+            BEGIN
+                {self._fts_delete('old')}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_fts_update
+            AFTER UPDATE OF type, name, file_name, tag_names ON clipboard_items
+            BEGIN
+                {self._fts_delete('old')}
+                {self._fts_insert('new')}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS item_tags_fts_insert
+            AFTER INSERT ON item_tags
+            BEGIN
+                UPDATE clipboard_items SET tag_names = {self._tag_names_of('new.item_id')}
+                WHERE id = new.item_id;
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS item_tags_fts_delete
+            AFTER DELETE ON item_tags
+            BEGIN
+                UPDATE clipboard_items SET tag_names = {self._tag_names_of('old.item_id')}
+                WHERE id = old.item_id;
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tags_fts_rename
+            AFTER UPDATE OF name ON tags
+            BEGIN
+                UPDATE clipboard_items SET tag_names = {self._tag_names_of('clipboard_items.id')}
+                WHERE id IN (SELECT item_id FROM item_tags WHERE tag_id = new.id);
+            END
+            """
+        )
+
+        if needs_rebuild:
+            for table in self.FTS_INDEXES:
+                cursor.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+
+    def _decompress_text_rows(self, cursor):
+        """
+        Store the data of text and URL rows compressed by earlier versions plain again.
+
+        The full-text views read that column directly. Rows whose codec is
+        unavailable keep their data and are indexed without content.
+        """
+        cursor.execute(
+            """
+            SELECT id, data, data_codec FROM clipboard_items
+            WHERE type IN ('text', 'url') AND data_codec IS NOT NULL AND data_codec != ?
+            """,
+            (self.codec.RAW,),
+        )
+        updates = []
+        for row in cursor.fetchall():
+            try:
+                updates.append((self.codec.decompress(row["data"], row["data_codec"]), row["id"]))
+            except Exception as e:
+                logging.error(f"Cannot decompress item {row['id']}, it stays out of search: {e}")
+        cursor.executemany("UPDATE clipboard_items SET data = ?, data_codec = NULL WHERE id = ?", updates)
+        if updates:
+            logging.info(f"Stored {len(updates)} compressed texts plain for the full-text indexes")
+
+    def rebuild_fts_index(self):
+        """Rebuild the full-text indexes from the items table"""
+        for table in self.FTS_INDEXES:
+            self.conn.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+        self._commit()
+        logging.info("Rebuilt full-text indexes")
+
+    def check_fts_index(self) -> bool:
+        """
+        Check that the full-text indexes match the items table.
+
+        Runs the FTS5 integrity check against the external content, which
+        reports missing, stale and extra index entries.
+
+        Returns:
+            True if every index is consistent
+        """
+        for table in self.FTS_INDEXES:
+            try:
+                self.conn.execute(
+                    f"INSERT INTO {table} ({table}, rank) VALUES ('integrity-check', 1)"
+                )
+            except sqlite3.DatabaseError as e:
+                logging.error(f"Full-text index {table} is inconsistent with clipboard_items: {e}")
+                return False
+        return True
+
+    def check_fts_rows(self, after_id: int = 0, batch_size: int = None) -> tuple:
+        """
+        Check that a batch of items can be found through the full-text indexes.
+
+        Each item is looked up by rowid with the first FTS_CHECK_WORDS words
+        of its indexed content and name, which finds rows missing from an
+        index or indexed with other content. Unlike check_fts_index(), the
+        work is bounded by the batch, so it can run as a maintenance step.
+
+        Args:
+            after_id: Resume after this item ID
+            batch_size: Number of items to check (default FTS_CHECK_ITEMS)
+
+        Returns:
+            Tuple of (ID to resume from or None when every item was checked,
+            True if every item of the batch was found)
+        """
+        batch_size = batch_size or self.FTS_CHECK_ITEMS
+        columns = ", ".join(
+            f"{self._fts_content(table, 'ci')} AS \"{table}\"" for table in self.FTS_INDEXES
+        )
+        rows = self.conn.execute(
+            f"""
+            SELECT ci.id, {self._fts_name('ci')} AS name, {columns}
+            FROM clipboard_items ci
+            WHERE ci.id > ?
+            ORDER BY ci.id
+            LIMIT ?
+            """,
+            (after_id, batch_size),
+        ).fetchall()
+        if not rows:
+            return None, True
+
+        for row in rows:
+            for table, (_, tokenize, _) in self.FTS_INDEXES.items():
+                words = self._check_words(row[table], tokenize == "trigram")
+                words += self._check_words(row["name"], tokenize == "trigram")
+                if not words:
+                    continue
+                query = " ".join(self._fts_phrase(word) for word in words[: self.FTS_CHECK_WORDS])
+                found = self.conn.execute(
+                    f"SELECT 1 FROM {table} WHERE {table} MATCH ? AND rowid = ?", (query, row["id"])
+                ).fetchone()
+                if not found:
+                    logging.error(f"Item {row['id']} is missing from full-text index {table}")
+                    return rows[-1]["id"], False
+        return rows[-1]["id"], True
+
+    @classmethod
+    def _check_words(cls, text: Optional[str], trigram: bool) -> List[str]:
+        """Whole words from the head of an indexed text that the tokenizer keeps"""
+        if not text:
+            return []
+        head = text[: cls.FTS_CHECK_WORDS * 64]
+        words = head.split()
+        if len(head) < len(text) and words and not head[-1].isspace():
+            words.pop()  # Cut off by the head
+        if trigram:
+            return [word for word in words if len(word) >= 3]
+        return [word for word in words if any(char.isalnum() for char in word)]
+
+    # Counters kept by triggers; per-kind counts are named "kind:<kind>"
+    COUNTER_ITEMS = "items"
+    COUNTER_NON_FAVORITE = "non_favorite"
+    COUNTER_PASTED = "pasted"
+
+    @staticmethod
+    def _counter_add(name: str, delta: str) -> str:
+        """Trigger statement adding delta to a counter, creating it if missing"""
+        return (
+            f"INSERT INTO counters (name, value) SELECT {name}, {delta} WHERE {name} IS NOT NULL "
+            f"ON CONFLICT (name) DO UPDATE SET value = value + excluded.value;"
+        )
+
+    def _init_counters(self, cursor):
+        """
+        Create the counters table and the triggers that keep it exact.
+
+        Totals used on every clipboard event and page load (all items,
+        non-favorite items for retention, pasted items, items per kind)
+        are read from here instead of COUNT(*) scans.
+        reconcile_counters() recomputes them from the tables.
+
+        Args:
+            cursor: Cursor on the writer connection
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+            """
+        )
+        items = f"'{self.COUNTER_ITEMS}'"
+        non_favorite = f"'{self.COUNTER_NON_FAVORITE}'"
+        pasted = f"'{self.COUNTER_PASTED}'"
+
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_count_insert
+            AFTER INSERT ON clipboard_items
+            BEGIN
+                {self._counter_add(items, "1")}
+                {self._counter_add(non_favorite, "new.is_favorite IS 0")}
+                {self._counter_add("'kind:' || new.kind", "1")}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_count_delete
+            AFTER DELETE ON clipboard_items
+            BEGIN
+                {self._counter_add(items, "-1")}
+                {self._counter_add(non_favorite, "-(old.is_favorite IS 0)")}
+                {self._counter_add("'kind:' || old.kind", "-1")}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_count_update
+            AFTER UPDATE OF is_favorite, kind ON clipboard_items
+            BEGIN
+                {self._counter_add(non_favorite, "(new.is_favorite IS 0) - (old.is_favorite IS 0)")}
+                {self._counter_add("'kind:' || old.kind", "-1")}
+                {self._counter_add("'kind:' || new.kind", "1")}
+            END
+            """
+        )
+        # Pasted items (not paste events): items with a last_pasted time.
+        # Older versions counted rows of the paste log.
+        cursor.execute("DROP TRIGGER IF EXISTS recently_pasted_count_insert")
+        cursor.execute("DROP TRIGGER IF EXISTS recently_pasted_count_delete")
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_pasted_count_insert
+            AFTER INSERT ON clipboard_items
+            WHEN new.last_pasted IS NOT NULL
+            BEGIN
+                {self._counter_add(pasted, "1")}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_pasted_count_delete
+            AFTER DELETE ON clipboard_items
+            WHEN old.last_pasted IS NOT NULL
+            BEGIN
+                {self._counter_add(pasted, "-1")}
+            END
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS clipboard_items_pasted_count_update
+            AFTER UPDATE OF last_pasted ON clipboard_items
+            WHEN (old.last_pasted IS NULL) != (new.last_pasted IS NULL)
+            BEGIN
+                {self._counter_add(pasted, "(new.last_pasted IS NOT NULL) - (old.last_pasted IS NOT NULL)")}
+            END
+            """
+        )
+
+    def _count(self, conn: sqlite3.Connection, name: str) -> int:
+        """Read a counter"""
+        row = conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()
+        return row["value"] if row else 0
+
+    def reconcile_counters(self) -> bool:
+        """
+        Recompute the counters from the tables and fix any drift.
+
+        Paste log rows of items that no longer exist are removed first.
+
+        Returns:
+            True if the stored counters were already exact
+        """
+        self._cleanup_orphaned_pasted_records()
+        cursor = self.conn.cursor()
+        expected = {
+            self.COUNTER_ITEMS: cursor.execute("SELECT COUNT(*) FROM clipboard_items").fetchone()[0],
+            self.COUNTER_NON_FAVORITE: cursor.execute(
+                "SELECT COUNT(*) FROM clipboard_items WHERE is_favorite = 0"
+            ).fetchone()[0],
+            self.COUNTER_PASTED: cursor.execute(
+                "SELECT COUNT(*) FROM clipboard_items WHERE last_pasted IS NOT NULL"
+            ).fetchone()[0],
+        }
+        cursor.execute(
+            "SELECT 'kind:' || kind, COUNT(*) FROM clipboard_items WHERE kind IS NOT NULL GROUP BY kind"
+        )
+        expected.update({name: count for name, count in cursor.fetchall()})
+
+        cursor.execute("SELECT name, value FROM counters")
+        stored = {row["name"]: row["value"] for row in cursor.fetchall()}
+        # A missing counter reads as 0 (see _count), so it matches an expected 0
+        matches = all(stored.get(name, 0) == count for name, count in expected.items())
+        extra = any(value for name, value in stored.items() if name not in expected)
+        if matches and not extra:
+            return True
+
+        logging.warning(f"Counters drifted, reconciling: stored={stored} expected={expected}")
+        cursor.execute("DELETE FROM counters")
+        cursor.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?)", expected.items()
+        )
+        self._commit()
+        return False
+
+    def get_kind_counts(self) -> Dict[str, int]:
+        """Number of items per kind (text, url, image, file)"""
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT substr(name, 6) AS kind, value FROM counters "
+                "WHERE name > 'kind:' AND name < 'kind;' AND value > 0"
+            ).fetchall()
+            return {row["kind"]: row["value"] for row in rows}
+
+    def _migrate_schema(self, cursor):
+        """
+        Add columns introduced after the initial schema to existing databases.
+
+        Args:
+            cursor: Cursor on the writer connection
+        """
+        cursor.execute("PRAGMA table_info(clipboard_items)")
+        existing = {row["name"] for row in cursor.fetchall()}
+
+        new_columns = {
+            "blob_key": "TEXT",
+            "preview": "TEXT",
+            "text_length": "INTEGER",
+            "page_count": "INTEGER",
+            "kind": "TEXT",
+            "extension": "TEXT",
+            "file_name": "TEXT",
+            "file_size": "INTEGER",
+            "mime_type": "TEXT",
+            "original_path": "TEXT",
+            "is_directory": "INTEGER",
+            "tag_names": "TEXT",
+            "dedup_key": "TEXT",
+            "copy_count": "INTEGER DEFAULT 1",
+            "data_codec": "TEXT",
+            "formatted_codec": "TEXT",
+            "last_pasted": "INTEGER",
+            "paste_count": "INTEGER DEFAULT 0",
+        }
+        for column, definition in new_columns.items():
+            if column not in existing:
+                cursor.execute(
+                    f"ALTER TABLE clipboard_items ADD COLUMN {column} {definition}"
+                )
+                logging.info(f"Migrated clipboard_items: added column {column}")
+
+        # Fill the filter columns of existing rows once, when they are added.
+        # Only the JSON header of file rows is read.
+        if "kind" not in existing:
+            cursor.execute(
+                """
+                UPDATE clipboard_items SET kind = CASE
+                    WHEN type LIKE 'image/%' OR type = 'screenshot' THEN 'image'
+                    ELSE type END
+                """
+            )
+        if "extension" not in existing or "file_name" not in existing:
+            separator = self.FILE_SEPARATOR.hex().upper()
+            header = f"CAST(substr(data, 1, instr(data, X'{separator}') - 1) AS TEXT)"
+            cursor.execute(
+                f"""
+                UPDATE clipboard_items
+                SET extension = nullif(lower(json_extract({header}, '$.extension')), ''),
+                    file_name = coalesce(json_extract({header}, '$.name'), ''),
+                    file_size = json_extract({header}, '$.size'),
+                    mime_type = json_extract({header}, '$.mime_type'),
+                    original_path = json_extract({header}, '$.original_path'),
+                    is_directory = coalesce(json_extract({header}, '$.is_directory'), 0)
+                WHERE type = 'file' AND instr(data, X'{separator}') > 0
+                """
+            )
+        if "dedup_key" not in existing:
+            # Older versions hashed only the first 64 KB, so their hashes are
+            # full-content hashes for payloads up to that size. Externalized
+            # images are skipped; the newest row wins if keys collide.
+            size = "CASE WHEN kind = 'file' THEN coalesce(file_size, 0) ELSE length(data) END"
+            key = f"kind || ':' || ({size}) || ':' || hash"
+            cursor.execute(
+                f"""
+                UPDATE clipboard_items SET dedup_key = {key}
+                WHERE id IN (
+                    SELECT max(id) FROM clipboard_items
+                    WHERE hash IS NOT NULL AND ({size}) <= 65536
+                      AND (blob_key IS NULL OR kind = 'file')
+                    GROUP BY {key}
+                )
+                """
+            )
+
+        # Before the rollup, so last_pasted is filled with integers
+        self._migrate_timestamps(cursor)
+
+        if "last_pasted" not in existing:
+            self._rollup_paste_log(cursor)
+
+    # Timestamp columns (table, column, NOT NULL) that older versions
+    # declared as TEXT and filled with ISO strings
+    TIMESTAMP_COLUMNS = (
+        ("clipboard_items", "timestamp", True),
+        ("clipboard_items", "last_pasted", False),
+        ("recently_pasted", "pasted_timestamp", True),
+        ("item_tags", "item_timestamp", False),
+    )
+
+    def _migrate_timestamps(self, cursor):
+        """
+        Convert ISO timestamp columns of older versions to INTEGER epoch
+        microseconds.
+
+        A column's type can't be altered in place, so the integers are
+        written to a new column that then replaces the old one. Indexes
+        and triggers on the old column are dropped first; _init_db()
+        creates them again on the new one.
+
+        Args:
+            cursor: Cursor on the writer connection
+        """
+        self.conn.create_function("epoch_us", 1, self._parse_epoch_us)
+        for table, column, not_null in self.TIMESTAMP_COLUMNS:
+            cursor.execute(f"PRAGMA table_info({table})")
+            types = {row["name"]: row["type"].upper() for row in cursor.fetchall()}
+            if types.get(column) != "TEXT":
+                continue
+
+            cursor.execute("SELECT type, name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') AND sql IS NOT NULL")
+            for row in cursor.fetchall():
+                if re.search(rf"\b{column}\b", row["sql"]):
+                    cursor.execute(f"DROP {row['type'].upper()} {row['name']}")
+
+            converted = f"{column}_us"
+            if not_null:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {converted} INTEGER NOT NULL DEFAULT 0")
+                cursor.execute(f"UPDATE {table} SET {converted} = coalesce(epoch_us({column}), 0)")
+            else:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {converted} INTEGER")
+                cursor.execute(f"UPDATE {table} SET {converted} = epoch_us({column})")
+            cursor.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+            cursor.execute(f"ALTER TABLE {table} RENAME COLUMN {converted} TO {column}")
+            logging.info(f"Migrated {table}: {column} converted to epoch microseconds")
+
+    @staticmethod
+    def _parse_epoch_us(value) -> Optional[int]:
+        """epoch_us() SQL function: an ISO timestamp in epoch microseconds, NULL if unreadable"""
+        try:
+            return to_epoch_us(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _rollup_paste_log(self, cursor):
+        """
+        Fill last_pasted and paste_count from the paste log of older
+        versions, then trim the log to PASTE_LOG_MAX_ROWS.
+
+        Args:
+            cursor: Cursor on the writer connection
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'recently_pasted'"
+        )
+        if cursor.fetchone() is None:
+            return
+        cursor.execute(
+            """
+            UPDATE clipboard_items
+            SET last_pasted = rollup.last_pasted, paste_count = rollup.paste_count
+            FROM (
+                SELECT clipboard_item_id, max(pasted_timestamp) AS last_pasted, COUNT(*) AS paste_count
+                FROM recently_pasted GROUP BY clipboard_item_id
+            ) AS rollup
+            WHERE clipboard_items.id = rollup.clipboard_item_id
+            """
+        )
+        logging.info(f"Migrated clipboard_items: rolled up pastes of {cursor.rowcount} items")
+        cursor.execute(
+            "DELETE FROM recently_pasted WHERE id <= (SELECT max(id) FROM recently_pasted) - ?",
+            (self.PASTE_LOG_MAX_ROWS,),
+        )
+
+    def _externalize_payload(self, item_type: str, data: bytes, content_hash: str = None) -> tuple:
+        """
+        Move a large image or file payload into the blob store.
+
+        For file items only the content after FILE_SEPARATOR is moved; the
+        JSON metadata stays in the row so list views can render it.
+
+        Args:
+            item_type: Type of the item
+            data: Payload as passed to add_item
+            content_hash: SHA256 of the moved content, if already known
+
+        Returns:
+            Tuple of (bytes to keep in the data column, blob key or None)
+        """
+        if self.blob_store is None:
+            return data, None
+
+        if item_type == "file":
+            if self.FILE_SEPARATOR not in data:
+                return data, None
+            metadata_bytes, content = data.split(self.FILE_SEPARATOR, 1)
+            if len(content) < self.BLOB_MIN_SIZE:
+                return data, None
+            return metadata_bytes + self.FILE_SEPARATOR, self.blob_store.put(content, content_hash)
+
+        if item_type.startswith("image/") or item_type == "screenshot":
+            if len(data) < self.BLOB_MIN_SIZE:
+                return data, None
+            return b"", self.blob_store.put(data, content_hash)
+
+        return data, None
+
+    def store_file_content(self, path: str | Path) -> Optional[str]:
+        """
+        Stream the content of a file into the blob store.
+
+        Reads and hashes the file once, without holding it in memory. Pass
+        the key as blob_key to add_item, with data ending at FILE_SEPARATOR.
+
+        Returns:
+            Blob key (SHA256 of the content), or None for an in-memory
+            database, which has no blob store
+        """
+        if self.blob_store is None:
+            return None
+        return self.blob_store.put_file(path)
+
+    def _load_payload(self, data: bytes, blob_key: Optional[str]) -> bytes:
+        """
+        Reassemble the full payload of a row whose content is in the blob store.
+
+        Args:
+            data: Value of the data column
+            blob_key: Value of the blob_key column
+
+        Returns:
+            The payload in the format originally passed to add_item
+        """
+        if not blob_key or self.blob_store is None:
+            return data
+        try:
+            with self.blob_store.open(blob_key) as mapped:
+                return data + mapped
+        except FileNotFoundError:
+            logging.error(f"Blob {blob_key[:16]}... is missing from {self.blob_store.root}")
+            return data
+
+    def stream_payload(self, item_id: int, chunk_size: int = None) -> Optional[tuple]:
+        """
+        Read the content of an image or file item in fixed-size chunks.
+
+        Only one chunk is in memory at a time: blob store files are read
+        sequentially and inline payloads with incremental BLOB I/O
+        (blobopen), checking out a read connection per chunk. File items
+        yield the content after FILE_SEPARATOR, like the blob store holds it.
+
+        Args:
+            item_id: ID of the item
+            chunk_size: Bytes per chunk (default PAYLOAD_CHUNK_SIZE)
+
+        Returns:
+            Tuple of (item type, content size, iterator of chunks), or None
+            if the item does not exist or is not an image or file
+        """
+        chunk_size = chunk_size or self.PAYLOAD_CHUNK_SIZE
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT type, blob_key, data_codec, length(data) AS data_length,
+                       CASE WHEN type = 'file' THEN instr(data, ?) END AS separator
+                FROM clipboard_items WHERE id = ?
+                """,
+                (self.FILE_SEPARATOR, item_id),
+            ).fetchone()
+        if not row:
+            return None
+        item_type = row["type"]
+        if item_type != "file" and not (item_type.startswith("image/") or item_type == "screenshot"):
+            return None
+
+        if row["blob_key"] and self.blob_store is not None:
+            path = self.blob_store.path(row["blob_key"])
+            return item_type, path.stat().st_size, self._stream_file(path, chunk_size)
+
+        if row["data_codec"] not in (None, self.codec.RAW):
+            # Compressed rows are small inline payloads; decode them whole
+            data = self.get_item(item_id)["data"]
+            if item_type == "file":
+                data = data.split(self.FILE_SEPARATOR, 1)[-1]
+            chunks = (data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+            return item_type, len(data), chunks
+
+        offset = 0
+        if item_type == "file":
+            if not row["separator"]:
+                return None
+            offset = row["separator"] - 1 + len(self.FILE_SEPARATOR)
+        size = row["data_length"] - offset
+        return item_type, size, self._stream_inline(item_id, offset, size, chunk_size)
+
+    @staticmethod
+    def _stream_file(path: Path, chunk_size: int) -> Iterator[bytes]:
+        """Yield a file in chunks"""
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def _stream_inline(self, item_id: int, offset: int, size: int, chunk_size: int) -> Iterator[bytes]:
+        """Yield the data column of an item from offset in chunks, via incremental BLOB reads"""
+        end = offset + size
+        while offset < end:
+            with self._reader() as conn:
+                with conn.blobopen("clipboard_items", "data", item_id, readonly=True) as blob:
+                    blob.seek(offset)
+                    chunk = blob.read(min(chunk_size, end - offset))
+            if not chunk:
+                return
+            offset += len(chunk)
+            yield chunk
+
+    def read_blob(self, blob_key: str) -> Optional[bytes]:
+        """
+        Read a payload from the blob store.
+
+        Args:
+            blob_key: Key of the blob
+
+        Returns:
+            The blob bytes, or None if it does not exist
+        """
+        if self.blob_store is None:
+            return None
+        try:
+            return self.blob_store.read(blob_key)
+        except FileNotFoundError:
+            return None
+
+    def _release_unreferenced_blobs(self) -> int:
+        """
+        Delete blobs that are no longer referenced by any item.
+
+        Rows are removed and committed before the files are unlinked, so a
+        crash in between leaves at most an unreferenced file behind.
+
+        Returns:
+            Number of blobs released
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT key FROM blobs WHERE refcount <= 0")
+        keys = [row["key"] for row in cursor.fetchall()]
+        if not keys:
+            return 0
+
+        cursor.executemany(
+            "DELETE FROM blobs WHERE key = ? AND refcount <= 0",
+            [(key,) for key in keys],
+        )
+        self._commit()
+
+        if self.blob_store is not None:
+            self._after_commit(lambda: self._delete_blob_files(keys))
+
+        logging.info(f"Released {len(keys)} unreferenced blobs")
+        return len(keys)
+
+    def _delete_blob_files(self, keys: List[str]):
+        """Unlink released blob files, skipping any a later write in the same group reused"""
+        placeholders = ", ".join("?" for _ in keys)
+        reused = {
+            row["key"]
+            for row in self.conn.execute(f"SELECT key FROM blobs WHERE key IN ({placeholders})", keys)
+        }
+        for key in keys:
+            if key not in reused:
+                self.blob_store.delete(key)
+
+    def migrate_inline_blobs(self, after_id: int = 0, batch_size: int = 20) -> Optional[int]:
+        """
+        Move inline image and file payloads of existing rows to the blob store.
+
+        Works in batches ordered by id so it can run in the background
+        between other writes. Freed pages are reused by later inserts.
+
+        Args:
+            after_id: Resume after this item ID
+            batch_size: Number of rows to check per call
+
+        Returns:
+            ID to resume from, or None when every row has been checked
+        """
+        if self.blob_store is None:
+            return None
+
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT id, type, data, data_codec FROM clipboard_items
+            WHERE id > ? AND blob_key IS NULL
+              AND (type = 'file' OR type LIKE 'image/%' OR type = 'screenshot')
+              AND length(data) >= ?
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            (after_id, self.BLOB_MIN_SIZE, batch_size),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return None
+
+        moved = 0
+        for row in rows:
+            data, blob_key = self._externalize_payload(
+                row["type"], self.codec.decompress(row["data"], row["data_codec"])
+            )
+            if blob_key is None:
+                continue
+            cursor.execute(
+                "INSERT OR IGNORE INTO blobs (key, size) VALUES (?, ?)",
+                (blob_key, self.blob_store.size(blob_key)),
+            )
+            cursor.execute(
+                "UPDATE clipboard_items SET data = ?, blob_key = ?, data_codec = NULL WHERE id = ?",
+                (data, blob_key, row["id"]),
+            )
+            moved += 1
+        self._commit()
+
+        if moved:
+            logging.info(f"Moved {moved} inline payloads to the blob store")
+        return rows[-1]["id"]
+
+    @classmethod
+    def _text_columns(cls, item_type: str, data: bytes) -> tuple:
+        """
+        Compute the stored preview, character length and page count of an item.
+
+        Args:
+            item_type: Type of the item
+            data: Payload as passed to add_item
+
+        Returns:
+            Tuple of (preview, text_length, page_count), all None for
+            items that are not text or URLs
+        """
+        if item_type not in ("text", "url"):
+            return None, None, None
+        text = data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+        page_count = max(1, math.ceil(len(text) / cls.PREVIEW_LENGTH))
+        return text[: cls.PREVIEW_LENGTH], len(text), page_count
+
+    def backfill_text_columns(self, after_id: int = 0, batch_size: int = 200) -> Optional[int]:
+        """
+        Fill the preview, text_length and page_count of rows written by older versions.
+
+        Works in batches ordered by id so it can run in the background
+        between other writes.
+
+        Args:
+            after_id: Resume after this item ID
+            batch_size: Number of rows to fill per call
+
+        Returns:
+            ID to resume from, or None when every row has been filled
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT id, type, data, data_codec FROM clipboard_items
+            WHERE id > ? AND type IN ('text', 'url') AND text_length IS NULL
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            (after_id, batch_size),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return None
+
+        cursor.executemany(
+            "UPDATE clipboard_items SET preview = ?, text_length = ?, page_count = ? WHERE id = ?",
+            [
+                (*self._text_columns(row["type"], self.codec.decompress(row["data"], row["data_codec"])), row["id"])
+                for row in rows
+            ],
+        )
+        self._commit()
+
+        logging.info(f"Backfilled text columns of {len(rows)} items")
+        return rows[-1]["id"]
+
+    def _write_text_chunks(self, cursor: sqlite3.Cursor, item_id: int, data: bytes):
+        """Store the text of an item as compressed TEXT_CHUNK_SIZE character chunks"""
+        text = data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+        chunks = []
+        for seq, start in enumerate(range(0, len(text), self.TEXT_CHUNK_SIZE)):
+            chunk = text[start:start + self.TEXT_CHUNK_SIZE]
+            data, codec = self.codec.compress(chunk.encode("utf-8"))
+            chunks.append((item_id, seq, len(chunk), data, codec))
+        cursor.executemany(
+            "INSERT OR REPLACE INTO text_chunks (item_id, seq, length, data, codec) VALUES (?, ?, ?, ?, ?)",
+            chunks,
+        )
+
+    def _read_text_chunks(self, conn: sqlite3.Connection, item_id: int, first: int = 0, last: int = None):
+        """
+        Yield the decoded chunks first..last of an item in order (last None: to the end).
+
+        Rows are fetched lazily, so a caller that stops early reads no further chunks.
+        """
+        cursor = conn.execute(
+            """
+            SELECT data, codec FROM text_chunks
+            WHERE item_id = ? AND seq BETWEEN ? AND ?
+            ORDER BY seq
+            """,
+            (item_id, first, last if last is not None else 2 ** 62),
+        )
+        for row in cursor:
+            yield self.codec.decompress(row["data"], row["codec"]).decode("utf-8")
+
+    def backfill_text_chunks(self, after_id: int = 0, batch_size: int = 10) -> Optional[int]:
+        """
+        Chunk long texts written by older versions.
+
+        Works in batches ordered by id so it can run in the background
+        between other writes. Needs the text columns to be backfilled first.
+
+        Args:
+            after_id: Resume after this item ID
+            batch_size: Number of rows to chunk per call
+
+        Returns:
+            ID to resume from, or None when every long text has been chunked
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT id, data, data_codec FROM clipboard_items ci
+            WHERE id > ? AND type IN ('text', 'url') AND text_length > ?
+              AND NOT EXISTS (SELECT 1 FROM text_chunks WHERE item_id = ci.id)
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            (after_id, self.TEXT_CHUNK_SIZE, batch_size),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return None
+
+        for row in rows:
+            self._write_text_chunks(cursor, row["id"], self.codec.decompress(row["data"], row["data_codec"]))
+        self._commit()
+
+        logging.info(f"Chunked {len(rows)} long texts")
+        return rows[-1]["id"]
+
+    def _compress_data(self, kind: str, data: bytes) -> tuple:
+        """
+        Compress the data column of a text, URL or inline file row.
+
+        Returns:
+            Tuple of (bytes to store, codec or None if left uncompressed)
+        """
+        min_size = self.COMPRESS_MIN_SIZE.get(kind)
+        if min_size is None or not isinstance(data, bytes) or len(data) < min_size:
+            return data, None
+        return self.codec.compress(data)
+
+    def _compress_formatted(self, format_type: Optional[str], formatted_content: Optional[bytes]) -> tuple:
+        """
+        Compress formatted content; HTML uses the trained dictionary when there is one.
+
+        Returns:
+            Tuple of (bytes to store, codec or None if left uncompressed)
+        """
+        is_html = (format_type or "").lower() == "html"
+        min_size = self.COMPRESS_MIN_SIZE.get("html" if is_html else "formatted")
+        if min_size is None or not isinstance(formatted_content, bytes) or len(formatted_content) < min_size:
+            return formatted_content, None
+        return self.codec.compress(formatted_content, self.codec.latest_dictionary() if is_html else None)
+
+    def train_html_dictionary(self) -> Optional[int]:
+        """
+        Train a compression dictionary from recent HTML formatted content.
+
+        HTML copied from the same sites and editors shares most of its markup,
+        which a dictionary lets even short payloads compress well. New HTML
+        uses the newest dictionary; rows keep the one they were written with.
+
+        Returns:
+            ID of the new dictionary, or None if there are not enough samples
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT formatted_content, formatted_codec FROM clipboard_items
+            WHERE lower(format_type) = 'html' AND formatted_content IS NOT NULL
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (self.HTML_DICT_MAX_SAMPLES,),
+        )
+        samples = [
+            self.codec.decompress(row["formatted_content"], row["formatted_codec"])
+            for row in cursor.fetchall()
+        ]
+        if len(samples) < self.HTML_DICT_MIN_SAMPLES:
+            return None
+
+        try:
+            algorithm, dictionary = self.codec.train_dictionary(samples)
+        except Exception as e:
+            logging.warning(f"Failed to train HTML compression dictionary: {e}")
+            return None
+        if not dictionary:
+            return None
+
+        cursor.execute(
+            "INSERT INTO compression_dicts (algorithm, data) VALUES (?, ?)",
+            (algorithm, dictionary),
+        )
+        self._commit()
+        self.codec.add_dictionary(cursor.lastrowid, algorithm, dictionary)
+        return cursor.lastrowid
+
+    def recompress_items(self, after_id: int = 0, batch_size: int = 100) -> Optional[int]:
+        """
+        Compress payloads of rows written uncompressed (older versions, or
+        HTML written before a dictionary existed).
+
+        Works in batches ordered by id so it can run in the background
+        between other writes. Rows that do not compress are marked "raw"
+        so they are not tried again.
+
+        Args:
+            after_id: Resume after this item ID
+            batch_size: Number of rows to check per call
+
+        Returns:
+            ID to resume from, or None when every row has been checked
+        """
+        data_kinds = sorted(kind for kind in ("text", "url", "file") if kind in self.COMPRESS_MIN_SIZE)
+        min_size = min(self.COMPRESS_MIN_SIZE.values(), default=None)
+        if min_size is None:
+            return None
+
+        # HTML compressed before a dictionary existed is re-encoded once
+        stale_html = (
+            f"OR (lower(format_type) = 'html' AND formatted_codec = '{self.codec.preferred_algorithm()}')"
+            if self.codec.latest_dictionary() is not None else ""
+        )
+        kind_list = ", ".join(f"'{kind}'" for kind in data_kinds) or "NULL"
+
+        cursor = self.conn.cursor()
         cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_item_tags_item
-            ON item_tags(item_id)
-            """
+            f"""
+            SELECT id, kind, data, data_codec, format_type, formatted_content, formatted_codec
+            FROM clipboard_items
+            WHERE id > ?
+              AND ((data_codec IS NULL AND blob_key IS NULL AND kind IN ({kind_list})
+                    AND length(data) >= ?)
+                OR (formatted_codec IS NULL AND formatted_content IS NOT NULL
+                    AND length(formatted_content) >= ?)
+                {stale_html})
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            (after_id, min_size, min_size, batch_size),
         )
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_item_tags_tag
-            ON item_tags(tag_id)
+        rows = cursor.fetchall()
+        if not rows:
+            return None
+
+        updates = []
+        for row in rows:
+            data, data_codec = row["data"], row["data_codec"]
+            if data_codec is None:
+                data, data_codec = self._compress_data(row["kind"], data)
+            formatted, formatted_codec = row["formatted_content"], row["formatted_codec"]
+            if formatted is not None:
+                formatted, formatted_codec = self._compress_formatted(
+                    row["format_type"], self.codec.decompress(formatted, formatted_codec)
+                )
+                formatted_codec = formatted_codec or self.codec.RAW
+            updates.append((data, data_codec or self.codec.RAW, formatted, formatted_codec, row["id"]))
+
+        # Only file rows have their data compressed, and their indexed
+        # content is the file name, so the FTS index stays valid
+        cursor.executemany(
             """
+            UPDATE clipboard_items
+            SET data = ?, data_codec = ?, formatted_content = ?, formatted_codec = ?
+            WHERE id = ?
+            """,
+            updates,
         )
+        self._commit()
+
+        logging.info(f"Recompressed payloads of {len(rows)} items")
+        return rows[-1]["id"]
+
+    @classmethod
+    def _hash_buffer(cls, buffer) -> str:
+        """SHA256 of a bytes-like object, fed to hashlib in HASH_CHUNK_SIZE slices"""
+        digest = hashlib.sha256()
+        with memoryview(buffer) as view:
+            for offset in range(0, len(view), cls.HASH_CHUNK_SIZE):
+                digest.update(view[offset:offset + cls.HASH_CHUNK_SIZE])
+        return digest.hexdigest()
+
+    @classmethod
+    def calculate_hash(cls, data: bytes) -> str:
+        """
+        Calculate SHA256 hash of the full content of data
+        Returns hex digest (64 characters)
+        """
+        return cls._hash_buffer(data)
 
-        self.conn.commit()
-        logging.info(
-            f"Database initialized or already exists at: {self.db_path}"
-        )
+    @classmethod
+    def hash_file(cls, path: str | Path) -> str:
+        """
+        Calculate SHA256 hash of a file's content without reading it into memory.
+
+        The file is mapped read-only and hashed in chunks, so only the pages
+        being hashed need to be resident.
+
+        Args:
+            path: Path of a regular file
+
+        Returns:
+            Hex digest (64 characters)
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls._hash_buffer(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return cls._hash_buffer(mapped)
 
     @staticmethod
-    def calculate_hash(data: bytes) -> str:
+    def dedup_key(kind: str, size: int, data_hash: str) -> str:
+        """Key identifying identical content: kind, byte size and content hash"""
+        return f"{kind}:{size}:{data_hash}"
+
+    @classmethod
+    def _dedup_content(cls, item_type: str, data: bytes, file_metadata: Optional[Dict]) -> bytes:
         """
-        Calculate SHA256 hash of data
-        Uses first 64KB for very large files for performance
-        Returns hex digest (64 characters)
+        The bytes that identify an item's content for deduplication.
+
+        Files are identified by their content, not their JSON header;
+        directories by their path.
         """
-        if len(data) > 65536:
-            # For large files, hash first 64KB for performance
-            data = data[:65536]
-        return hashlib.sha256(data).hexdigest()
+        if item_type != "file":
+            return data
+        if file_metadata and file_metadata.get("is_directory"):
+            return (file_metadata.get("original_path") or "").encode("utf-8")
+        if cls.FILE_SEPARATOR in data:
+            return data.split(cls.FILE_SEPARATOR, 1)[1]
+        return data
 
     def add_item(
         self,
         item_type: str,
         data: bytes,
-        timestamp: str = None,
+        timestamp: int | str = None,
         thumbnail: bytes = None,
         data_hash: str = None,
         name: str = None,
         format_type: str = None,
         formatted_content: bytes = None,
         is_favorite: bool = False,
+        file_metadata: Optional[Dict] = None,
+        blob_key: Optional[str] = None,
     ) -> int:
         """
         Add a clipboard item to the database
 
+        Always inserts a new row; clipboard ingest uses upsert_item to
+        deduplicate.
+
         Args:
             item_type: Type of item (text, image/png, screenshot, etc.)
             data: The actual data (text as bytes or image data)
-            timestamp: ISO format timestamp (defaults to now)
+            timestamp: Epoch microseconds, datetime or ISO format timestamp (defaults to now)
             thumbnail: Optional thumbnail data for images
             data_hash: Optional pre-calculated hash (will be calculated if not provided)
             name: Optional custom name for the item
             format_type: Optional format type (e.g., 'html', 'rtf') for formatted text
             formatted_content: Optional formatted content (HTML, RTF, etc.)
             is_favorite: Whether this item is favorited
+            file_metadata: Metadata of a file item (name, size, mime_type,
+                extension, original_path, is_directory); parsed from the
+                JSON header of data when not given
+            blob_key: Key of the file content, already in the blob store
+                (see store_file_content); data then ends at FILE_SEPARATOR
 
         Returns:
             The ID of the inserted item
         """
-        if timestamp is None:
-            timestamp = datetime.now().isoformat()
+        item_id, _ = self._write_item(
+            item_type,
+            data,
+            timestamp,
+            thumbnail=thumbnail,
+            data_hash=data_hash,
+            name=name,
+            format_type=format_type,
+            formatted_content=formatted_content,
+            is_favorite=is_favorite,
+            file_metadata=file_metadata,
+            blob_key=blob_key,
+            dedup=False,
+        )
+        return item_id
 
-        # Calculate hash if not provided (for all item types)
-        if data_hash is None:
-            data_hash = self.calculate_hash(data)
+    def upsert_item(self, item_type: str, data: bytes, timestamp: int | str = None, **fields) -> tuple:
+        """
+        Insert a clipboard item, or bump the timestamp of identical content
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO clipboard_items (timestamp, type, data, thumbnail, hash, name, format_type, formatted_content, is_favorite)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                timestamp,
-                item_type,
-                data,
-                thumbnail,
-                data_hash,
-                name,
-                format_type,
-                formatted_content,
-                1 if is_favorite else 0,
-            ),
-        )
-        item_id = cursor.lastrowid
+        Identical content is detected by the UNIQUE dedup_key (kind, size
+        and full-content hash) in a single INSERT ... ON CONFLICT statement.
+        A duplicate keeps its row, tags and name; its timestamp is updated
+        and its copy_count incremented.
 
-        # Insert into FTS for searchability
-        if item_type == "text":
-            try:
-                text_content = data.decode("utf-8")
-                cursor.execute(
-                    """
-                    INSERT INTO clipboard_fts (rowid, content, name)
-                    VALUES (?, ?, ?)
-                    """,
-                    (item_id, text_content, name if name else ""),
-                )
-            except Exception as e:
-                logging.warning(
-                    f"Failed to index text item {item_id} in FTS: {e}"
-                )
-        elif item_type == "file":
-            # Index file items with their file name
+        Args:
+            item_type: Type of item (text, image/png, screenshot, etc.)
+            data: The actual data
+            timestamp: Epoch microseconds, datetime or ISO format timestamp (defaults to now)
+            **fields: Other keyword arguments of add_item. data_hash, if
+                given, must be the full-content hash of the deduplicated
+                bytes (file content for files, the path for directories)
+
+        Returns:
+            Tuple of (item ID, True if a new row was inserted)
+        """
+        return self._write_item(item_type, data, timestamp, dedup=True, **fields)
+
+    # Order of the values returned by _file_columns()
+    _FILE_COLUMNS = ("extension", "file_name", "file_size", "mime_type", "original_path", "is_directory")
+    # Columns of the row built by _item_row(), bound by name
+    _ITEM_COLUMNS = (
+        "timestamp", "type", "data", "thumbnail", "hash", "name", "format_type", "formatted_content",
+        "is_favorite", "blob_key", "preview", "text_length", "page_count", "kind",
+        *_FILE_COLUMNS,
+        "dedup_key", "data_codec", "formatted_codec",
+    )
+
+    _INSERT_ITEM_SQL = f"""
+        INSERT INTO clipboard_items ({", ".join(_ITEM_COLUMNS)})
+        VALUES ({", ".join(":" + column for column in _ITEM_COLUMNS)})
+        ON CONFLICT (dedup_key) DO UPDATE
+        SET timestamp = excluded.timestamp, copy_count = copy_count + 1
+    """
+
+    def _item_row(
+        self,
+        item_type: str,
+        data: bytes,
+        timestamp: int | str = None,
+        thumbnail: bytes = None,
+        data_hash: str = None,
+        name: str = None,
+        format_type: str = None,
+        formatted_content: bytes = None,
+        is_favorite: bool = False,
+        file_metadata: Optional[Dict] = None,
+        blob_key: Optional[str] = None,
+        dedup: bool = True,
+    ) -> tuple:
+        """
+        Build the column values of an item for _INSERT_ITEM_SQL.
+
+        Moves a large payload to the blob store and compresses the rest.
+
+        Returns:
+            Tuple of (dict of values by column name, (blob key, blob size) or None)
+        """
+        timestamp = now_us() if timestamp is None else to_epoch_us(timestamp)
+
+        if item_type != "file":
+            file_metadata = None
+        elif file_metadata is None:
             try:
-                # Extract file name from metadata
-                separator = b"\n---FILE_CONTENT---\n"
-                if separator in data:
-                    metadata_bytes, _ = data.split(separator, 1)
-                    metadata = json.loads(metadata_bytes.decode("utf-8"))
-                    file_name = metadata.get("name", "")
-
-                    # Index with file name as content and custom name (if any)
-                    cursor.execute(
-                        """
-                        INSERT INTO clipboard_fts (rowid, content, name)
-                        VALUES (?, ?, ?)
-                        """,
-                        (item_id, file_name, name if name else ""),
-                    )
+                file_metadata = self._parse_file_metadata(data)
             except Exception as e:
-                logging.warning(
-                    f"Failed to index file item {item_id} in FTS: {e}"
-                )
+                logging.warning(f"Failed to parse file metadata: {e}")
+
+        kind = self.item_kind(item_type)
+        if blob_key is not None:
+            # The content was streamed into the blob store; its key is its hash
+            data_hash = blob_key
+            blob_size = self.blob_store.size(blob_key)
+            dedup_key = self.dedup_key(kind, blob_size, data_hash) if dedup else None
+            stored_data = data
+        else:
+            # Calculate hash if not provided (for all item types). With dedup,
+            # a given hash is of the deduplicated bytes, which are also what
+            # goes to the blob store, so either way it doubles as the blob key
+            dedup_content = self._dedup_content(item_type, data, file_metadata)
+            content_hash = data_hash if dedup else None
+            if data_hash is None:
+                data_hash = content_hash = self.calculate_hash(dedup_content)
+            dedup_key = self.dedup_key(kind, len(dedup_content), data_hash) if dedup else None
+
+            stored_data, blob_key = self._externalize_payload(item_type, data, content_hash)
+            blob_size = len(data) - len(stored_data)
+        stored_data, data_codec = self._compress_data(kind, stored_data)
+        formatted_content, formatted_codec = self._compress_formatted(format_type, formatted_content)
+        preview, text_length, page_count = self._text_columns(item_type, data)
+        file_columns = self._file_columns(file_metadata)
+
+        values = {
+            "timestamp": timestamp,
+            "type": item_type,
+            "data": stored_data,
+            "thumbnail": thumbnail,
+            "hash": data_hash,
+            "name": name,
+            "format_type": format_type,
+            "formatted_content": formatted_content,
+            "is_favorite": 1 if is_favorite else 0,
+            "blob_key": blob_key,
+            "preview": preview,
+            "text_length": text_length,
+            "page_count": page_count,
+            "kind": kind,
+            **dict(zip(self._FILE_COLUMNS, file_columns)),
+            "dedup_key": dedup_key,
+            "data_codec": data_codec,
+            "formatted_codec": formatted_codec,
+        }
+        return values, ((blob_key, blob_size) if blob_key is not None else None)
 
-        self.conn.commit()
-        logging.info(
-            f"Added item to DB: ID={item_id}, Type={item_type}, Hash={data_hash[:16] if data_hash else 'None'}..., Timestamp={timestamp}"
-        )
-        return item_id
+    def _write_item(self, item_type: str, data: bytes, timestamp: int | str = None, **fields) -> tuple:
+        """Insert an item; with dedup, upsert it on its dedup_key (NULL never conflicts)"""
+        values, blob = self._item_row(item_type, data, timestamp, **fields)
+        timestamp, data_hash, text_length = values["timestamp"], values["hash"], values["text_length"]
+
+        cursor = self.conn.cursor()
+        if blob is not None:
+            cursor.execute("INSERT OR IGNORE INTO blobs (key, size) VALUES (?, ?)", blob)
+        cursor.execute(self._INSERT_ITEM_SQL + " RETURNING id, copy_count", values)
+        row = cursor.fetchone()
+        item_id, inserted = row["id"], row["copy_count"] == 1
+        if inserted and text_length is not None and text_length > self.TEXT_CHUNK_SIZE:
+            self._write_text_chunks(cursor, item_id, data)
+
+        self._commit()
+        if inserted:
+            logging.info(
+                f"Added item to DB: ID={item_id}, Type={item_type}, Hash={data_hash[:16] if data_hash else 'None'}..., Timestamp={timestamp}"
+            )
+        else:
+            logging.info(f"Updated duplicate item {item_id} (Type={item_type}) to Timestamp={timestamp}")
+            if blob is not None:
+                # The existing row may keep its payload inline
+                self._release_unreferenced_blobs()
+        return item_id, inserted
+
+    def add_items_bulk(self, items: List[Dict], dedup: bool = True) -> List[tuple]:
+        """
+        Insert many items in one transaction.
+
+        Rows are written with a single executemany (the full-text index
+        triggers run inside the same statement) and committed once, instead
+        of paying a statement round-trip and a commit per item.
+
+        Args:
+            items: Dicts with the arguments of add_item (item_type, data
+                and optionally timestamp, data_hash, name, file_metadata, ...)
+            dedup: Upsert on identical content like upsert_item; with False
+                every item is inserted like add_item
+
+        Returns:
+            List of (item ID, True if a new row was inserted), in the order
+            of items. A duplicate within the batch refers to its first copy.
+        """
+        if not items:
+            return []
+
+        prepared = [self._item_row(dedup=dedup, **item) for item in items]
+        rows = [values for values, _ in prepared]
+        blobs = [blob for _, blob in prepared if blob is not None]
+
+        cursor = self.conn.cursor()
+        cursor.executemany("INSERT OR IGNORE INTO blobs (key, size) VALUES (?, ?)", blobs)
+
+        if dedup:
+            keys = [values["dedup_key"] for values in rows]
+            existing = set(self._ids_by_dedup_key(cursor, keys))
+            cursor.executemany(self._INSERT_ITEM_SQL, rows)
+            ids = self._ids_by_dedup_key(cursor, keys)
+            results = []
+            for key in keys:
+                results.append((ids[key], key not in existing))
+                existing.add(key)
+        else:
+            last_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM clipboard_items").fetchone()[0]
+            cursor.executemany(self._INSERT_ITEM_SQL, rows)
+            # The writer connection is the only writer, so the new ids follow last_id in order
+            cursor.execute("SELECT id FROM clipboard_items WHERE id > ? ORDER BY id", (last_id,))
+            results = [(row["id"], True) for row in cursor.fetchall()]
+
+        for item, (values, _), (item_id, inserted) in zip(items, prepared, results):
+            text_length = values["text_length"]
+            if inserted and text_length is not None and text_length > self.TEXT_CHUNK_SIZE:
+                self._write_text_chunks(cursor, item_id, item["data"])
+
+        self._commit()
+        inserted_count = sum(1 for _, inserted in results if inserted)
+        logging.info(f"Bulk added {inserted_count} items ({len(items) - inserted_count} duplicates)")
+        if blobs and inserted_count < len(items):
+            self._release_unreferenced_blobs()
+        return results
+
+    @staticmethod
+    def _ids_by_dedup_key(cursor: sqlite3.Cursor, keys: List[str]) -> Dict[str, int]:
+        """Map the dedup keys that exist to their item IDs"""
+        ids = {}
+        unique = list(set(keys))
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            placeholders = ", ".join("?" for _ in batch)
+            cursor.execute(
+                f"SELECT dedup_key, id FROM clipboard_items WHERE dedup_key IN ({placeholders})",
+                batch,
+            )
+            ids.update({row["dedup_key"]: row["id"] for row in cursor.fetchall()})
+        return ids
 
     def cleanup_old_items(self, max_items: int) -> list:
         """
@@ -346,8 +2123,7 @@ class ClipboardDB:
         cursor = self.conn.cursor()
 
         # Count total non-favorite items
-        cursor.execute("SELECT COUNT(*) as total FROM clipboard_items WHERE is_favorite = 0")
-        total = cursor.fetchone()["total"]
+        total = self._count(self.conn, self.COUNTER_NON_FAVORITE)
 
         if total <= max_items:
             return []
@@ -376,12 +2152,13 @@ class ClipboardDB:
             f"DELETE FROM clipboard_items WHERE id IN ({placeholders})",
             ids_to_delete,
         )
-        self.conn.commit()
+        self._commit()
 
         logging.info(
             f"Retention cleanup: deleted {len(ids_to_delete)} oldest non-favorite items (limit: {max_items})"
         )
         self._cleanup_orphaned_pasted_records()
+        self._release_unreferenced_blobs()
 
         return ids_to_delete
 
@@ -416,12 +2193,13 @@ class ClipboardDB:
         )
 
         deleted_count = cursor.rowcount
-        self.conn.commit()
+        self._commit()
 
         if deleted_count > 0:
             logging.info(f"Bulk delete: removed {deleted_count} oldest non-favorite items")
             # Clean up orphaned recently_pasted records (belt-and-suspenders approach)
             self._cleanup_orphaned_pasted_records()
+            self._release_unreferenced_blobs()
 
         return deleted_count
 
@@ -441,7 +2219,7 @@ class ClipboardDB:
         """)
 
         orphaned_count = cursor.rowcount
-        self.conn.commit()
+        self._commit()
 
         if orphaned_count > 0:
             logging.info(f"Cleaned up {orphaned_count} orphaned recently_pasted records")
@@ -458,13 +2236,14 @@ class ClipboardDB:
         Returns:
             True if hash exists, False otherwise
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM clipboard_items WHERE hash = ?",
-            (data_hash,),
-        )
-        row = cursor.fetchone()
-        return row["count"] > 0
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) as count FROM clipboard_items WHERE hash = ?",
+                (data_hash,),
+            )
+            row = cursor.fetchone()
+            return row["count"] > 0
 
     def get_item_by_hash(self, data_hash: str) -> Optional[int]:
         """
@@ -476,16 +2255,17 @@ class ClipboardDB:
         Returns:
             Item ID if found, None otherwise
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT id FROM clipboard_items WHERE hash = ? ORDER BY id DESC LIMIT 1",
-            (data_hash,),
-        )
-        row = cursor.fetchone()
-        return row["id"] if row else None
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id FROM clipboard_items WHERE hash = ? ORDER BY id DESC LIMIT 1",
+                (data_hash,),
+            )
+            row = cursor.fetchone()
+            return row["id"] if row else None
 
     def update_timestamp(
-        self, item_id: int, new_timestamp: str = None
+        self, item_id: int, new_timestamp: int | str = None
     ) -> bool:
         """
         Update the timestamp of an existing item
@@ -497,8 +2277,7 @@ class ClipboardDB:
         Returns:
             True if updated, False otherwise
         """
-        if new_timestamp is None:
-            new_timestamp = datetime.now().isoformat()
+        new_timestamp = now_us() if new_timestamp is None else to_epoch_us(new_timestamp)
 
         cursor = self.conn.cursor()
         cursor.execute(
@@ -509,87 +2288,271 @@ class ClipboardDB:
             """,
             (new_timestamp, item_id),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount > 0
 
+    @classmethod
+    def _list_columns(cls, alias: str = "") -> str:
+        """
+        Build the select list used by list queries.
+
+        List views only need a text preview, the full text length and page
+        count, the metadata columns of file items and the thumbnail, so the
+        data BLOB itself is never returned. Full payloads come from get_item,
+        get_text_page and read_blob.
+
+        Text columns are precomputed at ingest; rows that have not been
+        backfilled yet fall back to computing them from the data column.
+
+        Args:
+            alias: Optional table alias of clipboard_items
+
+        Returns:
+            Comma-separated SQL column expressions
+        """
+        p = f"{alias}." if alias else ""
+        return f"""{p}id, {p}timestamp, {p}type, {p}thumbnail, {p}name, {p}format_type,
+                {p}formatted_content, {p}formatted_codec, {p}is_favorite, {p}blob_key,
+                {p}extension, {p}file_name, {p}file_size, {p}mime_type, {p}original_path, {p}is_directory,
+                COALESCE({p}preview, CASE WHEN {p}type IN ('text', 'url')
+                    THEN substr(CAST({p}data AS TEXT), 1, {cls.PREVIEW_LENGTH}) END) AS preview,
+                COALESCE({p}text_length, CASE WHEN {p}type IN ('text', 'url')
+                    THEN length(CAST({p}data AS TEXT)) END) AS total_length,
+                COALESCE({p}page_count, CASE WHEN {p}type IN ('text', 'url')
+                    THEN max(1, (length(CAST({p}data AS TEXT)) + {cls.PREVIEW_LENGTH - 1}) / {cls.PREVIEW_LENGTH})
+                    END) AS total_pages"""
+
+    def _list_item(self, row: sqlite3.Row) -> Dict:
+        """Convert a row selected with _list_columns() into an item dict"""
+        return {
+            "id": row["id"],
+            "timestamp": row["timestamp"],
+            "type": row["type"],
+            "preview": row["preview"],
+            "total_length": row["total_length"],
+            "total_pages": row["total_pages"],
+            "file_metadata": self._file_metadata(row),
+            "thumbnail": row["thumbnail"],
+            "name": row["name"],
+            "format_type": row["format_type"],
+            "formatted_content": self.codec.decompress(row["formatted_content"], row["formatted_codec"]),
+            "is_favorite": bool(row["is_favorite"]),
+            "blob_key": row["blob_key"],
+        }
+
+    @staticmethod
+    def item_kind(item_type: str) -> str:
+        """Normalize an item type to the kind filters work on (text, url, image, file)"""
+        if item_type.startswith("image/") or item_type == "screenshot":
+            return "image"
+        return item_type
+
+    @staticmethod
+    def normalize_extension(extension: Optional[str]) -> Optional[str]:
+        """Normalize a file extension to lowercase with a leading dot ('PDF' -> '.pdf')"""
+        if not extension or not extension.strip("."):
+            return None
+        return "." + extension.lstrip(".").lower()
+
+    @classmethod
+    def _parse_file_metadata(cls, data: bytes) -> Optional[Dict]:
+        """Parse the JSON header of a file payload, or None if it has none"""
+        if cls.FILE_SEPARATOR not in data:
+            return None
+        metadata_bytes, _ = data.split(cls.FILE_SEPARATOR, 1)
+        return json.loads(metadata_bytes.decode("utf-8"))
+
+    @classmethod
+    def _file_columns(cls, metadata: Optional[Dict]) -> tuple:
+        """
+        Map file metadata to the structured file columns.
+
+        Returns:
+            Tuple of (extension, file_name, file_size, mime_type,
+            original_path, is_directory), all None without metadata
+        """
+        if metadata is None:
+            return None, None, None, None, None, None
+        return (
+            cls.normalize_extension(metadata.get("extension")),
+            metadata.get("name", ""),
+            metadata.get("size"),
+            metadata.get("mime_type"),
+            metadata.get("original_path"),
+            1 if metadata.get("is_directory") else 0,
+        )
+
+    @staticmethod
+    def _file_metadata(row: sqlite3.Row) -> Optional[Dict]:
+        """Build the metadata dict of a file item from its structured columns"""
+        if row["type"] != "file" or row["file_name"] is None:
+            return None
+        return {
+            "name": row["file_name"],
+            "size": row["file_size"],
+            "mime_type": row["mime_type"],
+            "extension": row["extension"] or "",
+            "original_path": row["original_path"],
+            "is_directory": bool(row["is_directory"]),
+        }
+
+    def _filter_clauses(self, filters: Optional[List[str]], alias: str = "") -> tuple:
+        """
+        Compile UI filter strings into WHERE terms on indexed columns.
+
+        Content filters ("text", "image", "url", "file", "favorite" and file
+        extensions such as "file:.pdf" or ".pdf") are OR-ed together and seek
+        on the kind, extension and is_favorite indexes. Any other string is
+        a tag name; tag filters are AND-ed with the content filters.
+
+        Args:
+            filters: List of filter strings
+            alias: Optional table alias of clipboard_items
+
+        Returns:
+            Tuple of (list of SQL terms to AND together, list of parameters)
+        """
+        p = f"{alias}." if alias else ""
+        kinds = []
+        extensions = []
+        favorite = False
+        tag_filters = []
+
+        for f in filters or []:
+            if self._is_tag_filter(f):
+                tag_filters.append(f)
+            elif f == "favorite":
+                favorite = True
+            elif f.startswith("file:") or f.startswith("."):
+                extension = self.normalize_extension(f[5:] if f.startswith("file:") else f)
+                if extension:
+                    extensions.append(extension)
+            else:
+                kinds.append(f)
+
+        clauses = []
+        params = []
+
+        content_filters = []
+        if kinds:
+            content_filters.append(f"{p}kind IN ({','.join('?' * len(kinds))})")
+            params.extend(kinds)
+        if extensions:
+            content_filters.append(f"{p}extension IN ({','.join('?' * len(extensions))})")
+            params.extend(extensions)
+        if favorite:
+            content_filters.append(f"{p}is_favorite = 1")
+        if content_filters:
+            clauses.append(f"({' OR '.join(content_filters)})")
+
+        if tag_filters:
+            tag_placeholders = ",".join("?" * len(tag_filters))
+            clauses.append(
+                f"""{p}id IN (
+                    SELECT item_id FROM item_tags
+                    WHERE tag_id IN (
+                        SELECT id FROM tags WHERE name IN ({tag_placeholders})
+                    )
+                )"""
+            )
+            params.extend(tag_filters)
+
+        return clauses, params
+
+    @staticmethod
+    def _is_tag_filter(f: str) -> bool:
+        """True for filter strings naming a tag rather than content"""
+        return (
+            f not in ("text", "image", "url", "file", "favorite")
+            and not f.startswith("file:")
+            and not f.startswith(".")
+        )
+
+    @staticmethod
+    def history_cursor(items: List[Dict]) -> Optional[Dict]:
+        """
+        Build the keyset cursor that continues after a page from get_items.
+
+        Args:
+            items: Page returned by get_items
+
+        Returns:
+            Cursor dict, or None for an empty page
+        """
+        if not items:
+            return None
+        last = items[-1]
+        return {"timestamp": last["timestamp"], "id": last["id"]}
+
+    @staticmethod
+    def pasted_cursor(items: List[Dict]) -> Optional[Dict]:
+        """
+        Build the keyset cursor that continues after a page from get_recently_pasted.
+
+        Args:
+            items: Page returned by get_recently_pasted
+
+        Returns:
+            Cursor dict, or None for an empty page
+        """
+        if not items:
+            return None
+        last = items[-1]
+        return {"timestamp": last["pasted_timestamp"], "id": last["id"]}
+
     def get_items(
         self,
         limit: int = 100,
         offset: int = 0,
         sort_order: str = "DESC",
         filters: List[str] = None,
+        cursor: Optional[Dict] = None,
     ) -> List[Dict]:
         """
-        Get clipboard items (sorted by timestamp)
+        Get clipboard items (sorted by timestamp, then ID)
+
+        Pages can be addressed either by offset or, cheaper for deep pages,
+        by a keyset cursor: the (timestamp, id) of the last item of the
+        previous page, as returned by history_cursor(). A cursor takes
+        precedence over offset.
 
         Args:
             limit: Maximum number of items to return
             offset: Number of items to skip
             sort_order: "DESC" for newest first, "ASC" for oldest first
             filters: List of filter strings (e.g., ["text", "image", ".pdf", "MyTag"])
+            cursor: Optional {"timestamp": ..., "id": ...} to continue after
 
         Returns:
-            List of items as dicts with 'id', 'timestamp', 'type', 'data', 'thumbnail', 'tags'
+            List of items as dicts with 'id', 'timestamp', 'type', 'preview',
+            'total_length', 'file_metadata', 'thumbnail', 'tags' (no payload)
         """
-        cursor = self.conn.cursor()
         # Validate sort_order to prevent SQL injection
         if sort_order not in ["DESC", "ASC"]:
             sort_order = "DESC"
 
-        # Build WHERE clause from filters
-        where_clauses = []
-        query_params = []
-
-        if filters:
-            # Separate filters into categories
-            type_filters = []
-            tag_filters = []
-
-            for f in filters:
-                if f in ["text", "image", "url", "file", "favorite"]:
-                    # Content type filters
-                    if f == "text":
-                        type_filters.append("type = 'text'")
-                    elif f == "image":
-                        type_filters.append(
-                            "(type LIKE 'image/%' OR type = 'screenshot')"
-                        )
-                    elif f == "url":
-                        type_filters.append("type = 'url'")
-                    elif f == "file":
-                        type_filters.append("type = 'file'")
-                    elif f == "favorite":
-                        type_filters.append("is_favorite = 1")
-                elif f.startswith("file:"):
-                    # File extension filter (format: "file:pdf", "file:docx", etc.)
-                    ext = f[5:]  # Remove "file:" prefix
-                    type_filters.append("type LIKE ?")
-                    query_params.append(f"%{ext}%")
-                elif f.startswith("."):
-                    # File extension filter (format: ".pdf", ".docx", etc.)
-                    type_filters.append("type LIKE ?")
-                    query_params.append(f"%{f}%")
-                else:
-                    # Custom tag filter
-                    tag_filters.append(f)
-
-            # Combine type filters with OR
-            if type_filters:
-                where_clauses.append(f"({' OR '.join(type_filters)})")
-
-            # Handle tag filters
-            if tag_filters:
-                # Build subquery for tags
-                tag_placeholders = ",".join("?" * len(tag_filters))
-                where_clauses.append(
-                    f"""id IN (
-                    SELECT item_id FROM item_tags
-                    WHERE tag_id IN (
-                        SELECT id FROM tags WHERE name IN ({tag_placeholders})
-                    )
-                )"""
-                )
-                query_params.extend(tag_filters)
+        # A single tag is read from item_tags, whose index holds the tagged
+        # items in history order; other filters go through _filter_clauses
+        tags = [f for f in filters or [] if self._is_tag_filter(f)]
+        if len(tags) == 1:
+            where_clauses, query_params = self._filter_clauses(
+                [f for f in filters if f not in tags], "ci"
+            )
+            where_clauses.insert(0, "it.tag_id = (SELECT id FROM tags WHERE name = ?)")
+            query_params.insert(0, tags[0])
+            source = "item_tags it CROSS JOIN clipboard_items ci ON ci.id = it.item_id"
+            order_columns = ("it.item_timestamp", "it.item_id")
+        else:
+            where_clauses, query_params = self._filter_clauses(filters, "ci")
+            source = "clipboard_items ci"
+            order_columns = ("ci.timestamp", "ci.id")
+
+        # Seek past the previous page instead of skipping rows
+        if cursor:
+            comparison = "<" if sort_order == "DESC" else ">"
+            where_clauses.append(f"({', '.join(order_columns)}) {comparison} (?, ?)")
+            query_params.extend([to_epoch_us(cursor["timestamp"]), cursor["id"]])
+            offset = 0
 
         # Build final query
         where_clause = ""
@@ -597,10 +2560,10 @@ class ClipboardDB:
             where_clause = "WHERE " + " AND ".join(where_clauses)
 
         query = f"""
-            SELECT id, timestamp, type, data, thumbnail, name, format_type, formatted_content, is_favorite
-            FROM clipboard_items
+            SELECT {self._list_columns("ci")}
+            FROM {source}
             {where_clause}
-            ORDER BY timestamp {sort_order}
+            ORDER BY {order_columns[0]} {sort_order}, {order_columns[1]} {sort_order}
             LIMIT ? OFFSET ?
         """
 
@@ -611,56 +2574,66 @@ class ClipboardDB:
         logging.info(f"[FILTER DB] WHERE clause: {where_clause}")
         logging.info(f"[FILTER DB] Query params: {query_params}")
 
-        cursor.execute(query, tuple(query_params))
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, tuple(query_params))
 
-        items = []
-        for row in cursor.fetchall():
-            item_id = row["id"]
-            # Get tags for this item
-            tags = self.get_tags_for_item(item_id)
-            items.append(
-                {
-                    "id": item_id,
+            items = [self._list_item(row) for row in cursor.fetchall()]
+            return self._attach_tags(items)
+
+    def get_list_item(self, item_id: int) -> Optional[Dict]:
+        """
+        Get a single item as list queries return it (no payload)
+
+        Used to push a new or updated item to the UI without reading its data.
+
+        Returns:
+            Item dict like those of get_items(), or None if not found
+        """
+        with self._reader() as conn:
+            row = conn.execute(
+                f"SELECT {self._list_columns()} FROM clipboard_items WHERE id = ?", (item_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return self._attach_tags([self._list_item(row)])[0]
+
+    def get_item(self, item_id: int) -> Optional[Dict]:
+        """Get a single item by ID"""
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, timestamp, type, data, thumbnail, name, format_type, formatted_content, is_favorite, hash, blob_key,
+                       extension, file_name, file_size, mime_type, original_path, is_directory,
+                       data_codec, formatted_codec
+                FROM clipboard_items
+                WHERE id = ?
+            """,
+                (item_id,),
+            )
+
+            row = cursor.fetchone()
+            if row:
+                return {
+                    "id": row["id"],
                     "timestamp": row["timestamp"],
                     "type": row["type"],
-                    "data": row["data"],
+                    "data": self._load_payload(
+                        self.codec.decompress(row["data"], row["data_codec"]), row["blob_key"]
+                    ),
                     "thumbnail": row["thumbnail"],
                     "name": row["name"],
                     "format_type": row["format_type"],
-                    "formatted_content": row["formatted_content"],
+                    "formatted_content": self.codec.decompress(
+                        row["formatted_content"], row["formatted_codec"]
+                    ),
                     "is_favorite": bool(row["is_favorite"]),
-                    "tags": tags,
+                    "hash": row["hash"],
+                    "blob_key": row["blob_key"],
+                    "file_metadata": self._file_metadata(row),
                 }
-            )
-        return items
-
-    def get_item(self, item_id: int) -> Optional[Dict]:
-        """Get a single item by ID"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, timestamp, type, data, thumbnail, name, format_type, formatted_content, is_favorite, hash
-            FROM clipboard_items
-            WHERE id = ?
-        """,
-            (item_id,),
-        )
-
-        row = cursor.fetchone()
-        if row:
-            return {
-                "id": row["id"],
-                "timestamp": row["timestamp"],
-                "type": row["type"],
-                "data": row["data"],
-                "thumbnail": row["thumbnail"],
-                "name": row["name"],
-                "format_type": row["format_type"],
-                "formatted_content": row["formatted_content"],
-                "is_favorite": bool(row["is_favorite"]),
-                "hash": row["hash"],
-            }
-        return None
+            return None
 
     def get_text_page(self, item_id: int, page: int = 0, page_size: int = 500) -> Optional[Dict]:
         """Get a single page of text content for a clipboard item.
@@ -673,20 +2646,41 @@ class ClipboardDB:
         Returns:
             Dict with content, page, total_pages, total_length or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT type, data FROM clipboard_items WHERE id = ?",
-            (item_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
+        with self._reader() as conn:
+            # Long texts: read only the chunks the page overlaps. The length
+            # comes from the last chunk; reading text_length from the item
+            # row would walk past its whole data column.
+            last_chunk = conn.execute(
+                "SELECT seq, length FROM text_chunks WHERE item_id = ? ORDER BY seq DESC LIMIT 1",
+                (item_id,),
+            ).fetchone()
+            if last_chunk:
+                total_length = last_chunk["seq"] * self.TEXT_CHUNK_SIZE + last_chunk["length"]
+                total_pages = max(1, math.ceil(total_length / page_size))
+                page = max(0, min(page, total_pages - 1))
+                start = page * page_size
+                end = min(start + page_size, total_length)
+                first = start // self.TEXT_CHUNK_SIZE
+                chunks = "".join(
+                    self._read_text_chunks(conn, item_id, first, max(end - 1, start) // self.TEXT_CHUNK_SIZE)
+                )
+                offset = start - first * self.TEXT_CHUNK_SIZE
+                return {
+                    "content": chunks[offset:offset + end - start],
+                    "page": page,
+                    "total_pages": total_pages,
+                    "total_length": total_length,
+                }
 
-        item_type = row["type"]
-        if item_type not in ("text", "url"):
+            # Short texts, and long texts not chunked yet
+            row = conn.execute(
+                "SELECT type, data, data_codec FROM clipboard_items WHERE id = ?",
+                (item_id,),
+            ).fetchone()
+        if not row or row["type"] not in ("text", "url"):
             return None
 
-        data = row["data"]
+        data = self.codec.decompress(row["data"], row["data_codec"])
         full_text = data.decode("utf-8") if isinstance(data, bytes) else data
         total_length = len(full_text)
         total_pages = max(1, math.ceil(total_length / page_size))
@@ -705,6 +2699,66 @@ class ClipboardDB:
             "total_length": total_length,
         }
 
+    def find_text_match_page(self, item_id: int, terms: List[str], page_size: int = 500) -> int:
+        """Find the page of a text item holding the earliest match of any term.
+
+        Long texts are scanned chunk by chunk; shorter texts (at most
+        TEXT_CHUNK_SIZE characters) are decoded whole. Matching is
+        case-insensitive, with Unicode case folding.
+
+        Args:
+            item_id: ID of the item
+            terms: Search terms (words or phrases)
+            page_size: Characters per page
+
+        Returns:
+            Page number (0-indexed) containing the earliest match, or 0 if no match
+        """
+        terms = [term for term in terms if term]
+        if not terms:
+            return 0
+
+        with self._reader() as conn:
+            position = self._find_in_chunks(conn, item_id, terms)
+            if position is None:
+                row = conn.execute(
+                    "SELECT data, data_codec FROM clipboard_items WHERE id = ? AND type IN ('text', 'url')",
+                    (item_id,),
+                ).fetchone()
+                if not row:
+                    return 0
+                data = self.codec.decompress(row["data"], row["data_codec"])
+                text = (data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data).lower()
+                hits = [pos for pos in (text.find(term.lower()) for term in terms) if pos >= 0]
+                position = min(hits) if hits else -1
+        return position // page_size if position >= 0 else 0
+
+    def _find_in_chunks(self, conn: sqlite3.Connection, item_id: int, terms: List[str]) -> Optional[int]:
+        """
+        Character position of the earliest match of any term in a chunked text.
+
+        Chunks are decoded in order and the scan stops at the first chunk
+        holding a match; the tail of the previous chunk is carried over so
+        matches spanning a chunk boundary are found.
+
+        Returns:
+            Position, -1 if no term matches, or None if the item has no chunks
+        """
+        needles = [term.lower() for term in terms]
+        overlap = max(len(needle) for needle in needles) - 1
+        carried = ""
+        offset = 0
+        found_chunks = False
+        for chunk in self._read_text_chunks(conn, item_id):
+            found_chunks = True
+            window = (carried + chunk).lower()
+            hits = [pos for pos in (window.find(needle) for needle in needles) if pos >= 0]
+            if hits:
+                return offset - len(carried) + min(hits)
+            carried = chunk[len(chunk) - overlap:] if overlap else ""
+            offset += len(chunk)
+        return -1 if found_chunks else None
+
     def update_thumbnail(self, item_id: int, thumbnail: bytes) -> bool:
         """Update thumbnail for an item"""
         cursor = self.conn.cursor()
@@ -716,67 +2770,28 @@ class ClipboardDB:
         """,
             (thumbnail, item_id),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount > 0
 
     def delete_item(self, item_id: int) -> bool:
         """Delete an item by ID"""
         cursor = self.conn.cursor()
-        # Delete from FTS first (if exists)
-        try:
-            cursor.execute(
-                "DELETE FROM clipboard_fts WHERE rowid = ?", (item_id,)
-            )
-        except Exception as e:
-            logging.warning(
-                f"Failed to delete FTS entry for item {item_id}: {e}"
-            )
-        # Delete from main table
+        # The FTS entry is removed by a trigger
         cursor.execute("DELETE FROM clipboard_items WHERE id = ?", (item_id,))
-        self.conn.commit()
-        return cursor.rowcount > 0
+        self._commit()
+        deleted = cursor.rowcount > 0
+        if deleted:
+            self._release_unreferenced_blobs()
+        return deleted
 
     def update_item_name(self, item_id: int, name: str) -> bool:
-        """Update the name of an item"""
+        """Update the name of an item (the FTS entry follows via trigger)"""
         cursor = self.conn.cursor()
         cursor.execute(
             "UPDATE clipboard_items SET name = ? WHERE id = ?",
             (name if name else None, item_id),
         )
-
-        # Also update FTS table.
-        # We need to get the item's content to potentially re-insert/update FTS.
-        cursor.execute(
-            "SELECT type, data FROM clipboard_items WHERE id = ?", (item_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            item_type = row["type"]
-            item_data = row["data"]
-
-            fts_content = ""
-            if item_type == "text":
-                fts_content = item_data.decode("utf-8")
-            elif item_type == "file":
-                # Extract filename from file metadata
-                separator = b"\n---FILE_CONTENT---\n"
-                if separator in item_data:
-                    metadata_bytes, _ = item_data.split(separator, 1)
-                    metadata = json.loads(metadata_bytes.decode("utf-8"))
-                    fts_content = metadata.get("name", "") # Index file name as content
-
-            try:
-                # Use INSERT OR REPLACE to update or insert the FTS entry
-                cursor.execute(
-                    "INSERT OR REPLACE INTO clipboard_fts (rowid, content, name) VALUES (?, ?, ?)",
-                    (item_id, fts_content, name if name else ""),
-                )
-            except Exception as e:
-                logging.warning(
-                    f"Failed to update FTS for item {item_id} with name '{name}': {e}"
-                )
-
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount > 0
 
     def toggle_favorite(self, item_id: int, is_favorite: bool) -> bool:
@@ -795,7 +2810,7 @@ class ClipboardDB:
             "UPDATE clipboard_items SET is_favorite = ? WHERE id = ?",
             (1 if is_favorite else 0, item_id),
         )
-        self.conn.commit()
+        self._commit()
         success = cursor.rowcount > 0
         if success:
             logging.info(f"Toggled favorite for item {item_id}: is_favorite={is_favorite}")
@@ -804,55 +2819,47 @@ class ClipboardDB:
     def clear_all(self):
         """Clear all items from database"""
         cursor = self.conn.cursor()
-        # Clear FTS table first
-        try:
-            cursor.execute("DELETE FROM clipboard_fts")
-        except Exception as e:
-            logging.warning(f"Failed to clear FTS table: {e}")
-        # Clear main table
+        # FTS entries are removed by a trigger
         cursor.execute("DELETE FROM clipboard_items")
-        self.conn.commit()
+        self._commit()
+        self._release_unreferenced_blobs()
 
     def get_latest_id(self) -> Optional[int]:
         """Get the ID of the most recent item"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT MAX(id) as max_id FROM clipboard_items")
-        row = cursor.fetchone()
-        return row["max_id"] if row["max_id"] is not None else None
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT MAX(id) as max_id FROM clipboard_items")
+            row = cursor.fetchone()
+            return row["max_id"] if row["max_id"] is not None else None
 
     def get_total_count(self) -> int:
         """Get total count of clipboard items"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT COUNT(*) as count FROM clipboard_items")
-        row = cursor.fetchone()
-        return row["count"] if row else 0
+        with self._reader() as conn:
+            return self._count(conn, self.COUNTER_ITEMS)
 
     def get_pasted_count(self) -> int:
-        """Get total count of pasted items (excluding orphaned records)"""
-        cursor = self.conn.cursor()
-        # Only count pasted records that still have a valid clipboard item
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM recently_pasted rp
-            INNER JOIN clipboard_items ci ON rp.clipboard_item_id = ci.id
-        """)
-        row = cursor.fetchone()
-        return row["count"] if row else 0
+        """Get the number of items in the pasted tab (each pasted item once)"""
+        with self._reader() as conn:
+            return self._count(conn, self.COUNTER_PASTED)
 
     def add_pasted_item(
-        self, clipboard_item_id: int, pasted_timestamp: str = None
+        self, clipboard_item_id: int, pasted_timestamp: int | str = None
     ) -> int:
         """
         Record when a clipboard item was pasted
 
+        Appends to the paste log, dropping the oldest events beyond
+        PASTE_LOG_MAX_ROWS, and updates the item's last_pasted and
+        paste_count, which the pasted tab reads.
+
         Args:
             clipboard_item_id: ID of the clipboard item that was pasted
-            pasted_timestamp: ISO format timestamp (defaults to now)
+            pasted_timestamp: Epoch microseconds, datetime or ISO format timestamp (defaults to now)
 
         Returns:
             The ID of the pasted record
         """
-        if pasted_timestamp is None:
-            pasted_timestamp = datetime.now().isoformat()
+        pasted_timestamp = now_us() if pasted_timestamp is None else to_epoch_us(pasted_timestamp)
 
         cursor = self.conn.cursor()
         cursor.execute(
@@ -862,110 +2869,78 @@ class ClipboardDB:
         """,
             (clipboard_item_id, pasted_timestamp),
         )
-        self.conn.commit()
         pasted_id = cursor.lastrowid
+        cursor.execute(
+            "DELETE FROM recently_pasted WHERE id <= ?",
+            (pasted_id - self.PASTE_LOG_MAX_ROWS,),
+        )
+        cursor.execute(
+            """
+            UPDATE clipboard_items
+            SET last_pasted = max(coalesce(last_pasted, ?), ?), paste_count = paste_count + 1
+            WHERE id = ?
+            """,
+            (pasted_timestamp, pasted_timestamp, clipboard_item_id),
+        )
+        self._commit()
         logging.info(
             f"Recorded paste: Item ID={clipboard_item_id}, Pasted ID={pasted_id}, Timestamp={pasted_timestamp}"
         )
         return pasted_id
 
     def get_recently_pasted(
-        self, limit: int = 100, offset: int = 0, sort_order: str = "DESC", filters: List[str] = None
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        sort_order: str = "DESC",
+        filters: List[str] = None,
+        cursor: Optional[Dict] = None,
     ) -> List[Dict]:
         """
-        Get recently pasted items (sorted by pasted timestamp) with JOIN to clipboard_items
+        Get pasted items, each once, by the time they were last pasted
+
+        Reads the per-item rollup kept by add_pasted_item, not the paste
+        log. Like get_items, accepts a keyset cursor (the pasted_timestamp
+        and item ID of the last row, see pasted_cursor()) instead of an offset.
 
         Args:
             limit: Maximum number of items to return
             offset: Number of items to skip
             sort_order: "DESC" for newest first, "ASC" for oldest first
             filters: List of filter strings (e.g., ["text", "image", "url", "file", "MyTag"])
+            cursor: Optional {"timestamp": ..., "id": ...} to continue after
 
         Returns:
-            List of pasted items with full clipboard item data
+            List of items with the list-view columns, 'pasted_timestamp'
+            (last paste) and 'paste_count'
         """
-        cursor = self.conn.cursor()
         # Validate sort_order to prevent SQL injection
         if sort_order not in ["DESC", "ASC"]:
             sort_order = "DESC"
 
-        # Build WHERE clause from filters (same logic as get_items)
-        where_clauses = []
-        query_params = []
-
-        if filters:
-            # Separate filters into categories
-            type_filters = []
-            tag_filters = []
-
-            for f in filters:
-                if f in ["text", "image", "url", "file", "favorite"]:
-                    # Content type filters
-                    if f == "text":
-                        type_filters.append("ci.type = 'text'")
-                    elif f == "image":
-                        type_filters.append(
-                            "(ci.type LIKE 'image/%' OR ci.type = 'screenshot')"
-                        )
-                    elif f == "url":
-                        type_filters.append("ci.type = 'url'")
-                    elif f == "file":
-                        type_filters.append("ci.type = 'file'")
-                    elif f == "favorite":
-                        type_filters.append("ci.is_favorite = 1")
-                elif f.startswith("file:"):
-                    # File extension filter (format: "file:pdf", "file:docx", etc.)
-                    ext = f[5:]  # Remove "file:" prefix
-                    type_filters.append("ci.type LIKE ?")
-                    query_params.append(f"%{ext}%")
-                elif f.startswith("."):
-                    # File extension filter (format: ".pdf", ".docx", etc.")
-                    type_filters.append("ci.type LIKE ?")
-                    query_params.append(f"%{f}%")
-                else:
-                    # Custom tag filter
-                    tag_filters.append(f)
-
-            # Combine type filters with OR
-            if type_filters:
-                where_clauses.append(f"({' OR '.join(type_filters)})")
-
-            # Handle tag filters
-            if tag_filters:
-                # Build subquery for tags
-                tag_placeholders = ",".join("?" * len(tag_filters))
-                where_clauses.append(
-                    f"""ci.id IN (
-                    SELECT item_id FROM item_tags
-                    WHERE tag_id IN (
-                        SELECT id FROM tags WHERE name IN ({tag_placeholders})
-                    )
-                )"""
-                )
-                query_params.extend(tag_filters)
+        # Build WHERE clause from filters
+        where_clauses, query_params = self._filter_clauses(filters, "ci")
+        where_clauses.insert(0, "ci.last_pasted IS NOT NULL")
 
-        # Build final query
-        where_clause = ""
-        if where_clauses:
-            where_clause = "WHERE " + " AND ".join(where_clauses)
+        # Seek past the previous page instead of skipping rows
+        if cursor:
+            comparison = "<" if sort_order == "DESC" else ">"
+            where_clauses.append(f"(ci.last_pasted, ci.id) {comparison} (?, ?)")
+            query_params.extend([to_epoch_us(cursor["timestamp"]), cursor["id"]])
+            offset = 0
+
+        where_clause = "WHERE " + " AND ".join(where_clauses)
 
+        # Pasted items are a small part of the history: filters are checked
+        # while walking them in paste order rather than seeking their own index
         query = f"""
             SELECT
-                rp.id as paste_id,
-                rp.pasted_timestamp,
-                ci.id,
-                ci.timestamp,
-                ci.type,
-                ci.data,
-                ci.thumbnail,
-                ci.name,
-                ci.format_type,
-                ci.formatted_content,
-                ci.is_favorite
-            FROM recently_pasted rp
-            INNER JOIN clipboard_items ci ON rp.clipboard_item_id = ci.id
+                ci.last_pasted AS pasted_timestamp,
+                ci.paste_count,
+                {self._list_columns("ci")}
+            FROM clipboard_items ci INDEXED BY idx_last_pasted_id
             {where_clause}
-            ORDER BY rp.pasted_timestamp {sort_order}
+            ORDER BY ci.last_pasted {sort_order}, ci.id {sort_order}
             LIMIT ? OFFSET ?
         """
 
@@ -976,184 +2951,137 @@ class ClipboardDB:
         logging.info(f"[FILTER DB PASTED] WHERE clause: {where_clause}")
         logging.info(f"[FILTER DB PASTED] Query params: {query_params}")
 
-        cursor.execute(query, tuple(query_params))
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, tuple(query_params))
 
-        items = []
-        for row in cursor.fetchall():
-            item_id = row["id"]
-            # Get tags for this item
-            tags = self.get_tags_for_item(item_id)
-            items.append(
+            items = [
                 {
-                    "paste_id": row["paste_id"],
                     "pasted_timestamp": row["pasted_timestamp"],
-                    "id": item_id,
-                    "timestamp": row["timestamp"],
-                    "type": row["type"],
-                    "data": row["data"],
-                    "thumbnail": row["thumbnail"],
-                    "name": row["name"],
-                    "format_type": row["format_type"],
-                    "formatted_content": row["formatted_content"],
-                    "is_favorite": bool(row["is_favorite"]),
-                    "tags": tags,
+                    "paste_count": row["paste_count"],
+                    **self._list_item(row),
                 }
-            )
-        return items
+                for row in cursor.fetchall()
+            ]
+            return self._attach_tags(items)
+
+    @staticmethod
+    def _query_parts(query: str) -> List[str]:
+        """
+        Split a search query into terms.
+
+        A query wrapped entirely in quotes is one phrase; otherwise quoted
+        phrases are kept together and other words are split on spaces.
+        Example: hello "world foo" bar → ['hello', 'world foo', 'bar']
+        """
+        if len(query) > 1 and query.startswith('"') and query.endswith('"'):
+            parts = [query[1:-1]]
+        else:
+            parts = [part.strip('"') for part in re.findall(r'"[^"]+"|\S+', query)]
+        return [part for part in parts if part]
+
+    @staticmethod
+    def _fts_phrase(term: str) -> str:
+        """Quote a term as an FTS5 phrase, escaping embedded quotes"""
+        return '"' + term.replace('"', '""') + '"'
+
+    @staticmethod
+    def _like_pattern(term: str) -> str:
+        """Build a LIKE pattern matching term anywhere, escaping wildcards"""
+        escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"%{escaped}%"
 
     def search_items(
-        self, query: str, limit: int = 100, filters: List[str] = None
+        self, query: str, limit: int = 100, filters: List[str] = None, mode: str = "token"
     ) -> List[Dict]:
         """
         Search clipboard items using full-text search
 
+        Token mode matches whole words from the unicode61 index. Substring
+        mode matches any part of a word (e.g. "ashboar" finds "dashboard")
+        from the trigram index, which covers the first
+        FTS_INDEXES["clipboard_fts_trigram"][2] characters of each text;
+        terms shorter than a trigram are checked with LIKE on the rows the
+        trigram terms matched. A query made only of such short terms
+        matches word prefixes from the unicode61 index instead of scanning
+        every row. All terms must appear, in any order.
+
         Args:
             query: Search query string
             limit: Maximum number of results to return
             filters: List of filter strings (e.g., ["text", "image", "file:pdf", "MyTag"])
+            mode: "token" or "substring"
 
         Returns:
             List of matching items sorted by relevance (BM25 rank)
         """
+        if mode not in self.SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}")
         if not query or not query.strip():
             return []
 
-        # Build FTS5 query:
-        # - If user wraps in quotes: exact phrase search
-        # - Multiple words without quotes: ALL words must appear (AND), any order
-        # - FTS5 BM25 ranks by relevance (more occurrences = higher score)
-
         query = query.strip()
+        parts = self._query_parts(query)
+        if not parts:
+            return []
 
-        # Check if user wrapped entire query in quotes for exact phrase
-        if query.startswith('"') and query.endswith('"'):
-            # User wants exact phrase - use as-is
-            fts_query = query
-        else:
-            # Parse query: respect quoted phrases but split unquoted words
-            # Example: hello "world foo" bar → hello AND "world foo" AND bar
-            # Split on spaces but keep quoted phrases together
-            parts = re.findall(r'"[^"]+"|\S+', query)
-
-            # Wrap non-quoted words in quotes to escape special chars
-            fts_parts = []
-            for part in parts:
-                if part.startswith('"') and part.endswith('"'):
-                    # Already quoted phrase
-                    fts_parts.append(part)
-                else:
-                    # Individual word - quote it
-                    fts_parts.append(f'"{part}"')
-
-            # Join with spaces (FTS5 treats space-separated terms as AND by default)
-            fts_query = " ".join(fts_parts)
-
-        # Build filter conditions for both FTS and tag queries
-        type_filter_clause = ""
-        tag_filter_clause = ""
-        filter_params = []
-
-        if filters:
-            # Separate filters into categories
-            type_filters = []
-            tag_filters = []
-
-            for f in filters:
-                if f in ["text", "image", "url", "file", "favorite"]:
-                    # Content type filters
-                    if f == "text":
-                        type_filters.append("ci.type = 'text'")
-                    elif f == "image":
-                        type_filters.append(
-                            "(ci.type LIKE 'image/%' OR ci.type = 'screenshot')"
-                        )
-                    elif f == "url":
-                        type_filters.append("ci.type = 'url'")
-                    elif f == "file":
-                        type_filters.append("ci.type = 'file'")
-                    elif f == "favorite":
-                        type_filters.append("ci.is_favorite = 1")
-                elif f.startswith("file:"):
-                    # File extension filter (format: "file:pdf", "file:docx", etc.)
-                    ext = f[5:]  # Remove "file:" prefix
-                    type_filters.append("ci.type LIKE ?")
-                    filter_params.append(f"%{ext}%")
-                elif f.startswith("."):
-                    # File extension filter (format: ".pdf", ".docx", etc.)
-                    type_filters.append("ci.type LIKE ?")
-                    filter_params.append(f"%{f}%")
-                else:
-                    # Custom tag filter
-                    tag_filters.append(f)
-
-            # Combine type filters with OR
-            if type_filters:
-                type_filter_clause = f" AND ({' OR '.join(type_filters)})"
-
-            # Handle tag filters
-            if tag_filters:
-                # Build subquery for tags
-                tag_placeholders = ",".join("?" * len(tag_filters))
-                tag_filter_clause = f""" AND ci.id IN (
-                    SELECT item_id FROM item_tags
-                    WHERE tag_id IN (
-                        SELECT id FROM tags WHERE name IN ({tag_placeholders})
-                    )
-                )"""
-                filter_params.extend(tag_filters)
+        fts_table = "clipboard_fts"
+        match_terms = parts
+        short_terms = []
+        prefix = False
+        if mode == "substring":
+            trigram_terms = [part for part in parts if len(part) >= 3]
+            if trigram_terms:
+                fts_table = "clipboard_fts_trigram"
+                match_terms = trigram_terms
+                short_terms = [part for part in parts if len(part) < 3]
+            else:
+                # Without a trigram to match, LIKE would read and decompress every row
+                prefix = True
+
+        # FTS5 treats space-separated phrases as AND; quoting escapes special chars
+        where_clauses = [f"{fts_table} MATCH ?"]
+        query_params = [
+            " ".join(self._fts_phrase(term) + ("*" if prefix else "") for term in match_terms)
+        ]
+        for term in short_terms:
+            where_clauses.append(
+                f"({fts_table}.content LIKE ? ESCAPE '\\' OR {fts_table}.name LIKE ? ESCAPE '\\')"
+            )
+            query_params += [self._like_pattern(term)] * 2
 
-        # Debug logging
-        logging.info(f"[SEARCH DB] Query: '{query}', Filters: {filters}")
+        # Build filter conditions on indexed columns
+        filter_clauses, filter_params = self._filter_clauses(filters, "ci")
+        where_clauses += filter_clauses
+        query_params += filter_params
 
-        cursor = self.conn.cursor()
+        logging.info(f"[SEARCH DB] Query: '{query}', Mode: {mode}, Filters: {filters}")
 
-        # Use UNION to combine FTS results with tag-based results
-        # Query 1: FTS search (content and names)
-        # Query 2: Tag name search
         query_sql = f"""
-            SELECT DISTINCT
-                ci.id,
-                ci.timestamp,
-                ci.type,
-                ci.data,
-                ci.thumbnail,
-                ci.name,
-                ci.format_type,
-                ci.formatted_content,
-                ci.is_favorite,
-                -rank as relevance
-            FROM clipboard_fts
-            INNER JOIN clipboard_items ci ON clipboard_fts.rowid = ci.id
-            WHERE clipboard_fts MATCH ?{type_filter_clause}{tag_filter_clause}
+            SELECT
+                {self._list_columns("ci")},
+                -{fts_table}.rank as relevance
+            FROM {fts_table}
+            INNER JOIN clipboard_items ci ON {fts_table}.rowid = ci.id
+            WHERE {" AND ".join(where_clauses)}
             ORDER BY relevance, timestamp DESC
             LIMIT ?
         """
+        query_params.append(limit)
 
-        # Build parameter list: fts_query, filter_params (once), limit
-        query_params = [fts_query] + filter_params + [limit]
+        logging.debug(f"[SEARCH DB] SQL: {query_sql}")
+        logging.debug(f"[SEARCH DB] Params: {query_params}")
 
-        logging.info(f"[SEARCH DB] SQL: {query_sql}")
-        logging.info(f"[SEARCH DB] Params: {query_params}")
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query_sql, tuple(query_params))
 
-        cursor.execute(query_sql, tuple(query_params))
-
-        items = []
-        for row in cursor.fetchall():
-            items.append(
-                {
-                    "id": row["id"],
-                    "timestamp": row["timestamp"],
-                    "type": row["type"],
-                    "data": row["data"],
-                    "thumbnail": row["thumbnail"],
-                    "name": row["name"],
-                    "format_type": row["format_type"],
-                    "formatted_content": row["formatted_content"],
-                    "is_favorite": bool(row["is_favorite"]),
-                    "relevance": row["relevance"],
-                }
-            )
-        return items
+            items = []
+            for row in cursor.fetchall():
+                item = self._list_item(row)
+                item["relevance"] = row["relevance"]
+                items.append(item)
+            return self._attach_tags(items)
 
     # ========== Tag Management Methods ==========
 
@@ -1195,7 +3123,7 @@ class ClipboardDB:
                 """,
                 (name, description, color),
             )
-            self.conn.commit()
+            self._commit()
             tag_id = cursor.lastrowid
             logging.info(
                 f"Created tag: ID={tag_id}, Name='{name}', Color={color}"
@@ -1212,50 +3140,52 @@ class ClipboardDB:
         Returns:
             List of tags as dicts with 'id', 'name', 'description', 'color', 'created_at'
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, name, description, color, created_at
-            FROM tags
-            ORDER BY name ASC
-            """
-        )
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, name, description, color, created_at
+                FROM tags
+                ORDER BY name ASC
+                """
+            )
 
-        tags = []
-        for row in cursor.fetchall():
-            tags.append(
-                {
+            tags = []
+            for row in cursor.fetchall():
+                tags.append(
+                    {
+                        "id": row["id"],
+                        "name": row["name"],
+                        "description": row["description"],
+                        "color": row["color"],
+                        "created_at": row["created_at"],
+                    }
+                )
+            return tags
+
+    def get_tag(self, tag_id: int) -> Optional[Dict]:
+        """Get a single tag by ID"""
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, name, description, color, created_at
+                FROM tags
+                WHERE id = ?
+                """,
+                (tag_id,),
+            )
+
+            row = cursor.fetchone()
+            if row:
+                return {
                     "id": row["id"],
                     "name": row["name"],
                     "description": row["description"],
                     "color": row["color"],
                     "created_at": row["created_at"],
                 }
-            )
-        return tags
-
-    def get_tag(self, tag_id: int) -> Optional[Dict]:
-        """Get a single tag by ID"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT id, name, description, color, created_at
-            FROM tags
-            WHERE id = ?
-            """,
-            (tag_id,),
-        )
-
-        row = cursor.fetchone()
-        if row:
-            return {
-                "id": row["id"],
-                "name": row["name"],
-                "description": row["description"],
-                "color": row["color"],
-                "created_at": row["created_at"],
-            }
-        return None
+            return None
 
     def update_tag(
         self,
@@ -1302,7 +3232,7 @@ class ClipboardDB:
             """,
             params,
         )
-        self.conn.commit()
+        self._commit()
         success = cursor.rowcount > 0
         if success:
             logging.info(f"Updated tag ID={tag_id}")
@@ -1320,7 +3250,7 @@ class ClipboardDB:
         """
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
-        self.conn.commit()
+        self._commit()
         success = cursor.rowcount > 0
         if success:
             logging.info(f"Deleted tag ID={tag_id}")
@@ -1348,48 +3278,7 @@ class ClipboardDB:
                 """,
                 (item_id, tag_id),
             )
-            self.conn.commit()
-
-            # NEW: Update FTS for this item to include the new tag's name
-            tag = self.get_tag(tag_id)
-            if tag:
-                tag_name = tag.get("name", "")
-                # Get current FTS content and name for this item
-                cursor.execute("SELECT content, name FROM clipboard_fts WHERE rowid = ?", (item_id,))
-                fts_row = cursor.fetchone()
-                if fts_row:
-                    current_fts_content = fts_row["content"]
-                    current_fts_name = fts_row["name"]
-                    # Append new tag name to FTS name field, avoid duplicates
-                    new_fts_name_parts = set(current_fts_name.split())
-                    new_fts_name_parts.add(tag_name)
-                    new_fts_name = " ".join(list(new_fts_name_parts))
-                    cursor.execute(
-                        """
-                        UPDATE clipboard_fts
-                        SET name = ?
-                        WHERE rowid = ?
-                        """,
-                        (new_fts_name, item_id),
-                    )
-                    self.conn.commit()
-                    logging.info(f"Updated FTS for item {item_id} with tag '{tag_name}'")
-                else:
-                    # If item not in FTS (e.g., image), insert it with tag name
-                    # We need to get content for this item
-                    item = self.get_item(item_id)
-                    if item:
-                        item_content = item.get("data", b"").decode("utf-8") if item.get("type") == "text" else ""
-                        cursor.execute(
-                            """
-                            INSERT INTO clipboard_fts (rowid, content, name)
-                            VALUES (?, ?, ?)
-                            """,
-                            (item_id, item_content, tag_name),
-                        )
-                        self.conn.commit()
-                        logging.info(f"Inserted item {item_id} into FTS with tag '{tag_name}'")
-
+            self._commit()
 
             logging.info(f"Committed add tag {tag_id} to item {item_id}")
             return True
@@ -1417,32 +3306,9 @@ class ClipboardDB:
             """,
             (item_id, tag_id),
         )
-        self.conn.commit()
+        self._commit()
         success = cursor.rowcount > 0
         if success:
-            # NEW: Update FTS for this item to remove the tag's name
-            tag = self.get_tag(tag_id)
-            if tag:
-                tag_name = tag.get("name", "")
-                cursor.execute("SELECT content, name FROM clipboard_fts WHERE rowid = ?", (item_id,))
-                fts_row = cursor.fetchone()
-                if fts_row:
-                    current_fts_content = fts_row["content"]
-                    current_fts_name = fts_row["name"]
-                    # Remove tag name from FTS name field
-                    new_fts_name_parts = [p for p in current_fts_name.split() if p != tag_name]
-                    new_fts_name = " ".join(new_fts_name_parts)
-                    cursor.execute(
-                        """
-                        UPDATE clipboard_fts
-                        SET name = ?
-                        WHERE rowid = ?
-                        """,
-                        (new_fts_name, item_id),
-                    )
-                    self.conn.commit()
-                    logging.info(f"Updated FTS for item {item_id} by removing tag '{tag_name}'")
-
             logging.info(f"Committed remove tag {tag_id} from item {item_id}")
         else:
             logging.warning(
@@ -1460,30 +3326,56 @@ class ClipboardDB:
         Returns:
             List of tags as dicts
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT t.id, t.name, t.description, t.color, t.created_at
-            FROM tags t
-            INNER JOIN item_tags it ON t.id = it.tag_id
-            WHERE it.item_id = ?
-            ORDER BY t.name ASC
-            """,
-            (item_id,),
-        )
+        return self.get_tags_for_items([item_id]).get(item_id, [])
 
-        tags = []
-        for row in cursor.fetchall():
-            tags.append(
-                {
-                    "id": row["id"],
-                    "name": row["name"],
-                    "description": row["description"],
-                    "color": row["color"],
-                    "created_at": row["created_at"],
-                }
+    def get_tags_for_items(self, item_ids: List[int]) -> Dict[int, List[Dict]]:
+        """
+        Get the tags of several clipboard items with a single query
+
+        Args:
+            item_ids: IDs of the clipboard items
+
+        Returns:
+            Dict mapping item ID to its list of tags (items without tags are omitted)
+        """
+        if not item_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(item_ids))
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT it.item_id, t.id, t.name, t.description, t.color, t.created_at
+                FROM item_tags it
+                CROSS JOIN tags t ON t.id = it.tag_id
+                WHERE it.item_id IN ({placeholders})
+                """,
+                tuple(item_ids),
             )
-        return tags
+
+            tags_by_item = {}
+            for row in cursor.fetchall():
+                tags_by_item.setdefault(row["item_id"], []).append(
+                    {
+                        "id": row["id"],
+                        "name": row["name"],
+                        "description": row["description"],
+                        "color": row["color"],
+                        "created_at": row["created_at"],
+                    }
+                )
+            # Sorted here: a handful of tags per item is not worth a sort in SQL
+            for tags in tags_by_item.values():
+                tags.sort(key=lambda tag: tag["name"])
+            return tags_by_item
+
+    def _attach_tags(self, items: List[Dict]) -> List[Dict]:
+        """Set the 'tags' of every item of a page using one batched query"""
+        tags_by_item = self.get_tags_for_items(list({item["id"] for item in items}))
+        for item in items:
+            item["tags"] = tags_by_item.get(item["id"], [])
+        return items
 
     def get_items_by_tags(
         self,
@@ -1507,94 +3399,215 @@ class ClipboardDB:
         if not tag_ids:
             return []
 
-        cursor = self.conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        if match_all:
-            # Items must have ALL specified tags
-            # Use HAVING COUNT to ensure item has all tags
-            placeholders = ",".join("?" * len(tag_ids))
-            cursor.execute(
-                f"""
-                SELECT ci.id, ci.timestamp, ci.type, ci.data, ci.thumbnail, ci.name, ci.format_type, ci.formatted_content, ci.is_favorite
-                FROM clipboard_items ci
-                INNER JOIN item_tags it ON ci.id = it.item_id
-                WHERE it.tag_id IN ({placeholders})
-                GROUP BY ci.id
-                HAVING COUNT(DISTINCT it.tag_id) = ?
-                ORDER BY ci.id DESC
-                LIMIT ? OFFSET ?
-                """,
-                (*tag_ids, len(tag_ids), limit, offset),
-            )
-        else:
-            # Items must have ANY of the specified tags
-            placeholders = ",".join("?" * len(tag_ids))
-            cursor.execute(
-                f"""
-                SELECT DISTINCT ci.id, ci.timestamp, ci.type, ci.data, ci.thumbnail, ci.name, ci.format_type, ci.formatted_content, ci.is_favorite
-                FROM clipboard_items ci
-                INNER JOIN item_tags it ON ci.id = it.item_id
-                WHERE it.tag_id IN ({placeholders})
-                ORDER BY ci.id DESC
-                LIMIT ? OFFSET ?
-                """,
-                (*tag_ids, limit, offset),
-            )
+            if match_all or len(set(tag_ids)) == 1:
+                # Items must have ALL specified tags: walk the first tag's
+                # items in ID order and probe the others by primary key
+                first, *others = dict.fromkeys(tag_ids)
+                exists = "".join(
+                    " AND EXISTS (SELECT 1 FROM item_tags o WHERE o.item_id = it.item_id AND o.tag_id = ?)"
+                    for _ in others
+                )
+                cursor.execute(
+                    f"""
+                    SELECT {self._list_columns("ci")}
+                    FROM item_tags it
+                    CROSS JOIN clipboard_items ci ON ci.id = it.item_id
+                    WHERE it.tag_id = ?{exists}
+                    ORDER BY it.item_id DESC
+                    LIMIT ? OFFSET ?
+                    """,
+                    (first, *others, limit, offset),
+                )
+            else:
+                # Items must have ANY of the specified tags
+                placeholders = ",".join("?" * len(tag_ids))
+                cursor.execute(
+                    f"""
+                    SELECT DISTINCT {self._list_columns("ci")}
+                    FROM clipboard_items ci
+                    INNER JOIN item_tags it ON ci.id = it.item_id
+                    WHERE it.tag_id IN ({placeholders})
+                    ORDER BY ci.id DESC
+                    LIMIT ? OFFSET ?
+                    """,
+                    (*tag_ids, limit, offset),
+                )
 
-        items = []
-        for row in cursor.fetchall():
-            items.append(
-                {
-                    "id": row["id"],
-                    "timestamp": row["timestamp"],
-                    "type": row["type"],
-                    "data": row["data"],
-                    "thumbnail": row["thumbnail"],
-                    "name": row["name"],
-                    "format_type": row["format_type"],
-                    "formatted_content": row["formatted_content"],
-                    "is_favorite": bool(row["is_favorite"]),
-                }
-            )
-        return items
+            items = [self._list_item(row) for row in cursor.fetchall()]
+            return self._attach_tags(items)
 
     def get_file_extensions(self) -> List[str]:
         """
         Get unique file extensions from file-type clipboard items
 
+        Answered from the extension index without touching item data.
+
         Returns:
             List of file extensions (e.g., ['.zip', '.sh', '.txt'])
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT DISTINCT data FROM clipboard_items
-            WHERE type = 'file'
-            ORDER BY id DESC
-            LIMIT 100
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT DISTINCT extension FROM clipboard_items
+                WHERE extension IS NOT NULL
+                ORDER BY extension
+                """
+            )
+            return [row["extension"] for row in cursor.fetchall()]
+
+    def get_maintenance_runs(self) -> Dict[str, float]:
+        """Return the time (seconds since the epoch) each maintenance task last completed"""
+        with self._reader() as conn:
+            cursor = conn.execute("SELECT task, last_run FROM maintenance_runs")
+            return {row["task"]: row["last_run"] for row in cursor.fetchall()}
+
+    def record_maintenance_run(self, task: str, when: float):
+        """Store the time a maintenance task completed"""
+        self.conn.execute(
             """
+            INSERT INTO maintenance_runs (task, last_run) VALUES (?, ?)
+            ON CONFLICT(task) DO UPDATE SET last_run = excluded.last_run
+            """,
+            (task, when),
         )
+        self._commit()
 
-        extensions = set()
-        for row in cursor.fetchall():
-            try:
-                data = row["data"]
-                # Extract metadata from file data
-                separator = b"\n---FILE_CONTENT---\n"
-                if separator in data:
-                    metadata_bytes, _ = data.split(separator, 1)
-                    metadata_json = metadata_bytes.decode("utf-8")
-                    metadata = json.loads(metadata_json)
-                    extension = metadata.get("extension", "")
-                    if extension:
-                        extensions.add(extension)
-            except Exception:
-                continue
+    def merge_fts(self, pages: int = None) -> bool:
+        """
+        Merge full-text index segments, a few pages at a time.
+
+        Runs the FTS5 'merge' command with a negative page count, which
+        merges segments of any level; repeated until done it leaves each
+        index as compact as 'optimize' without one long write.
+
+        Args:
+            pages: Pages of segment data merged per index (default FTS_MERGE_PAGES)
+
+        Returns:
+            True when there is nothing left to merge
+        """
+        pages = pages or self.FTS_MERGE_PAGES
+        done = True
+        for table in self.FTS_INDEXES:
+            before = self.conn.total_changes
+            self.conn.execute(
+                f"INSERT INTO {table} ({table}, rank) VALUES ('merge', ?)", (-pages,)
+            )
+            # FTS5 changes fewer than two rows when a merge finds no work
+            if self.conn.total_changes - before >= 2:
+                done = False
+        self._commit()
+        return done
+
+    def optimize_query_planner(self):
+        """Refresh the statistics the query planner uses (PRAGMA optimize)"""
+        # Bounds the rows ANALYZE looks at per index
+        self.conn.execute("PRAGMA analysis_limit = 400")
+        self.conn.execute("PRAGMA optimize")
+
+    def enable_incremental_vacuum(self) -> bool:
+        """
+        Switch a database created before auto_vacuum was enabled to incremental vacuum.
+
+        This takes one full VACUUM, which rewrites the whole file, so it is
+        a one-time startup step rather than a maintenance slice. It only
+        runs when enough of the file is free to be worth it.
+
+        Returns:
+            True if the database was vacuumed and converted
+        """
+        if self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+        free = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        total = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        if not free or free < total * self.VACUUM_CONVERT_MIN_FREE:
+            return False
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.conn.execute("VACUUM")
+        logging.info(f"Vacuumed database and enabled incremental vacuum ({free} of {total} pages free)")
+        return True
+
+    def incremental_vacuum(self, pages: int = None) -> bool:
+        """
+        Return free pages at the end of the file to the filesystem.
+
+        Does nothing on databases not yet switched to incremental vacuum
+        (see enable_incremental_vacuum()): one step must stay bounded.
+
+        Args:
+            pages: Pages freed per call (default VACUUM_PAGES)
+
+        Returns:
+            True when no free pages are left to return
+        """
+        pages = pages or self.VACUUM_PAGES
+        if self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return True
+        if not self.conn.execute("PRAGMA freelist_count").fetchone()[0]:
+            return True
+
+        # executescript steps the pragma to completion; execute() would
+        # free a single page
+        self.conn.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+        return self.conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def cleanup_orphans(self) -> int:
+        """
+        Remove rows and blob files left without their item.
+
+        Covers paste records, chunks and tag links of deleted items (from
+        versions that ran without foreign keys), blobs whose refcount
+        dropped to zero, and blob files with no row, e.g. after a crash
+        between storing the file and committing the item.
 
-        return sorted(list(extensions))
+        Returns:
+            Number of rows and files removed
+        """
+        removed = self._cleanup_orphaned_pasted_records()
+
+        cursor = self.conn.cursor()
+        for table, column in (("text_chunks", "item_id"), ("item_tags", "item_id")):
+            cursor.execute(
+                f"""
+                DELETE FROM {table}
+                WHERE NOT EXISTS (SELECT 1 FROM clipboard_items WHERE id = {table}.{column})
+                """
+            )
+            if cursor.rowcount > 0:
+                logging.info(f"Cleaned up {cursor.rowcount} orphaned {table} rows")
+                removed += cursor.rowcount
+        self._commit()
+
+        removed += self._release_unreferenced_blobs()
+
+        if self.blob_store is not None:
+            known = {row["key"] for row in self.conn.execute("SELECT key FROM blobs")}
+            cutoff = time.time() - self.ORPHAN_BLOB_MIN_AGE
+            stray = 0
+            for key in self.blob_store.keys():
+                if key in known:
+                    continue
+                try:
+                    modified = self.blob_store.path(key).stat().st_mtime
+                except FileNotFoundError:
+                    continue  # Removed since it was listed
+                if modified < cutoff and self.blob_store.delete(key):
+                    stray += 1
+            if stray:
+                logging.info(f"Removed {stray} blob files with no database row")
+                removed += stray
+
+        return removed
 
     def close(self):
-        """Close database connection"""
+        """Close the writer connection and every pooled read connection"""
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
+        self.read_pool_size = 0
         self.conn.close()
 
 
@@ -1611,6 +3624,6 @@ if __name__ == "__main__":
     items = db.get_items(limit=10)
     print(f"Total items: {len(items)}")
     for item in items:
-        print(f"  [{item['id']}] {item['type']}: {item['data'][:50]}")
+        print(f"  [{item['id']}] {item['type']}: {(item['preview'] or '')[:50]}")
 
     db.close()
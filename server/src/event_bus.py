@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+In-process event bus for clipboard item changes
+The ingest path publishes item created/updated/deleted events as it writes;
+subscribers such as IPCService push them to clients right away instead of
+polling the database for new rows
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Events, published with the ID of the item concerned
+ITEM_CREATED = "item_created"
+ITEM_UPDATED = "item_updated"
+ITEM_DELETED = "item_deleted"
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe between server services.
+
+    Subscribers run in the publisher's thread, in subscription order, and
+    must return quickly: hand real work to another thread or event loop. A
+    subscriber that raises is logged and does not affect the others or the
+    publisher.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event: str, callback: Callable) -> Callable[[], None]:
+        """
+        Call `callback(event, item_id)` whenever `event` is published.
+
+        Returns:
+            Function removing the subscription
+        """
+        with self._lock:
+            # Copy on write: publish() iterates without holding the lock
+            self._subscribers[event] = self._subscribers.get(event, []) + [callback]
+
+        def unsubscribe():
+            with self._lock:
+                self._subscribers[event] = [cb for cb in self._subscribers.get(event, []) if cb is not callback]
+
+        return unsubscribe
+
+    def publish(self, event: str, item_id: int):
+        """Notify the subscribers of an event about an item."""
+        for callback in self._subscribers.get(event, ()):
+            try:
+                callback(event, item_id)
+            except Exception as e:
+                logger.error(f"Error in {event} subscriber: {e}")
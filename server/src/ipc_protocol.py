@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Message framing for the TFCBM IPC socket
+Every connection starts with JSON frames (an ASCII length line, then the
+JSON text); a client that sends a "hello" can switch both directions to
+binary frames, which carry bytes values as raw attachments instead of base64
+"""
+
+import asyncio
+import base64
+import json
+import struct
+from typing import Any, List, Optional, Tuple
+
+# Framings a connection can use, negotiated by the "hello" action
+FRAMING_JSON = "json"
+FRAMING_BINARY = "binary"
+
+# Binary frame: header, one length per attachment, the JSON metadata, then
+# the attachments back to back. Header fields: magic, version, flags
+# (reserved, 0), attachment count and metadata length.
+MAGIC = b"TFCB"
+VERSION = 1
+HEADER = struct.Struct("!4sBBHI")
+ATTACHMENT_LENGTH = struct.Struct("!Q")
+
+# Metadata placeholder for a bytes value: {"$bin": attachment index}
+ATTACHMENT_KEY = "$bin"
+
+
+def split_attachments(value: Any, attachments: List[bytes]) -> Any:
+    """
+    Replace the bytes values of a message by attachment placeholders.
+
+    Args:
+        value: Message, or a value nested in it
+        attachments: List the removed bytes values are appended to
+
+    Returns:
+        The value with every bytes value replaced by a placeholder
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        attachments.append(value)
+        return {ATTACHMENT_KEY: len(attachments) - 1}
+    if isinstance(value, dict):
+        return {key: split_attachments(item, attachments) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [split_attachments(item, attachments) for item in value]
+    return value
+
+
+def join_attachments(value: Any, attachments: List[bytes]) -> Any:
+    """Put the attachments of a binary frame back in place of their placeholders"""
+    if isinstance(value, dict):
+        if len(value) == 1 and ATTACHMENT_KEY in value:
+            return attachments[value[ATTACHMENT_KEY]]
+        return {key: join_attachments(item, attachments) for key, item in value.items()}
+    if isinstance(value, list):
+        return [join_attachments(item, attachments) for item in value]
+    return value
+
+
+def _base64_default(value: Any) -> str:
+    """json.dumps hook sending bytes values as base64 text over JSON frames"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json_frame(message: dict) -> bytes:
+    """Encode a message as a JSON frame; bytes values become base64 strings"""
+    message_bytes = json.dumps(message, default=_base64_default).encode("utf-8") + b"\n"
+    return f"{len(message_bytes)}\n".encode("utf-8") + message_bytes
+
+
+def binary_frame_head(metadata: Any, attachment_lengths: List[int]) -> bytes:
+    """
+    Encode everything of a binary frame that precedes the attachments.
+
+    Args:
+        metadata: Message with its bytes values replaced by placeholders
+        attachment_lengths: Size of each attachment, in placeholder order
+
+    Returns:
+        Header, attachment lengths and metadata
+    """
+    metadata_bytes = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+    return (
+        HEADER.pack(MAGIC, VERSION, 0, len(attachment_lengths), len(metadata_bytes))
+        + b"".join(ATTACHMENT_LENGTH.pack(length) for length in attachment_lengths)
+        + metadata_bytes
+    )
+
+
+def encode_binary_frame(message: dict) -> bytes:
+    """Encode a message as a binary frame; bytes values are sent raw"""
+    attachments = []
+    metadata = split_attachments(message, attachments)
+    head = binary_frame_head(metadata, [len(attachment) for attachment in attachments])
+    return b"".join([head, *attachments])
+
+
+def encode_frame(message: dict, framing: str) -> bytes:
+    """Encode a message in the framing negotiated for a connection"""
+    if framing == FRAMING_BINARY:
+        return encode_binary_frame(message)
+    return encode_json_frame(message)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[dict, str]:
+    """
+    Read the next message of either framing.
+
+    Args:
+        reader: Stream of the connection
+
+    Returns:
+        Tuple of (message, framing it was sent in)
+
+    Raises:
+        asyncio.IncompleteReadError: If the connection closed
+        ValueError: If the frame is malformed or of an unknown version
+    """
+    first = await reader.readexactly(1)
+    if first != MAGIC[:1]:
+        length_line = first + await reader.readuntil(b"\n")
+        message_length = int(length_line.decode("utf-8").strip())
+        message_bytes = await reader.readexactly(message_length)
+        return json.loads(message_bytes.decode("utf-8").rstrip("\n")), FRAMING_JSON
+
+    magic, version, _flags, count, metadata_length = HEADER.unpack(
+        first + await reader.readexactly(HEADER.size - 1)
+    )
+    if magic != MAGIC:
+        raise ValueError(f"Bad frame magic {magic!r}")
+    if version != VERSION:
+        raise ValueError(f"Unsupported frame version {version}")
+    lengths_bytes = await reader.readexactly(ATTACHMENT_LENGTH.size * count)
+    lengths = [
+        ATTACHMENT_LENGTH.unpack_from(lengths_bytes, i * ATTACHMENT_LENGTH.size)[0]
+        for i in range(count)
+    ]
+    metadata = json.loads(await reader.readexactly(metadata_length))
+    attachments = [await reader.readexactly(length) for length in lengths]
+    return join_attachments(metadata, attachments), FRAMING_BINARY
+
+
+def as_bytes(value: Any) -> Optional[bytes]:
+    """
+    Bytes of a binary message field, whichever framing carried it.
+
+    Binary frames deliver bytes as is; JSON frames deliver them as base64.
+
+    Args:
+        value: Field value (bytes, base64 string or None)
+
+    Returns:
+        The bytes, or None for an empty value
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    return base64.b64decode(value)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Idle-time maintenance scheduler for the clipboard database
+Runs housekeeping (index merges, vacuum, orphan cleanup) in short slices
+while no UI request is being served
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class MaintenanceTask:
+    """A maintenance job made of bounded steps"""
+
+    name: str
+    # Seconds between completed runs
+    interval: float
+    # Does one bounded unit of work; returns True when the task is complete
+    step: Callable[[], bool]
+
+
+class MaintenanceScheduler:
+    """
+    Runs due maintenance tasks while the server is idle.
+
+    The server counts as idle once IDLE_AFTER seconds have passed since
+    the last note_activity() call. Work is done in slices: steps of the
+    most overdue task run until SLICE_BUDGET seconds are used, the task
+    completes or activity is noted, then the thread pauses for
+    SLICE_PAUSE seconds. A request therefore waits for at most one step.
+
+    A task that is preempted resumes where its steps left off in a later
+    slice. The completion time of each task is persisted through the
+    store, so intervals carry over restarts.
+    """
+
+    IDLE_AFTER = 30.0
+    SLICE_BUDGET = 0.05
+    SLICE_PAUSE = 0.5
+    POLL_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        tasks: List[MaintenanceTask],
+        store,
+        idle_after: float = None,
+        slice_budget: float = None,
+    ):
+        """
+        Args:
+            tasks: Tasks to schedule; earlier tasks win ties
+            store: Object with get_maintenance_runs() and record_maintenance_run(task, when)
+            idle_after: Seconds without activity before maintenance runs (default IDLE_AFTER)
+            slice_budget: Seconds of work per slice (default SLICE_BUDGET)
+        """
+        self.tasks = list(tasks)
+        self.store = store
+        self.idle_after = self.IDLE_AFTER if idle_after is None else idle_after
+        self.slice_budget = self.SLICE_BUDGET if slice_budget is None else slice_budget
+        self._last_activity = time.monotonic()
+        self._last_runs: Optional[Dict[str, float]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def note_activity(self):
+        """Record a request; running maintenance yields after its current step"""
+        self._last_activity = time.monotonic()
+
+    def is_idle(self) -> bool:
+        """True once no activity was noted for idle_after seconds"""
+        return time.monotonic() - self._last_activity >= self.idle_after
+
+    def last_runs(self) -> Dict[str, float]:
+        """Completion time (seconds since the epoch) of each task that has run"""
+        if self._last_runs is None:
+            self._last_runs = dict(self.store.get_maintenance_runs())
+        return self._last_runs
+
+    def next_task(self, now: float = None) -> Optional[MaintenanceTask]:
+        """Return the most overdue task, or None if none is due"""
+        now = time.time() if now is None else now
+        runs = self.last_runs()
+        due = [
+            (runs.get(task.name, 0.0) + task.interval, index, task)
+            for index, task in enumerate(self.tasks)
+            if now - runs.get(task.name, 0.0) >= task.interval
+        ]
+        return min(due)[2] if due else None
+
+    def run_slice(self) -> Optional[str]:
+        """
+        Work on the most overdue task for up to one slice budget.
+
+        Returns:
+            Name of the task worked on, or None if none was due
+        """
+        task = self.next_task()
+        if task is None:
+            return None
+
+        started = time.monotonic()
+        deadline = started + self.slice_budget
+        done = False
+        try:
+            while not done:
+                done = task.step()
+                if time.monotonic() >= deadline or self._last_activity > started:
+                    break
+            if done:
+                logging.info(f"Maintenance task {task.name} completed")
+        except Exception as e:
+            # Retried at the next interval rather than on every slice
+            logging.error(f"Maintenance task {task.name} failed: {e}")
+            done = True
+
+        if done:
+            when = time.time()
+            self.store.record_maintenance_run(task.name, when)
+            self.last_runs()[task.name] = when
+        return task.name
+
+    def start(self):
+        """Start the scheduler thread"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="db-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the scheduler thread after its current step"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            worked = False
+            if self.is_idle():
+                try:
+                    worked = self.run_slice() is not None
+                except Exception as e:
+                    logging.error(f"Maintenance slice failed: {e}")
+            self._stop.wait(self.SLICE_PAUSE if worked else self.POLL_INTERVAL)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Compression of clipboard payloads stored in SQLite
+Text, HTML and small file bodies are compressed per row; the codec used
+is recorded next to the data so rows can be decoded independently
+"""
+
+import logging
+import re
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed to read rows written with zstd
+    zstandard = None
+
+
+class PayloadCodec:
+    """
+    Compress and decompress payloads, optionally with a trained dictionary.
+
+    Codec names stored per row:
+        None / "raw"       stored as-is ("raw": compression did not pay off)
+        "zstd" / "zlib"    compressed without a dictionary
+        "zstd:<id>"        compressed with dictionary <id> (same for zlib)
+
+    New rows always use zlib, from the standard library, so every build
+    can read them back; dictionaries are preset dictionaries (zdict).
+    zstd rows written by earlier versions are decoded when the optional
+    zstandard package is installed.
+    """
+
+    RAW = "raw"
+    ZLIB_LEVEL = 6
+
+    # Size of trained dictionaries; zlib only uses the last 32 KB of a zdict
+    DICT_SIZE = 32 * 1024
+
+    # Store compressed data only if it saves at least this fraction
+    MIN_SAVING = 0.1
+
+    def __init__(self):
+        self._dictionaries: Dict[int, Tuple[str, bytes]] = {}
+
+    @staticmethod
+    def preferred_algorithm() -> str:
+        """The algorithm used for new rows"""
+        return "zlib"
+
+    def add_dictionary(self, dict_id: int, algorithm: str, data: bytes):
+        """Make a stored dictionary available for compression and decompression"""
+        self._dictionaries[dict_id] = (algorithm, data)
+
+    def latest_dictionary(self) -> Optional[int]:
+        """Newest dictionary usable with the preferred algorithm, if any"""
+        usable = [
+            dict_id for dict_id, (algorithm, _) in self._dictionaries.items()
+            if algorithm == self.preferred_algorithm()
+        ]
+        return max(usable) if usable else None
+
+    def compress(self, data: bytes, dict_id: Optional[int] = None) -> Tuple[bytes, str]:
+        """
+        Compress data with the preferred algorithm.
+
+        Args:
+            data: Payload bytes
+            dict_id: Dictionary to compress with (must use the preferred algorithm)
+
+        Returns:
+            Tuple of (bytes to store, codec name). Data that does not shrink
+            by MIN_SAVING is returned unchanged with codec "raw".
+        """
+        algorithm = self.preferred_algorithm()
+        dictionary = self._dictionaries[dict_id][1] if dict_id is not None else None
+
+        compressor = (
+            zlib.compressobj(self.ZLIB_LEVEL, zdict=dictionary)
+            if dictionary is not None else zlib.compressobj(self.ZLIB_LEVEL)
+        )
+        compressed = compressor.compress(data) + compressor.flush()
+
+        if len(compressed) > len(data) * (1 - self.MIN_SAVING):
+            return data, self.RAW
+        codec = algorithm if dict_id is None else f"{algorithm}:{dict_id}"
+        return compressed, codec
+
+    def decompress(self, data: bytes, codec: Optional[str]) -> bytes:
+        """
+        Decode a stored payload.
+
+        Raises:
+            RuntimeError: If the codec needs zstandard or a dictionary that is unavailable
+        """
+        if not codec or codec == self.RAW or data is None:
+            return data
+
+        algorithm, _, dict_ref = codec.partition(":")
+        dictionary = None
+        if dict_ref:
+            entry = self._dictionaries.get(int(dict_ref))
+            if entry is None:
+                raise RuntimeError(f"Compression dictionary {dict_ref} is not loaded")
+            dictionary = entry[1]
+
+        if algorithm == "zlib":
+            decompressor = (
+                zlib.decompressobj(zdict=dictionary) if dictionary is not None else zlib.decompressobj()
+            )
+            return decompressor.decompress(data) + decompressor.flush()
+        if algorithm == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Payload is zstd-compressed but zstandard is not installed")
+            params = {}
+            if dictionary is not None:
+                params["dict_data"] = zstandard.ZstdCompressionDict(dictionary)
+            return zstandard.ZstdDecompressor(**params).decompress(data)
+        raise RuntimeError(f"Unknown payload codec: {codec}")
+
+    @classmethod
+    def train_dictionary(cls, samples: Iterable[bytes]) -> Tuple[str, bytes]:
+        """
+        Build a dictionary for the preferred algorithm from sample payloads.
+
+        The markup fragments (tags with their attributes) that recur across
+        samples are packed into a preset dictionary, most valuable last
+        since zlib favours near matches.
+
+        Returns:
+            Tuple of (algorithm, dictionary bytes)
+        """
+        samples = [sample for sample in samples if sample]
+        algorithm = cls.preferred_algorithm()
+        fragments = Counter()
+        for sample in samples:
+            # Count each fragment once per sample so one huge paste can't dominate
+            fragments.update(set(re.findall(rb"<[^<>]{1,200}>|[^<>]{8,64}(?=<)", sample)))
+
+        chosen = []
+        size = 0
+        for fragment, count in sorted(
+            fragments.items(), key=lambda item: item[1] * len(item[0]), reverse=True
+        ):
+            if count < 2:
+                break
+            if size + len(fragment) > cls.DICT_SIZE:
+                continue
+            chosen.append(fragment)
+            size += len(fragment)
+        logging.info(f"Trained {algorithm} dictionary from {len(samples)} samples ({size} bytes)")
+        return algorithm, b"".join(reversed(chosen))
@@ -2,7 +2,6 @@
 """
 Clipboard Service - Processes clipboard events
 """
-import base64
 import json
 import logging
 import mimetypes
@@ -11,11 +10,16 @@ import subprocess
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from urllib.parse import unquote, urlparse
 
+from server.src.event_bus import ITEM_CREATED, ITEM_UPDATED, EventBus
+from server.src.ipc_protocol import as_bytes
 from server.src.services.database_service import DatabaseService
-from server.src.services.thumbnail_service import ThumbnailService
+
+if TYPE_CHECKING:
+    # Needs GdkPixbuf; only the caller's instance is used at runtime
+    from server.src.services.thumbnail_service import ThumbnailService
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +27,23 @@ logger = logging.getLogger(__name__)
 class ClipboardService:
     """Service for processing clipboard events"""
 
-    def __init__(self, database_service: DatabaseService, thumbnail_service: ThumbnailService):
+    # File content read before a multi-file event is written to the database
+    BULK_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, database_service: DatabaseService, thumbnail_service: "ThumbnailService",
+                 event_bus: EventBus = None):
         """
         Initialize clipboard service
 
         Args:
             database_service: Database service for storing clipboard data
             thumbnail_service: Thumbnail service for image processing
+            event_bus: Optional EventBus told about every stored item
         """
         logger.info("[ClipboardService.__init__] Starting initialization...")
         self.db_service = database_service
         self.thumbnail_service = thumbnail_service
+        self.event_bus = event_bus
         # Keep in-memory history for legacy compatibility
         self.history = []
         logger.info("[ClipboardService.__init__] Initialization complete")
@@ -46,7 +56,9 @@ class ClipboardService:
             file_uri: file:// URI from clipboard
 
         Returns:
-            Dict with file metadata and content, or None if error
+            Dict with file metadata, content and content hash, or None if error.
+            The content of a large file is None: it is in the blob store under
+            'blob_key'.
         """
         try:
             # Parse file URI to get path
@@ -128,8 +140,18 @@ class ClipboardService:
                 return None
 
             try:
-                with open(file_path, 'rb') as f:
-                    file_content = f.read()
+                # Large files are copied into the blob store, hashed on the way;
+                # smaller ones are read to be stored inline. Either way the file
+                # is read and hashed once.
+                blob_key = None
+                if file_size >= self.db_service.BLOB_MIN_SIZE:
+                    blob_key = self.db_service.store_file_content(file_path)
+                if blob_key is not None:
+                    file_content, file_hash = None, blob_key
+                else:
+                    with open(file_path, 'rb') as f:
+                        file_content = f.read()
+                    file_hash = self.db_service.calculate_hash(file_content)
             except PermissionError as e:
                 logger.error(f"Permission denied reading file: {file_path}")
                 logger.error(f"  This may be due to Flatpak sandbox restrictions")
@@ -153,7 +175,9 @@ class ClipboardService:
 
             return {
                 'metadata': metadata,
-                'content': file_content
+                'content': file_content,
+                'hash': file_hash,
+                'blob_key': blob_key
             }
 
         except Exception as e:
@@ -189,17 +213,23 @@ class ClipboardService:
             logger.error(f"Error handling clipboard event from DBus: {e}")
             logger.error(traceback.format_exc())
 
+    def _publish(self, item_id: int, inserted: bool):
+        """Announce a new item, or an identical one moved to the top."""
+        if self.event_bus:
+            self.event_bus.publish(ITEM_CREATED if inserted else ITEM_UPDATED, item_id)
+
     def _handle_text(self, text: str, event_data: Dict):
         """Handle text clipboard event"""
         text_bytes = text.encode("utf-8")
 
         # Extract formatted content if present
         format_type = event_data.get("format_type") or event_data.get("formatType")
-        formatted_content_b64 = event_data.get("formatted_content") or event_data.get("formattedContent")
+        # Raw bytes over binary frames, base64 over JSON frames
         formatted_content = None
+        if format_type:
+            formatted_content = as_bytes(event_data.get("formatted_content") or event_data.get("formattedContent"))
 
-        if format_type and formatted_content_b64:
-            formatted_content = base64.b64decode(formatted_content_b64)
+        if formatted_content:
             logger.info(f"  Detected {format_type} formatting ({len(formatted_content)} bytes)")
 
         # Check for URL
@@ -207,59 +237,49 @@ class ClipboardService:
         is_url = url_pattern.search(text) is not None
         item_type = "url" if is_url else "text"
 
-        # Calculate hash for deduplication
-        text_hash = self.db_service.calculate_hash(text_bytes)
+        # Insert, or move an identical item to the top
         timestamp = datetime.now().isoformat()
-
-        existing_item_id = self.db_service.get_item_by_hash(text_hash)
-
-        if existing_item_id:
-            # Duplicate - update timestamp
-            format_info = f" [{format_type}]" if format_type else ""
-            logger.info(f"↻ Updating duplicate {item_type} ({len(text)} chars){format_info}")
-            self.db_service.update_timestamp(existing_item_id, timestamp)
-        else:
-            # New item
+        item_id, inserted = self.db_service.upsert_item(
+            item_type, text_bytes, timestamp,
+            format_type=format_type,
+            formatted_content=formatted_content
+        )
+        self._publish(item_id, inserted)
+
+        format_info = f" [{format_type}]" if format_type else ""
+        if inserted:
             self.history.append({"type": item_type, "content": text, "timestamp": timestamp})
-
-            self.db_service.add_item(
-                item_type, text_bytes, timestamp,
-                data_hash=text_hash,
-                format_type=format_type,
-                formatted_content=formatted_content
-            )
-
-            format_info = f" [{format_type}]" if format_type else ""
             logger.info(f"✓ Copied {item_type} ({len(text)} chars){format_info}")
+        else:
+            logger.info(f"↻ Updated duplicate {item_type} ({len(text)} chars){format_info}")
+
+    def _handle_image(self, event_type: str, content_data):
+        """Handle image clipboard event
 
-    def _handle_image(self, event_type: str, content_data: str):
-        """Handle image clipboard event"""
-        image_content = json.loads(content_data)
-        image_data_b64 = image_content.get("data")
-        if not image_data_b64:
+        The image comes as raw bytes (binary frames), as base64 (JSON
+        frames) or, from older clients, as a JSON string {"data": base64}.
+        """
+        if isinstance(content_data, str) and content_data.startswith("{"):
+            content_data = json.loads(content_data).get("data")
+        image_bytes = as_bytes(content_data)
+        if not image_bytes:
             logger.warning("Image event missing data field")
             return
 
-        image_bytes = base64.b64decode(image_data_b64)
-        image_hash = self.db_service.calculate_hash(image_bytes)
         timestamp = datetime.now().isoformat()
 
-        existing_item_id = self.db_service.get_item_by_hash(image_hash)
+        item_id, inserted = self.db_service.upsert_item(event_type, image_bytes, timestamp)
+        self._publish(item_id, inserted)
 
-        if existing_item_id:
-            # Duplicate
-            logger.info(f"↻ Updating duplicate image ({event_type}, {len(image_bytes)} bytes)")
-            self.db_service.update_timestamp(existing_item_id, timestamp)
-        else:
-            # New image
-            self.history.append({"type": event_type, "content": image_data_b64, "timestamp": timestamp})
-
-            item_id = self.db_service.add_item(event_type, image_bytes, timestamp, data_hash=image_hash)
+        if inserted:
+            self.history.append({"type": event_type, "content": image_bytes, "timestamp": timestamp})
 
             # Generate thumbnail asynchronously
             self.thumbnail_service.process_thumbnail_async(item_id, image_bytes)
 
             logger.info(f"✓ Copied image ({event_type}, {len(image_bytes)} bytes)")
+        else:
+            logger.info(f"↻ Updated duplicate image ({event_type}, {len(image_bytes)} bytes)")
 
     def _handle_file(self, file_uris_raw: str):
         """Handle file clipboard event"""
@@ -269,37 +289,52 @@ class ClipboardService:
         file_uris = [uri.strip() for uri in file_uris_raw.split('\n') if uri.strip()]
         logger.info(f"Processing {len(file_uris)} file(s)/folder(s)")
 
-        # Process each file/folder
+        # Read each file/folder and store them in one transaction; very large
+        # selections are flushed every BULK_MAX_BYTES to bound memory
+        items = []
+        item_uris = []
+        pending_bytes = 0
         for file_uri in file_uris:
             file_data = self.process_file(file_uri)
 
             if file_data:
                 metadata = file_data['metadata']
-                file_content = file_data['content']
-
-                # Hash for deduplication
-                if metadata.get('is_directory'):
-                    hash_input = metadata['original_path'].encode('utf-8')
-                else:
-                    hash_input = file_content
-
-                file_hash = self.db_service.calculate_hash(hash_input)
-                timestamp = datetime.now().isoformat()
-
-                existing_item_id = self.db_service.get_item_by_hash(file_hash)
-
-                if existing_item_id:
-                    logger.info("↻ Updating duplicate file/folder")
-                    self.db_service.update_timestamp(existing_item_id, timestamp)
-                else:
-                    self.history.append({"type": "file", "content": file_uri, "timestamp": timestamp})
-
-                    # Store as: metadata_json + separator + file_content
-                    metadata_json = json.dumps(metadata).encode('utf-8')
-                    separator = b'\n---FILE_CONTENT---\n'
-                    combined_data = metadata_json + separator + file_content
+                file_content = file_data['content'] or b''
+
+                # Store as: metadata_json + separator + file_content; content
+                # already in the blob store is referenced by its key
+                metadata_json = json.dumps(metadata).encode('utf-8')
+                separator = b'\n---FILE_CONTENT---\n'
+                items.append({
+                    "item_type": "file",
+                    "data": metadata_json + separator + file_content,
+                    "timestamp": datetime.now().isoformat(),
+                    "data_hash": file_data.get('hash'),
+                    "name": metadata.get('name', 'unknown'),
+                    "file_metadata": metadata,
+                    "blob_key": file_data.get('blob_key'),
+                })
+                item_uris.append(file_uri)
+                pending_bytes += len(file_content)
+
+                if pending_bytes >= self.BULK_MAX_BYTES:
+                    self._store_files(items, item_uris)
+                    items, item_uris, pending_bytes = [], [], 0
+
+        self._store_files(items, item_uris)
+
+    def _store_files(self, items: list, item_uris: list):
+        """Insert file items in one transaction, or move identical content (or folder path) to the top"""
+        if not items:
+            return
 
-                    self.db_service.add_item("file", combined_data, timestamp,
-                                           data_hash=file_hash, name=metadata.get('name', 'unknown'))
+        results = self.db_service.add_items_bulk(items)
 
-                    logger.info(f"✓ Copied file/folder: {metadata.get('name', 'unknown')} (mime: {metadata.get('mime_type', 'unknown')})")
+        for item, file_uri, (item_id, inserted) in zip(items, item_uris, results):
+            self._publish(item_id, inserted)
+            metadata = item["file_metadata"]
+            if inserted:
+                self.history.append({"type": "file", "content": file_uri, "timestamp": item["timestamp"]})
+                logger.info(f"✓ Copied file/folder: {metadata.get('name', 'unknown')} (mime: {metadata.get('mime_type', 'unknown')})")
+            else:
+                logger.info("↻ Updated duplicate file/folder")
@@ -4,10 +4,14 @@ Database Service - Wrapper for database operations
 """
 import logging
 import threading
+from concurrent.futures import Future
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 from server.src.database import ClipboardDB
+from server.src.maintenance import MaintenanceTask
+from server.src.write_queue import WriteQueue
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +19,18 @@ logger = logging.getLogger(__name__)
 class DatabaseService:
     """Service for managing database operations with thread-safety"""
 
+    SEARCH_MODES = ClipboardDB.SEARCH_MODES
+    BLOB_MIN_SIZE = ClipboardDB.BLOB_MIN_SIZE
+
+    # Seconds between runs of each idle-time maintenance task
+    MAINTENANCE_INTERVALS = {
+        "fts_merge": 24 * 3600,
+        "optimize": 24 * 3600,
+        "orphan_cleanup": 24 * 3600,
+        "fts_check": 7 * 24 * 3600,
+        "incremental_vacuum": 7 * 24 * 3600,
+    }
+
     def __init__(self, db_path: Optional[str] = None, settings_service=None):
         """
         Initialize database service
@@ -25,158 +41,384 @@ class DatabaseService:
         """
         logger.info("[DatabaseService.__init__] Starting initialization...")
         logger.info(f"[DatabaseService.__init__] Connecting to database: {db_path or 'default path'}")
-        self.db = ClipboardDB(db_path)
+        read_pool_size = (
+            settings_service.read_pool_size if settings_service
+            else ClipboardDB.DEFAULT_READ_POOL_SIZE
+        )
+        self.db = ClipboardDB(db_path, read_pool_size=read_pool_size)
+        # Serializes writes on the single writer connection. Reads only take
+        # it when the database has no read pool (e.g. in-memory databases).
         self.lock = threading.Lock()
+        # Item and tag mutations go through one writer thread that applies
+        # bursts of writes in a single commit
+        self.writer = WriteQueue(self.db, self.lock)
         self.settings_service = settings_service
+        if self.db.fts_rebuilt:
+            # Check the recreated indexes at the next idle time
+            self.db.record_maintenance_run("fts_check", 0.0)
+        logger.info(f"[DatabaseService.__init__] Read pool size: {self.db.read_pool_size}")
         logger.info("[DatabaseService.__init__] Initializing database schema...")
         logger.info(f"Database initialized or already exists at: {self.db.db_path}")
         logger.info("[DatabaseService.__init__] Initialization complete")
 
+    def _read_lock(self):
+        """Lock to hold for a read: none when pooled read connections exist"""
+        if self.db.read_pool_size:
+            return nullcontext()
+        return self.lock
+
+    def submit_write(self, method: str, *args, **kwargs) -> Future:
+        """Queue a ClipboardDB write method for the writer thread.
+
+        Writes queued within a few milliseconds of each other are committed
+        together. For writes that need no result (e.g. caching a thumbnail).
+
+        Returns:
+            Future resolved with the method's result once it is committed
+        """
+        return self.writer.submit(getattr(self.db, method), *args, **kwargs)
+
+    def write(self, method: str, *args, **kwargs):
+        """Run a ClipboardDB write method on the writer thread and wait for its commit.
+
+        The queue counts the waiting thread, so it keeps its group open for
+        other waiting writers instead of committing early.
+
+        Returns:
+            The method's result
+        """
+        return self.writer.run(getattr(self.db, method), *args, **kwargs)
+
     def add_item(self, item_type: str, data: bytes, timestamp: str, **kwargs) -> int:
         """Thread-safe add item to database"""
-        with self.lock:
-            return self.db.add_item(item_type, data, timestamp, **kwargs)
+        return self.write("add_item", item_type, data, timestamp, **kwargs)
+
+    def upsert_item(self, item_type: str, data: bytes, timestamp: str, **kwargs) -> Tuple[int, bool]:
+        """Thread-safe insert-or-bump of an item. Returns (item ID, inserted)."""
+        return self.write("upsert_item", item_type, data, timestamp, **kwargs)
+
+    def add_items_bulk(self, items: List[Dict[str, Any]], dedup: bool = True) -> List[Tuple[int, bool]]:
+        """Thread-safe insert of many items in one transaction. Returns (item ID, inserted) per item."""
+        return self.write("add_items_bulk", items, dedup)
 
     def cleanup_old_items(self, max_items: int) -> list:
         """Thread-safe retention cleanup. Returns list of deleted item IDs."""
-        with self.lock:
-            return self.db.cleanup_old_items(max_items)
+        return self.write("cleanup_old_items", max_items)
 
     def get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Thread-safe get item from database"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_item(item_id)
 
+    def get_list_item(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Thread-safe get of one item in list form (no payload)"""
+        with self._read_lock():
+            return self.db.get_list_item(item_id)
+
+    def stream_payload(self, item_id: int, chunk_size: int = None) -> Optional[Tuple[str, int, Iterator[bytes]]]:
+        """Thread-safe chunked read of an image or file payload.
+
+        The lock is held per chunk, not across the whole stream.
+        """
+        with self._read_lock():
+            stream = self.db.stream_payload(item_id, chunk_size)
+        if stream is None:
+            return None
+        item_type, size, chunks = stream
+        return item_type, size, self._locked_chunks(chunks)
+
+    def _locked_chunks(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        while True:
+            with self._read_lock():
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
     def get_items(self, limit: int = 20, offset: int = 0, sort_order: str = "DESC",
-                  filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+                  filters: Optional[Dict] = None, cursor: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Thread-safe get items from database"""
-        with self.lock:
-            return self.db.get_items(limit, offset, sort_order, filters)
+        with self._read_lock():
+            return self.db.get_items(limit, offset, sort_order, filters, cursor)
 
     def get_total_count(self) -> int:
         """Thread-safe get total item count"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_total_count()
 
+    def get_kind_counts(self) -> Dict[str, int]:
+        """Thread-safe get item count per kind"""
+        with self._read_lock():
+            return self.db.get_kind_counts()
+
+    def reconcile_counters(self) -> bool:
+        """Recompute the maintained counters, fixing any drift"""
+        with self.lock:
+            return self.db.reconcile_counters()
+
     def get_latest_id(self) -> Optional[int]:
         """Thread-safe get latest item ID"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_latest_id()
 
     def get_item_by_hash(self, data_hash: str) -> Optional[int]:
         """Thread-safe check if item with hash exists"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_item_by_hash(data_hash)
 
     def update_timestamp(self, item_id: int, timestamp: str) -> bool:
         """Thread-safe update item timestamp"""
-        with self.lock:
-            return self.db.update_timestamp(item_id, timestamp)
+        return self.write("update_timestamp", item_id, timestamp)
 
     def update_thumbnail(self, item_id: int, thumbnail: bytes) -> bool:
         """Thread-safe update item thumbnail"""
-        with self.lock:
-            return self.db.update_thumbnail(item_id, thumbnail)
+        return self.write("update_thumbnail", item_id, thumbnail)
 
     def delete_item(self, item_id: int) -> bool:
         """Thread-safe delete item"""
-        with self.lock:
-            return self.db.delete_item(item_id)
+        return self.write("delete_item", item_id)
 
     def get_recently_pasted(self, limit: int = 20, offset: int = 0,
-                           sort_order: str = "DESC", filters: List = None) -> List[Dict[str, Any]]:
+                           sort_order: str = "DESC", filters: List = None,
+                           cursor: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Thread-safe get recently pasted items"""
-        with self.lock:
-            return self.db.get_recently_pasted(limit, offset, sort_order, filters)
+        with self._read_lock():
+            return self.db.get_recently_pasted(limit, offset, sort_order, filters, cursor)
 
     def get_pasted_count(self) -> int:
         """Thread-safe get pasted count"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_pasted_count()
 
     def add_pasted_item(self, item_id: int) -> int:
         """Thread-safe record paste event"""
-        with self.lock:
-            return self.db.add_pasted_item(item_id)
+        return self.write("add_pasted_item", item_id)
 
-    def search_items(self, query: str, limit: int = 100, filters: List = None) -> List[Dict[str, Any]]:
+    def search_items(
+        self, query: str, limit: int = 100, filters: List = None, mode: str = "token"
+    ) -> List[Dict[str, Any]]:
         """Thread-safe search items"""
-        with self.lock:
-            return self.db.search_items(query, limit, filters)
+        with self._read_lock():
+            return self.db.search_items(query, limit, filters, mode)
 
     def get_all_tags(self) -> List[Dict[str, Any]]:
         """Thread-safe get all tags"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_all_tags()
 
     def create_tag(self, name: str, description: str = None, color: str = None) -> int:
         """Thread-safe create tag"""
-        with self.lock:
-            return self.db.create_tag(name, description, color)
+        return self.write("create_tag", name, description, color)
 
     def get_tag(self, tag_id: int) -> Optional[Dict[str, Any]]:
         """Thread-safe get tag"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_tag(tag_id)
 
     def update_tag(self, tag_id: int, name: str = None, description: str = None,
                    color: str = None) -> bool:
         """Thread-safe update tag"""
-        with self.lock:
-            return self.db.update_tag(tag_id, name, description, color)
+        return self.write("update_tag", tag_id, name, description, color)
 
     def delete_tag(self, tag_id: int) -> bool:
         """Thread-safe delete tag"""
-        with self.lock:
-            return self.db.delete_tag(tag_id)
+        return self.write("delete_tag", tag_id)
 
     def add_tag_to_item(self, item_id: int, tag_id: int) -> bool:
         """Thread-safe add tag to item"""
-        with self.lock:
-            return self.db.add_tag_to_item(item_id, tag_id)
+        return self.write("add_tag_to_item", item_id, tag_id)
 
     def remove_tag_from_item(self, item_id: int, tag_id: int) -> bool:
         """Thread-safe remove tag from item"""
-        with self.lock:
-            return self.db.remove_tag_from_item(item_id, tag_id)
+        return self.write("remove_tag_from_item", item_id, tag_id)
 
     def get_tags_for_item(self, item_id: int) -> List[Dict[str, Any]]:
         """Thread-safe get tags for item"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_tags_for_item(item_id)
 
+    def get_tags_for_items(self, item_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Thread-safe get tags for several items in one query"""
+        with self._read_lock():
+            return self.db.get_tags_for_items(item_ids)
+
     def bulk_delete_oldest(self, count: int) -> int:
         """Thread-safe bulk delete oldest items"""
-        with self.lock:
-            return self.db.bulk_delete_oldest(count)
+        return self.write("bulk_delete_oldest", count)
 
     def get_items_by_tags(self, tag_ids: List[int], match_all: bool = False,
                          limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Thread-safe get items by tags"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_items_by_tags(tag_ids, match_all, limit, offset)
 
     def update_item_name(self, item_id: int, name: str) -> bool:
         """Thread-safe update item name"""
-        with self.lock:
-            return self.db.update_item_name(item_id, name)
+        return self.write("update_item_name", item_id, name)
 
     def toggle_favorite(self, item_id: int, is_favorite: bool) -> bool:
         """Thread-safe toggle favorite status"""
-        with self.lock:
-            return self.db.toggle_favorite(item_id, is_favorite)
+        return self.write("toggle_favorite", item_id, is_favorite)
 
     def get_text_page(self, item_id: int, page: int = 0, page_size: int = 500) -> Optional[Dict[str, Any]]:
         """Thread-safe get a page of text content"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_text_page(item_id, page, page_size)
 
+    def find_text_match_page(self, item_id: int, terms: List[str], page_size: int = 500) -> int:
+        """Thread-safe find the page of a text item holding a search match"""
+        with self._read_lock():
+            return self.db.find_text_match_page(item_id, terms, page_size)
+
     def get_file_extensions(self) -> List[str]:
         """Thread-safe get file extensions"""
-        with self.lock:
+        with self._read_lock():
             return self.db.get_file_extensions()
 
+    def read_blob(self, blob_key: str) -> Optional[bytes]:
+        """Thread-safe read of a payload from the blob store"""
+        with self._read_lock():
+            return self.db.read_blob(blob_key)
+
+    def migrate_inline_blobs(self, batch_size: int = 20) -> None:
+        """Move inline payloads of existing rows to the blob store.
+
+        Takes the lock one batch at a time so clipboard events are not held
+        up while a large database is migrated.
+        """
+        after_id = 0
+        while after_id is not None:
+            with self.lock:
+                after_id = self.db.migrate_inline_blobs(after_id, batch_size)
+
+    def backfill_text_columns(self, batch_size: int = 200) -> None:
+        """Fill the precomputed text columns of rows from older versions,
+        then split their long texts into chunks.
+
+        Takes the lock one batch at a time, like migrate_inline_blobs.
+        """
+        after_id = 0
+        while after_id is not None:
+            with self.lock:
+                after_id = self.db.backfill_text_columns(after_id, batch_size)
+
+        after_id = 0
+        while after_id is not None:
+            with self.lock:
+                after_id = self.db.backfill_text_chunks(after_id)
+
+    def recompress_items(self, batch_size: int = 100) -> None:
+        """Compress payloads stored uncompressed, training the HTML dictionary first.
+
+        Takes the lock one batch at a time, like migrate_inline_blobs.
+        """
+        with self.lock:
+            if self.db.codec.latest_dictionary() is None:
+                self.db.train_html_dictionary()
+        after_id = 0
+        while after_id is not None:
+            with self.lock:
+                after_id = self.db.recompress_items(after_id, batch_size)
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch a legacy database to incremental vacuum with one full VACUUM.
+
+        Holds the lock for the whole VACUUM: a one-time step run at startup,
+        outside the idle maintenance slices.
+        """
+        with self.lock:
+            return self.db.enable_incremental_vacuum()
+
+    def check_fts_index(self) -> bool:
+        """Check that the full-text index matches the items table"""
+        with self.lock:
+            return self.db.check_fts_index()
+
+    def rebuild_fts_index(self):
+        """Rebuild the full-text index from the items table"""
+        with self.lock:
+            self.db.rebuild_fts_index()
+
+    def get_maintenance_runs(self) -> Dict[str, float]:
+        """Get the time each maintenance task last completed"""
+        with self._read_lock():
+            return self.db.get_maintenance_runs()
+
+    def record_maintenance_run(self, task: str, when: float):
+        """Store the time a maintenance task completed"""
+        with self.lock:
+            self.db.record_maintenance_run(task, when)
+
+    def maintenance_tasks(self) -> List[MaintenanceTask]:
+        """Idle-time maintenance tasks for MaintenanceScheduler.
+
+        Each step takes the lock for one bounded unit of work, like the
+        background migrations, so a clipboard event waits for one step at most.
+        """
+        def locked(step):
+            def run() -> bool:
+                with self.lock:
+                    return step()
+            return run
+
+        def optimize() -> bool:
+            self.db.optimize_query_planner()
+            return True
+
+        def cleanup() -> bool:
+            self.db.cleanup_orphans()
+            return True
+
+        fts_check = {"after_id": 0}
+
+        def check_fts() -> bool:
+            after_id, consistent = self.db.check_fts_rows(fts_check["after_id"])
+            if not consistent:
+                # The one unbounded step, taken only when an index is damaged
+                self.db.rebuild_fts_index()
+                after_id = None
+            fts_check["after_id"] = after_id or 0
+            return after_id is None
+
+        steps = {
+            "orphan_cleanup": cleanup,
+            "fts_merge": self.db.merge_fts,
+            "fts_check": check_fts,
+            "optimize": optimize,
+            "incremental_vacuum": self.db.incremental_vacuum,
+        }
+        return [
+            MaintenanceTask(name, self.MAINTENANCE_INTERVALS[name], locked(step))
+            for name, step in steps.items()
+        ]
+
+    def close(self):
+        """Apply queued writes and close all database connections"""
+        self.writer.close()
+        with self.lock:
+            self.db.close()
+
     @staticmethod
     def calculate_hash(data: bytes) -> str:
         """Calculate hash for deduplication"""
         return ClipboardDB.calculate_hash(data)
+
+    def store_file_content(self, path: str) -> Optional[str]:
+        """Stream a file into the blob store, reading and hashing it once.
+
+        Takes no lock: blob files are only referenced once a row is written.
+
+        Returns:
+            Blob key (the content hash), or None without a blob store
+        """
+        return self.db.store_file_content(path)
+
+    @staticmethod
+    def history_cursor(items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Keyset cursor continuing after a page of get_items"""
+        return ClipboardDB.history_cursor(items)
+
+    @staticmethod
+    def pasted_cursor(items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Keyset cursor continuing after a page of get_recently_pasted"""
+        return ClipboardDB.pasted_cursor(items)
@@ -5,6 +5,7 @@ Replaces WebSocket for local inter-process communication
 """
 import asyncio
 import base64
+import contextvars
 import json
 import logging
 import math
@@ -13,49 +14,153 @@ import re
 import traceback
 from typing import Set, Optional, Tuple
 
-from server.src.services.thumbnail_service import ThumbnailService
+from server.src.event_bus import ITEM_CREATED, ITEM_DELETED, ITEM_UPDATED, EventBus
+from server.src.ipc_protocol import (
+    ATTACHMENT_KEY,
+    FRAMING_BINARY,
+    FRAMING_JSON,
+    VERSION as FRAMING_VERSION,
+    binary_frame_head,
+    encode_frame,
+    read_frame,
+)
+from server.src.timestamps import to_iso
+from server.src.work_pool import WorkPool
 
 logger = logging.getLogger(__name__)
 
+# request_id of the message being handled; replies echo it so a client can
+# match them to requests multiplexed over one connection
+current_request_id = contextvars.ContextVar("current_request_id", default=None)
+
+
+# Work pool lanes: requests (database access, payload preparation, frame
+# encoding) and clipboard ingest, which can take seconds for large files
+LANE_REQUESTS = "requests"
+LANE_INGEST = "ingest"
+
+
+def _with_request_id(data: dict) -> dict:
+    """Add the request_id of the message being handled to a reply."""
+    request_id = current_request_id.get()
+    if request_id is None or "request_id" in data:
+        return data
+    return {**data, "request_id": request_id}
+
 
 class IPCConnection:
     """Represents a single IPC client connection."""
 
-    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, pool: WorkPool = None):
         self.reader = reader
         self.writer = writer
         self.closed = False
+        # JSON until the client negotiates binary frames with "hello"
+        self.framing = FRAMING_JSON
+        # Encodes frames and reads streamed chunks off the event loop, if set
+        self.pool = pool
+        # Replies of concurrent requests must not interleave with a stream
+        self.send_lock = asyncio.Lock()
 
     async def send_json(self, data: dict):
-        """Send a JSON message to the client with length prefix."""
+        """Send a message to the client in the negotiated framing.
+
+        Bytes values are sent as raw attachments in binary frames and as
+        base64 strings in JSON frames. Replies carry the request_id of the
+        message being handled, if it had one.
+        """
+        data = _with_request_id(data)
+        if self.pool:
+            frame = await self.pool.run(LANE_REQUESTS, encode_frame, data, self.framing)
+        else:
+            frame = encode_frame(data, self.framing)
+        await self.send_frame(frame)
+
+    async def send_frame(self, frame: bytes):
+        """Send a message already encoded in this connection's framing."""
+        async with self.send_lock:
+            if self.closed or self.writer.is_closing():
+                return
+
+            try:
+                self.writer.write(frame)
+                await self.writer.drain()
+            except Exception as e:
+                logger.error(f"Error sending message: {e}")
+                self.closed = True
+
+    async def send_json_stream(self, data: dict, field: str, size: int, chunks):
+        """Send a message whose `field` holds a streamed payload.
+
+        The payload is written chunk by chunk, so only one chunk is held in
+        memory: raw in binary frames, base64-encoded in JSON frames. Other
+        replies wait until the whole frame is written.
+
+        Args:
+            data: The other (non-empty) fields of the message
+            field: Name of the payload field
+            size: Total payload size in bytes
+            chunks: Iterable of payload chunks
+        """
+        async with self.send_lock:
+            await self._send_stream(_with_request_id(data), field, size, chunks)
+
+    async def _send_stream(self, data: dict, field: str, size: int, chunks):
         if self.closed or self.writer.is_closing():
             return
 
+        binary = self.framing == FRAMING_BINARY
+        if binary:
+            head = binary_frame_head({**data, field: {ATTACHMENT_KEY: 0}}, [size])
+            tail = b""
+        else:
+            json_head = (json.dumps(data)[:-1] + f', "{field}": "').encode('utf-8')
+            tail = b'"}\n'
+            length = len(json_head) + 4 * math.ceil(size / 3) + len(tail)
+            head = f"{length}\n".encode('utf-8') + json_head
+        chunks = iter(chunks)
         try:
-            json_str = json.dumps(data)
-            message_bytes = json_str.encode('utf-8') + b'\n'
-            # Send length prefix followed by message
-            length_prefix = f"{len(message_bytes)}\n".encode('utf-8')
-            self.writer.write(length_prefix + message_bytes)
+            self.writer.write(head)
+            pending = b""
+            sent = 0
+            while True:
+                # Chunks are read from the database or blob store
+                if self.pool:
+                    chunk = await self.pool.run(LANE_REQUESTS, next, chunks, None)
+                else:
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                if binary:
+                    self.writer.write(chunk)
+                    sent += len(chunk)
+                else:
+                    pending += chunk
+                    # Encode whole 3-byte groups so the pieces concatenate
+                    cut = len(pending) - len(pending) % 3
+                    if cut:
+                        self.writer.write(base64.b64encode(pending[:cut]))
+                        sent += cut
+                        pending = pending[cut:]
+                await self.writer.drain()
+            if sent + len(pending) != size:
+                raise ValueError(f"Payload size changed while streaming ({sent + len(pending)} != {size} bytes)")
+            self.writer.write(base64.b64encode(pending) + tail)
             await self.writer.drain()
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            # The frame is incomplete; the client can no longer parse the stream
+            logger.error(f"Error streaming message: {e}")
             self.closed = True
+            self.writer.close()
 
     async def receive_json(self) -> Optional[dict]:
-        """Receive a JSON message from the client with length prefix."""
+        """Receive a message from the client, in either framing."""
         if self.closed:
             return None
 
         try:
-            # Read length prefix
-            length_line = await self.reader.readuntil(b'\n')
-            message_length = int(length_line.decode('utf-8').strip())
-
-            # Read message
-            message_bytes = await self.reader.readexactly(message_length)
-            message_str = message_bytes.decode('utf-8').rstrip('\n')
-            return json.loads(message_str)
+            message, _ = await read_frame(self.reader)
+            return message
         except asyncio.IncompleteReadError:
             # Connection closed
             self.closed = True
@@ -73,13 +178,27 @@ class IPCConnection:
             await self.writer.wait_closed()
 
 
+# Must match ClipboardDB.PREVIEW_LENGTH, the page size of the stored page counts
 TEXT_PAGE_SIZE = 500
 
+# Largest thumbnail sent to the UI (500 KB once base64-encoded)
+MAX_THUMBNAIL_SIZE = 500 * 1024 * 3 // 4
+
 
 class IPCService:
     """Service for UNIX domain socket communication with UI clients"""
 
-    def __init__(self, database_service, settings_service, clipboard_service):
+    # Worker threads per work pool lane; one ingest worker keeps clipboard
+    # events in the order they were copied
+    REQUEST_WORKERS = 4
+    INGEST_WORKERS = 1
+
+    # Requests with a request_id handled at once per connection; reading the
+    # connection pauses while this many are in flight
+    MAX_IN_FLIGHT = 16
+
+    def __init__(self, database_service, settings_service, clipboard_service, maintenance=None, pool=None,
+                 event_bus=None, thumbnail_service=None):
         """
         Initialize IPC service
 
@@ -87,79 +206,99 @@ class IPCService:
             database_service: Database service
             settings_service: Settings service
             clipboard_service: Clipboard service
+            maintenance: Optional MaintenanceScheduler, told about every request
+            pool: Optional WorkPool with the request and ingest lanes for
+                blocking work (one is created by default)
+            event_bus: Optional EventBus whose item events are pushed to
+                clients; the clipboard service publishes on the same bus
+            thumbnail_service: Optional ThumbnailService for thumbnails built
+                on the fly (one is created when first needed)
         """
         logger.info("[IPCService.__init__] Starting initialization...")
         self.db_service = database_service
         self.settings_service = settings_service
         self.clipboard_service = clipboard_service
+        self.maintenance = maintenance
+        self.pool = pool or WorkPool({LANE_REQUESTS: self.REQUEST_WORKERS, LANE_INGEST: self.INGEST_WORKERS})
+        self.event_bus = event_bus or EventBus()
+        self.thumbnail_service = thumbnail_service
         self.clients: Set[IPCConnection] = set()
         self.ui_pid: Optional[int] = None
-        self.last_known_id = database_service.get_latest_id() or 0
+        # Item events waiting to be pushed, created with the first connection
+        self._item_events: Optional[asyncio.Queue] = None
+        self._item_events_task: Optional[asyncio.Task] = None
         self.socket_path = self._get_socket_path()
         logger.info("[IPCService.__init__] Initialization complete")
 
+    def _thumbnails(self):
+        """The thumbnail service, created on first use.
+
+        Imported here: it needs GdkPixbuf, which requests without images
+        (and headless test runs) should not have to load.
+        """
+        if self.thumbnail_service is None:
+            from server.src.services.thumbnail_service import ThumbnailService
+            self.thumbnail_service = ThumbnailService(self.db_service)
+        return self.thumbnail_service
+
     def _get_socket_path(self) -> str:
         """Get the UNIX socket path in XDG_RUNTIME_DIR."""
         runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
         return os.path.join(runtime_dir, "tfcbm-ipc.sock")
 
     @staticmethod
-    def _find_match_page(full_content, search_query, page_size):
-        """Find which page contains the earliest match for the search query.
-
-        Args:
-            full_content: The full text content
-            search_query: The search query string
-            page_size: Characters per page
-
-        Returns:
-            Page number (0-indexed) containing the earliest match, or 0 if no match
-        """
-        if not search_query or not full_content:
-            return 0
-
+    def _search_terms(search_query):
+        """Split a search query into terms (quoted phrases + individual words)."""
         query = search_query.strip()
-        content_lower = full_content.lower()
-
-        # Parse query into terms (quoted phrases + individual words)
         if query.startswith('"') and query.endswith('"') and query.count('"') == 2:
-            terms = [query[1:-1]]
-        else:
-            parts = re.findall(r'"[^"]+"|\S+', query)
-            terms = [p.strip('"') for p in parts]
-
-        # Find earliest match position across all terms
-        earliest_pos = len(full_content)
-        for term in terms:
-            if not term:
-                continue
-            pos = content_lower.find(term.lower())
-            if pos != -1 and pos < earliest_pos:
-                earliest_pos = pos
-
-        if earliest_pos >= len(full_content):
-            return 0
-
-        return earliest_pos // page_size
+            return [query[1:-1]]
+        parts = re.findall(r'"[^"]+"|\S+', query)
+        return [p.strip('"') for p in parts]
 
     def prepare_item_for_ui(self, item: dict, search_query=None) -> dict:
-        """Convert database item to UI-renderable format"""
+        """Convert database item to UI-renderable format
+
+        Accepts both full items (from get_item) and list-view items, which
+        carry a preview, the total length and file metadata instead of data.
+        Timestamps are stored as epoch microseconds and sent as ISO strings.
+        Thumbnails and formatted content stay bytes; the connection sends
+        them raw or as base64, depending on its framing.
+        """
         item_type = item["type"]
-        data = item["data"]
+        data = item.get("data")
         thumbnail = item.get("thumbnail")
         content_truncated = False
         content_page = 0
         total_pages = 1
         total_length = 0
 
-        if item_type == "text" or item_type == "url":
+        if (item_type == "text" or item_type == "url") and "preview" in item:
+            # Built from the columns precomputed at ingest
+            total_length = item["total_length"] or 0
+            total_pages = item["total_pages"] or 1
+            content = item["preview"] or ""
+
+            # Fetch only the page holding the match, not the whole text
+            if search_query and total_pages > 1:
+                content_page = self.db_service.find_text_match_page(
+                    item["id"], self._search_terms(search_query), TEXT_PAGE_SIZE
+                )
+                if content_page:
+                    page = self.db_service.get_text_page(item["id"], content_page, TEXT_PAGE_SIZE)
+                    content = page["content"] if page else content
+
+            content_truncated = total_pages > 1
+            ui_thumbnail = None
+        elif item_type == "text" or item_type == "url":
             full_content = data.decode("utf-8") if isinstance(data, bytes) else data
             total_length = len(full_content)
             total_pages = max(1, math.ceil(total_length / TEXT_PAGE_SIZE))
 
-            # Determine which page to show in preview
+            # Determine which page to show in preview (long texts are searched chunk by chunk)
             if search_query and total_pages > 1:
-                content_page = self._find_match_page(full_content, search_query, TEXT_PAGE_SIZE)
+                content_page = self.db_service.find_text_match_page(
+                    item["id"], self._search_terms(search_query), TEXT_PAGE_SIZE
+                )
 
             start = content_page * TEXT_PAGE_SIZE
             end = min(start + TEXT_PAGE_SIZE, total_length)
@@ -168,57 +307,58 @@ class IPCService:
             if total_length > end or start > 0:
                 content_truncated = True
 
-            thumbnail_b64 = None
+            ui_thumbnail = None
         elif item_type == "file":
-            try:
-                separator = b'\n---FILE_CONTENT---\n'
-                if separator in data:
-                    metadata_bytes, _ = data.split(separator, 1)
-                    metadata_json = metadata_bytes.decode('utf-8')
-                    metadata = json.loads(metadata_json)
-                    content = metadata
-                else:
-                    content = {"error": "Invalid file data format"}
-                thumbnail_b64 = None
-            except Exception as e:
-                logger.error(f"Error parsing file metadata for item {item['id']}: {e}")
-                content = {"error": "Failed to parse file metadata"}
-                thumbnail_b64 = None
+            # Built from the structured file columns, never the payload
+            content = item.get("file_metadata") or {"error": "Invalid file data format"}
+            ui_thumbnail = None
         elif item_type.startswith("image/") or item_type == "screenshot":
             content = None
             if thumbnail:
-                thumbnail_b64 = base64.b64encode(thumbnail).decode("utf-8")
-                if len(thumbnail_b64) > 500 * 1024:
+                ui_thumbnail = thumbnail
+                if len(ui_thumbnail) > MAX_THUMBNAIL_SIZE:
                     logger.warning(f"Thumbnail for item {item['id']} is too large, sending None.")
-                    thumbnail_b64 = None
+                    ui_thumbnail = None
             else:
-                thumb_service = ThumbnailService(self.db_service)
-                thumb = thumb_service.generate_thumbnail(data, max_size=250)
+                # List items carry no payload; load it to build the thumbnail
+                if data is None:
+                    full_item = self.db_service.get_item(item["id"])
+                    data = full_item["data"] if full_item else b""
+                thumb = self._thumbnails().generate_thumbnail(data, max_size=250)
                 if thumb:
-                    thumbnail_b64 = base64.b64encode(thumb).decode("utf-8")
-                    if len(thumbnail_b64) <= 500 * 1024:
-                        self.db_service.update_thumbnail(item["id"], thumb)
+                    ui_thumbnail = thumb
+                    if len(ui_thumbnail) <= MAX_THUMBNAIL_SIZE:
+                        # Not awaited: the thumbnail is already in the response
+                        self.db_service.submit_write("update_thumbnail", item["id"], thumb)
                     else:
-                        thumbnail_b64 = None
+                        ui_thumbnail = None
                 else:
-                    thumbnail_b64 = None
+                    ui_thumbnail = None
         else:
             content = None
-            thumbnail_b64 = None
+            ui_thumbnail = None
 
         result = {
             "id": item["id"],
             "type": item_type,
             "content": content,
-            "thumbnail": thumbnail_b64,
-            "timestamp": item["timestamp"],
+            "thumbnail": ui_thumbnail,
+            "timestamp": to_iso(item["timestamp"]),
             "name": item.get("name"),
             "format_type": item.get("format_type"),
-            "formatted_content": base64.b64encode(item["formatted_content"]).decode("utf-8") if item.get("formatted_content") else None,
+            "formatted_content": item.get("formatted_content") or None,
             "is_favorite": item.get("is_favorite", False),
             "content_truncated": content_truncated,
         }
 
+        # Pasted items also carry the time of their last paste
+        if "pasted_timestamp" in item:
+            result["pasted_timestamp"] = to_iso(item["pasted_timestamp"])
+
+        # List items come with their tags, so rows need no get_item_tags call
+        if "tags" in item:
+            result["tags"] = item["tags"]
+
         if item_type in ("text", "url"):
             result["content_page"] = content_page
             result["total_pages"] = total_pages
@@ -231,8 +371,15 @@ class IPCService:
         addr = writer.get_extra_info('peername', 'unknown')
         logger.info(f"IPC client connected from {addr}")
 
-        connection = IPCConnection(reader, writer)
+        self._start_item_events()
+        connection = IPCConnection(reader, writer, self.pool)
         self.clients.add(connection)
+        # Requests with a request_id run concurrently, as the client matches
+        # their replies by ID; the rest are handled one by one, in order
+        in_flight = asyncio.Semaphore(self.MAX_IN_FLIGHT)
+        ordered: asyncio.Queue = asyncio.Queue()
+        ordered_task = asyncio.create_task(self._handle_in_order(connection, ordered))
+        tasks: Set[asyncio.Task] = set()
 
         try:
             while not connection.closed:
@@ -240,25 +387,111 @@ class IPCService:
                 if message is None:
                     break
 
-                try:
-                    await self._handle_message(connection, message)
-                except Exception as e:
-                    logger.error(f"Error handling IPC message: {e}")
-                    traceback.print_exc()
+                if self.maintenance:
+                    self.maintenance.note_activity()
+
+                if message.get("action") == "hello":
+                    # Later messages may already arrive in the negotiated framing
+                    await self._handle_safely(connection, message)
+                elif message.get("request_id") is None:
+                    ordered.put_nowait(message)
+                else:
+                    await in_flight.acquire()
+                    token = current_request_id.set(message["request_id"])
+                    try:
+                        task = asyncio.create_task(self._handle_safely(connection, message))
+                    finally:
+                        current_request_id.reset(token)
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    task.add_done_callback(lambda _: in_flight.release())
 
         except Exception as e:
             logger.error(f"IPC handler error: {e}")
             traceback.print_exc()
         finally:
             self.clients.discard(connection)
+            # Let the requests already received finish; their replies are
+            # dropped once the connection is closed
+            ordered.put_nowait(None)
+            await asyncio.gather(ordered_task, *tasks, return_exceptions=True)
             await connection.close()
             logger.info("IPC client disconnected")
 
+    def _start_item_events(self):
+        """Subscribe to item events, pushing them from the loop serving the clients.
+
+        Events come from ingest threads; they are queued on this loop and
+        pushed one at a time, in the order they were published.
+        """
+        if self._item_events is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self._item_events = asyncio.Queue()
+
+        def enqueue(event, item_id):
+            loop.call_soon_threadsafe(self._item_events.put_nowait, (event, item_id))
+
+        for event in (ITEM_CREATED, ITEM_UPDATED, ITEM_DELETED):
+            self.event_bus.subscribe(event, enqueue)
+        self._item_events_task = loop.create_task(self._push_item_events())
+
+    async def _push_item_events(self):
+        """Broadcast queued item events, with the prepared item for new and updated ones."""
+        while True:
+            event, item_id = await self._item_events.get()
+            try:
+                if event == ITEM_DELETED:
+                    await self.broadcast({"type": "item_deleted", "id": item_id})
+                    continue
+                if not self.clients:
+                    continue
+                item = await self._run(self.db_service.get_list_item, item_id)
+                if item is None:
+                    continue  # Deleted before it could be pushed
+                ui_item = await self._run(self.prepare_item_for_ui, item)
+                if event == ITEM_CREATED:
+                    await self.broadcast({"type": "new_item", "item": ui_item})
+                    logger.info(f"Pushed new item {item_id} ({item['type']}) to {len(self.clients)} clients")
+                else:
+                    await self.broadcast({"type": "item_updated", "item_id": item_id, "item": ui_item})
+            except Exception as e:
+                logger.error(f"Error pushing {event} for item {item_id}: {e}")
+
+    async def _handle_in_order(self, connection: IPCConnection, messages: asyncio.Queue):
+        """Handle queued messages one at a time until None is queued."""
+        while True:
+            message = await messages.get()
+            if message is None:
+                return
+            await self._handle_safely(connection, message)
+
+    async def _handle_safely(self, connection: IPCConnection, message: dict):
+        """Handle a message, logging rather than raising its errors."""
+        token = current_request_id.set(message.get("request_id"))
+        try:
+            await self._handle_message(connection, message)
+        except Exception as e:
+            logger.error(f"Error handling IPC message: {e}")
+            traceback.print_exc()
+        finally:
+            current_request_id.reset(token)
+
+    async def _run(self, fn, *args, **kwargs):
+        """Run blocking work (database access, payload preparation) on the request lane."""
+        return await self.pool.run(LANE_REQUESTS, fn, *args, **kwargs)
+
+    def _prepare_items(self, items, search_query=None) -> list:
+        """Prepare a list of database items for the UI."""
+        return [self.prepare_item_for_ui(item, search_query=search_query) for item in items]
+
     async def _handle_message(self, connection: IPCConnection, data: dict):
         """Handle individual IPC message"""
         action = data.get("action")
 
-        if action == "get_history":
+        if action == "hello":
+            await self._handle_hello(connection, data)
+        elif action == "get_history":
             await self._handle_get_history(connection, data)
         elif action == "register_ui_pid":
             await self._handle_register_ui_pid(connection, data)
@@ -313,22 +546,48 @@ class IPCService:
         else:
             logger.warning(f"Unknown IPC action: {action}")
 
+    async def _handle_hello(self, connection: IPCConnection, data):
+        """Handle hello action - negotiate the framing of the connection
+
+        The reply is still a JSON frame; messages after it use the framing it
+        names. Clients that never say hello keep JSON frames.
+        """
+        framings = data.get("framings", [])
+        version = data.get("version", FRAMING_VERSION)
+        framing = FRAMING_BINARY if FRAMING_BINARY in framings and version == FRAMING_VERSION else FRAMING_JSON
+        await connection.send_json({"type": "hello", "framing": framing, "version": FRAMING_VERSION})
+        connection.framing = framing
+        logger.info(f"IPC client negotiated {framing} framing")
+
     async def _handle_get_history(self, connection: IPCConnection, data):
         """Handle get_history action"""
         limit = data.get("limit", self.settings_service.max_page_length)
         offset = data.get("offset", 0)
         sort_order = data.get("sort_order", "DESC")
         filters = data.get("filters", None)
+        cursor = data.get("cursor")
 
         logger.info(f"[FILTER] get_history request with filters: {filters}")
 
-        items = self.db_service.get_items(limit=limit, offset=offset, sort_order=sort_order, filters=filters)
-        total_count = self.db_service.get_total_count()
+        items = await self._run(self.db_service.get_items, limit=limit, offset=offset, sort_order=sort_order,
+                                 filters=filters, cursor=cursor)
+        total_count = await self._run(self.db_service.get_total_count)
         logger.info(f"[FILTER] Returned {len(items)} items (total: {total_count})")
 
-        ui_items = [self.prepare_item_for_ui(item) for item in items]
+        ui_items = await self._run(self._prepare_items, items)
+
+        # Clients that send the cursor back fetch the next page with a keyset seek;
+        # older clients keep paging by offset
+        next_cursor = self.db_service.history_cursor(items) if len(items) == limit else None
 
-        response = {"type": "history", "items": ui_items, "total_count": total_count, "offset": offset}
+        response = {
+            "type": "history",
+            "items": ui_items,
+            "total_count": total_count,
+            "offset": offset,
+            "sort_order": sort_order,
+            "next_cursor": next_cursor,
+        }
         await connection.send_json(response)
 
     async def _handle_register_ui_pid(self, connection: IPCConnection, data):
@@ -343,30 +602,45 @@ class IPCService:
         await connection.send_json(response)
 
     async def _handle_get_full_image(self, connection: IPCConnection, data):
-        """Handle get_full_image action"""
+        """Handle get_full_image action - stream the full image or file content
+
+        Every request gets a reply: the content, or an error the UI can show
+        instead of waiting out its timeout.
+        """
         item_id = data.get("id")
-        if item_id:
-            item = self.db_service.get_item(item_id)
-            if item and (item["type"].startswith("image/") or item["type"] == "screenshot"):
-                full_image_b64 = base64.b64encode(item["data"]).decode("utf-8")
-                response = {"type": "full_image", "id": item_id, "content": full_image_b64}
-                await connection.send_json(response)
-            elif item and item["type"] == "file":
-                separator = b'\n---FILE_CONTENT---\n'
-                if separator in item["data"]:
-                    _, file_content = item["data"].split(separator, 1)
-                    file_content_b64 = base64.b64encode(file_content).decode("utf-8")
-                    response = {"type": "full_file", "id": item_id, "content": file_content_b64}
-                    await connection.send_json(response)
-                else:
-                    response = {"type": "error", "message": "Invalid file data format"}
-                    await connection.send_json(response)
+        if not item_id:
+            await connection.send_json({"type": "error", "message": "id is required"})
+            return
+
+        try:
+            stream = await self._run(self.db_service.stream_payload, item_id)
+            if stream is None:
+                item = await self._run(self.db_service.get_list_item, item_id)
+        except Exception as e:
+            # e.g. the blob store file of the item is missing
+            logger.error(f"Error reading payload of item {item_id}: {e}")
+            await connection.send_json({"type": "error", "id": item_id, "message": f"Could not read item: {e}"})
+            return
+
+        if stream is None:
+            if item and item["type"] == "file":
+                message = "Invalid file data format"
+            elif item:
+                message = "Item is not an image or file"
+            else:
+                message = "Item not found"
+            await connection.send_json({"type": "error", "id": item_id, "message": message})
+            return
+
+        item_type, size, chunks = stream
+        response_type = "full_file" if item_type == "file" else "full_image"
+        await connection.send_json_stream({"type": response_type, "id": item_id}, "content", size, chunks)
 
     async def _handle_get_full_text(self, connection: IPCConnection, data):
         """Handle get_full_text action - fetch full text content for truncated items"""
         item_id = data.get("id")
         if item_id:
-            item = self.db_service.get_item(item_id)
+            item = await self._run(self.db_service.get_item, item_id)
             if item and (item["type"] == "text" or item["type"] == "url"):
                 full_content = item["data"].decode("utf-8") if isinstance(item["data"], bytes) else item["data"]
                 response = {"type": "full_text", "id": item_id, "content": full_content}
@@ -380,9 +654,11 @@ class IPCService:
         """Handle delete_item action"""
         item_id = data.get("id")
         if item_id:
-            self.db_service.delete_item(item_id)
+            deleted = await self._run(self.db_service.delete_item, item_id)
             await connection.send_json({"status": "success", "id": item_id})
-            await self.broadcast({"type": "item_deleted", "id": item_id})
+            if deleted:
+                # Clients are told through the item events, like retention deletes
+                self.event_bus.publish(ITEM_DELETED, item_id)
 
     async def _handle_get_recently_pasted(self, connection: IPCConnection, data):
         """Handle get_recently_pasted action"""
@@ -390,17 +666,28 @@ class IPCService:
         offset = data.get("offset", 0)
         sort_order = data.get("sort_order", "DESC")
         filters = data.get("filters", [])
+        cursor = data.get("cursor")
 
-        items = self.db_service.get_recently_pasted(limit=limit, offset=offset, sort_order=sort_order, filters=filters)
-        total_count = self.db_service.get_pasted_count()
+        items = await self._run(self.db_service.get_recently_pasted, limit=limit, offset=offset,
+                                 sort_order=sort_order, filters=filters, cursor=cursor)
+        total_count = await self._run(self.db_service.get_pasted_count)
 
-        ui_items = [self.prepare_item_for_ui(item) for item in items]
+        ui_items = await self._run(self._prepare_items, items)
 
         for i, item in enumerate(items):
-            ui_items[i]["pasted_timestamp"] = item["pasted_timestamp"]
+            ui_items[i]["paste_count"] = item["paste_count"]
+
+        next_cursor = self.db_service.pasted_cursor(items) if len(items) == limit else None
 
         logger.info(f"Sending {len(ui_items)} pasted items (total: {total_count}, offset: {offset})")
-        response = {"type": "recently_pasted", "items": ui_items, "total_count": total_count, "offset": offset}
+        response = {
+            "type": "recently_pasted",
+            "items": ui_items,
+            "total_count": total_count,
+            "offset": offset,
+            "sort_order": sort_order,
+            "next_cursor": next_cursor,
+        }
         await connection.send_json(response)
 
     async def _handle_record_paste(self, connection: IPCConnection, data):
@@ -408,7 +695,7 @@ class IPCService:
         item_id = data.get("id")
         if item_id:
             logger.info(f"Received record_paste request for item {item_id}")
-            paste_id = self.db_service.add_pasted_item(item_id)
+            paste_id = await self._run(self.db_service.add_pasted_item, item_id)
             logger.info(f"Recorded paste for item {item_id} (paste_id={paste_id})")
             response = {"type": "paste_recorded", "success": True, "paste_id": paste_id}
             await connection.send_json(response)
@@ -418,11 +705,15 @@ class IPCService:
         query = data.get("query", "").strip()
         limit = data.get("limit", 100)
         filters = data.get("filters", [])
+        mode = data.get("mode", "token")
+        if mode not in self.db_service.SEARCH_MODES:
+            logger.warning(f"Unknown search mode '{mode}', using token search")
+            mode = "token"
 
         if query:
-            logger.info(f"Searching for: '{query}' (limit={limit}, filters={filters})")
-            results = self.db_service.search_items(query, limit, filters)
-            ui_items = [self.prepare_item_for_ui(item, search_query=query) for item in results]
+            logger.info(f"Searching for: '{query}' (limit={limit}, filters={filters}, mode={mode})")
+            results = await self._run(self.db_service.search_items, query, limit, filters, mode)
+            ui_items = await self._run(self._prepare_items, results, search_query=query)
             response = {"type": "search_results", "query": query, "items": ui_items, "count": len(ui_items)}
             await connection.send_json(response)
             logger.info(f"Search complete: {len(ui_items)} results")
@@ -433,7 +724,7 @@ class IPCService:
     async def _handle_get_tags(self, connection: IPCConnection):
         """Handle get_tags action"""
         logger.info("Fetching all tags")
-        tags = self.db_service.get_all_tags()
+        tags = await self._run(self.db_service.get_all_tags)
         response = {"type": "tags", "tags": tags}
         await connection.send_json(response)
         logger.info(f"Sent {len(tags)} tags")
@@ -447,8 +738,8 @@ class IPCService:
         if name:
             logger.info(f"Creating tag: '{name}'")
             try:
-                tag_id = self.db_service.create_tag(name, description, color)
-                tag = self.db_service.get_tag(tag_id)
+                tag_id = await self._run(self.db_service.create_tag, name, description, color)
+                tag = await self._run(self.db_service.get_tag, tag_id)
                 response = {"type": "tag_created", "tag": tag, "success": True}
                 await connection.send_json(response)
                 logger.info(f"Created tag: ID={tag_id}, Name='{name}'")
@@ -469,9 +760,9 @@ class IPCService:
 
         if tag_id:
             logger.info(f"Updating tag ID={tag_id}")
-            success = self.db_service.update_tag(tag_id, name, description, color)
+            success = await self._run(self.db_service.update_tag, tag_id, name, description, color)
             if success:
-                tag = self.db_service.get_tag(tag_id)
+                tag = await self._run(self.db_service.get_tag, tag_id)
             response = {"type": "tag_updated", "tag": tag if success else None, "success": success}
             await connection.send_json(response)
             logger.info(f"Updated tag ID={tag_id}: {success}")
@@ -485,7 +776,7 @@ class IPCService:
 
         if tag_id:
             logger.info(f"Deleting tag ID={tag_id}")
-            success = self.db_service.delete_tag(tag_id)
+            success = await self._run(self.db_service.delete_tag, tag_id)
             response = {"type": "tag_deleted", "tag_id": tag_id, "success": success}
             await connection.send_json(response)
             logger.info(f"Deleted tag ID={tag_id}: {success}")
@@ -500,7 +791,7 @@ class IPCService:
 
         if item_id and tag_id:
             logger.info(f"Adding tag {tag_id} to item {item_id}")
-            success = self.db_service.add_tag_to_item(item_id, tag_id)
+            success = await self._run(self.db_service.add_tag_to_item, item_id, tag_id)
 
             if success:
                 response = {"type": "tag_added", "item_id": item_id, "tag_id": tag_id, "success": True}
@@ -521,7 +812,7 @@ class IPCService:
 
         if item_id and tag_id:
             logger.info(f"Removing tag {tag_id} from item {item_id}")
-            success = self.db_service.remove_tag_from_item(item_id, tag_id)
+            success = await self._run(self.db_service.remove_tag_from_item, item_id, tag_id)
 
             if success:
                 response = {"type": "tag_removed", "item_id": item_id, "tag_id": tag_id, "success": True}
@@ -541,7 +832,7 @@ class IPCService:
 
         if item_id:
             logger.info(f"Fetching tags for item {item_id}")
-            tags = self.db_service.get_tags_for_item(item_id)
+            tags = await self._run(self.db_service.get_tags_for_item, item_id)
             response = {"type": "item_tags", "item_id": item_id, "tags": tags}
             await connection.send_json(response)
             logger.info(f"Sent {len(tags)} tags for item {item_id}")
@@ -558,8 +849,8 @@ class IPCService:
 
         if tag_ids:
             logger.info(f"Fetching items by tags: {tag_ids} (match_all={match_all})")
-            results = self.db_service.get_items_by_tags(tag_ids, match_all, limit, offset)
-            ui_items = [self.prepare_item_for_ui(item) for item in results]
+            results = await self._run(self.db_service.get_items_by_tags, tag_ids, match_all, limit, offset)
+            ui_items = await self._run(self._prepare_items, results)
             response = {"type": "items_by_tags", "items": ui_items, "count": len(ui_items)}
             await connection.send_json(response)
             logger.info(f"Sent {len(ui_items)} items for tags {tag_ids}")
@@ -574,7 +865,7 @@ class IPCService:
 
         if item_id is not None:
             logger.info(f"Updating name for item {item_id}: '{name}'")
-            success = self.db_service.update_item_name(item_id, name)
+            success = await self._run(self.db_service.update_item_name, item_id, name)
             response = {"type": "item_name_updated", "item_id": item_id, "name": name, "success": success}
             await connection.send_json(response)
 
@@ -592,7 +883,7 @@ class IPCService:
 
         if item_id is not None:
             logger.info(f"Toggling favorite for item {item_id}: is_favorite={is_favorite}")
-            success = self.db_service.toggle_favorite(item_id, is_favorite)
+            success = await self._run(self.db_service.toggle_favorite, item_id, is_favorite)
 
             if success:
                 response = {
@@ -626,10 +917,10 @@ class IPCService:
         item_id = data.get("item_id")
         if item_id is not None:
             logger.info(f"Fetching item {item_id}")
-            item = self.db_service.get_item(item_id)
+            item = await self._run(self.db_service.get_item, item_id)
 
             if item:
-                ui_item = self.prepare_item_for_ui(item)
+                ui_item = await self._run(self.prepare_item_for_ui, item)
                 response = {"type": "item", "item": ui_item}
                 logger.info(f"Sending item {item_id} to client")
             else:
@@ -644,7 +935,7 @@ class IPCService:
     async def _handle_get_file_extensions(self, connection: IPCConnection):
         """Handle get_file_extensions action"""
         logger.info("Fetching file extensions")
-        extensions = self.db_service.get_file_extensions()
+        extensions = await self._run(self.db_service.get_file_extensions)
         response = {"type": "file_extensions", "extensions": extensions}
         await connection.send_json(response)
         logger.info(f"Sent {len(extensions)} file extensions")
@@ -653,14 +944,19 @@ class IPCService:
         """Handle clipboard_event action"""
         event_data = data.get("data", {})
         logger.info(f"Received clipboard event via IPC: {event_data.get('type', 'unknown')}")
+        await self.pool.run(LANE_INGEST, self._ingest, event_data)
+
+    def _ingest(self, event_data: dict):
+        """Store a clipboard event and enforce retention.
+
+        Runs on the ingest lane, so a large file does not hold up requests.
+        The stored and pruned items reach clients as events on the bus.
+        """
         self.clipboard_service.handle_clipboard_event(event_data)
 
-        # Enforce retention and notify UI of any deletions
         if self.settings_service.retention_enabled:
-            max_items = self.settings_service.retention_max_items
-            deleted_ids = self.db_service.cleanup_old_items(max_items)
-            for item_id in deleted_ids:
-                await self.broadcast({"type": "item_deleted", "id": item_id})
+            for item_id in self.db_service.cleanup_old_items(self.settings_service.retention_max_items):
+                self.event_bus.publish(ITEM_DELETED, item_id)
 
     async def _handle_shutdown(self, connection: IPCConnection):
         """Handle shutdown action - gracefully shutdown the server"""
@@ -680,8 +976,12 @@ class IPCService:
 
     async def _handle_get_total_count(self, connection: IPCConnection):
         """Handle get_total_count action"""
-        total = self.db_service.get_total_count()
-        response = {"type": "total_count", "total": total}
+        total = await self._run(self.db_service.get_total_count)
+        response = {
+            "type": "total_count",
+            "total": total,
+            "kind_counts": await self._run(self.db_service.get_kind_counts),
+        }
         await connection.send_json(response)
         logger.info(f"Sent total count: {total}")
 
@@ -697,11 +997,12 @@ class IPCService:
             # Delete items if requested
             deleted = 0
             if delete_count > 0:
-                deleted = self.db_service.bulk_delete_oldest(delete_count)
+                deleted = await self._run(self.db_service.bulk_delete_oldest, delete_count)
                 logger.info(f"Deleted {deleted} oldest items")
 
             # Update settings
-            self.settings_service.update_settings(
+            await self._run(
+                self.settings_service.update_settings,
                 **{
                     "retention.enabled": enabled,
                     "retention.max_items": max_items
@@ -740,7 +1041,8 @@ class IPCService:
         try:
             # Update settings
             if refocus_on_copy is not None:
-                self.settings_service.update_settings(
+                await self._run(
+                    self.settings_service.update_settings,
                     **{"clipboard.refocus_on_copy": refocus_on_copy}
                 )
 
@@ -772,7 +1074,7 @@ class IPCService:
         page_size = data.get("page_size", TEXT_PAGE_SIZE)
 
         if item_id is not None:
-            result = self.db_service.get_text_page(item_id, page, page_size)
+            result = await self._run(self.db_service.get_text_page, item_id, page, page_size)
             if result:
                 response = {
                     "type": "text_page",
@@ -794,9 +1096,14 @@ class IPCService:
         if self.clients:
             # Create tasks for all sends but don't wait for all to complete
             tasks = []
+            frames = {}  # Encoded once per framing
             for client in list(self.clients):  # Create a copy to avoid modification during iteration
                 if not client.closed:
-                    tasks.append(client.send_json(message))
+                    if client.framing not in frames:
+                        frames[client.framing] = await self.pool.run(
+                            LANE_REQUESTS, encode_frame, message, client.framing
+                        )
+                    tasks.append(client.send_frame(frames[client.framing]))
 
             if tasks:
                 await asyncio.gather(*tasks, return_exceptions=True)
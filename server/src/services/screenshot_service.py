@@ -11,6 +11,7 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+from server.src.event_bus import ITEM_CREATED, EventBus
 from server.src.services.database_service import DatabaseService
 from server.src.services.thumbnail_service import ThumbnailService
 
@@ -21,7 +22,8 @@ class ScreenshotService:
     """Service for capturing periodic screenshots"""
 
     def __init__(self, database_service: DatabaseService, thumbnail_service: ThumbnailService,
-                 enabled: bool = False, interval: int = 30, save_dir: str = None):
+                 enabled: bool = False, interval: int = 30, save_dir: str = None,
+                 event_bus: EventBus = None):
         """
         Initialize screenshot service
 
@@ -31,6 +33,7 @@ class ScreenshotService:
             enabled: Whether screenshot capture is enabled
             interval: Interval between screenshots in seconds
             save_dir: Optional directory to save screenshots to disk
+            event_bus: Optional EventBus told about every screenshot stored
         """
         logger.info("[ScreenshotService.__init__] Starting initialization...")
         self.db_service = database_service
@@ -38,6 +41,7 @@ class ScreenshotService:
         self.enabled = enabled
         self.interval = interval
         self.save_dir = save_dir
+        self.event_bus = event_bus
         self.worker_thread = None
         logger.info("[ScreenshotService.__init__] Initialization complete")
 
@@ -72,6 +76,8 @@ class ScreenshotService:
                     # Save to database
                     image_bytes = base64.b64decode(image_data)
                     item_id = self.db_service.add_item("screenshot", image_bytes, timestamp_str)
+                    if self.event_bus:
+                        self.event_bus.publish(ITEM_CREATED, item_id)
 
                     # Generate thumbnail asynchronously
                     self.thumbnail_service.process_thumbnail_async(item_id, image_bytes)
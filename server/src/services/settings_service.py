@@ -51,6 +51,11 @@ class SettingsService:
         """Get retention max items setting"""
         return self._manager.retention_max_items
 
+    @property
+    def read_pool_size(self) -> int:
+        """Get database read pool size setting"""
+        return self._manager.read_pool_size
+
     def update_settings(self, **kwargs):
         """Update settings"""
         self._manager.update_settings(**kwargs)
@@ -52,6 +52,17 @@ class ApplicationSettings:
     autostart_enabled: bool = False
 
 
+@dataclass
+class DatabaseSettings:
+    """Database storage settings"""
+    read_pool_size: int = 4
+
+    def __post_init__(self):
+        """Validate settings"""
+        if not 0 <= self.read_pool_size <= 16:
+            raise ValueError("read_pool_size must be between 0 and 16")
+
+
 @dataclass
 class Settings:
     """Main settings model"""
@@ -59,6 +70,7 @@ class Settings:
     retention: RetentionSettings = field(default_factory=RetentionSettings)
     clipboard: ClipboardSettings = field(default_factory=ClipboardSettings)
     application: ApplicationSettings = field(default_factory=ApplicationSettings)
+    database: DatabaseSettings = field(default_factory=DatabaseSettings)
 
 
 class SettingsManager:
@@ -102,7 +114,8 @@ class SettingsManager:
                 display=DisplaySettings(**config_data.get('display', {})),
                 retention=RetentionSettings(**config_data.get('retention', {})),
                 clipboard=ClipboardSettings(**config_data.get('clipboard', {})),
-                application=ApplicationSettings(**config_data.get('application', {}))
+                application=ApplicationSettings(**config_data.get('application', {})),
+                database=DatabaseSettings(**config_data.get('database', {}))
             )
             print(f"Loaded settings from {self.config_path}")
             print(f"  - Max page length: {settings.display.max_page_length}")
@@ -156,6 +169,11 @@ class SettingsManager:
         """Get the autostart enabled setting"""
         return self.settings.application.autostart_enabled
 
+    @property
+    def read_pool_size(self) -> int:
+        """Get the number of pooled database read connections"""
+        return self.settings.database.read_pool_size
+
     def update_settings(self, **kwargs):
         """Update settings and save to file"""
         # Update the settings object
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Timestamp conversions for TFCBM
+The database stores times as integer microseconds since the epoch; ISO
+strings are only produced for the UI
+"""
+
+from datetime import datetime
+from typing import Optional, Union
+
+MICROSECONDS = 1_000_000
+
+
+def now_us() -> int:
+    """Current time in microseconds since the epoch"""
+    return to_epoch_us(datetime.now())
+
+
+def to_epoch_us(value: Union[int, str, datetime, None]) -> Optional[int]:
+    """
+    Convert a timestamp to microseconds since the epoch.
+
+    Args:
+        value: Epoch microseconds (returned as is), a datetime or an ISO
+            format string; naive values are local time
+
+    Returns:
+        Microseconds since the epoch, or None for None
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    # Whole seconds through timestamp(), microseconds added exactly
+    seconds = int(value.replace(microsecond=0).timestamp())
+    return seconds * MICROSECONDS + value.microsecond
+
+
+def to_iso(value: Optional[int]) -> Optional[str]:
+    """
+    Format epoch microseconds as a local ISO timestamp.
+
+    Args:
+        value: Microseconds since the epoch; strings are passed through
+
+    Returns:
+        ISO format string, or None for None
+    """
+    if value is None or isinstance(value, str):
+        return value
+    seconds, micros = divmod(value, MICROSECONDS)
+    return datetime.fromtimestamp(seconds).replace(microsecond=micros).isoformat()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Bounded thread pools for the blocking work of IPC requests
+Handlers run on the single IPC event loop; database access, payload
+preparation and frame encoding are handed to a pool lane, so the loop keeps
+serving other clients and broadcasts while that work runs
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class WorkPool:
+    """
+    Named lanes of worker threads, each with its own concurrency limit.
+
+    A lane runs at most `workers` jobs at once. At most QUEUE_FACTOR times
+    that many jobs are queued or running; further callers wait on the event
+    loop, which backs pressure up to the connections sending the requests.
+    Separate lanes keep slow work (a large clipboard ingest) from taking the
+    threads that answer quick queries.
+    """
+
+    QUEUE_FACTOR = 4
+
+    def __init__(self, lanes: Dict[str, int]):
+        """
+        Args:
+            lanes: Number of worker threads per lane name
+        """
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"ipc-{name}")
+            for name, workers in lanes.items()
+        }
+        self._slots = {
+            name: asyncio.Semaphore(workers * self.QUEUE_FACTOR)
+            for name, workers in lanes.items()
+        }
+
+    async def run(self, lane: str, fn: Callable, *args, **kwargs):
+        """
+        Run a blocking callable on a lane and wait for its result.
+
+        Args:
+            lane: Lane name
+            fn: Blocking callable
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            What fn returned; exceptions raised by fn propagate
+        """
+        async with self._slots[lane]:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executors[lane], functools.partial(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads, finishing the jobs already running."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Group-commit write queue for the clipboard database
+All mutations run on one writer thread; writes arriving close together are
+applied in a single transaction, so a burst pays for one commit
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+
+class WriteQueue:
+    """
+    Single writer thread applying queued writes in group commits.
+
+    The thread takes the first queued write, collects whatever else arrives
+    within WINDOW seconds (up to MAX_BATCH writes), runs them inside
+    ClipboardDB.group_commit() with a savepoint each, commits once and then
+    resolves their futures. A write that raises is rolled back on its own
+    and its future gets the exception; the rest of the group still commits.
+
+    The window is cut short when nothing is queued and every thread blocked
+    in run() is already in the group: no write can arrive before they resume.
+    """
+
+    WINDOW = 0.002
+    MAX_BATCH = 256
+
+    def __init__(self, db, lock: threading.Lock, window: float = None, max_batch: int = None):
+        """
+        Args:
+            db: ClipboardDB whose writer connection is used
+            lock: Lock serializing use of the writer connection, held per group
+            window: Seconds to wait for more writes after the first (default WINDOW)
+            max_batch: Most writes per commit (default MAX_BATCH)
+        """
+        self.db = db
+        self.lock = lock
+        self.window = self.WINDOW if window is None else window
+        self.max_batch = max_batch or self.MAX_BATCH
+        self._queue: queue.Queue = queue.Queue()
+        self._blocked = 0
+        self._blocked_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a write.
+
+        Args:
+            fn: Callable making the write on the writer connection
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Future resolved with fn's result once the write is committed
+        """
+        future: Future = Future()
+        if threading.current_thread() is self._thread:
+            # Called from inside a queued write: part of the same group
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        if self._closed:
+            raise RuntimeError("Write queue is closed")
+        self._queue.put((fn, args, kwargs, future))
+        return future
+
+    def run(self, fn: Callable, *args, **kwargs):
+        """Queue a write and wait for it to be committed; returns its result"""
+        with self._blocked_lock:
+            self._blocked += 1
+        try:
+            return self.submit(fn, *args, **kwargs).result()
+        finally:
+            with self._blocked_lock:
+                self._blocked -= 1
+
+    def close(self, timeout: Optional[float] = None):
+        """Apply the writes already queued and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                try:
+                    task = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or len(batch) >= self._blocked:
+                        break
+                    try:
+                        task = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if task is None:
+                    stop = True
+                    break
+                batch.append(task)
+            self._apply(batch)
+            if stop:
+                return
+
+    def _apply(self, batch: list):
+        """Run a group of writes in one transaction and resolve their futures"""
+        outcomes = []
+        try:
+            with self.lock, self.db.group_commit():
+                for fn, args, kwargs, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with self.db.savepoint():
+                            outcomes.append((future, fn(*args, **kwargs), None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+        except Exception as e:
+            logging.error(f"Group commit of {len(batch)} writes failed: {e}")
+            for _, _, _, future in batch:
+                if future.running():
+                    future.set_exception(e)
+            return
+
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
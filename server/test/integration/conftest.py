@@ -13,3 +13,5 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 # Add test/integration to path for fixtures imports
 sys.path.insert(0, str(Path(__file__).parent))
+# Add the repository root for code importing the server.src and ui packages
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
@@ -2,6 +2,7 @@
 
 import json
 import pytest
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Generator
@@ -29,6 +30,7 @@ def temp_db_file() -> Generator[ClipboardDB, None, None]:
 
     # Clean up
     Path(db_path).unlink(missing_ok=True)
+    shutil.rmtree(Path(db_path).with_suffix(".blobs"), ignore_errors=True)
 
 
 @pytest.fixture
@@ -0,0 +1,59 @@
+"""Benchmark storing a 1,000-file clipboard event."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.test_data import generate_file_data
+
+
+FILES = 1000
+
+
+def _file_items(tag: str) -> list:
+    items = []
+    for i in range(FILES):
+        name = f"{tag}_{i}.dat"
+        items.append({
+            "item_type": "file",
+            "data": generate_file_data(name, content=os.urandom(4096)),
+            "name": name,
+        })
+    return items
+
+
+class TestBulkInsertPerformance:
+    """One executemany and one commit beat a lock round-trip and commit per file."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_thousand_file_event(self, tmp_path):
+        """add_items_bulk against the per-file upsert loop it replaces."""
+        db = ClipboardDB(tmp_path / "bulk.db")
+        lock = threading.Lock()
+        try:
+            loop_items = _file_items("loop")
+            start = time.perf_counter()
+            for item in loop_items:
+                with lock:
+                    db.upsert_item(item["item_type"], item["data"], name=item["name"])
+            loop_s = time.perf_counter() - start
+
+            bulk_items = _file_items("bulk")
+            start = time.perf_counter()
+            with lock:
+                results = db.add_items_bulk(bulk_items)
+            bulk_s = time.perf_counter() - start
+
+            print(
+                f"\n{FILES} files: per-file loop {loop_s * 1000:.0f} ms ({FILES / loop_s:.0f} files/s), "
+                f"bulk {bulk_s * 1000:.0f} ms ({FILES / bulk_s:.0f} files/s)"
+            )
+            assert all(inserted for _, inserted in results)
+            assert db.get_total_count() == 2 * FILES
+            assert bulk_s < loop_s
+        finally:
+            db.close()
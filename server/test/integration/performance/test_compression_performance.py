@@ -0,0 +1,104 @@
+"""Benchmark database size and read latency with payload compression."""
+
+import os
+import random
+import time
+
+import pytest
+
+from database import ClipboardDB
+
+
+WORDS = [
+    "clipboard", "history", "meeting", "notes", "function", "return", "value",
+    "project", "release", "build", "config", "server", "client", "request",
+]
+
+
+def _text(rng: random.Random, words: int) -> bytes:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).encode()
+
+
+def _html(rng: random.Random) -> bytes:
+    rows = "".join(
+        f'<tr class="row"><td class="cell" style="padding: 4px">{rng.choice(WORDS)}</td>'
+        f'<td class="cell"><a href="https://example.com/{rng.choice(WORDS)}">link</a></td></tr>'
+        for _ in range(rng.randint(2, 10))
+    )
+    return f'<html><body><table class="data-table">{rows}</table></body></html>'.encode()
+
+
+def _fill(db: ClipboardDB, count: int):
+    rng = random.Random(42)
+    for _ in range(count):
+        db.add_item(
+            "text",
+            _text(rng, rng.randint(50, 2000)),
+            format_type="html",
+            formatted_content=_html(rng),
+        )
+
+
+def _payload_bytes(db: ClipboardDB) -> int:
+    return db.conn.execute(
+        "SELECT sum(length(data) + coalesce(length(formatted_content), 0)) FROM clipboard_items"
+    ).fetchone()[0]
+
+
+def _db_size(db: ClipboardDB) -> int:
+    db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return os.path.getsize(db.db_path)
+
+
+class TestCompressionPerformance:
+    """Compressed storage is smaller and reads stay fast."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_size_and_read_latency(self, tmp_path):
+        """Compression shrinks the database; get_item pays little for decoding."""
+        count = 2000
+        plain = ClipboardDB(tmp_path / "plain.db")
+        plain.COMPRESS_MIN_SIZE = {}
+        compressed = ClipboardDB(tmp_path / "compressed.db")
+        try:
+            _fill(plain, count)
+            _fill(compressed, count)
+            compressed.train_html_dictionary()
+            after_id = 0
+            while after_id is not None:
+                after_id = compressed.recompress_items(after_id, batch_size=500)
+            compressed.conn.execute("VACUUM")
+
+            plain_payload = _payload_bytes(plain)
+            compressed_payload = _payload_bytes(compressed)
+            plain_size = _db_size(plain)
+            compressed_size = _db_size(compressed)
+
+            ids = random.Random(7).sample(range(1, count + 1), 500)
+
+            def read_all(db):
+                start = time.perf_counter()
+                for item_id in ids:
+                    db.get_item(item_id)
+                return (time.perf_counter() - start) / len(ids) * 1000
+
+            read_all(plain)
+            read_all(compressed)
+            plain_ms = min(read_all(plain) for _ in range(3))
+            compressed_ms = min(read_all(compressed) for _ in range(3))
+
+            print(
+                f"\n{count} items: payloads {compressed_payload / plain_payload:.0%} of plain; "
+                f"file plain {plain_size / 1024:.0f} KB, "
+                f"compressed {compressed_size / 1024:.0f} KB "
+                f"({compressed_size / plain_size:.0%}); get_item "
+                f"plain {plain_ms:.3f} ms, compressed {compressed_ms:.3f} ms"
+            )
+            # The file also holds the full-text indexes, which are not compressed
+            assert compressed_payload < plain_payload * 0.5
+            assert compressed_size < plain_size * 0.8
+            assert compressed_ms < plain_ms + 1.0
+        finally:
+            plain.close()
+            compressed.close()
@@ -0,0 +1,120 @@
+"""Benchmark copy-to-visible latency: database polling against pushed item events."""
+
+import asyncio
+import statistics
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from server.src.event_bus import EventBus
+from server.src.ipc_protocol import FRAMING_BINARY, VERSION, encode_frame, read_frame
+from server.src.services.clipboard_service import ClipboardService
+from server.src.services.database_service import DatabaseService
+from server.src.services.ipc_service import IPCService
+
+
+PUSHED_COPIES = 50
+POLLED_COPIES = 10
+POLL_INTERVAL = 0.5
+
+
+def _poll_for_new_items(ipc_service, loop, stop: threading.Event, last_known_id: int):
+    """The replaced watcher: read MAX(id) every POLL_INTERVAL, then broadcast each new item."""
+    db_service = ipc_service.db_service
+    while not stop.wait(POLL_INTERVAL):
+        latest_id = db_service.get_latest_id()
+        if latest_id and latest_id > last_known_id:
+            for item_id in range(last_known_id + 1, latest_id + 1):
+                item = db_service.get_item(item_id)
+                if item:
+                    message = {"type": "new_item", "item": ipc_service.prepare_item_for_ui(item)}
+                    asyncio.run_coroutine_threadsafe(ipc_service.broadcast(message), loop)
+            last_known_id = latest_id
+
+
+def _copy_latencies(ipc_service, socket_path, copies: int, poll: bool) -> list:
+    """Milliseconds from sending each clipboard event to the listener receiving its new_item."""
+
+    async def connect():
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        writer.write(encode_frame({"action": "hello", "framings": [FRAMING_BINARY], "version": VERSION}, "json"))
+        await read_frame(reader)
+        return reader, writer
+
+    async def run():
+        server = await asyncio.start_unix_server(ipc_service.client_handler, str(socket_path))
+        reader, listener = await connect()
+        _, copier = await connect()
+        stop = threading.Event()
+        if poll:
+            # Read before the first copy, so the poller cannot miss it
+            last_known_id = ipc_service.db_service.get_latest_id() or 0
+            threading.Thread(
+                target=_poll_for_new_items,
+                args=(ipc_service, asyncio.get_running_loop(), stop, last_known_id),
+                daemon=True,
+            ).start()
+        latencies = []
+        try:
+            for i in range(copies):
+                start = time.perf_counter()
+                copier.write(encode_frame(
+                    {"action": "clipboard_event", "data": {"type": "text", "content": f"copy {i}"}}, FRAMING_BINARY
+                ))
+                await copier.drain()
+                while True:
+                    message, _ = await asyncio.wait_for(read_frame(reader), 5)
+                    if message["type"] == "new_item":
+                        break
+                latencies.append((time.perf_counter() - start) * 1000)
+            return latencies
+        finally:
+            stop.set()
+            listener.close()
+            copier.close()
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(run())
+
+
+def _ipc_service(database_service, event_bus) -> IPCService:
+    settings = SimpleNamespace(retention_enabled=False, max_page_length=20)
+    clipboard_service = ClipboardService(database_service, thumbnail_service=None, event_bus=event_bus)
+    return IPCService(database_service, settings, clipboard_service, event_bus=event_bus)
+
+
+class TestCopyLatencyPerformance:
+    """Pushing item events removes the polling delay before a copy shows up."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_copy_to_visible_latency(self, tmp_path):
+        before_db = DatabaseService(str(tmp_path / "before.db"))
+        after_db = DatabaseService(str(tmp_path / "after.db"))
+        try:
+            # No shared bus: nothing is pushed, only the poller broadcasts
+            before = _ipc_service(before_db, event_bus=None)
+            polled = _copy_latencies(before, tmp_path / "before.sock", POLLED_COPIES, poll=True)
+            before.pool.shutdown()
+
+            after = _ipc_service(after_db, EventBus())
+            pushed = _copy_latencies(after, tmp_path / "after.sock", PUSHED_COPIES, poll=False)
+            after.pool.shutdown()
+        finally:
+            before_db.close()
+            after_db.close()
+
+        def summary(latencies):
+            ordered = sorted(latencies)
+            return (
+                f"median {statistics.median(ordered):.1f} ms, "
+                f"p95 {ordered[int(len(ordered) * 0.95) - 1]:.1f} ms, max {ordered[-1]:.1f} ms"
+            )
+
+        print(f"\nCopy to visible, polling every {POLL_INTERVAL * 1000:.0f} ms: {summary(polled)}")
+        print(f"Copy to visible, pushed item events: {summary(pushed)}")
+        assert statistics.median(pushed) < statistics.median(polled)
+        assert statistics.median(pushed) < POLL_INTERVAL * 1000 / 5
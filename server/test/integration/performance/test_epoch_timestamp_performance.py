@@ -0,0 +1,95 @@
+"""Benchmark integer epoch timestamps against ISO TEXT timestamps at 100k rows."""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from timestamps import to_epoch_us
+
+
+ROWS = 100_000
+PAGE_SIZE = 50
+
+
+def _best_ms(fn, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def _build(path, column_type: str, values) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE items (id INTEGER PRIMARY KEY, timestamp {column_type} NOT NULL, is_favorite INTEGER)")
+    conn.executemany(
+        "INSERT INTO items (id, timestamp, is_favorite) VALUES (?, ?, ?)",
+        ((i + 1, value, int(i % 10 == 0)) for i, value in enumerate(values)),
+    )
+    conn.execute("CREATE INDEX idx_timestamp_id ON items(timestamp, id)")
+    conn.execute("CREATE INDEX idx_favorite_timestamp_id ON items(is_favorite, timestamp, id)")
+    conn.commit()
+    return conn
+
+
+def _index_bytes(conn: sqlite3.Connection) -> int:
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    pages = conn.execute(
+        "SELECT COUNT(*) FROM dbstat WHERE name IN ('idx_timestamp_id', 'idx_favorite_timestamp_id')"
+    ).fetchone()[0]
+    return pages * page_size
+
+
+class TestEpochTimestampPerformance:
+    """Integer timestamps make smaller indexes and cheaper comparisons."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_integer_vs_iso_timestamps_at_100k_rows(self, tmp_path):
+        """Index size, full sort, index scan and range count for both formats."""
+        start_time = datetime(2026, 1, 1)
+        iso = [(start_time + timedelta(seconds=i, microseconds=i)).isoformat() for i in range(ROWS)]
+        epoch = [to_epoch_us(value) for value in iso]
+
+        results = {}
+        for label, column_type, values, low, high in (
+            ("iso", "TEXT", iso, iso[ROWS // 4], iso[ROWS // 2]),
+            ("epoch", "INTEGER", epoch, epoch[ROWS // 4], epoch[ROWS // 2]),
+        ):
+            conn = _build(tmp_path / f"{label}.db", column_type, values)
+            try:
+                try:
+                    index_kb = _index_bytes(conn) / 1024
+                except sqlite3.OperationalError:
+                    pytest.skip("SQLite built without the dbstat virtual table")
+                sort_ms = _best_ms(
+                    lambda: conn.execute("SELECT id FROM items NOT INDEXED ORDER BY timestamp DESC, id DESC").fetchall()
+                )
+                scan_ms = _best_ms(
+                    lambda: conn.execute(
+                        "SELECT id FROM items INDEXED BY idx_timestamp_id ORDER BY timestamp DESC, id DESC"
+                    ).fetchall()
+                )
+                range_ms = _best_ms(
+                    lambda: conn.execute(
+                        "SELECT COUNT(*) FROM items WHERE timestamp BETWEEN ? AND ?", (low, high)
+                    ).fetchone()
+                )
+                page_ms = _best_ms(
+                    lambda: conn.execute(
+                        "SELECT id FROM items WHERE is_favorite = 0 ORDER BY timestamp, id LIMIT ?", (PAGE_SIZE,)
+                    ).fetchall()
+                )
+            finally:
+                conn.close()
+            results[label] = (index_kb, sort_ms, scan_ms, range_ms, page_ms)
+
+        for label, (index_kb, sort_ms, scan_ms, range_ms, page_ms) in results.items():
+            print(
+                f"\n{ROWS} rows, {label}: indexes {index_kb:.0f} KB, sort {sort_ms:.1f} ms, "
+                f"index scan {scan_ms:.1f} ms, range count {range_ms:.2f} ms, oldest page {page_ms:.3f} ms"
+            )
+        assert results["epoch"][0] < results["iso"][0] * 0.75
@@ -0,0 +1,39 @@
+"""Benchmark full-content hashing of large payloads and files."""
+
+import os
+import time
+
+import pytest
+
+from database import ClipboardDB
+
+
+class TestHashPerformance:
+    """Hashing throughput on 1-100 MB inputs."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    @pytest.mark.parametrize("size_mb", [1, 10, 100])
+    def test_hash_throughput(self, tmp_path, size_mb):
+        """Hashing a file through mmap keeps up with hashing the same bytes in memory."""
+        content = os.urandom(size_mb * 1024 * 1024)
+        path = tmp_path / "payload.bin"
+        path.write_bytes(content)
+
+        def best_of(fn, repeats=3):
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                digest = fn()
+                timings.append(time.perf_counter() - start)
+            return min(timings), digest
+
+        memory_time, memory_digest = best_of(lambda: ClipboardDB.calculate_hash(content))
+        file_time, file_digest = best_of(lambda: ClipboardDB.hash_file(path))
+
+        print(
+            f"\nHash {size_mb} MB: bytes {size_mb / memory_time:.0f} MB/s, "
+            f"mmap file {size_mb / file_time:.0f} MB/s"
+        )
+        assert file_digest == memory_digest
+        assert file_time < memory_time * 3
@@ -0,0 +1,140 @@
+"""Benchmark one multiplexed IPC connection against a connection per request."""
+
+import asyncio
+import concurrent.futures
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from server.src.ipc_protocol import FRAMING_BINARY, FRAMING_JSON, encode_frame, read_frame
+from ui.services.ipc_helpers import IPCChannel, connect as ipc_connect
+
+
+CALLS = 200
+BURST = 50
+
+
+class _EchoServer:
+    """Answers every request like IPCService does: hello, then echoed request IDs."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    async def _handle(self, reader, writer):
+        framing = FRAMING_JSON
+        try:
+            while True:
+                message, _ = await read_frame(reader)
+                if message.get("action") == "hello":
+                    writer.write(encode_frame({"type": "hello", "framing": FRAMING_BINARY}, framing))
+                    framing = FRAMING_BINARY
+                    continue
+                reply = {"type": "tags", "tags": [{"id": 1, "name": "Work"}]}
+                if "request_id" in message:
+                    reply["request_id"] = message["request_id"]
+                writer.write(encode_frame(reply, framing))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    def __enter__(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(
+            asyncio.start_unix_server(self._handle, self.socket_path), self.loop
+        ).result(5)
+        return self
+
+    def __exit__(self, *exc):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+
+def _connect_per_request(socket_path: str) -> dict:
+    """The old pattern: a thread, an event loop and a socket for each request."""
+    result = {}
+
+    def run():
+        async def request():
+            async with ipc_connect(socket_path) as conn:
+                await conn.send(json.dumps({"action": "get_tags"}))
+                result.update(json.loads(await conn.recv()))
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(request())
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(5)
+    return result
+
+
+def _count_thread_starts(monkeypatch) -> list:
+    started = []
+    original_start = threading.Thread.start
+
+    def counting_start(thread):
+        started.append(thread)
+        original_start(thread)
+
+    monkeypatch.setattr(threading.Thread, "start", counting_start)
+    return started
+
+
+class TestIPCChannelPerformance:
+    """A long-lived channel removes the per-request thread and connect cost."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_channel_vs_connection_per_request(self, tmp_path, monkeypatch):
+        socket_path = os.path.join(tmp_path, "ipc.sock")
+        with _EchoServer(socket_path):
+            channel = IPCChannel(socket_path)
+            assert channel.call({"action": "get_tags"})["type"] == "tags"  # Connect once up front
+
+            started = _count_thread_starts(monkeypatch)
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                assert _connect_per_request(socket_path)["type"] == "tags"
+            per_request_ms = (time.perf_counter() - start) * 1000 / CALLS
+            per_request_threads = len(started)
+
+            started.clear()
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                assert channel.call({"action": "get_tags"})["type"] == "tags"
+            channel_ms = (time.perf_counter() - start) * 1000 / CALLS
+            channel_threads = len(started)
+
+            # A burst of concurrent requests, as when a page of rows loads its tags
+            start = time.perf_counter()
+            with concurrent.futures.ThreadPoolExecutor(BURST) as pool:
+                list(pool.map(lambda _: _connect_per_request(socket_path), range(BURST)))
+            burst_per_request_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            futures = [channel.request({"action": "get_tags"}) for _ in range(BURST)]
+            assert all(f.result(5)["type"] == "tags" for f in futures)
+            burst_channel_ms = (time.perf_counter() - start) * 1000
+
+            channel.close()
+
+        print(
+            f"\n{CALLS} sequential calls: connection per request {per_request_ms:.3f} ms/call, "
+            f"{per_request_threads} threads started; channel {channel_ms:.3f} ms/call, "
+            f"{channel_threads} threads started"
+        )
+        print(
+            f"{BURST} concurrent calls: connection per request {burst_per_request_ms:.1f} ms, "
+            f"channel {burst_channel_ms:.1f} ms"
+        )
+        assert per_request_threads == CALLS
+        assert channel_threads == 0
+        assert channel_ms < per_request_ms
@@ -0,0 +1,75 @@
+"""Benchmark sending a 5 MB screenshot over JSON and binary IPC frames."""
+
+import asyncio
+import base64
+import json
+import os
+import time
+
+import pytest
+
+from ipc_protocol import encode_binary_frame, encode_json_frame, read_frame
+
+
+SCREENSHOT_SIZE = 5 * 1024 * 1024
+
+
+def _best_ms(fn, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def _decode(loop: asyncio.AbstractEventLoop, frame: bytes) -> dict:
+    reader = asyncio.StreamReader(limit=len(frame) + 1, loop=loop)
+    reader.feed_data(frame)
+    reader.feed_eof()
+    message, _ = loop.run_until_complete(read_frame(reader))
+    return message
+
+
+class TestIPCFramingPerformance:
+    """Raw attachments avoid the base64 inflation and its encode/decode passes."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_5mb_screenshot(self):
+        """Clipboard event and full_image response, end to end through the framing."""
+        # Random bytes: a PNG screenshot is already compressed
+        screenshot = os.urandom(SCREENSHOT_SIZE)
+        loop = asyncio.new_event_loop()
+
+        # Before: the monitor nested a JSON string of base64 inside the event
+        def json_round_trip():
+            event = {"type": "image/generic", "content": json.dumps({"data": base64.b64encode(screenshot).decode("ascii")})}
+            frame = encode_json_frame({"action": "clipboard_event", "data": event})
+            received = _decode(loop, frame)
+            data = base64.b64decode(json.loads(received["data"]["content"])["data"])
+            assert len(data) == SCREENSHOT_SIZE
+            return frame
+
+        def binary_round_trip():
+            event = {"type": "image/generic", "content": screenshot}
+            frame = encode_binary_frame({"action": "clipboard_event", "data": event})
+            received = _decode(loop, frame)
+            assert len(received["data"]["content"]) == SCREENSHOT_SIZE
+            return frame
+
+        try:
+            json_bytes = len(json_round_trip())
+            binary_bytes = len(binary_round_trip())
+            json_ms = _best_ms(json_round_trip)
+            binary_ms = _best_ms(binary_round_trip)
+        finally:
+            loop.close()
+
+        print(
+            f"\n5 MB screenshot: JSON/base64 {json_bytes / 1024 / 1024:.2f} MB in {json_ms:.1f} ms, "
+            f"binary {binary_bytes / 1024 / 1024:.2f} MB in {binary_ms:.1f} ms"
+        )
+        assert binary_bytes < SCREENSHOT_SIZE + 1024
+        assert json_bytes > SCREENSHOT_SIZE * 1.3
+        assert binary_ms < json_ms
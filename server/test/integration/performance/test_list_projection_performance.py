@@ -0,0 +1,53 @@
+"""Benchmark list queries on a history full of large files."""
+
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from fixtures.test_data import generate_file_data
+
+
+def _measure(fetch, repeats: int = 5) -> tuple:
+    """Return (best latency in seconds, peak Python memory in bytes) of fetch()."""
+    latencies = []
+    peak = 0
+    for _ in range(repeats):
+        tracemalloc.start()
+        start = time.perf_counter()
+        fetch()
+        latencies.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return min(latencies), peak
+
+
+class TestListProjectionPerformance:
+    """Compare full-row pages with the list-view projection."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_file_page_memory_and_latency(self, temp_db: ClipboardDB):
+        """A page of large files is rendered without loading their content."""
+        content = os.urandom(4 * 1024 * 1024)
+        for i in range(20):
+            temp_db.add_item("file", generate_file_data(f"file{i}.bin", content=content + bytes([i])))
+
+        def full_rows():
+            return temp_db.conn.execute(
+                "SELECT id, timestamp, type, data, thumbnail, name, format_type, formatted_content, is_favorite "
+                "FROM clipboard_items ORDER BY timestamp DESC, id DESC LIMIT 20"
+            ).fetchall()
+
+        full_latency, full_peak = _measure(full_rows)
+        list_latency, list_peak = _measure(lambda: temp_db.get_items(limit=20))
+
+        print(
+            f"\nPage of 20 x 4 MB files: full rows {full_latency * 1000:.1f} ms / {full_peak / 1024 / 1024:.1f} MB, "
+            f"projection {list_latency * 1000:.1f} ms / {list_peak / 1024:.1f} KB"
+        )
+        assert list_peak * 100 < full_peak
+        assert list_latency < full_latency
@@ -0,0 +1,80 @@
+"""Benchmark the pasted tab after 100k paste events."""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import ClipboardDB
+
+
+ITEMS = 2000
+PASTES = 100_000
+PAGE_SIZE = 50
+
+
+def _best_ms(fn, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+class TestPasteLogPerformance:
+    """The paste log stays bounded and the pasted tab reads the rollup."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_pasted_tab_after_100k_pastes(self, tmp_path):
+        """Log size is capped; pages cost the same at the top and deep down."""
+        db = ClipboardDB(tmp_path / "pastes.db")
+        try:
+            with db.group_commit():
+                item_ids = [db.add_item("text", f"snippet {i}".encode()) for i in range(ITEMS)]
+            start_time = datetime(2026, 1, 1)
+
+            start = time.perf_counter()
+            with db.group_commit():
+                for i in range(PASTES):
+                    pasted = (start_time + timedelta(seconds=i)).isoformat()
+                    db.add_pasted_item(item_ids[(i * 7919) % ITEMS], pasted)
+            paste_us = (time.perf_counter() - start) / PASTES * 1e6
+
+            log_rows = db.conn.execute("SELECT COUNT(*) FROM recently_pasted").fetchone()[0]
+            assert log_rows == ClipboardDB.PASTE_LOG_MAX_ROWS
+            assert db.get_pasted_count() == ITEMS
+
+            pages = [db.get_recently_pasted(limit=PAGE_SIZE)]
+            while len(pages[-1]) == PAGE_SIZE:
+                pages.append(db.get_recently_pasted(limit=PAGE_SIZE, cursor=ClipboardDB.pasted_cursor(pages[-1])))
+            assert sum(len(page) for page in pages) == ITEMS
+            assert sum(item["paste_count"] for page in pages for item in page) == PASTES
+            deep_cursor = ClipboardDB.pasted_cursor(pages[-3])
+
+            first_page = _best_ms(lambda: db.get_recently_pasted(limit=PAGE_SIZE))
+            deep_page = _best_ms(lambda: db.get_recently_pasted(limit=PAGE_SIZE, cursor=deep_cursor))
+
+            # The same page deduplicated from the log instead of the rollup
+            def from_log():
+                db.conn.execute(
+                    """
+                    SELECT clipboard_item_id, max(pasted_timestamp) AS last_pasted, COUNT(*)
+                    FROM recently_pasted GROUP BY clipboard_item_id
+                    ORDER BY last_pasted DESC LIMIT ?
+                    """,
+                    (PAGE_SIZE,),
+                ).fetchall()
+
+            log_page = _best_ms(from_log)
+
+            print(
+                f"\n{PASTES} pastes over {ITEMS} items ({paste_us:.0f} us/paste): log {log_rows} rows, "
+                f"first page {first_page:.2f} ms, deep page {deep_page:.2f} ms, "
+                f"deduplicated from the log {log_page:.2f} ms"
+            )
+            assert deep_page < first_page * 3
+            assert first_page < log_page
+        finally:
+            db.close()
@@ -0,0 +1,56 @@
+"""Benchmark peak memory of fetching a 100 MB file payload."""
+
+import base64
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db_file
+from fixtures.test_data import generate_file_data
+
+
+def _peak_mb(fn) -> tuple:
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024, elapsed
+    finally:
+        tracemalloc.stop()
+
+
+class TestPayloadStreamPerformance:
+    """Streaming keeps memory bounded regardless of payload size."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_streamed_fetch_memory(self, temp_db_file: ClipboardDB):
+        """Encoding chunk by chunk peaks at a few chunks instead of ~3x the payload."""
+        content = os.urandom(100 * 1024 * 1024)
+        item_id = temp_db_file.add_item("file", generate_file_data("large.bin", content=content))
+        del content
+
+        def streamed():
+            # What IPCConnection.send_json_stream does with each chunk
+            _, _, chunks = temp_db_file.stream_payload(item_id)
+            for chunk in chunks:
+                base64.b64encode(chunk)
+
+        def whole():
+            data = temp_db_file.get_item(item_id)["data"]
+            _, file_content = data.split(ClipboardDB.FILE_SEPARATOR, 1)
+            base64.b64encode(file_content).decode("utf-8")
+
+        streamed_mb, streamed_s = _peak_mb(streamed)
+        whole_mb, whole_s = _peak_mb(whole)
+
+        print(
+            f"\n100 MB file: streamed peak {streamed_mb:.1f} MB in {streamed_s:.2f} s, "
+            f"whole peak {whole_mb:.0f} MB in {whole_s:.2f} s"
+        )
+        assert streamed_mb < 2
+        assert whole_mb > 200
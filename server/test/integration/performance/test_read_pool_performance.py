@@ -0,0 +1,77 @@
+"""Benchmark read latency under a concurrent write load."""
+
+import statistics
+import threading
+import time
+from contextlib import nullcontext
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.test_data import generate_random_text
+
+
+def _measure_read_latency(db: ClipboardDB, reads: int = 200) -> list:
+    """Run get_items/get_total_count while a writer thread keeps committing.
+
+    Writes are serialized by a lock the way DatabaseService does it. Without a
+    read pool, reads have to take the same lock.
+    """
+    write_lock = threading.Lock()
+    read_lock = nullcontext() if db.read_pool_size else write_lock
+    stop = threading.Event()
+    payload = generate_random_text(256 * 1024)
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            with write_lock:
+                item_id = db.add_item("text", payload + str(i).encode())
+                db.update_thumbnail(item_id, payload)
+            i += 1
+
+    for _ in range(200):
+        db.add_item("text", generate_random_text(100))
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    latencies = []
+    try:
+        for _ in range(reads):
+            start = time.perf_counter()
+            with read_lock:
+                db.get_items(limit=20)
+            with read_lock:
+                db.get_total_count()
+            latencies.append(time.perf_counter() - start)
+    finally:
+        stop.set()
+        thread.join()
+    return latencies
+
+
+class TestReadPoolPerformance:
+    """Compare reads behind the writer lock with pooled WAL reads."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_read_latency_under_write_load(self, tmp_path):
+        """Pooled reads are not queued behind concurrent commits."""
+        serialized_db = ClipboardDB(tmp_path / "serialized.db", read_pool_size=0)
+        pooled_db = ClipboardDB(tmp_path / "pooled.db", read_pool_size=4)
+        try:
+            serialized = _measure_read_latency(serialized_db)
+            pooled = _measure_read_latency(pooled_db)
+        finally:
+            serialized_db.close()
+            pooled_db.close()
+
+        def p95(values):
+            return statistics.quantiles(values, n=20)[-1] * 1000
+
+        print(
+            f"\nRead latency under write load (ms): "
+            f"serialized median={statistics.median(serialized) * 1000:.2f} p95={p95(serialized):.2f}, "
+            f"pooled median={statistics.median(pooled) * 1000:.2f} p95={p95(pooled):.2f}"
+        )
+        assert p95(pooled) <= p95(serialized)
@@ -0,0 +1,64 @@
+"""Benchmark token and substring search over a large history."""
+
+import random
+import time
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db_file
+from fixtures.test_data import generate_timestamp
+
+WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+]
+
+
+def _best_of(fetch, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fetch()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestSearchPerformance:
+    """Search latency at 100k text and URL items."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_100k_items(self, temp_db_file: ClipboardDB):
+        """Substring search uses the trigram index instead of scanning every row."""
+        rng = random.Random(42)
+        timestamp = generate_timestamp()
+        rows = []
+        for i in range(100_000):
+            if i % 5 == 0:
+                rows.append((timestamp, "url", f"https://example.com/{rng.choice(WORDS)}/{i:x}".encode()))
+            else:
+                words = " ".join(rng.choice(WORDS) for _ in range(12))
+                rows.append((timestamp, "text", f"{words} ref{i:06d}".encode()))
+        rows[50_000] = (timestamp, "text", b"the quarterly dashboardmetrics export")
+        with temp_db_file.conn:
+            temp_db_file.conn.executemany(
+                "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, ?, ?)", rows
+            )
+
+        token = _best_of(lambda: temp_db_file.search_items("dashboardmetrics"))
+        substring = _best_of(lambda: temp_db_file.search_items("boardmetr", mode="substring"))
+        url = _best_of(lambda: temp_db_file.search_items("ample.com/ech", mode="substring", limit=20))
+        scan = _best_of(
+            lambda: temp_db_file.conn.execute(
+                "SELECT id FROM clipboard_items WHERE CAST(data AS TEXT) LIKE '%boardmetr%'"
+            ).fetchall()
+        )
+
+        print(
+            f"\nSearch over 100k items: token {token * 1000:.2f} ms, substring {substring * 1000:.2f} ms, "
+            f"url substring (20 hits) {url * 1000:.2f} ms, LIKE scan {scan * 1000:.2f} ms"
+        )
+        assert [i["type"] for i in temp_db_file.search_items("boardmetr", mode="substring")] == ["text"]
+        assert len(temp_db_file.search_items("ample.com/ech", mode="substring", limit=20)) == 20
+        assert substring < scan
@@ -0,0 +1,43 @@
+"""Benchmark tag hydration of an item page."""
+
+import time
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db_file
+
+
+class TestTagHydrationPerformance:
+    """Compare per-item tag queries with the batched hydration."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_100_items_with_20_tags(self, temp_db_file: ClipboardDB):
+        """Hydrating a page in one query beats one query per item."""
+        tag_ids = [temp_db_file.create_tag(f"Tag {i}") for i in range(20)]
+        for i in range(100):
+            item_id = temp_db_file.add_item("text", f"Item {i}".encode())
+            for tag_id in tag_ids:
+                temp_db_file.add_tag_to_item(item_id, tag_id)
+        items = temp_db_file.get_items(limit=100)
+        item_ids = [item["id"] for item in items]
+
+        def best_of(fetch, repeats=20):
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                fetch()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        per_item = best_of(lambda: [temp_db_file.get_tags_for_item(item_id) for item_id in item_ids])
+        batched = best_of(lambda: temp_db_file.get_tags_for_items(item_ids))
+        page = best_of(lambda: temp_db_file.get_items(limit=100))
+
+        print(
+            f"\nTags for 100 items x 20 tags: per item {per_item * 1000:.2f} ms, "
+            f"batched {batched * 1000:.2f} ms, full page with tags {page * 1000:.2f} ms"
+        )
+        assert all(len(item["tags"]) == 20 for item in items)
+        assert batched < per_item
@@ -0,0 +1,75 @@
+"""Benchmark paging and match lookup in a 50 MB log paste."""
+
+import time
+
+import pytest
+
+from database import ClipboardDB
+
+
+PAGE_SIZE = 500
+
+
+def _log_text(size: int) -> str:
+    lines = []
+    length = 0
+    i = 0
+    while length < size:
+        line = f"2026-10-16 12:{i // 60 % 60:02d}:{i % 60:02d} INFO worker-{i % 8} request {i} completed in {i % 97}ms\n"
+        lines.append(line)
+        length += len(line)
+        i += 1
+    return "".join(lines)
+
+
+def _best_ms(fn, repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+class TestTextChunksPerformance:
+    """Chunked reads do not depend on the size of the document."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_pages_and_matches_in_50mb_log(self, tmp_path):
+        """Pages and early matches are served from single chunks."""
+        text = _log_text(50 * 1024 * 1024) + "FATAL disk full\n"
+        db = ClipboardDB(tmp_path / "chunks.db")
+        try:
+            start = time.perf_counter()
+            item_id = db.add_item("text", text.encode())
+            ingest_s = time.perf_counter() - start
+
+            middle_page = len(text) // 2 // PAGE_SIZE
+            early_term = ["request 1234 "]
+
+            def read_page():
+                assert db.get_text_page(item_id, middle_page, PAGE_SIZE)["content"]
+
+            def early_match():
+                assert db.find_text_match_page(item_id, early_term, PAGE_SIZE) > 0
+
+            def late_match():
+                assert db.find_text_match_page(item_id, ["fatal"], PAGE_SIZE) == (len(text) - 1) // PAGE_SIZE
+
+            chunked = [_best_ms(read_page), _best_ms(early_match), _best_ms(late_match, repeats=2)]
+
+            # The same lookups on the whole document
+            db.conn.execute("DELETE FROM text_chunks")
+            db.conn.commit()
+            whole = [_best_ms(read_page), _best_ms(early_match), _best_ms(late_match, repeats=2)]
+
+            print(
+                f"\n50 MB log (ingest {ingest_s:.1f} s): page {chunked[0]:.2f} vs {whole[0]:.1f} ms, "
+                f"early match {chunked[1]:.2f} vs {whole[1]:.1f} ms, "
+                f"last-line match {chunked[2]:.0f} vs {whole[2]:.0f} ms (chunked vs whole document)"
+            )
+            assert chunked[0] * 20 < whole[0]
+            assert chunked[1] * 20 < whole[1]
+        finally:
+            db.close()
@@ -0,0 +1,107 @@
+"""Benchmark write throughput with per-write commits and with group commits."""
+
+import threading
+import time
+
+import pytest
+
+from database import ClipboardDB
+from write_queue import WriteQueue
+from server.src.services.database_service import DatabaseService
+
+
+WRITERS = 8
+WRITES_PER_WRITER = 250
+
+
+def _concurrent_writes(write) -> float:
+    """Run WRITERS threads each making WRITES_PER_WRITER writes; return writes/sec."""
+    def worker(n):
+        for i in range(WRITES_PER_WRITER):
+            write(f"writer {n} copy {i}".encode())
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(WRITERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return WRITERS * WRITES_PER_WRITER / (time.perf_counter() - start)
+
+
+class TestWriteQueuePerformance:
+    """Group commits raise write throughput under bursty load."""
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    @pytest.mark.parametrize("synchronous", ["NORMAL", "FULL"])
+    def test_writes_per_second(self, tmp_path, synchronous):
+        """Concurrent writers and a single-thread burst, before and after."""
+        before_db = ClipboardDB(tmp_path / "before.db")
+        after_db = ClipboardDB(tmp_path / "after.db")
+        for db in (before_db, after_db):
+            db.conn.execute(f"PRAGMA synchronous = {synchronous}")
+        lock = threading.Lock()
+        writer = WriteQueue(after_db, lock)
+        try:
+            def locked_write(data):
+                with lock:
+                    before_db.add_item("text", data)
+
+            before_rate = _concurrent_writes(locked_write)
+            after_rate = _concurrent_writes(lambda data: writer.run(after_db.add_item, "text", data))
+
+            count = WRITERS * WRITES_PER_WRITER
+            start = time.perf_counter()
+            for i in range(count):
+                before_db.add_item("text", f"burst {i}".encode())
+            burst_before = count / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            futures = [writer.submit(after_db.add_item, "text", f"burst {i}".encode()) for i in range(count)]
+            for future in futures:
+                future.result()
+            burst_after = count / (time.perf_counter() - start)
+
+            print(
+                f"\nsynchronous={synchronous}: {WRITERS} writers {before_rate:.0f} -> {after_rate:.0f} writes/s, "
+                f"burst {burst_before:.0f} -> {burst_after:.0f} writes/s (per-write commit -> group commit)"
+            )
+            assert after_db.get_total_count() == before_db.get_total_count() == 2 * count
+            assert burst_after > burst_before
+        finally:
+            writer.close()
+            before_db.close()
+            after_db.close()
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_service_path_commits(self, tmp_path):
+        """Concurrent DatabaseService writes: waiting on submit() futures vs run()."""
+        results = {}
+        for path in ("submit", "run"):
+            db_service = DatabaseService(str(tmp_path / f"{path}.db"))
+            statements = []
+            db_service.db.conn.set_trace_callback(statements.append)
+            try:
+                if path == "submit":
+                    # Waiters the queue cannot see: the group is committed as soon as the queue is empty
+                    def write(data):
+                        db_service.submit_write("add_item", "text", data, "2025-01-01T10:00:00").result()
+                else:
+                    def write(data):
+                        db_service.add_item("text", data, "2025-01-01T10:00:00")
+                rate = _concurrent_writes(write)
+                db_service.db.conn.set_trace_callback(None)
+                commits = sum(1 for sql in statements if sql.strip().upper() == "COMMIT")
+                results[path] = (rate, commits)
+                assert db_service.get_total_count() == WRITERS * WRITES_PER_WRITER
+            finally:
+                db_service.close()
+
+        print(
+            f"\nDatabaseService, {WRITERS} writers x {WRITES_PER_WRITER}: "
+            f"submit().result() {results['submit'][0]:.0f} writes/s in {results['submit'][1]} commits, "
+            f"run() {results['run'][0]:.0f} writes/s in {results['run'][1]} commits"
+        )
+        assert results["run"][1] <= results["submit"][1]
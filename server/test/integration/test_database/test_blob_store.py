@@ -0,0 +1,281 @@
+"""Tests for the content-addressed blob store."""
+
+import hashlib
+import json
+import os
+import sqlite3
+
+import pytest
+
+from blob_store import BlobStore
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data, generate_random_image, generate_timestamp
+from server.src.blob_store import BlobStore as ServerBlobStore
+from server.src.database import ClipboardDB as ServerClipboardDB
+from server.src.services.clipboard_service import ClipboardService
+from server.src.services.database_service import DatabaseService
+
+
+LARGE = ClipboardDB.BLOB_MIN_SIZE
+
+
+def _blob_row(db: ClipboardDB, key: str):
+    return db.conn.execute("SELECT size, refcount FROM blobs WHERE key = ?", (key,)).fetchone()
+
+
+class TestBlobStore:
+    """Test the on-disk store on its own."""
+
+    def test_put_is_content_addressed(self, tmp_path):
+        """Keys are the SHA256 of the content and files are sharded by prefix."""
+        store = BlobStore(tmp_path)
+        key = store.put(b"payload")
+
+        assert key == BlobStore.key_for(b"payload")
+        assert store.path(key) == tmp_path / key[:2] / key[2:4] / key
+        assert store.read(key) == b"payload"
+
+    def test_put_same_content_once(self, tmp_path):
+        """Storing identical content twice keeps a single file."""
+        store = BlobStore(tmp_path)
+
+        assert store.put(b"same") == store.put(b"same")
+        assert len(list(store.keys())) == 1
+
+    def test_open_maps_file(self, tmp_path):
+        """Blobs are read through a read-only memory map."""
+        store = BlobStore(tmp_path)
+        key = store.put(b"x" * 4096)
+
+        with store.open(key) as mapped:
+            assert len(mapped) == 4096
+            assert mapped[:4] == b"xxxx"
+
+    def test_delete_removes_empty_shards(self, tmp_path):
+        """Deleting the last blob of a shard removes its directories."""
+        store = BlobStore(tmp_path)
+        key = store.put(b"gone")
+
+        assert store.delete(key) is True
+        assert store.delete(key) is False
+        assert not (tmp_path / key[:2]).exists()
+
+    def test_put_file_streams_content(self, tmp_path):
+        """A file is copied chunk by chunk under the hash of its content, once."""
+        store = BlobStore(tmp_path / "blobs")
+        store.COPY_CHUNK_SIZE = 1000
+        content = os.urandom(4500)
+        source = tmp_path / "source.bin"
+        source.write_bytes(content)
+
+        key = store.put_file(source)
+
+        assert key == BlobStore.key_for(content)
+        assert store.read(key) == content
+        assert store.put_file(source) == key
+        assert sorted(path.name for path in (tmp_path / "blobs").rglob("*") if path.is_file()) == [key]
+
+    def test_rejects_invalid_keys(self, tmp_path):
+        """Keys that are not SHA256 hex digests cannot escape the store."""
+        store = BlobStore(tmp_path)
+
+        with pytest.raises(ValueError):
+            store.path("../../etc/passwd")
+
+
+class TestClipboardDBBlobs:
+    """Test how ClipboardDB keeps large payloads in the blob store."""
+
+    def test_large_image_is_externalized(self, temp_db_file: ClipboardDB):
+        """The row keeps only the blob key; get_item returns the full payload."""
+        image = os.urandom(LARGE)
+        item_id = temp_db_file.add_item("image/png", image, timestamp=generate_timestamp())
+
+        row = temp_db_file.conn.execute(
+            "SELECT data, blob_key FROM clipboard_items WHERE id = ?", (item_id,)
+        ).fetchone()
+        assert row["data"] == b""
+        assert row["blob_key"] == BlobStore.key_for(image)
+        assert temp_db_file.blob_store.exists(row["blob_key"])
+
+        item = temp_db_file.get_item(item_id)
+        assert item["data"] == image
+        assert item["blob_key"] == row["blob_key"]
+
+    def test_large_file_keeps_metadata_inline(self, temp_db_file: ClipboardDB):
+        """File rows keep their JSON metadata so lists can render names."""
+        content = os.urandom(LARGE)
+        data = generate_file_data("big.bin", content=content)
+        item_id = temp_db_file.add_item("file", data, name="big.bin")
+
+        row = temp_db_file.conn.execute(
+            "SELECT data, blob_key FROM clipboard_items WHERE id = ?", (item_id,)
+        ).fetchone()
+        metadata_bytes, rest = row["data"].split(ClipboardDB.FILE_SEPARATOR, 1)
+        assert json.loads(metadata_bytes)["name"] == "big.bin"
+        assert rest == b""
+        assert row["blob_key"] == BlobStore.key_for(content)
+
+        assert temp_db_file.get_item(item_id)["data"] == data
+        assert temp_db_file.get_items()[0]["file_metadata"]["name"] == "big.bin"
+
+    def test_small_payloads_stay_inline(self, temp_db_file: ClipboardDB):
+        """Payloads below the threshold and text items are not externalized."""
+        image_id = temp_db_file.add_item("image/png", b"tiny")
+        text_id = temp_db_file.add_item("text", b"t" * LARGE)
+
+        assert temp_db_file.get_item(image_id)["blob_key"] is None
+        assert temp_db_file.get_item(text_id)["blob_key"] is None
+
+    def test_memory_database_keeps_payloads_inline(self, temp_db: ClipboardDB):
+        """Without a blob store everything stays in the data column."""
+        image = os.urandom(LARGE)
+        item_id = temp_db.add_item("image/png", image)
+
+        assert temp_db.blob_store is None
+        assert temp_db.get_item(item_id)["data"] == image
+        assert temp_db.get_item(item_id)["blob_key"] is None
+
+    def test_identical_payloads_are_refcounted(self, temp_db_file: ClipboardDB):
+        """Identical payloads share one blob that lives until its last item."""
+        image = os.urandom(LARGE)
+        first = temp_db_file.add_item("image/png", image, data_hash="a")
+        second = temp_db_file.add_item("image/png", image, data_hash="b")
+        key = BlobStore.key_for(image)
+
+        assert _blob_row(temp_db_file, key)["refcount"] == 2
+        assert _blob_row(temp_db_file, key)["size"] == LARGE
+
+        temp_db_file.delete_item(first)
+        assert _blob_row(temp_db_file, key)["refcount"] == 1
+        assert temp_db_file.blob_store.exists(key)
+
+        temp_db_file.delete_item(second)
+        assert _blob_row(temp_db_file, key) is None
+        assert not temp_db_file.blob_store.exists(key)
+
+    def test_retention_releases_blobs(self, temp_db_file: ClipboardDB):
+        """Blobs of items pruned by retention are deleted from disk."""
+        keys = []
+        for i in range(12):
+            image = os.urandom(LARGE)
+            keys.append(BlobStore.key_for(image))
+            temp_db_file.add_item("image/png", image, timestamp=generate_timestamp(hours_ago=12 - i))
+
+        temp_db_file.cleanup_old_items(10)
+
+        assert not temp_db_file.blob_store.exists(keys[0])
+        assert not temp_db_file.blob_store.exists(keys[1])
+        assert all(temp_db_file.blob_store.exists(key) for key in keys[2:])
+
+    def test_clear_all_releases_blobs(self, temp_db_file: ClipboardDB):
+        """Clearing the history empties the blob store."""
+        temp_db_file.add_item("image/png", generate_random_image(200, 200))
+        temp_db_file.add_item("image/png", os.urandom(LARGE))
+
+        temp_db_file.clear_all()
+
+        assert list(temp_db_file.blob_store.keys()) == []
+
+    def test_missing_blob_returns_inline_part(self, temp_db_file: ClipboardDB):
+        """A blob removed behind the database's back does not break reads."""
+        image = os.urandom(LARGE)
+        item_id = temp_db_file.add_item("image/png", image)
+        temp_db_file.blob_store.delete(BlobStore.key_for(image))
+
+        assert temp_db_file.get_item(item_id)["data"] == b""
+        assert temp_db_file.read_blob(BlobStore.key_for(image)) is None
+
+    def test_migrate_inline_blobs(self, temp_db_file: ClipboardDB):
+        """Rows written inline by older versions are moved to the blob store."""
+        image = os.urandom(LARGE)
+        content = os.urandom(LARGE)
+        file_data = generate_file_data("old.bin", content=content)
+        small_file = generate_file_data("small.txt", content=b"x" * 10, size=10)
+        for item_type, data in (("image/png", image), ("file", file_data), ("file", small_file)):
+            temp_db_file.conn.execute(
+                "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, ?, ?)",
+                (generate_timestamp(), item_type, data),
+            )
+        temp_db_file.conn.commit()
+
+        after_id = 0
+        while after_id is not None:
+            after_id = temp_db_file.migrate_inline_blobs(after_id, batch_size=1)
+
+        rows = temp_db_file.conn.execute(
+            "SELECT id, blob_key FROM clipboard_items ORDER BY id"
+        ).fetchall()
+        assert rows[0]["blob_key"] == BlobStore.key_for(image)
+        assert rows[1]["blob_key"] == BlobStore.key_for(content)
+        assert rows[2]["blob_key"] is None
+        assert _blob_row(temp_db_file, rows[0]["blob_key"])["refcount"] == 1
+
+        assert temp_db_file.get_item(rows[0]["id"])["data"] == image
+        assert temp_db_file.get_item(rows[1]["id"])["data"] == file_data
+
+    def test_schema_migration_adds_blob_key(self, tmp_path):
+        """Databases created before the blob store gain the blob_key column."""
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE clipboard_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                type TEXT NOT NULL,
+                data BLOB NOT NULL,
+                thumbnail BLOB,
+                hash TEXT,
+                name TEXT,
+                format_type TEXT,
+                formatted_content BLOB,
+                is_favorite INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, data) VALUES ('2025-01-01T00:00:00', 'text', 'old')"
+        )
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            item = db.get_items()[0]
+            assert item["preview"] == "old"
+            assert item["blob_key"] is None
+        finally:
+            db.close()
+
+
+class TestFileIngest:
+    """Copied files are read and hashed once on their way into the database."""
+
+    def test_large_file_streamed_into_blob_store(self, tmp_path, monkeypatch):
+        content = os.urandom(LARGE * 4)
+        path = tmp_path / "copied.bin"
+        path.write_bytes(content)
+
+        def unexpected_hash(*args):
+            raise AssertionError("file content hashed again")
+
+        database_service = DatabaseService(str(tmp_path / "clipboard.db"))
+        try:
+            monkeypatch.setattr(ServerClipboardDB, "calculate_hash", unexpected_hash)
+            monkeypatch.setattr(ServerBlobStore, "key_for", unexpected_hash)
+            service = ClipboardService(database_service, thumbnail_service=None)
+
+            service.handle_clipboard_event({"type": "file", "content": path.as_uri()})
+            service.handle_clipboard_event({"type": "file", "content": path.as_uri()})
+
+            db = database_service.db
+            [row] = db.conn.execute("SELECT id, hash, blob_key, copy_count FROM clipboard_items").fetchall()
+            key = hashlib.sha256(content).hexdigest()
+            assert (row["hash"], row["blob_key"], row["copy_count"]) == (key, key, 2)
+            assert db.get_item(row["id"])["data"].split(ClipboardDB.FILE_SEPARATOR, 1)[1] == content
+            assert tuple(db.conn.execute("SELECT size, refcount FROM blobs").fetchone()) == (len(content), 1)
+        finally:
+            database_service.close()
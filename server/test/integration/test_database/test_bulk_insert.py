@@ -0,0 +1,106 @@
+"""Tests for inserting many items in one transaction."""
+
+import os
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data
+
+
+def _file_item(name: str, content: bytes = None) -> dict:
+    return {"item_type": "file", "data": generate_file_data(name, content=content), "name": name}
+
+
+class TestAddItemsBulk:
+    """add_items_bulk matches add_item/upsert_item with one commit."""
+
+    def test_inserts_in_order_with_one_commit(self, temp_db_file: ClipboardDB):
+        """Every item is stored, IDs follow the input order and one COMMIT is issued."""
+        statements = []
+        temp_db_file.conn.set_trace_callback(statements.append)
+        results = temp_db_file.add_items_bulk([_file_item(f"doc{i}.pdf") for i in range(20)])
+        temp_db_file.conn.set_trace_callback(None)
+
+        assert [inserted for _, inserted in results] == [True] * 20
+        ids = [item_id for item_id, _ in results]
+        assert ids == sorted(ids)
+        assert [temp_db_file.get_item(i)["name"] for i in ids] == [f"doc{i}.pdf" for i in range(20)]
+        assert sum(1 for sql in statements if sql.strip().upper() == "COMMIT") == 1
+
+    def test_dedup_against_table_and_batch(self, temp_db: ClipboardDB):
+        """Existing content and repeats within the batch are bumped, not inserted."""
+        existing_id, _ = temp_db.upsert_item("file", generate_file_data("a.txt", content=b"same"))
+
+        results = temp_db.add_items_bulk([
+            _file_item("a.txt", b"same"),
+            _file_item("b.txt", b"new"),
+            _file_item("b.txt", b"new"),
+        ])
+
+        assert results[0] == (existing_id, False)
+        assert results[1][1] is True
+        assert results[2] == (results[1][0], False)
+        assert temp_db.get_total_count() == 2
+        copies = temp_db.conn.execute(
+            "SELECT copy_count FROM clipboard_items WHERE id = ?", (results[1][0],)
+        ).fetchone()[0]
+        assert copies == 2
+
+    def test_without_dedup_inserts_every_item(self, temp_db: ClipboardDB):
+        """dedup=False inserts duplicates like add_item."""
+        results = temp_db.add_items_bulk(
+            [{"item_type": "text", "data": b"repeat"}] * 3, dedup=False
+        )
+
+        assert [inserted for _, inserted in results] == [True] * 3
+        assert len({item_id for item_id, _ in results}) == 3
+
+    def test_indexes_counters_and_blobs(self, temp_db_file: ClipboardDB):
+        """Triggers keep FTS and counters current; large content goes to the blob store."""
+        content = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 2)
+        results = temp_db_file.add_items_bulk([
+            _file_item("quarterly.xlsx"),
+            _file_item("archive.bin", content),
+            {"item_type": "text", "data": b"bulk text entry"},
+        ])
+
+        assert [item["id"] for item in temp_db_file.search_items("quarterly")] == [results[0][0]]
+        assert [item["id"] for item in temp_db_file.search_items("bulk")] == [results[2][0]]
+        assert temp_db_file.get_kind_counts() == {"file": 2, "text": 1}
+        assert temp_db_file.get_item(results[1][0])["data"].endswith(content)
+        assert temp_db_file.get_item(results[1][0])["blob_key"] is not None
+        assert temp_db_file.check_fts_index()
+        assert temp_db_file.reconcile_counters()
+
+    def test_duplicate_blob_released(self, temp_db_file: ClipboardDB):
+        """A duplicate large file leaves a single blob."""
+        content = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 2)
+        temp_db_file.add_items_bulk([_file_item("one.bin", content), _file_item("two.bin", content)])
+
+        assert list(temp_db_file.blob_store.keys()) == [ClipboardDB.calculate_hash(content)]
+
+    def test_values_land_in_their_columns(self, temp_db: ClipboardDB):
+        """Every column is bound by name; long texts are chunked from their text_length."""
+        temp_db.TEXT_CHUNK_SIZE = 100
+        (file_id, _), (text_id, _) = temp_db.add_items_bulk([
+            _file_item("report.pdf", b"pdf bytes"),
+            {"item_type": "text", "data": b"x" * 250},
+        ])
+
+        row = temp_db.conn.execute(
+            "SELECT kind, extension, file_name, file_size, is_directory FROM clipboard_items WHERE id = ?",
+            (file_id,),
+        ).fetchone()
+        assert tuple(row) == ("file", ".pdf", "report.pdf", 9, 0)
+        text_row = temp_db.conn.execute(
+            "SELECT text_length, dedup_key IS NOT NULL FROM clipboard_items WHERE id = ?", (text_id,)
+        ).fetchone()
+        assert tuple(text_row) == (250, 1)
+        chunks = temp_db.conn.execute(
+            "SELECT COUNT(*) FROM text_chunks WHERE item_id = ?", (text_id,)
+        ).fetchone()[0]
+        assert chunks == 3
+
+    def test_empty(self, temp_db: ClipboardDB):
+        """No items, no writes."""
+        assert temp_db.add_items_bulk([]) == []
@@ -0,0 +1,272 @@
+"""Tests for per-row payload compression."""
+
+import os
+import sqlite3
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data, generate_timestamp
+from payload_codec import PayloadCodec
+
+
+LONG_TEXT = ("The quick brown fox jumps over the lazy dog. " * 100).encode()
+
+
+def _html(i: int) -> bytes:
+    return (
+        f'<html><body><div class="message-body" style="font-family: Arial, sans-serif">'
+        f'<p class="paragraph">Item number {i}</p>'
+        f'<a href="https://example.com/items/{i}" class="link link-primary">details</a>'
+        f'<span class="meta meta-author">posted by user{i % 7}</span></div></body></html>'
+    ).encode()
+
+
+def _codecs(db: ClipboardDB, item_id: int) -> tuple:
+    row = db.conn.execute(
+        "SELECT data_codec, formatted_codec, length(data) FROM clipboard_items WHERE id = ?",
+        (item_id,),
+    ).fetchone()
+    return row["data_codec"], row["formatted_codec"], row[2]
+
+
+class TestPayloadCodec:
+    """The codec round-trips payloads and records what it did."""
+
+    def test_round_trip(self):
+        """Compressed data decodes to the original bytes."""
+        codec = PayloadCodec()
+
+        compressed, name = codec.compress(LONG_TEXT)
+
+        assert name == PayloadCodec.preferred_algorithm()
+        assert len(compressed) < len(LONG_TEXT)
+        assert codec.decompress(compressed, name) == LONG_TEXT
+
+    def test_incompressible_stays_raw(self):
+        """Data that does not shrink is stored as-is."""
+        data = os.urandom(4096)
+
+        assert PayloadCodec().compress(data) == (data, PayloadCodec.RAW)
+        assert PayloadCodec().decompress(data, PayloadCodec.RAW) == data
+        assert PayloadCodec().decompress(data, None) == data
+
+    def test_dictionary_round_trip(self):
+        """Dictionary codecs name the dictionary and need it to decode."""
+        samples = [_html(i) for i in range(100)]
+        algorithm, dictionary = PayloadCodec.train_dictionary(samples)
+        codec = PayloadCodec()
+        codec.add_dictionary(1, algorithm, dictionary)
+
+        compressed, name = codec.compress(_html(1000), dict_id=1)
+        plain, _ = codec.compress(_html(1000))
+
+        assert name == f"{algorithm}:1"
+        assert len(compressed) < len(plain)
+        assert codec.decompress(compressed, name) == _html(1000)
+        with pytest.raises(RuntimeError):
+            PayloadCodec().decompress(compressed, name)
+
+    def test_new_rows_use_zlib(self):
+        """New rows use zlib, which every build can read, even when zstandard is installed."""
+        compressed, name = PayloadCodec().compress(LONG_TEXT)
+
+        assert name == "zlib"
+        assert PayloadCodec().decompress(compressed, name) == LONG_TEXT
+
+
+class TestStoredCompression:
+    """Items are compressed at ingest by kind and read back transparently."""
+
+    def test_text_stored_plain(self, temp_db: ClipboardDB):
+        """Text data is what the full-text indexes read, so it is not compressed."""
+        item_id = temp_db.add_item("text", LONG_TEXT)
+
+        assert _codecs(temp_db, item_id) == (None, None, len(LONG_TEXT))
+        assert temp_db.get_item(item_id)["data"] == LONG_TEXT
+        assert temp_db.get_text_page(item_id, 0)["content"] == LONG_TEXT.decode()[:ClipboardDB.PREVIEW_LENGTH]
+
+    def test_rows_writable_without_sql_functions(self, temp_db_file: ClipboardDB):
+        """Another SQLite client can update and delete items; the index stays consistent."""
+        html = _html(1) * 5
+        text_id = temp_db_file.add_item("text", LONG_TEXT, format_type="html", formatted_content=html)
+        file_id = temp_db_file.add_item("file", generate_file_data("notes.txt", content=LONG_TEXT))
+
+        conn = sqlite3.connect(temp_db_file.db_path)
+        conn.execute("UPDATE clipboard_items SET name = 'renamed' WHERE id = ?", (text_id,))
+        conn.execute("DELETE FROM clipboard_items WHERE id = ?", (file_id,))
+        conn.commit()
+        conn.close()
+
+        assert [item["id"] for item in temp_db_file.search_items("renamed")] == [text_id]
+        assert temp_db_file.search_items("notes") == []
+        assert temp_db_file.check_fts_index()
+
+    def test_compressed_text_from_earlier_versions_stored_plain(self, temp_db_file: ClipboardDB):
+        """Reopening decodes text compressed by earlier versions and indexes it again."""
+        text = LONG_TEXT + b" needleword"
+        item_id = temp_db_file.add_item("text", text)
+        compressed, codec = temp_db_file.codec.compress(text)
+        temp_db_file.conn.execute(
+            "UPDATE clipboard_items SET data = ?, data_codec = ? WHERE id = ?", (compressed, codec, item_id)
+        )
+        # Earlier versions indexed through a view that decompressed in SQL
+        temp_db_file.conn.execute("DROP VIEW clipboard_fts_source")
+        temp_db_file.conn.commit()
+
+        db = ClipboardDB(temp_db_file.db_path)
+        try:
+            assert _codecs(db, item_id) == (None, None, len(text))
+            assert [item["id"] for item in db.search_items("needleword")] == [item_id]
+            assert [item["id"] for item in db.search_items("quick brown", mode="substring")] == [item_id]
+            assert db.find_text_match_page(item_id, ["needleword"], page_size=500) == len(text) // 500
+            assert db.check_fts_index()
+        finally:
+            db.close()
+
+    def test_formatted_content_compressed(self, temp_db: ClipboardDB):
+        """HTML formatted content is compressed and returned decoded in lists and get_item."""
+        html = _html(1) * 5
+        item_id = temp_db.add_item("text", b"plain", format_type="html", formatted_content=html)
+
+        assert _codecs(temp_db, item_id)[1] == PayloadCodec.preferred_algorithm()
+        assert temp_db.get_item(item_id)["formatted_content"] == html
+        assert temp_db.get_items()[0]["formatted_content"] == html
+
+    def test_images_not_compressed(self, temp_db: ClipboardDB):
+        """Image payloads are stored as-is."""
+        item_id = temp_db.add_item("image/png", b"\x00" * 4096)
+
+        assert _codecs(temp_db, item_id)[0] is None
+
+    def test_inline_file_compressed(self, temp_db: ClipboardDB):
+        """Small files kept inline are compressed and keep their metadata."""
+        data = generate_file_data("notes.txt", content=LONG_TEXT)
+        item_id = temp_db.add_item("file", data)
+
+        assert _codecs(temp_db, item_id)[0] == PayloadCodec.preferred_algorithm()
+        item = temp_db.get_item(item_id)
+        assert item["data"] == data
+        assert item["file_metadata"]["name"] == "notes.txt"
+
+    def test_large_file_moved_to_blob_store_uncompressed(self, temp_db_file: ClipboardDB):
+        """Externalized files keep only their small header in the row."""
+        content = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 2)
+        data = generate_file_data("archive.bin", content=content)
+        item_id = temp_db_file.add_item("file", data)
+
+        assert temp_db_file.get_item(item_id)["data"] == data
+
+    def test_threshold_override(self, temp_db: ClipboardDB):
+        """An empty threshold table disables compression."""
+        temp_db.COMPRESS_MIN_SIZE = {}
+        item_id = temp_db.add_item("text", LONG_TEXT)
+
+        assert _codecs(temp_db, item_id) == (None, None, len(LONG_TEXT))
+
+
+class TestHtmlDictionary:
+    """A dictionary trained on stored HTML is used for new HTML."""
+
+    def test_not_trained_without_samples(self, temp_db: ClipboardDB):
+        """Training needs HTML_DICT_MIN_SAMPLES payloads."""
+        temp_db.add_item("text", b"x", format_type="html", formatted_content=_html(1))
+
+        assert temp_db.train_html_dictionary() is None
+
+    def test_trained_dictionary_used_and_persisted(self, temp_db_file: ClipboardDB):
+        """New HTML uses the dictionary, which survives reopening the database."""
+        for i in range(ClipboardDB.HTML_DICT_MIN_SAMPLES):
+            temp_db_file.add_item("text", f"item {i}".encode(), format_type="html", formatted_content=_html(i))
+
+        dict_id = temp_db_file.train_html_dictionary()
+        assert dict_id is not None
+
+        item_id = temp_db_file.add_item("text", b"new", format_type="html", formatted_content=_html(999))
+        assert _codecs(temp_db_file, item_id)[1].endswith(f":{dict_id}")
+
+        db = ClipboardDB(temp_db_file.db_path)
+        try:
+            assert db.get_item(item_id)["formatted_content"] == _html(999)
+        finally:
+            db.close()
+
+
+class TestRecompression:
+    """The background job compresses rows stored uncompressed."""
+
+    def test_legacy_rows_recompressed(self, temp_db: ClipboardDB):
+        """Rows without a codec are compressed; incompressible ones are marked raw."""
+        random_text = os.urandom(2048).hex().encode()[:2048]
+        for data in (LONG_TEXT, random_text):
+            temp_db.conn.execute(
+                "INSERT INTO clipboard_items (timestamp, type, kind, data) VALUES (?, 'file', 'file', ?)",
+                (generate_timestamp(), generate_file_data("notes.txt", content=data)),
+            )
+        temp_db.conn.commit()
+
+        after_id = 0
+        while after_id is not None:
+            after_id = temp_db.recompress_items(after_id, batch_size=1)
+
+        compressed, hex_text = temp_db.conn.execute(
+            "SELECT id, data_codec FROM clipboard_items ORDER BY id"
+        ).fetchall()
+        assert compressed["data_codec"] == PayloadCodec.preferred_algorithm()
+        assert hex_text["data_codec"] in (PayloadCodec.preferred_algorithm(), PayloadCodec.RAW)
+        assert temp_db.get_item(compressed["id"])["data"] == generate_file_data("notes.txt", content=LONG_TEXT)
+        assert temp_db.recompress_items() is None
+        assert temp_db.check_fts_index()
+
+    def test_html_reencoded_with_dictionary(self, temp_db: ClipboardDB):
+        """HTML compressed before a dictionary existed is re-encoded with it."""
+        ids = [
+            temp_db.add_item("text", f"item {i}".encode(), format_type="html", formatted_content=_html(i))
+            for i in range(ClipboardDB.HTML_DICT_MIN_SAMPLES)
+        ]
+        dict_id = temp_db.train_html_dictionary()
+
+        after_id = 0
+        while after_id is not None:
+            after_id = temp_db.recompress_items(after_id)
+
+        assert _codecs(temp_db, ids[0])[1].endswith(f":{dict_id}")
+        assert temp_db.get_item(ids[0])["formatted_content"] == _html(0)
+
+    def test_legacy_database_gets_codec_columns(self, tmp_path):
+        """Opening a database from before compression adds the columns and keeps rows readable."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE clipboard_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                type TEXT NOT NULL,
+                data BLOB NOT NULL,
+                thumbnail BLOB,
+                hash TEXT,
+                name TEXT,
+                format_type TEXT,
+                formatted_content BLOB,
+                is_favorite INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, 'text', ?)",
+            (generate_timestamp(), LONG_TEXT),
+        )
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            assert db.recompress_items() is None
+            assert _codecs(db, 1)[0] is None
+            assert db.get_item(1)["data"] == LONG_TEXT
+            assert [item["id"] for item in db.search_items("quick")] == [1]
+        finally:
+            db.close()
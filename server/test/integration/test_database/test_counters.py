@@ -0,0 +1,169 @@
+"""Tests for the trigger-maintained counters table."""
+
+import sqlite3
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from fixtures.test_data import generate_file_data, generate_timestamp
+
+
+def _true_counts(db: ClipboardDB) -> tuple:
+    conn = db.conn
+    return (
+        conn.execute("SELECT COUNT(*) FROM clipboard_items").fetchone()[0],
+        conn.execute("SELECT COUNT(*) FROM clipboard_items WHERE is_favorite = 0").fetchone()[0],
+        conn.execute("SELECT COUNT(*) FROM clipboard_items WHERE last_pasted IS NOT NULL").fetchone()[0],
+    )
+
+
+def _counted(db: ClipboardDB) -> tuple:
+    return (
+        db.get_total_count(),
+        db._count(db.conn, ClipboardDB.COUNTER_NON_FAVORITE),
+        db.get_pasted_count(),
+    )
+
+
+class TestCounters:
+    """Counters stay exact through every kind of write."""
+
+    def test_inserts_favorites_pastes_and_deletes(self, temp_db: ClipboardDB):
+        """Totals, non-favorites, pasted items and kinds follow each write."""
+        text_id = temp_db.add_item("text", b"text")
+        temp_db.add_item("url", b"https://example.com")
+        image_id = temp_db.add_item("image/png", b"png")
+        temp_db.add_item("file", generate_file_data("a.pdf"))
+        temp_db.toggle_favorite(image_id, True)
+        temp_db.add_pasted_item(text_id)
+        temp_db.add_pasted_item(text_id)
+
+        # An item pasted twice is one pasted item
+        assert _counted(temp_db) == (4, 3, 1)
+        assert temp_db.get_kind_counts() == {"text": 1, "url": 1, "image": 1, "file": 1}
+
+        # Deleting the item cascades to its pasted records
+        temp_db.delete_item(text_id)
+        temp_db.toggle_favorite(image_id, False)
+
+        assert _counted(temp_db) == _true_counts(temp_db) == (3, 3, 0)
+        assert temp_db.get_kind_counts() == {"url": 1, "image": 1, "file": 1}
+
+    def test_upsert_duplicate_does_not_count(self, temp_db: ClipboardDB):
+        """Bumping a duplicate leaves the counters unchanged."""
+        temp_db.upsert_item("text", b"same")
+        temp_db.upsert_item("text", b"same")
+
+        assert temp_db.get_total_count() == 1
+
+    def test_bulk_deletes(self, temp_db: ClipboardDB):
+        """Retention, bulk delete and clear_all keep the counters exact."""
+        for i in range(10):
+            temp_db.add_item("text", f"item {i}".encode(), timestamp=generate_timestamp(hours_ago=10 - i))
+        temp_db.toggle_favorite(1, True)
+
+        assert len(temp_db.cleanup_old_items(6)) == 3
+        assert _counted(temp_db) == _true_counts(temp_db) == (7, 6, 0)
+
+        temp_db.bulk_delete_oldest(2)
+        assert _counted(temp_db) == _true_counts(temp_db)
+
+        temp_db.clear_all()
+        assert _counted(temp_db) == (0, 0, 0)
+        assert temp_db.get_kind_counts() == {}
+
+    def test_counts_read_without_scanning(self, temp_db: ClipboardDB):
+        """Count reads and the retention check never scan clipboard_items."""
+        temp_db.add_item("text", b"one")
+
+        statements = []
+        temp_db.conn.set_trace_callback(statements.append)
+        try:
+            temp_db.get_total_count()
+            temp_db.get_pasted_count()
+            temp_db.cleanup_old_items(100)
+        finally:
+            temp_db.conn.set_trace_callback(None)
+
+        assert not any("COUNT(" in sql.upper() for sql in statements)
+
+
+class TestReconcileCounters:
+    """Startup reconciliation repairs drifted counters."""
+
+    def test_consistent_counters_untouched(self, temp_db: ClipboardDB):
+        """Exact counters are reported as such."""
+        temp_db.add_item("text", b"one")
+
+        assert temp_db.reconcile_counters() is True
+
+    def test_new_database_is_consistent(self, tmp_path, caplog):
+        """A fresh database, with no counter rows yet, reports no drift."""
+        db = ClipboardDB(tmp_path / "new.db")
+        try:
+            assert db.reconcile_counters() is True
+        finally:
+            db.close()
+
+        assert "Counters drifted" not in caplog.text
+
+    def test_drift_is_repaired(self, temp_db: ClipboardDB):
+        """Counters edited out of band are recomputed."""
+        temp_db.add_item("text", b"one")
+        temp_db.add_item("image/png", b"png")
+        temp_db.conn.execute("UPDATE counters SET value = 42")
+        temp_db.conn.execute("INSERT INTO counters (name, value) VALUES ('kind:bogus', 3)")
+        temp_db.conn.commit()
+
+        assert temp_db.reconcile_counters() is False
+        assert temp_db.reconcile_counters() is True
+        assert _counted(temp_db) == (2, 2, 0)
+        assert temp_db.get_kind_counts() == {"text": 1, "image": 1}
+
+    def test_existing_database_is_counted_on_open(self, tmp_path):
+        """A database from before the counters table opens with exact counts."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE clipboard_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                type TEXT NOT NULL,
+                data BLOB NOT NULL,
+                thumbnail BLOB,
+                hash TEXT,
+                name TEXT,
+                format_type TEXT,
+                formatted_content BLOB,
+                is_favorite INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE recently_pasted (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                clipboard_item_id INTEGER NOT NULL,
+                pasted_timestamp TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        for item_type, favorite in (("text", 0), ("text", 1), ("screenshot", 0)):
+            conn.execute(
+                "INSERT INTO clipboard_items (timestamp, type, data, is_favorite) VALUES (?, ?, x'00', ?)",
+                (generate_timestamp(), item_type, favorite),
+            )
+        # One valid paste and one orphan left behind without foreign keys
+        conn.execute("INSERT INTO recently_pasted (clipboard_item_id, pasted_timestamp) VALUES (1, ?)", (generate_timestamp(),))
+        conn.execute("INSERT INTO recently_pasted (clipboard_item_id, pasted_timestamp) VALUES (99, ?)", (generate_timestamp(),))
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            assert _counted(db) == (3, 2, 1)
+            assert db.get_kind_counts() == {"text": 2, "image": 1}
+        finally:
+            db.close()
@@ -0,0 +1,157 @@
+"""Tests for full-content deduplication with the upsert on dedup_key."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data, generate_timestamp
+from timestamps import to_epoch_us
+
+
+class TestDedupUpsert:
+    """upsert_item inserts new content once and bumps duplicates."""
+
+    def test_duplicate_bumps_existing_row(self, temp_db: ClipboardDB):
+        """The same text twice is one row with the newer timestamp."""
+        item_id, inserted = temp_db.upsert_item("text", b"same", "2025-01-01T00:00:00")
+        temp_db.update_item_name(item_id, "Kept name")
+
+        again_id, again_inserted = temp_db.upsert_item("text", b"same", "2025-02-01T00:00:00")
+
+        assert inserted and not again_inserted
+        assert again_id == item_id
+        item = temp_db.get_item(item_id)
+        assert item["timestamp"] == to_epoch_us("2025-02-01T00:00:00")
+        assert item["name"] == "Kept name"
+        assert temp_db.get_total_count() == 1
+
+    def test_shared_header_is_not_a_duplicate(self, temp_db_file: ClipboardDB):
+        """Large payloads that only share their first 64 KB are distinct."""
+        header = os.urandom(64 * 1024)
+        first, _ = temp_db_file.upsert_item("image/png", header + b"first")
+        second, inserted = temp_db_file.upsert_item("image/png", header + b"second")
+
+        assert inserted
+        assert first != second
+        assert temp_db_file.get_item(second)["data"] == header + b"second"
+
+    def test_key_includes_kind_and_size(self, temp_db: ClipboardDB):
+        """Equal hashes of different kinds or sizes do not collide."""
+        _, text_inserted = temp_db.upsert_item("text", b"payload", data_hash="0" * 64)
+        _, url_inserted = temp_db.upsert_item("url", b"payload", data_hash="0" * 64)
+        _, longer_inserted = temp_db.upsert_item("text", b"payload!", data_hash="0" * 64)
+
+        assert text_inserted and url_inserted and longer_inserted
+
+    def test_files_dedup_on_content(self, temp_db_file: ClipboardDB):
+        """Files with the same content are one item; directories dedup on their path."""
+        content = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 2)
+        first, _ = temp_db_file.upsert_item("file", generate_file_data("a.bin", content=content))
+        second, inserted = temp_db_file.upsert_item("file", generate_file_data("b.bin", content=content))
+
+        assert not inserted
+        assert second == first
+
+        folder = {"name": "docs", "size": 0, "original_path": "/home/user/docs", "is_directory": True}
+        other = {**folder, "original_path": "/tmp/docs"}
+        for metadata, expected in ((folder, True), (other, True), (folder, False)):
+            data = json.dumps(metadata).encode() + ClipboardDB.FILE_SEPARATOR
+            assert temp_db_file.upsert_item("file", data, file_metadata=metadata)[1] is expected
+
+    def test_upsert_is_one_statement(self, temp_db: ClipboardDB):
+        """Deduplication does not look the hash up before writing."""
+        temp_db.upsert_item("text", b"once")
+
+        statements = []
+        temp_db.conn.set_trace_callback(statements.append)
+        try:
+            temp_db.upsert_item("text", b"once")
+        finally:
+            temp_db.conn.set_trace_callback(None)
+
+        # Trigger programs are traced with the text of the statement that fired them
+        item_statements = list(dict.fromkeys(sql for sql in statements if "clipboard_items" in sql))
+        assert len(item_statements) == 1
+        assert "ON CONFLICT" in item_statements[0]
+
+    def test_unique_index_rejects_duplicate_keys(self, temp_db: ClipboardDB):
+        """The dedup key is enforced by a UNIQUE index."""
+        item_id, _ = temp_db.upsert_item("text", b"unique")
+        key = temp_db.conn.execute(
+            "SELECT dedup_key FROM clipboard_items WHERE id = ?", (item_id,)
+        ).fetchone()[0]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.conn.execute(
+                "INSERT INTO clipboard_items (timestamp, type, data, dedup_key) VALUES (?, 'text', ?, ?)",
+                (generate_timestamp(), b"unique", key),
+            )
+
+    def test_add_item_always_inserts(self, temp_db: ClipboardDB):
+        """add_item keeps inserting rows without a dedup key."""
+        first = temp_db.add_item("text", b"twice")
+        second = temp_db.add_item("text", b"twice")
+
+        assert first != second
+        assert temp_db.upsert_item("text", b"twice")[1] is True
+
+    def test_hash_file_matches_calculate_hash(self, tmp_path):
+        """The mmap-backed file hash equals the in-memory hash, including empty files."""
+        for size in (0, 1, ClipboardDB.HASH_CHUNK_SIZE + 7):
+            path = tmp_path / f"file{size}"
+            content = os.urandom(size)
+            path.write_bytes(content)
+
+            assert ClipboardDB.hash_file(path) == ClipboardDB.calculate_hash(content)
+
+    def test_legacy_rows_get_keys(self, tmp_path):
+        """Rows from before the dedup key are keyed if their old hash covered the full content."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE clipboard_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                type TEXT NOT NULL,
+                data BLOB NOT NULL,
+                thumbnail BLOB,
+                hash TEXT,
+                name TEXT,
+                format_type TEXT,
+                formatted_content BLOB,
+                is_favorite INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        small = b"small text"
+        large = b"y" * (70 * 1024)
+        rows = [
+            (small, ClipboardDB.calculate_hash(small)),
+            (small, ClipboardDB.calculate_hash(small)),
+            (large, ClipboardDB.calculate_hash(large[:65536])),
+        ]
+        for data, data_hash in rows:
+            conn.execute(
+                "INSERT INTO clipboard_items (timestamp, type, data, hash) VALUES (?, 'text', ?, ?)",
+                (generate_timestamp(), data, data_hash),
+            )
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            keys = [row[0] for row in db.conn.execute("SELECT dedup_key FROM clipboard_items ORDER BY id")]
+            assert keys[0] is None
+            assert keys[1] == ClipboardDB.dedup_key("text", len(small), ClipboardDB.calculate_hash(small))
+            assert keys[2] is None
+
+            assert db.upsert_item("text", small) == (2, False)
+            assert db.upsert_item("text", large)[1] is True
+        finally:
+            db.close()
@@ -0,0 +1,168 @@
+"""Tests for integer epoch-microsecond timestamps and their migration."""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from timestamps import now_us, to_epoch_us, to_iso
+
+
+def _column_types(db: ClipboardDB, table: str) -> dict:
+    return {row["name"]: row["type"] for row in db.conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _create_legacy_db(db_path):
+    """A database of a version that stored ISO timestamps as TEXT."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE clipboard_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            type TEXT NOT NULL,
+            data BLOB NOT NULL,
+            thumbnail BLOB,
+            hash TEXT,
+            name TEXT,
+            format_type TEXT,
+            formatted_content BLOB,
+            is_favorite INTEGER DEFAULT 0,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.execute("CREATE INDEX idx_timestamp ON clipboard_items(timestamp)")
+    conn.execute(
+        """
+        CREATE TABLE recently_pasted (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            clipboard_item_id INTEGER NOT NULL,
+            pasted_timestamp TEXT NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.execute("CREATE INDEX idx_pasted_timestamp ON recently_pasted(pasted_timestamp)")
+    conn.execute("CREATE TABLE tags (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, description TEXT, color TEXT NOT NULL, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)")
+    conn.execute(
+        """
+        CREATE TABLE item_tags (
+            item_id INTEGER NOT NULL,
+            tag_id INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (item_id, tag_id)
+        )
+        """
+    )
+    for timestamp, data in (
+        ("2025-03-01T09:00:00.250000", b"middle"),
+        ("2025-01-01T09:00:00", b"oldest"),
+        ("2025-06-01T09:00:00.000001", b"newest"),
+    ):
+        conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, 'text', ?)",
+            (timestamp, data),
+        )
+    conn.execute("INSERT INTO recently_pasted (clipboard_item_id, pasted_timestamp) VALUES (2, '2025-07-01T10:00:00')")
+    conn.execute("INSERT INTO recently_pasted (clipboard_item_id, pasted_timestamp) VALUES (2, '2025-07-02T10:00:00')")
+    conn.execute("INSERT INTO tags (name, color) VALUES ('Work', '#3584e4')")
+    conn.execute("INSERT INTO item_tags (item_id, tag_id) VALUES (1, 1)")
+    conn.commit()
+    conn.close()
+
+
+class TestTimestampConversions:
+    """Conversions between epoch microseconds and ISO strings."""
+
+    def test_round_trip_keeps_microseconds(self):
+        iso = "2025-03-01T09:00:00.123456"
+        assert to_iso(to_epoch_us(iso)) == iso
+
+    def test_accepts_datetimes_and_integers(self):
+        moment = datetime(2025, 3, 1, 9, 0, 0, 5)
+        assert to_epoch_us(moment) == to_epoch_us(moment.isoformat())
+        assert to_epoch_us(1_000_000) == 1_000_000
+        assert to_epoch_us(None) is None
+
+    def test_now_is_current(self):
+        assert abs(now_us() - to_epoch_us(datetime.now())) < 5_000_000
+
+
+class TestEpochTimestamps:
+    """Items and pastes are stored and ordered by integer timestamps."""
+
+    def test_new_schema_declares_integers(self, temp_db: ClipboardDB):
+        assert _column_types(temp_db, "clipboard_items")["timestamp"] == "INTEGER"
+        assert _column_types(temp_db, "clipboard_items")["last_pasted"] == "INTEGER"
+        assert _column_types(temp_db, "recently_pasted")["pasted_timestamp"] == "INTEGER"
+        assert _column_types(temp_db, "item_tags")["item_timestamp"] == "INTEGER"
+
+    def test_iso_input_is_stored_as_integer(self, temp_db: ClipboardDB):
+        item_id = temp_db.add_item("text", b"hello", timestamp="2025-01-01T10:00:00")
+        temp_db.add_pasted_item(item_id, "2025-01-02T10:00:00")
+
+        stored = temp_db.conn.execute(
+            "SELECT typeof(timestamp), typeof(last_pasted) FROM clipboard_items WHERE id = ?", (item_id,)
+        ).fetchone()
+        assert tuple(stored) == ("integer", "integer")
+        assert temp_db.get_item(item_id)["timestamp"] == to_epoch_us("2025-01-01T10:00:00")
+
+    def test_iso_cursor_is_accepted(self, temp_db: ClipboardDB):
+        """Cursors handed out before the migration still seek correctly."""
+        for day in range(1, 5):
+            temp_db.add_item("text", f"day {day}".encode(), timestamp=f"2025-01-0{day}T10:00:00")
+
+        items = temp_db.get_items(cursor={"timestamp": "2025-01-03T10:00:00", "id": 3})
+
+        assert [item["id"] for item in items] == [2, 1]
+
+    def test_legacy_database_is_migrated(self, tmp_path):
+        """ISO TEXT columns become integers with order and indexes intact."""
+        db_path = tmp_path / "legacy.db"
+        _create_legacy_db(db_path)
+
+        db = ClipboardDB(db_path)
+        try:
+            assert _column_types(db, "clipboard_items")["timestamp"] == "INTEGER"
+            assert _column_types(db, "recently_pasted")["pasted_timestamp"] == "INTEGER"
+            assert db.conn.execute(
+                "SELECT COUNT(*) FROM clipboard_items WHERE typeof(timestamp) != 'integer'"
+            ).fetchone()[0] == 0
+
+            items = db.get_items()
+            assert [item["id"] for item in items] == [3, 1, 2]
+            assert items[0]["timestamp"] == to_epoch_us("2025-06-01T09:00:00.000001")
+            assert to_iso(items[1]["timestamp"]) == "2025-03-01T09:00:00.250000"
+
+            [pasted] = db.get_recently_pasted()
+            assert pasted["pasted_timestamp"] == to_epoch_us("2025-07-02T10:00:00")
+            assert pasted["paste_count"] == 2
+
+            assert [item["id"] for item in db.get_items(filters=["Work"])] == [1]
+
+            indexes = {row["name"] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert {"idx_timestamp_id", "idx_favorite_timestamp_id", "idx_last_pasted_id", "idx_item_tags_tag_timestamp"} <= indexes
+            assert "idx_timestamp" not in indexes
+
+            # New items sort after the migrated ones
+            new_id = db.add_item("text", b"after migration")
+            assert db.get_items(limit=1)[0]["id"] == new_id
+        finally:
+            db.close()
+
+    def test_unreadable_timestamp_does_not_block_migration(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        _create_legacy_db(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO clipboard_items (timestamp, type, data) VALUES ('not a date', 'text', 'x')")
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            assert db.get_items(sort_order="ASC", limit=1)[0]["timestamp"] == 0
+        finally:
+            db.close()
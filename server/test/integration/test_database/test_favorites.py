@@ -250,7 +250,7 @@ class TestFavoritesInSearch:
         assert len(results) == 2
         for result in results:
             assert result["is_favorite"] is True
-            assert b"Important" in result["data"]
+            assert "Important" in result["preview"]
 
     def test_get_recently_pasted_includes_is_favorite(self, temp_db: ClipboardDB):
         """Test that get_recently_pasted includes is_favorite field."""
@@ -0,0 +1,123 @@
+"""Tests for the structured file metadata columns."""
+
+import json
+import sqlite3
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from fixtures.test_data import generate_file_data, generate_timestamp
+
+
+FILE_COLUMNS = "extension, file_name, file_size, mime_type, original_path, is_directory"
+
+
+class TestFileMetadataColumns:
+    """File metadata is stored in columns and read from them."""
+
+    def test_columns_from_explicit_metadata(self, temp_db: ClipboardDB):
+        """Metadata passed by the caller is stored without parsing data."""
+        metadata = {
+            "name": "Photos",
+            "size": 0,
+            "mime_type": "inode/directory",
+            "extension": "",
+            "original_path": "/home/user/Photos",
+            "is_directory": True,
+        }
+        data = json.dumps(metadata).encode() + ClipboardDB.FILE_SEPARATOR
+        item_id = temp_db.add_item("file", data, file_metadata=metadata)
+
+        row = temp_db.conn.execute(
+            f"SELECT {FILE_COLUMNS} FROM clipboard_items WHERE id = ?", (item_id,)
+        ).fetchone()
+
+        assert tuple(row) == (None, "Photos", 0, "inode/directory", "/home/user/Photos", 1)
+        assert temp_db.get_item(item_id)["file_metadata"] == {**metadata, "is_directory": True}
+
+    def test_columns_parsed_from_header(self, temp_db: ClipboardDB):
+        """Without explicit metadata, the JSON header of data is parsed once."""
+        item_id = temp_db.add_item("file", generate_file_data("Report.PDF", content=b"x" * 10))
+
+        item = temp_db.get_items()[0]
+
+        assert item["id"] == item_id
+        assert item["file_metadata"]["name"] == "Report.PDF"
+        assert item["file_metadata"]["extension"] == ".pdf"
+        assert item["file_metadata"]["size"] == 10
+        assert item["file_metadata"]["is_directory"] is False
+
+    def test_non_file_items_have_no_metadata(self, temp_db: ClipboardDB):
+        """Other item types leave the file columns empty."""
+        temp_db.add_item("text", b"plain")
+
+        assert temp_db.get_items()[0]["file_metadata"] is None
+
+    def test_rename_indexes_file_name_column(self, temp_db: ClipboardDB):
+        """Renaming a file keeps its file name searchable."""
+        item_id = temp_db.add_item("file", generate_file_data("quarterly.xlsx"), name="quarterly.xlsx")
+
+        temp_db.update_item_name(item_id, "Numbers")
+
+        assert [item["id"] for item in temp_db.search_items("quarterly")] == [item_id]
+        assert [item["id"] for item in temp_db.search_items("Numbers")] == [item_id]
+
+    def test_extensions_from_index(self, temp_db: ClipboardDB):
+        """The extension list is distinct, sorted and read from the index only."""
+        for name in ["a.pdf", "b.PDF", "c.zip", "d.txt"]:
+            temp_db.add_item("file", generate_file_data(name))
+        temp_db.add_item("text", b"no extension")
+
+        assert temp_db.get_file_extensions() == [".pdf", ".txt", ".zip"]
+
+        plan = temp_db.conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT DISTINCT extension FROM clipboard_items
+            WHERE extension IS NOT NULL ORDER BY extension
+            """
+        ).fetchall()
+        assert any("COVERING INDEX idx_extension_timestamp" in row[3] for row in plan)
+
+    def test_legacy_file_rows_are_backfilled(self, tmp_path):
+        """Opening a database from before the columns fills them from the headers."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE clipboard_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                type TEXT NOT NULL,
+                data BLOB NOT NULL,
+                thumbnail BLOB,
+                hash TEXT,
+                name TEXT,
+                format_type TEXT,
+                formatted_content BLOB,
+                is_favorite INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        metadata = {
+            "name": "song.mp3",
+            "size": 7,
+            "mime_type": "audio/mpeg",
+            "extension": ".mp3",
+            "original_path": "/music/song.mp3",
+            "is_directory": False,
+        }
+        conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, 'file', ?)",
+            (generate_timestamp(), json.dumps(metadata).encode() + ClipboardDB.FILE_SEPARATOR + b"content"),
+        )
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            row = db.conn.execute(f"SELECT {FILE_COLUMNS} FROM clipboard_items").fetchone()
+            assert tuple(row) == (".mp3", "song.mp3", 7, "audio/mpeg", "/music/song.mp3", 0)
+            assert db.get_file_extensions() == [".mp3"]
+        finally:
+            db.close()
@@ -0,0 +1,260 @@
+"""Tests for the indexed kind/extension filters and their query plans."""
+
+import re
+import sqlite3
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from fixtures.test_data import generate_file_data, generate_timestamp
+
+
+FILTER_COMBINATIONS = [
+    ["text"],
+    ["url"],
+    ["image"],
+    ["file"],
+    ["favorite"],
+    ["file:.pdf"],
+    [".pdf"],
+    ["Work"],
+    ["text", "image"],
+    ["text", "favorite"],
+    ["file:.pdf", "file:.docx"],
+    ["file:.pdf", "favorite"],
+    ["image", "Work"],
+    ["text", "url", "image", "file", "favorite", "Work"],
+]
+
+# A full scan of clipboard_items; "SCAN ... USING INDEX" is an ordered index walk
+FULL_SCAN = re.compile(r"\bSCAN (clipboard_items|ci)\b(?! USING)")
+
+# A full scan of any table, or a sort of the result
+SLOW_PLAN = re.compile(r"\bSCAN \w+\b(?! USING| VIRTUAL TABLE)|USE TEMP B-TREE FOR (RIGHT PART OF )?ORDER BY")
+
+# Every list query shape the IPC layer issues, as (name, call on the database).
+# Search is ranked, so its matches are always sorted and it is not listed.
+CURSOR = {"timestamp": "2025-06-01T00:00:00", "id": 50}
+HOT_QUERIES = [
+    ("history", lambda db: db.get_items()),
+    ("history ascending", lambda db: db.get_items(sort_order="ASC")),
+    ("history next page", lambda db: db.get_items(cursor=CURSOR)),
+    ("history by kind", lambda db: db.get_items(filters=["text"])),
+    ("history by extension", lambda db: db.get_items(filters=["file:.pdf"])),
+    ("history favorites", lambda db: db.get_items(filters=["favorite"])),
+    ("history favorites next page", lambda db: db.get_items(filters=["favorite"], cursor=CURSOR)),
+    ("history by tag", lambda db: db.get_items(filters=["Work"])),
+    ("history by tag next page", lambda db: db.get_items(filters=["Work"], cursor=CURSOR)),
+    ("history by tag and kind", lambda db: db.get_items(filters=["Work", "image"])),
+    ("pasted", lambda db: db.get_recently_pasted()),
+    ("pasted ascending", lambda db: db.get_recently_pasted(sort_order="ASC")),
+    ("pasted next page", lambda db: db.get_recently_pasted(cursor=CURSOR)),
+    ("pasted favorites", lambda db: db.get_recently_pasted(filters=["favorite"])),
+    ("pasted by tag", lambda db: db.get_recently_pasted(filters=["Work"])),
+    ("items by tag", lambda db: db.get_items_by_tags([1])),
+    ("items with all tags", lambda db: db.get_items_by_tags([1, 2], match_all=True)),
+    ("tags of a page", lambda db: db.get_tags_for_items(list(range(1, 21)))),
+    ("all tags", lambda db: db.get_all_tags()),
+    ("file extensions", lambda db: db.get_file_extensions()),
+    ("kind counts", lambda db: db.get_kind_counts()),
+    ("retention", lambda db: db.cleanup_old_items(10_000)),
+]
+
+
+@pytest.fixture
+def filter_db(temp_db: ClipboardDB) -> ClipboardDB:
+    """Database with items of every kind, a tag and a paste."""
+    for i in range(20):
+        temp_db.add_item("text", f"note {i}".encode())
+        temp_db.add_item("url", f"https://example.com/note/{i}".encode())
+        temp_db.add_item("image/png", f"png {i}".encode())
+        temp_db.add_item("file", generate_file_data(f"note{i}.pdf"), name=f"note{i}.pdf")
+    tag_id = temp_db.create_tag("Work")
+    temp_db.add_tag_to_item(1, tag_id)
+    temp_db.add_pasted_item(1)
+    return temp_db
+
+
+def _query_plans(db: ClipboardDB, fetch, include_tags: bool = False) -> list:
+    """Run fetch() and return the query plan of every SELECT it issued.
+
+    Tag hydration queries are left out unless include_tags is set.
+    """
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        fetch()
+    finally:
+        db.conn.set_trace_callback(None)
+
+    plans = []
+    for sql in statements:
+        if not sql.lstrip().upper().startswith("SELECT"):
+            continue
+        if "JOIN tags t ON t.id = it.tag_id" in sql and not include_tags:
+            continue
+        rows = db.conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        plans.append([row[3] for row in rows])
+    return plans
+
+
+class TestFilterQueryPlans:
+    """Every filter combination compiles to index seeks."""
+
+    @pytest.mark.parametrize("filters", FILTER_COMBINATIONS, ids=lambda f: "+".join(f))
+    @pytest.mark.parametrize("method", ["get_items", "get_recently_pasted", "search_items"])
+    def test_filters_use_indexes(self, filter_db: ClipboardDB, method, filters):
+        """No filtered list query scans clipboard_items."""
+        if method == "search_items":
+            fetch = lambda: filter_db.search_items("note", filters=filters)
+        else:
+            fetch = lambda: getattr(filter_db, method)(filters=filters)
+
+        plans = _query_plans(filter_db, fetch)
+
+        assert plans
+        for plan in plans:
+            assert not any(FULL_SCAN.search(line) for line in plan), plan
+
+    @pytest.mark.parametrize(
+        "filters, index",
+        [
+            (["text"], "idx_kind_timestamp"),
+            (["image"], "idx_kind_timestamp"),
+            (["file:.pdf"], "idx_extension_timestamp"),
+            ([".pdf"], "idx_extension_timestamp"),
+        ],
+    )
+    def test_content_filters_seek_on_composite_index(self, filter_db: ClipboardDB, filters, index):
+        """Kind and extension filters are answered from their composite index."""
+        plan = _query_plans(filter_db, lambda: filter_db.get_items(filters=filters))[0]
+
+        assert any(line.startswith("SEARCH") and index in line for line in plan), plan
+
+
+class TestHotQueryPlans:
+    """List queries of the UI neither scan tables nor sort their results."""
+
+    @pytest.fixture(params=["fresh", "analyzed"])
+    def hot_db(self, filter_db: ClipboardDB, request) -> ClipboardDB:
+        """filter_db with favorites, pastes and two tags; optionally with planner statistics."""
+        work = filter_db.get_all_tags()[0]["id"]
+        home = filter_db.create_tag("Home")
+        for item_id in range(2, 31):
+            filter_db.add_tag_to_item(item_id, work)
+            if item_id % 3 == 0:
+                filter_db.add_tag_to_item(item_id, home)
+                filter_db.toggle_favorite(item_id, True)
+                filter_db.add_pasted_item(item_id)
+        if request.param == "analyzed":
+            filter_db.optimize_query_planner()
+            filter_db.conn.execute("ANALYZE")
+        return filter_db
+
+    @pytest.mark.parametrize("name, fetch", HOT_QUERIES, ids=[name for name, _ in HOT_QUERIES])
+    def test_no_scan_or_sort(self, hot_db: ClipboardDB, name, fetch):
+        """Each query seeks or walks an index in the order it returns rows."""
+        plans = _query_plans(hot_db, lambda: fetch(hot_db), include_tags=True)
+
+        assert plans
+        for plan in plans:
+            assert not any(SLOW_PLAN.search(line) for line in plan), plan
+
+    def test_tag_filter_follows_retimestamped_items(self, filter_db: ClipboardDB):
+        """Copying a tagged item again moves it to the top of the tag filter."""
+        tag_id = filter_db.get_all_tags()[0]["id"]
+        filter_db.add_tag_to_item(5, tag_id)
+        filter_db.update_timestamp(1, "2099-01-01T00:00:00")
+
+        assert [item["id"] for item in filter_db.get_items(filters=["Work"])] == [1, 5]
+        assert [item["id"] for item in filter_db.get_items(filters=["Work"], sort_order="ASC")] == [5, 1]
+
+    def test_legacy_item_tags_backfilled(self, tmp_path):
+        """Tags from before item_tags.item_timestamp are filled in when the database opens."""
+        db = ClipboardDB(tmp_path / "legacy.db")
+        tag_id = db.create_tag("Work")
+        for i in range(3):
+            db.add_tag_to_item(db.add_item("text", f"note {i}".encode()), tag_id)
+        db.conn.execute("DROP INDEX idx_item_tags_tag_timestamp")
+        db.conn.execute("DROP TRIGGER item_tags_timestamp_insert")
+        db.conn.execute("ALTER TABLE item_tags DROP COLUMN item_timestamp")
+        db.conn.commit()
+        db.close()
+
+        db = ClipboardDB(tmp_path / "legacy.db")
+        try:
+            assert [item["id"] for item in db.get_items(filters=["Work"])] == [3, 2, 1]
+        finally:
+            db.close()
+
+
+class TestKindAndExtensionFilters:
+    """Filters match on the normalized columns."""
+
+    def test_extension_filter_matches_files(self, temp_db: ClipboardDB):
+        """file:.pdf and .PDF match file items by their extension."""
+        pdf_id = temp_db.add_item("file", generate_file_data("report.PDF"))
+        temp_db.add_item("file", generate_file_data("notes.docx"))
+        temp_db.add_item("text", b"report.pdf mentioned in text")
+
+        for filters in (["file:.pdf"], ["file:pdf"], [".PDF"]):
+            assert [item["id"] for item in temp_db.get_items(filters=filters)] == [pdf_id]
+
+    def test_image_filter_includes_screenshots(self, temp_db: ClipboardDB):
+        """Every image MIME type and screenshots share the image kind."""
+        ids = {
+            temp_db.add_item("image/png", b"png"),
+            temp_db.add_item("image/jpeg", b"jpeg"),
+            temp_db.add_item("screenshot", b"screen"),
+        }
+        temp_db.add_item("text", b"image/png")
+
+        assert {item["id"] for item in temp_db.get_items(filters=["image"])} == ids
+
+    def test_legacy_rows_are_backfilled(self, tmp_path):
+        """Opening a database from before the columns fills kind and extension."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE clipboard_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                type TEXT NOT NULL,
+                data BLOB NOT NULL,
+                thumbnail BLOB,
+                hash TEXT,
+                name TEXT,
+                format_type TEXT,
+                formatted_content BLOB,
+                is_favorite INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        rows = [
+            ("text", b"hello"),
+            ("screenshot", b"screen"),
+            ("file", generate_file_data("Slides.PPTX")),
+        ]
+        for item_type, data in rows:
+            conn.execute(
+                "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, ?, ?)",
+                (generate_timestamp(), item_type, data),
+            )
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            result = db.conn.execute(
+                "SELECT kind, extension FROM clipboard_items ORDER BY id"
+            ).fetchall()
+            assert [tuple(row) for row in result] == [
+                ("text", None),
+                ("image", None),
+                ("file", ".pptx"),
+            ]
+        finally:
+            db.close()
@@ -0,0 +1,240 @@
+"""Tests for the trigger-maintained external-content FTS index."""
+
+import sqlite3
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data, generate_timestamp
+
+
+def _search_ids(db: ClipboardDB, query: str) -> list:
+    return [item["id"] for item in db.search_items(query)]
+
+
+class TestFtsTriggers:
+    """Writes to items and tags keep the index current without manual FTS code."""
+
+    def test_add_and_delete(self, temp_db: ClipboardDB):
+        """Inserted items are searchable and deleted items disappear."""
+        text_id = temp_db.add_item("text", b"alpha bravo")
+        file_id = temp_db.add_item("file", generate_file_data("alpha.pdf"))
+
+        assert set(_search_ids(temp_db, "alpha")) == {text_id, file_id}
+
+        temp_db.delete_item(text_id)
+
+        assert _search_ids(temp_db, "alpha") == [file_id]
+        assert temp_db.check_fts_index()
+
+    def test_rename(self, temp_db: ClipboardDB):
+        """Renaming replaces the indexed name."""
+        item_id = temp_db.add_item("text", b"content", name="Before")
+
+        temp_db.update_item_name(item_id, "After")
+
+        assert _search_ids(temp_db, "Before") == []
+        assert _search_ids(temp_db, "After") == [item_id]
+        assert temp_db.check_fts_index()
+
+    def test_tag_add_remove_rename_delete(self, temp_db: ClipboardDB):
+        """Tag names follow tag assignment, renames and deletes."""
+        item_id = temp_db.add_item("text", b"content")
+        tag_id = temp_db.create_tag("Groceries")
+
+        temp_db.add_tag_to_item(item_id, tag_id)
+        assert _search_ids(temp_db, "Groceries") == [item_id]
+
+        temp_db.update_tag(tag_id, name="Errands")
+        assert _search_ids(temp_db, "Groceries") == []
+        assert _search_ids(temp_db, "Errands") == [item_id]
+
+        temp_db.remove_tag_from_item(item_id, tag_id)
+        assert _search_ids(temp_db, "Errands") == []
+
+        temp_db.add_tag_to_item(item_id, tag_id)
+        temp_db.delete_tag(tag_id)
+        assert _search_ids(temp_db, "Errands") == []
+        assert temp_db.check_fts_index()
+
+    def test_bulk_deletes(self, temp_db: ClipboardDB):
+        """Retention cleanup and clear_all remove index entries too."""
+        ids = [temp_db.add_item("text", f"bulk item {i}".encode()) for i in range(5)]
+
+        temp_db.cleanup_old_items(2)
+        assert set(_search_ids(temp_db, "bulk")) == set(ids[-2:])
+
+        temp_db.clear_all()
+        assert _search_ids(temp_db, "bulk") == []
+        assert temp_db.check_fts_index()
+
+    def test_content_not_stored_twice(self, temp_db: ClipboardDB):
+        """The index reads text from clipboard_items and keeps no copy of it."""
+        temp_db.add_item("text", b"stored once")
+
+        tables = {
+            row[0]
+            for row in temp_db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+
+        assert "clipboard_fts" in tables
+        assert "clipboard_fts_content" not in tables
+
+
+class TestFtsConsistency:
+    """The checker detects drift and a rebuild repairs it."""
+
+    def test_detects_stale_entry(self, temp_db: ClipboardDB):
+        """An out-of-band edit that skips the triggers is reported and repaired."""
+        item_id = temp_db.add_item("text", b"original words")
+        temp_db.conn.execute("DROP TRIGGER clipboard_items_fts_update")
+        temp_db.conn.execute("UPDATE clipboard_items SET name = 'Sneaky' WHERE id = ?", (item_id,))
+        temp_db.conn.commit()
+
+        assert not temp_db.check_fts_index()
+
+        temp_db.rebuild_fts_index()
+
+        assert temp_db.check_fts_index()
+        assert _search_ids(temp_db, "Sneaky") == [item_id]
+
+    def test_detects_missing_entry(self, temp_db: ClipboardDB):
+        """Rows missing from the index are reported."""
+        temp_db.add_item("text", b"indexed")
+        temp_db.conn.execute("INSERT INTO clipboard_fts (clipboard_fts) VALUES ('delete-all')")
+        temp_db.conn.commit()
+
+        assert not temp_db.check_fts_index()
+
+        temp_db.rebuild_fts_index()
+
+        assert _search_ids(temp_db, "indexed")
+
+    def test_legacy_index_is_rebuilt(self, tmp_path):
+        """A standalone index from older versions is replaced and rebuilt once."""
+        db_path = tmp_path / "legacy.db"
+        db = ClipboardDB(db_path)
+        tag_id = db.create_tag("Legacy")
+        db.close()
+
+        conn = sqlite3.connect(db_path)
+        for trigger in ClipboardDB.FTS_TRIGGERS:
+            conn.execute(f"DROP TRIGGER {trigger}")
+        for table, (view, _, _) in ClipboardDB.FTS_INDEXES.items():
+            conn.execute(f"DROP TABLE {table}")
+            conn.execute(f"DROP VIEW {view}")
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE clipboard_fts
+            USING fts5(content, name, tokenize="unicode61 separators './:?=&#@'")
+            """
+        )
+        conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, data, name) VALUES (?, 'text', ?, 'Kept')",
+            (generate_timestamp(), b"carried over"),
+        )
+        conn.execute("INSERT INTO item_tags (item_id, tag_id) VALUES (1, ?)", (tag_id,))
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            assert db.check_fts_index()
+            assert _search_ids(db, "carried") == [1]
+            assert _search_ids(db, "Kept") == [1]
+            assert _search_ids(db, "Legacy") == [1]
+        finally:
+            db.close()
+
+    def test_reopening_keeps_index(self, temp_db_file: ClipboardDB):
+        """Opening an up-to-date database does not rebuild the index."""
+        temp_db_file.add_item("text", b"persistent words")
+        db = ClipboardDB(temp_db_file.db_path)
+        try:
+            statements = []
+            db.conn.set_trace_callback(statements.append)
+            db._init_fts(db.conn.cursor())
+            db.conn.set_trace_callback(None)
+
+            assert not any("'rebuild'" in sql for sql in statements)
+            assert _search_ids(db, "persistent")
+        finally:
+            db.close()
+
+
+class TestSubstringSearch:
+    """The trigram index finds parts of words; URLs are in both indexes."""
+
+    def test_infix_match(self, temp_db: ClipboardDB):
+        """Substring mode finds the middle of a word that token mode misses."""
+        item_id = temp_db.add_item("text", b"open the Dashboard settings")
+        hash_id = temp_db.add_item("text", b"commit 9f86d081884c7d659a2feaa0c55ad015")
+
+        assert _search_ids(temp_db, "ashboar") == []
+        assert [i["id"] for i in temp_db.search_items("ashboar", mode="substring")] == [item_id]
+        assert [i["id"] for i in temp_db.search_items("884c7d65", mode="substring")] == [hash_id]
+
+    def test_all_terms_required(self, temp_db: ClipboardDB):
+        """Every term must appear, including terms shorter than a trigram."""
+        both = temp_db.add_item("text", b"quarterly report v2")
+        temp_db.add_item("text", b"quarterly summary")
+
+        assert [i["id"] for i in temp_db.search_items("arterl epor", mode="substring")] == [both]
+        assert [i["id"] for i in temp_db.search_items("rterly v2", mode="substring")] == [both]
+        assert [i["id"] for i in temp_db.search_items("v2", mode="substring")] == [both]
+
+    def test_like_wildcards_are_literal(self, temp_db: ClipboardDB):
+        """% and _ in short terms match themselves only."""
+        literal = temp_db.add_item("text", b"100% done")
+        temp_db.add_item("text", b"100 done")
+
+        assert [i["id"] for i in temp_db.search_items("done 0%", mode="substring")] == [literal]
+
+    def test_short_terms_alone_match_word_prefixes(self, temp_db: ClipboardDB):
+        """Without a trigram-length term, the word index is searched instead of every row."""
+        report = temp_db.add_item("text", b"quarterly report")
+        temp_db.add_item("text", b"weekly summary")
+        statements = []
+        temp_db.conn.set_trace_callback(statements.append)
+
+        assert [i["id"] for i in temp_db.search_items("qu re", mode="substring")] == [report]
+        assert temp_db.search_items("rt", mode="substring") == []
+        temp_db.conn.set_trace_callback(None)
+
+        searches = [sql for sql in statements if "relevance" in sql]
+        assert searches and all("clipboard_fts MATCH" in sql and "LIKE" not in sql for sql in searches)
+
+    def test_names_tags_and_filters(self, temp_db: ClipboardDB):
+        """Substring search covers names and tags and honours filters."""
+        item_id = temp_db.add_item("text", b"content", name="Invoices")
+        temp_db.add_tag_to_item(item_id, temp_db.create_tag("Household"))
+        temp_db.add_item("image/png", b"png", name="Invoices scan")
+
+        assert [i["id"] for i in temp_db.search_items("voice", mode="substring", filters=["text"])] == [item_id]
+        assert [i["id"] for i in temp_db.search_items("sehol", mode="substring")] == [item_id]
+
+    def test_url_items_are_indexed(self, temp_db: ClipboardDB):
+        """URL items are found by token and by substring search."""
+        url_id = temp_db.add_item("url", b"https://github.com/example/tfcbm/pulls")
+
+        assert _search_ids(temp_db, "github") == [url_id]
+        assert [i["id"] for i in temp_db.search_items("ithub.co", mode="substring")] == [url_id]
+
+        temp_db.delete_item(url_id)
+        assert temp_db.search_items("ithub.co", mode="substring") == []
+        assert temp_db.check_fts_index()
+
+    def test_trigram_index_covers_head_of_long_text(self, temp_db: ClipboardDB):
+        """Substring search is limited to the indexed head; token search sees everything."""
+        max_chars = ClipboardDB.FTS_INDEXES["clipboard_fts_trigram"][2]
+        item_id = temp_db.add_item("text", ("x " * max_chars + "tailmarker").encode())
+
+        assert _search_ids(temp_db, "tailmarker") == [item_id]
+        assert temp_db.search_items("ilmarke", mode="substring") == []
+        assert temp_db.check_fts_index()
+
+    def test_unknown_mode_rejected(self, temp_db: ClipboardDB):
+        """Only token and substring modes exist."""
+        with pytest.raises(ValueError):
+            temp_db.search_items("anything", mode="regex")
@@ -0,0 +1,103 @@
+"""Tests for keyset (cursor) pagination of the history and pasted lists."""
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from fixtures.test_data import generate_timestamp
+
+
+def _page_through(fetch, cursor_for, page_size):
+    """Collect every page by following the cursor until a short page."""
+    pages = []
+    cursor = None
+    while True:
+        page = fetch(limit=page_size, cursor=cursor)
+        pages.append(page)
+        if len(page) < page_size:
+            return pages
+        cursor = cursor_for(page)
+
+
+class TestKeysetPagination:
+    """Test cursor-based pagination."""
+
+    @pytest.mark.parametrize("sort_order", ["DESC", "ASC"])
+    def test_cursor_pages_match_offset_pages(self, temp_db: ClipboardDB, sort_order):
+        """Walking with a cursor yields the same pages as offsets."""
+        for i in range(23):
+            temp_db.add_item("text", f"Item {i}".encode(), timestamp=generate_timestamp(hours_ago=i))
+
+        keyset = _page_through(
+            lambda **kw: temp_db.get_items(sort_order=sort_order, **kw),
+            ClipboardDB.history_cursor,
+            page_size=5,
+        )
+        by_offset = [
+            temp_db.get_items(limit=5, offset=offset, sort_order=sort_order)
+            for offset in range(0, 25, 5)
+        ]
+
+        assert [[item["id"] for item in page] for page in keyset] == [
+            [item["id"] for item in page] for page in by_offset
+        ]
+
+    def test_cursor_breaks_timestamp_ties_by_id(self, temp_db: ClipboardDB):
+        """Items sharing a timestamp are neither skipped nor repeated."""
+        timestamp = generate_timestamp()
+        item_ids = [temp_db.add_item("text", f"Same time {i}".encode(), timestamp=timestamp) for i in range(7)]
+
+        pages = _page_through(temp_db.get_items, ClipboardDB.history_cursor, page_size=3)
+        seen = [item["id"] for page in pages for item in page]
+
+        assert seen == sorted(item_ids, reverse=True)
+
+    def test_cursor_with_filters(self, temp_db: ClipboardDB):
+        """Filters are applied together with the cursor."""
+        for i in range(10):
+            temp_db.add_item("text", f"Text {i}".encode(), timestamp=generate_timestamp(hours_ago=2 * i))
+            temp_db.add_item("url", f"https://example.com/{i}".encode(), timestamp=generate_timestamp(hours_ago=2 * i + 1))
+
+        pages = _page_through(
+            lambda **kw: temp_db.get_items(filters=["url"], **kw),
+            ClipboardDB.history_cursor,
+            page_size=4,
+        )
+        items = [item for page in pages for item in page]
+
+        assert len(items) == 10
+        assert all(item["type"] == "url" for item in items)
+        assert len({item["id"] for item in items}) == 10
+
+    def test_pasted_cursor(self, temp_db: ClipboardDB):
+        """The pasted list pages by last paste time and item ID."""
+        item_ids = [temp_db.add_item("text", f"Item {i}".encode()) for i in range(12)]
+        timestamp = generate_timestamp()
+        for _ in range(3):
+            for item_id in item_ids:
+                temp_db.add_pasted_item(item_id, pasted_timestamp=timestamp)
+
+        pages = _page_through(temp_db.get_recently_pasted, ClipboardDB.pasted_cursor, page_size=5)
+        seen = [item["id"] for page in pages for item in page]
+
+        assert seen == sorted(item_ids, reverse=True)
+
+    def test_cursor_of_empty_page(self):
+        """There is no cursor after an empty page."""
+        assert ClipboardDB.history_cursor([]) is None
+        assert ClipboardDB.pasted_cursor([]) is None
+
+    def test_history_query_seeks_on_index(self, temp_db: ClipboardDB):
+        """A cursor query is answered from the timestamp index."""
+        plan = temp_db.conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id FROM clipboard_items
+            WHERE (timestamp, id) < (?, ?)
+            ORDER BY timestamp DESC, id DESC LIMIT 20
+            """,
+            (generate_timestamp(), 1000),
+        ).fetchall()
+        details = " ".join(row[3] for row in plan)
+
+        assert "idx_timestamp" in details
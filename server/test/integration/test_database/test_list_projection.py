@@ -0,0 +1,138 @@
+"""Tests for the lightweight columns returned by list queries."""
+
+import os
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data, generate_timestamp
+
+
+class TestListProjection:
+    """List queries return previews and metadata, never payloads."""
+
+    def test_list_items_have_no_payload(self, temp_db: ClipboardDB):
+        """Every list method omits the data column."""
+        item_id = temp_db.add_item("text", b"projection check")
+        temp_db.add_pasted_item(item_id)
+        tag_id = temp_db.create_tag("Work")
+        temp_db.add_tag_to_item(item_id, tag_id)
+
+        lists = [
+            temp_db.get_items(),
+            temp_db.get_recently_pasted(),
+            temp_db.search_items("projection"),
+            temp_db.get_items_by_tags([tag_id]),
+            [temp_db.get_list_item(item_id)],
+        ]
+
+        for items in lists:
+            assert len(items) == 1
+            assert "data" not in items[0]
+            assert items[0]["preview"] == "projection check"
+
+    def test_list_item_matches_list_query(self, temp_db: ClipboardDB):
+        """get_list_item returns an item as get_items does, tags included."""
+        item_id = temp_db.add_item("text", b"single row")
+        temp_db.add_tag_to_item(item_id, temp_db.create_tag("Work"))
+
+        assert temp_db.get_list_item(item_id) == temp_db.get_items()[0]
+        assert temp_db.get_list_item(item_id + 1) is None
+
+    def test_text_preview_is_truncated(self, temp_db: ClipboardDB):
+        """Long text is cut to the preview length but reports its full length."""
+        text = "é" * (ClipboardDB.PREVIEW_LENGTH * 3)
+        temp_db.add_item("text", text.encode("utf-8"))
+
+        item = temp_db.get_items()[0]
+
+        assert item["preview"] == text[:ClipboardDB.PREVIEW_LENGTH]
+        assert item["total_length"] == len(text)
+
+    def test_file_metadata_without_content(self, temp_db: ClipboardDB):
+        """File items expose their metadata columns only."""
+        content = os.urandom(256 * 1024)
+        temp_db.add_item("file", generate_file_data("archive.zip", content=content), name="archive.zip")
+
+        item = temp_db.get_items()[0]
+        metadata = item["file_metadata"]
+
+        assert metadata["name"] == "archive.zip"
+        assert metadata["size"] == len(content)
+        assert item["preview"] is None
+        assert item["total_length"] is None
+
+    def test_image_keeps_thumbnail_reference(self, temp_db_file: ClipboardDB):
+        """Images return the thumbnail and blob key, not the image bytes."""
+        image = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 2)
+        item_id = temp_db_file.add_item("image/png", image, thumbnail=b"thumb")
+
+        item = temp_db_file.get_items()[0]
+
+        assert item["thumbnail"] == b"thumb"
+        assert item["blob_key"] is not None
+        assert temp_db_file.get_item(item_id)["data"] == image
+
+    def test_find_text_match_page(self, temp_db: ClipboardDB):
+        """The earliest match of any term decides the page."""
+        text = "a" * 1200 + "Needle" + "b" * 100 + "haystack"
+        item_id = temp_db.add_item("text", text.encode("utf-8"))
+
+        assert temp_db.find_text_match_page(item_id, ["needle"], page_size=500) == 2
+        assert temp_db.find_text_match_page(item_id, ["haystack", "needle"], page_size=500) == 2
+        assert temp_db.find_text_match_page(item_id, ["missing"], page_size=500) == 0
+        assert temp_db.find_text_match_page(item_id, [], page_size=500) == 0
+
+
+class TestPrecomputedTextColumns:
+    """Preview, length and page count are stored when an item is written."""
+
+    def test_columns_written_at_ingest(self, temp_db: ClipboardDB):
+        """add_item stores the preview slice, character length and page count."""
+        text = "ü" * (ClipboardDB.PREVIEW_LENGTH * 2 + 1)
+        item_id = temp_db.add_item("text", text.encode("utf-8"))
+
+        row = temp_db.conn.execute(
+            "SELECT preview, text_length, page_count FROM clipboard_items WHERE id = ?",
+            (item_id,),
+        ).fetchone()
+
+        assert row["preview"] == text[:ClipboardDB.PREVIEW_LENGTH]
+        assert row["text_length"] == len(text)
+        assert row["page_count"] == 3
+        assert temp_db.get_items()[0]["total_pages"] == 3
+
+    def test_non_text_items_have_no_text_columns(self, temp_db: ClipboardDB):
+        """Images and files leave the text columns empty."""
+        item_id = temp_db.add_item("image/png", b"png bytes")
+
+        row = temp_db.conn.execute(
+            "SELECT preview, text_length, page_count FROM clipboard_items WHERE id = ?",
+            (item_id,),
+        ).fetchone()
+
+        assert tuple(row) == (None, None, None)
+
+    def test_backfill_legacy_rows(self, temp_db: ClipboardDB):
+        """Rows written without the columns are listed and then backfilled."""
+        text = "legacy " * 200
+        temp_db.conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, 'text', ?)",
+            (generate_timestamp(), text.encode("utf-8")),
+        )
+        temp_db.conn.commit()
+
+        item = temp_db.get_items()[0]
+        assert item["preview"] == text[:ClipboardDB.PREVIEW_LENGTH]
+        assert item["total_length"] == len(text)
+        assert item["total_pages"] == 3
+
+        after_id = temp_db.backfill_text_columns()
+        assert after_id == item["id"]
+        assert temp_db.backfill_text_columns(after_id) is None
+
+        row = temp_db.conn.execute(
+            "SELECT preview, text_length, page_count FROM clipboard_items"
+        ).fetchone()
+        assert tuple(row) == (text[:ClipboardDB.PREVIEW_LENGTH], len(text), 3)
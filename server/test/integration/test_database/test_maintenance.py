@@ -0,0 +1,258 @@
+"""Tests for idle-time database maintenance."""
+
+import os
+import sqlite3
+import time
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data
+from maintenance import MaintenanceScheduler, MaintenanceTask
+from server.src.services.database_service import DatabaseService
+
+
+class _Steps:
+    """Task step finishing after a given number of calls."""
+
+    def __init__(self, calls: int, duration: float = 0.0):
+        self.remaining = calls
+        self.duration = duration
+        self.calls = 0
+
+    def __call__(self) -> bool:
+        self.calls += 1
+        self.remaining -= 1
+        if self.duration:
+            time.sleep(self.duration)
+        return self.remaining <= 0
+
+
+class TestMaintenanceScheduler:
+    """Tasks run when due, in bounded slices, and yield to activity."""
+
+    def test_runs_most_overdue_task_and_persists(self, temp_db: ClipboardDB):
+        """A completed task is recorded and not due again within its interval."""
+        first = _Steps(1)
+        second = _Steps(1)
+        scheduler = MaintenanceScheduler(
+            [MaintenanceTask("first", 3600, first), MaintenanceTask("second", 60, second)],
+            temp_db,
+        )
+        temp_db.record_maintenance_run("first", time.time() - 7200)
+
+        assert scheduler.run_slice() == "second"
+        assert scheduler.run_slice() == "first"
+        assert scheduler.run_slice() is None
+        assert (first.calls, second.calls) == (1, 1)
+
+        runs = temp_db.get_maintenance_runs()
+        assert set(runs) == {"first", "second"}
+        assert MaintenanceScheduler(scheduler.tasks, temp_db).next_task() is None
+
+    def test_slice_budget_bounds_work(self, temp_db: ClipboardDB):
+        """A long task is spread over slices and only recorded when done."""
+        steps = _Steps(20, duration=0.01)
+        scheduler = MaintenanceScheduler([MaintenanceTask("long", 60, steps)], temp_db, slice_budget=0.03)
+
+        scheduler.run_slice()
+
+        assert 1 <= steps.calls < 20
+        assert temp_db.get_maintenance_runs() == {}
+
+        while "long" not in temp_db.get_maintenance_runs():
+            scheduler.run_slice()
+        assert steps.calls == 20
+
+    def test_activity_preempts_slice(self, temp_db: ClipboardDB):
+        """Noting activity stops the slice after the current step."""
+        scheduler = MaintenanceScheduler([], temp_db, idle_after=60, slice_budget=10)
+
+        def step() -> bool:
+            scheduler.note_activity()
+            return False
+
+        scheduler.tasks.append(MaintenanceTask("busy", 60, step))
+
+        start = time.monotonic()
+        assert scheduler.run_slice() == "busy"
+        assert time.monotonic() - start < 1
+        assert not scheduler.is_idle()
+
+    def test_failing_task_waits_for_next_interval(self, temp_db: ClipboardDB):
+        """A task that raises is not retried on every slice."""
+        def step() -> bool:
+            raise RuntimeError("boom")
+
+        scheduler = MaintenanceScheduler([MaintenanceTask("broken", 60, step)], temp_db)
+
+        assert scheduler.run_slice() == "broken"
+        assert scheduler.run_slice() is None
+
+    def test_thread_runs_only_when_idle(self, temp_db: ClipboardDB):
+        """The scheduler thread starts work once the idle period has passed."""
+        steps = _Steps(1)
+        scheduler = MaintenanceScheduler([MaintenanceTask("task", 60, steps)], temp_db, idle_after=0.2)
+        scheduler.POLL_INTERVAL = 0.05
+        scheduler.start()
+        try:
+            time.sleep(0.1)
+            assert steps.calls == 0
+            deadline = time.monotonic() + 5
+            while not steps.calls and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert steps.calls == 1
+        finally:
+            scheduler.stop()
+
+
+class TestMaintenanceSteps:
+    """The ClipboardDB maintenance steps leave the database consistent."""
+
+    def test_fts_merge_completes(self, temp_db: ClipboardDB):
+        """Merging runs until there is no work left; search still works."""
+        for i in range(100):
+            temp_db.add_item("text", f"entry number {i} keyword{i % 5}".encode())
+
+        for _ in range(1000):
+            if temp_db.merge_fts(pages=4):
+                break
+        else:
+            raise AssertionError("merge_fts never completed")
+
+        assert len(temp_db.search_items("keyword3", limit=100)) == 20
+        assert temp_db.check_fts_index()
+
+    def test_fts_check_in_batches(self, temp_db: ClipboardDB):
+        """Items are checked a batch at a time; one dropped from an index is reported."""
+        temp_db.add_item("text", b"first note about invoices")
+        url_id = temp_db.add_item("url", b"https://example.com/reports")
+        temp_db.add_item("file", generate_file_data("quarterly.xlsx"), name="Q3")
+        temp_db.add_item("image/png", b"png")
+
+        assert temp_db.check_fts_rows(0, batch_size=3) == (3, True)
+        assert temp_db.check_fts_rows(3, batch_size=3) == (4, True)
+        assert temp_db.check_fts_rows(4, batch_size=3) == (None, True)
+
+        table = "clipboard_fts_trigram"
+        temp_db.conn.execute(
+            f"INSERT INTO {table} ({table}, rowid, content, name) "
+            f"SELECT 'delete', id, content, name FROM {table}_source WHERE id = ?",
+            (url_id,),
+        )
+        assert temp_db.check_fts_rows(0, batch_size=3) == (3, False)
+        assert not temp_db.check_fts_index()
+
+    def test_fts_check_task_rebuilds_damaged_index(self, tmp_path):
+        """The maintenance task walks every item and rebuilds an index that lost one."""
+        db_service = DatabaseService(str(tmp_path / "clipboard.db"))
+        try:
+            db = db_service.db
+            ids = [db.add_item("text", f"entry number {i}".encode()) for i in range(5)]
+            db.conn.execute(
+                "INSERT INTO clipboard_fts (clipboard_fts, rowid, content, name) "
+                "SELECT 'delete', id, content, name FROM clipboard_fts_source WHERE id = ?",
+                (ids[3],),
+            )
+            db.FTS_CHECK_ITEMS = 2
+            [task] = [task for task in db_service.maintenance_tasks() if task.name == "fts_check"]
+
+            assert not task.step()
+            assert task.step()
+            assert db.check_fts_index()
+            assert [item["id"] for item in db.search_items("entry", limit=10)] == ids[::-1]
+        finally:
+            db_service.close()
+
+    def test_optimize_query_planner(self, temp_db: ClipboardDB):
+        """PRAGMA optimize runs without disturbing queries."""
+        temp_db.add_item("text", b"hello")
+
+        temp_db.optimize_query_planner()
+
+        assert temp_db.get_total_count() == 1
+
+    def test_incremental_vacuum_shrinks_file(self, temp_db_file: ClipboardDB):
+        """Free pages are returned a few at a time until none are left."""
+        ids = [temp_db_file.add_item("text", os.urandom(3000).hex().encode()) for _ in range(200)]
+        for item_id in ids:
+            temp_db_file.delete_item(item_id)
+        temp_db_file.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        assert temp_db_file.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        free_before = temp_db_file.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        assert free_before > 16
+
+        assert not temp_db_file.incremental_vacuum(pages=16)
+        assert temp_db_file.conn.execute("PRAGMA freelist_count").fetchone()[0] == free_before - 16
+        while not temp_db_file.incremental_vacuum(pages=16):
+            pass
+        assert temp_db_file.conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def test_legacy_database_converted_to_incremental_vacuum(self, tmp_path):
+        """A database without auto_vacuum is vacuumed once, outside maintenance slices."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE filler (data BLOB)")
+        conn.executemany("INSERT INTO filler VALUES (?)", [(os.urandom(4000),)] * 200)
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            db.conn.execute("DROP TABLE filler")
+            db.conn.commit()
+            assert db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+            # A maintenance step never runs the full VACUUM
+            assert db.incremental_vacuum()
+            assert db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+            assert db.enable_incremental_vacuum()
+            assert db.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+            assert db.conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+            assert not db.enable_incremental_vacuum()
+        finally:
+            db.close()
+
+    def test_cleanup_orphans(self, temp_db_file: ClipboardDB):
+        """Orphaned rows and stray old blob files are removed; live ones are kept."""
+        db = temp_db_file
+        kept = db.add_item("file", generate_file_data("kept.bin", content=os.urandom(ClipboardDB.BLOB_MIN_SIZE)))
+        db.add_pasted_item(kept)
+        tag_id = db.create_tag("work")
+        db.add_tag_to_item(kept, tag_id)
+
+        db.conn.execute("PRAGMA foreign_keys = OFF")
+        db.conn.execute("INSERT INTO recently_pasted (clipboard_item_id, pasted_timestamp) VALUES (999, 'x')")
+        db.conn.execute("INSERT INTO item_tags (item_id, tag_id) VALUES (999, ?)", (tag_id,))
+        db.conn.execute("INSERT INTO text_chunks (item_id, seq, length, data) VALUES (999, 0, 1, X'61')")
+        db.conn.commit()
+        db.conn.execute("PRAGMA foreign_keys = ON")
+
+        stray_old = db.blob_store.put(b"old stray payload")
+        stray_new = db.blob_store.put(b"new stray payload")
+        old = time.time() - ClipboardDB.ORPHAN_BLOB_MIN_AGE - 60
+        os.utime(db.blob_store.path(stray_old), (old, old))
+
+        assert db.cleanup_orphans() == 4
+
+        assert not db.blob_store.exists(stray_old)
+        assert db.blob_store.exists(stray_new)
+        assert db.get_pasted_count() == 1
+        assert [tag["id"] for tag in db.get_tags_for_item(kept)] == [tag_id]
+        assert db.conn.execute("SELECT COUNT(*) FROM text_chunks").fetchone()[0] == 0
+        assert len(db.get_item(kept)["data"]) > ClipboardDB.BLOB_MIN_SIZE
+        assert db.cleanup_orphans() == 0
+
+    def test_cleanup_orphans_skips_vanished_blob(self, temp_db_file: ClipboardDB, monkeypatch):
+        """A blob file removed while the sweep runs is skipped, not fatal."""
+        db = temp_db_file
+        old = time.time() - ClipboardDB.ORPHAN_BLOB_MIN_AGE - 60
+        strays = [db.blob_store.put(f"stray {i}".encode()) for i in range(2)]
+        for key in strays:
+            os.utime(db.blob_store.path(key), (old, old))
+        listed = list(db.blob_store.keys())
+        db.blob_store.delete(strays[0])
+        monkeypatch.setattr(db.blob_store, "keys", lambda: iter(listed))
+
+        assert db.cleanup_orphans() == 1
+        assert not db.blob_store.exists(strays[1])
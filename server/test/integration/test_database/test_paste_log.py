@@ -0,0 +1,100 @@
+"""Tests for the per-item paste rollup and the bounded paste log."""
+
+import sqlite3
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from fixtures.test_data import generate_timestamp
+from timestamps import to_epoch_us
+
+
+@pytest.fixture
+def small_log_db(temp_db: ClipboardDB) -> ClipboardDB:
+    """Database with a tiny paste log so trimming is quick to reach."""
+    temp_db.PASTE_LOG_MAX_ROWS = 5
+    return temp_db
+
+
+def _log_rows(db: ClipboardDB) -> int:
+    return db.conn.execute("SELECT COUNT(*) FROM recently_pasted").fetchone()[0]
+
+
+class TestPasteRollup:
+    """The pasted tab lists each item once, by its last paste."""
+
+    def test_item_listed_once_with_count(self, temp_db: ClipboardDB):
+        """Repeated pastes update one row: last paste time and paste count."""
+        first = temp_db.add_item("text", b"first")
+        second = temp_db.add_item("text", b"second")
+        temp_db.add_pasted_item(first, generate_timestamp(hours_ago=3))
+        temp_db.add_pasted_item(second, generate_timestamp(hours_ago=2))
+        latest = generate_timestamp(hours_ago=1)
+        temp_db.add_pasted_item(first, latest)
+
+        pasted = temp_db.get_recently_pasted()
+
+        assert [item["id"] for item in pasted] == [first, second]
+        assert pasted[0]["pasted_timestamp"] == to_epoch_us(latest)
+        assert [item["paste_count"] for item in pasted] == [2, 1]
+        assert temp_db.get_pasted_count() == 2
+
+    def test_out_of_order_paste_keeps_latest(self, temp_db: ClipboardDB):
+        """An older paste time recorded late does not move the item back."""
+        item_id = temp_db.add_item("text", b"item")
+        latest = generate_timestamp(hours_ago=1)
+        temp_db.add_pasted_item(item_id, latest)
+        temp_db.add_pasted_item(item_id, generate_timestamp(hours_ago=5))
+
+        [item] = temp_db.get_recently_pasted()
+
+        assert item["pasted_timestamp"] == to_epoch_us(latest)
+        assert item["paste_count"] == 2
+
+    def test_log_is_trimmed(self, small_log_db: ClipboardDB):
+        """The log keeps only the newest events; the rollup keeps every paste."""
+        item_id = small_log_db.add_item("text", b"item")
+        paste_ids = [small_log_db.add_pasted_item(item_id) for _ in range(12)]
+
+        assert _log_rows(small_log_db) == 5
+        remaining = [row[0] for row in small_log_db.conn.execute("SELECT id FROM recently_pasted ORDER BY id")]
+        assert remaining == paste_ids[-5:]
+        assert small_log_db.get_recently_pasted()[0]["paste_count"] == 12
+
+    def test_legacy_paste_log_rolled_up(self, tmp_path):
+        """Pastes recorded by older versions fill the rollup on upgrade."""
+        db_path = tmp_path / "legacy.db"
+        db = ClipboardDB(db_path)
+        first = db.add_item("text", b"first")
+        second = db.add_item("text", b"second")
+        db.close()
+
+        # Pastes as an older version stored them: log rows only
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP INDEX idx_last_pasted_id")
+        for event in ("insert", "delete", "update"):
+            conn.execute(f"DROP TRIGGER clipboard_items_pasted_count_{event}")
+        conn.execute("ALTER TABLE clipboard_items DROP COLUMN last_pasted")
+        conn.execute("ALTER TABLE clipboard_items DROP COLUMN paste_count")
+        conn.executemany(
+            "INSERT INTO recently_pasted (clipboard_item_id, pasted_timestamp) VALUES (?, ?)",
+            [
+                (first, "2025-01-01T10:00:00"),
+                (second, "2025-01-01T11:00:00"),
+                (first, "2025-01-01T12:00:00"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        db = ClipboardDB(db_path)
+        try:
+            pasted = db.get_recently_pasted()
+
+            assert [item["id"] for item in pasted] == [first, second]
+            assert pasted[0]["pasted_timestamp"] == "2025-01-01T12:00:00"
+            assert [item["paste_count"] for item in pasted] == [2, 1]
+            assert db.get_pasted_count() == 2
+        finally:
+            db.close()
@@ -0,0 +1,78 @@
+"""Tests for chunked streaming of image and file payloads."""
+
+import os
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_file_data
+
+
+def _collect(stream) -> tuple:
+    item_type, size, chunks = stream
+    chunks = list(chunks)
+    return item_type, size, chunks
+
+
+class TestPayloadStream:
+    """stream_payload yields the content in bounded chunks from every storage."""
+
+    def test_inline_image_uses_blob_reads(self, temp_db: ClipboardDB):
+        """Inline images are read in chunks of the requested size."""
+        image = os.urandom(10_000)
+        item_id = temp_db.add_item("image/png", image)
+
+        item_type, size, chunks = _collect(temp_db.stream_payload(item_id, chunk_size=3000))
+
+        assert (item_type, size) == ("image/png", len(image))
+        assert [len(chunk) for chunk in chunks] == [3000, 3000, 3000, 1000]
+        assert b"".join(chunks) == image
+
+    def test_inline_file_skips_metadata(self, temp_db: ClipboardDB):
+        """File items stream the content after the separator only."""
+        content = os.urandom(5000)
+        item_id = temp_db.add_item("file", generate_file_data("data.bin", content=content))
+
+        item_type, size, chunks = _collect(temp_db.stream_payload(item_id, chunk_size=1024))
+
+        assert (item_type, size) == ("file", len(content))
+        assert b"".join(chunks) == content
+
+    def test_compressed_inline_file(self, temp_db: ClipboardDB):
+        """Compressed inline files are decoded before streaming."""
+        content = b"compressible " * 1000
+        item_id = temp_db.add_item("file", generate_file_data("notes.txt", content=content))
+
+        item_type, size, chunks = _collect(temp_db.stream_payload(item_id, chunk_size=4096))
+
+        assert size == len(content)
+        assert max(len(chunk) for chunk in chunks) == 4096
+        assert b"".join(chunks) == content
+
+    def test_blob_store_payloads(self, temp_db_file: ClipboardDB):
+        """Externalized images and files are read from the blob store in chunks."""
+        image = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 4)
+        content = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 3 + 7)
+        image_id = temp_db_file.add_item("image/png", image)
+        file_id = temp_db_file.add_item("file", generate_file_data("big.bin", content=content))
+
+        _, image_size, image_chunks = _collect(temp_db_file.stream_payload(image_id, chunk_size=8192))
+        _, file_size, file_chunks = _collect(temp_db_file.stream_payload(file_id, chunk_size=8192))
+
+        assert image_size == len(image) and b"".join(image_chunks) == image
+        assert file_size == len(content) and b"".join(file_chunks) == content
+        assert max(len(chunk) for chunk in file_chunks) == 8192
+
+    def test_other_items_not_streamed(self, temp_db: ClipboardDB):
+        """Text items, missing items and files without content return None."""
+        text_id = temp_db.add_item("text", b"plain")
+        broken_id = temp_db.add_item("file", b'{"name": "x"}')
+
+        assert temp_db.stream_payload(text_id) is None
+        assert temp_db.stream_payload(broken_id) is None
+        assert temp_db.stream_payload(9999) is None
+
+    def test_empty_file(self, temp_db: ClipboardDB):
+        """An empty file streams no chunks."""
+        item_id = temp_db.add_item("file", generate_file_data("empty.txt", content=b""))
+
+        assert _collect(temp_db.stream_payload(item_id)) == ("file", 0, [])
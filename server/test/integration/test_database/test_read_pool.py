@@ -0,0 +1,113 @@
+"""Tests for WAL mode and the pooled read connections."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from fixtures.test_data import generate_random_text, generate_timestamp
+
+
+class TestReadPool:
+    """Test the writer/reader connection split."""
+
+    def test_file_database_uses_wal(self, temp_db_file: ClipboardDB):
+        """File-backed databases switch to write-ahead logging."""
+        mode = temp_db_file.conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+        assert temp_db_file.read_pool_size == ClipboardDB.DEFAULT_READ_POOL_SIZE
+
+    def test_memory_database_has_no_pool(self, temp_db: ClipboardDB):
+        """In-memory databases route reads through the writer connection."""
+        assert temp_db.read_pool_size == 0
+
+        item_id = temp_db.add_item("text", b"in memory")
+        assert temp_db.get_item(item_id)["data"] == b"in memory"
+
+    def test_pool_size_is_configurable(self, tmp_path):
+        """The number of read connections follows the constructor argument."""
+        db = ClipboardDB(tmp_path / "pool.db", read_pool_size=2)
+        try:
+            assert db.read_pool_size == 2
+        finally:
+            db.close()
+
+        db = ClipboardDB(tmp_path / "nopool.db", read_pool_size=0)
+        try:
+            assert db.read_pool_size == 0
+            item_id = db.add_item("text", b"no pool")
+            assert db.get_item(item_id)["data"] == b"no pool"
+        finally:
+            db.close()
+
+    def test_read_connections_are_read_only(self, temp_db_file: ClipboardDB):
+        """Pooled connections refuse writes."""
+        with temp_db_file._reader() as conn:
+            assert conn is not temp_db_file.conn
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM clipboard_items")
+
+    def test_nested_reads_reuse_connection(self, temp_db_file: ClipboardDB):
+        """A nested read on the same thread does not take a second connection."""
+        with temp_db_file._reader() as outer:
+            with temp_db_file._reader() as inner:
+                assert inner is outer
+
+    def test_reads_see_committed_writes(self, temp_db_file: ClipboardDB):
+        """Items are visible to the read pool as soon as they are committed."""
+        item_id = temp_db_file.add_item("text", b"committed", timestamp=generate_timestamp())
+        temp_db_file.add_pasted_item(item_id)
+
+        assert temp_db_file.get_item(item_id)["data"] == b"committed"
+        assert temp_db_file.get_total_count() == 1
+        assert temp_db_file.get_pasted_count() == 1
+        assert [i["id"] for i in temp_db_file.get_items()] == [item_id]
+        assert [i["id"] for i in temp_db_file.get_recently_pasted()] == [item_id]
+        assert [i["id"] for i in temp_db_file.search_items("committed")] == [item_id]
+
+    def test_reads_are_not_blocked_by_open_write(self, temp_db_file: ClipboardDB):
+        """Readers see the last committed snapshot while a write is in flight."""
+        temp_db_file.add_item("text", b"before")
+
+        # Open a write transaction on the writer connection without committing
+        temp_db_file.conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, data) VALUES (?, 'text', ?)",
+            (generate_timestamp(), b"uncommitted"),
+        )
+
+        results = []
+        reader = threading.Thread(target=lambda: results.append(temp_db_file.get_items()))
+        reader.start()
+        reader.join(timeout=5)
+
+        assert not reader.is_alive()
+        assert [item["preview"] for item in results[0]] == ["before"]
+
+        temp_db_file.conn.commit()
+        assert temp_db_file.get_total_count() == 2
+
+    def test_concurrent_readers(self, temp_db_file: ClipboardDB):
+        """More reader threads than pooled connections all complete."""
+        for i in range(50):
+            temp_db_file.add_item("text", generate_random_text(50))
+
+        errors = []
+
+        def read():
+            try:
+                for _ in range(20):
+                    assert len(temp_db_file.get_items(limit=10)) == 10
+                    assert temp_db_file.get_total_count() == 50
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
@@ -25,7 +25,7 @@ class TestSearchAndFiltering:
         # Should find all items with "Python" (including the one from populated_db)
         assert len(results) >= 2
         for item in results:
-            data_str = item["data"].decode('utf-8', errors='ignore')
+            data_str = item["preview"]
             assert "Python" in data_str or "python" in data_str.lower()
 
     def test_search_by_file_name(self, temp_db: ClipboardDB):
@@ -129,7 +129,7 @@ class TestSearchAndFiltering:
         # Should only match the first item
         assert len(results) >= 1
         for item in results:
-            data_str = item["data"].decode('utf-8').lower()
+            data_str = item["preview"].lower()
             assert "python" in data_str and "programming" in data_str
 
 
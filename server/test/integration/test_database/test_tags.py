@@ -249,6 +249,64 @@ class TestItemTagRelationships:
         assert result is False
 
 
+class TestBatchedTagHydration:
+    """Test that list methods attach tags with one batched query."""
+
+    def test_get_tags_for_items(self, temp_db: ClipboardDB):
+        """Tags of several items are returned per item, sorted by name."""
+        first = temp_db.add_item("text", b"first")
+        second = temp_db.add_item("text", b"second")
+        untagged = temp_db.add_item("text", b"untagged")
+        work = temp_db.create_tag("Work")
+        home = temp_db.create_tag("Home")
+        temp_db.add_tag_to_item(first, work)
+        temp_db.add_tag_to_item(first, home)
+        temp_db.add_tag_to_item(second, work)
+
+        tags = temp_db.get_tags_for_items([first, second, untagged])
+
+        assert [tag["name"] for tag in tags[first]] == ["Home", "Work"]
+        assert [tag["name"] for tag in tags[second]] == ["Work"]
+        assert untagged not in tags
+        assert temp_db.get_tags_for_items([]) == {}
+
+    def test_every_list_method_returns_tags(self, temp_db: ClipboardDB):
+        """History, pasted, search and tag lists all carry item tags."""
+        item_id = temp_db.add_item("text", b"tagged searchable item")
+        temp_db.add_item("text", b"searchable without tags")
+        tag_id = temp_db.create_tag("Work")
+        temp_db.add_tag_to_item(item_id, tag_id)
+        temp_db.add_pasted_item(item_id)
+
+        lists = [
+            temp_db.get_items(),
+            temp_db.get_recently_pasted(),
+            temp_db.search_items("searchable"),
+            temp_db.get_items_by_tags([tag_id]),
+        ]
+
+        for items in lists:
+            for item in items:
+                expected = ["Work"] if item["id"] == item_id else []
+                assert [tag["name"] for tag in item["tags"]] == expected
+
+    def test_tags_fetched_in_one_query(self, temp_db: ClipboardDB):
+        """A page is hydrated with a single tag query, not one per item."""
+        tag_id = temp_db.create_tag("Work")
+        for i in range(10):
+            temp_db.add_tag_to_item(temp_db.add_item("text", f"Item {i}".encode()), tag_id)
+
+        statements = []
+        temp_db.conn.set_trace_callback(statements.append)
+        try:
+            items = temp_db.get_items(limit=10)
+        finally:
+            temp_db.conn.set_trace_callback(None)
+
+        assert all(item["tags"] for item in items)
+        assert sum("item_tags" in sql for sql in statements) == 1
+
+
 class TestTagColors:
     """Test tag color functionality."""
 
@@ -0,0 +1,110 @@
+"""Tests for the chunked storage of long texts."""
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db
+from fixtures.test_data import generate_timestamp
+
+
+@pytest.fixture
+def chunk_db(temp_db: ClipboardDB) -> ClipboardDB:
+    """Database with small chunks so tests stay fast."""
+    temp_db.TEXT_CHUNK_SIZE = 100
+    return temp_db
+
+
+def _long_text(length: int) -> str:
+    return "".join(chr(ord("a") + i % 26) for i in range(length))
+
+
+def _chunk_count(db: ClipboardDB, item_id: int) -> int:
+    return db.conn.execute(
+        "SELECT COUNT(*) FROM text_chunks WHERE item_id = ?", (item_id,)
+    ).fetchone()[0]
+
+
+class TestTextChunks:
+    """Long texts are chunked at ingest and pages are read from the chunks."""
+
+    def test_long_text_is_chunked(self, chunk_db: ClipboardDB):
+        """Only texts longer than one chunk get chunks."""
+        long_id = chunk_db.add_item("text", _long_text(1050).encode())
+        short_id = chunk_db.add_item("text", _long_text(100).encode())
+
+        assert _chunk_count(chunk_db, long_id) == 11
+        assert _chunk_count(chunk_db, short_id) == 0
+
+    def test_pages_match_full_text(self, chunk_db: ClipboardDB):
+        """Every page, including ones spanning chunks, equals the slice of the text."""
+        text = "é" + _long_text(1049)
+        item_id = chunk_db.add_item("text", text.encode("utf-8"))
+
+        for page in range(7):
+            result = chunk_db.get_text_page(item_id, page, page_size=150)
+            assert result["content"] == text[page * 150:(page + 1) * 150]
+            assert result["total_pages"] == 7
+            assert result["total_length"] == len(text)
+
+        assert chunk_db.get_text_page(item_id, 99, page_size=150)["page"] == 6
+
+    def test_page_reads_only_needed_chunks(self, chunk_db: ClipboardDB):
+        """A page inside one chunk decodes that chunk only."""
+        item_id = chunk_db.add_item("text", _long_text(1000).encode())
+        chunk_db.conn.execute("DELETE FROM text_chunks WHERE item_id = ? AND seq != 5", (item_id,))
+
+        assert chunk_db.get_text_page(item_id, 10, page_size=50)["content"] == _long_text(1000)[500:550]
+
+    def test_match_page_across_chunk_boundary(self, chunk_db: ClipboardDB):
+        """Matches are found case-insensitively, also when split between chunks."""
+        text = "x" * 195 + "NeedleWord" + "y" * 400 + "haystack"
+        item_id = chunk_db.add_item("text", text.encode())
+
+        assert chunk_db.find_text_match_page(item_id, ["needleword"], page_size=50) == 3
+        assert chunk_db.find_text_match_page(item_id, ["haystack", "needle"], page_size=50) == 3
+        assert chunk_db.find_text_match_page(item_id, ["haystack"], page_size=50) == 12
+        assert chunk_db.find_text_match_page(item_id, ["missing"], page_size=50) == 0
+
+    @pytest.mark.parametrize("length", [60, 600])
+    def test_match_page_folds_non_ascii_case(self, chunk_db: ClipboardDB, length: int):
+        """Short and chunked texts both match non-ASCII terms in any case."""
+        text = "x" * length + "Ärger ΣΟΦΙΑ Москва"
+        item_id = chunk_db.add_item("text", text.encode())
+
+        assert chunk_db.find_text_match_page(item_id, ["ärger"], page_size=50) == length // 50
+        assert chunk_db.find_text_match_page(item_id, ["σοφια"], page_size=50) == (length + 6) // 50
+        assert chunk_db.find_text_match_page(item_id, ["МОСКВА"], page_size=50) == (length + 12) // 50
+
+    def test_chunks_deleted_with_item(self, chunk_db: ClipboardDB):
+        """Deleting the item removes its chunks."""
+        item_id = chunk_db.add_item("text", _long_text(500).encode())
+
+        chunk_db.delete_item(item_id)
+
+        assert _chunk_count(chunk_db, item_id) == 0
+
+    def test_duplicate_keeps_single_set_of_chunks(self, chunk_db: ClipboardDB):
+        """Copying the same long text again reuses the existing chunks."""
+        data = _long_text(500).encode()
+        item_id, _ = chunk_db.upsert_item("text", data)
+        chunk_db.upsert_item("text", data)
+
+        assert _chunk_count(chunk_db, item_id) == 5
+
+    def test_legacy_long_text_backfilled(self, chunk_db: ClipboardDB):
+        """Long texts from older versions page from data until they are chunked."""
+        text = _long_text(300) + "needle" + _long_text(144)
+        chunk_db.conn.execute(
+            "INSERT INTO clipboard_items (timestamp, type, kind, data) VALUES (?, 'text', 'text', ?)",
+            (generate_timestamp(), text.encode()),
+        )
+        chunk_db.conn.commit()
+        chunk_db.backfill_text_columns()
+
+        assert chunk_db.get_text_page(1, 1, page_size=200)["content"] == text[200:400]
+        assert chunk_db.find_text_match_page(1, ["needle"], page_size=100) == 3
+
+        assert chunk_db.backfill_text_chunks() == 1
+        assert chunk_db.backfill_text_chunks(1) is None
+        assert _chunk_count(chunk_db, 1) == 5
+        assert chunk_db.get_text_page(1, 1, page_size=200)["content"] == text[200:400]
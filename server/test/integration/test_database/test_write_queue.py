@@ -0,0 +1,153 @@
+"""Tests for the group-commit write queue."""
+
+import threading
+import time
+
+import pytest
+
+from database import ClipboardDB
+from fixtures.database import temp_db, temp_db_file
+from write_queue import WriteQueue
+from server.src.services.database_service import DatabaseService
+
+
+@pytest.fixture
+def writer(temp_db_file: ClipboardDB):
+    """Write queue over a file database."""
+    queue = WriteQueue(temp_db_file, threading.Lock())
+    yield queue
+    queue.close()
+
+
+def _count_commits(db: ClipboardDB) -> list:
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    return statements
+
+
+class TestWriteQueue:
+    """Writes are applied on the writer thread and committed in groups."""
+
+    def test_futures_return_results_after_commit(self, writer: WriteQueue, temp_db_file: ClipboardDB):
+        """The future holds the method's result and the write is visible to readers."""
+        item_id = writer.run(temp_db_file.add_item, "text", b"queued write")
+
+        assert temp_db_file.get_item(item_id)["data"] == b"queued write"
+        assert writer.run(temp_db_file.toggle_favorite, item_id, True) is True
+
+    def test_burst_is_grouped(self, writer: WriteQueue, temp_db_file: ClipboardDB):
+        """Writes queued while the writer is busy share a commit."""
+        statements = _count_commits(temp_db_file)
+
+        # Holding the lock stalls the writer as if a commit were in progress
+        with writer.lock:
+            futures = [writer.submit(temp_db_file.add_item, "text", f"burst {i}".encode()) for i in range(50)]
+        ids = [future.result() for future in futures]
+        temp_db_file.conn.set_trace_callback(None)
+
+        assert len(set(ids)) == 50
+        assert sum(1 for sql in statements if sql.strip().upper() == "COMMIT") <= 2
+        assert temp_db_file.get_total_count() == 50
+
+    def test_failed_write_is_isolated(self, writer: WriteQueue, temp_db_file: ClipboardDB):
+        """A write that raises is rolled back alone; the rest of its group commits."""
+        def failing_write():
+            temp_db_file.add_item("text", b"rolled back")
+            raise ValueError("boom")
+
+        before = writer.submit(temp_db_file.add_item, "text", b"before")
+        failed = writer.submit(failing_write)
+        after = writer.submit(temp_db_file.add_item, "text", b"after")
+
+        with pytest.raises(ValueError):
+            failed.result()
+        assert before.result() and after.result()
+        assert sorted(item["preview"] for item in temp_db_file.get_items()) == ["after", "before"]
+        assert temp_db_file.search_items("rolled") == []
+
+    def test_concurrent_submitters(self, writer: WriteQueue, temp_db_file: ClipboardDB):
+        """Writes from many threads all land exactly once."""
+        def worker(n):
+            for i in range(20):
+                writer.run(temp_db_file.add_item, "text", f"thread {n} item {i}".encode())
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert temp_db_file.get_total_count() == 160
+        assert temp_db_file.reconcile_counters()
+
+    def test_service_writers_count_as_waiting(self, tmp_path):
+        """DatabaseService writes wait through run(), so the queue sees them waiting."""
+        db_service = DatabaseService(str(tmp_path / "clipboard.db"))
+        try:
+            threads = [
+                threading.Thread(target=db_service.add_item, args=("text", f"item {i}".encode(), "2025-01-01T10:00:00"))
+                for i in range(4)
+            ]
+            # Holding the lock stalls the writer while the callers queue up
+            with db_service.lock:
+                for thread in threads:
+                    thread.start()
+                deadline = time.monotonic() + 5
+                while db_service.writer._blocked < 4 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                blocked = db_service.writer._blocked
+            for thread in threads:
+                thread.join()
+
+            assert blocked == 4
+            assert db_service.get_total_count() == 4
+        finally:
+            db_service.close()
+
+    def test_close_applies_queued_writes(self, temp_db_file: ClipboardDB):
+        """Writes queued before close are committed."""
+        queue = WriteQueue(temp_db_file, threading.Lock())
+        futures = [queue.submit(temp_db_file.add_item, "text", f"late {i}".encode()) for i in range(5)]
+
+        queue.close()
+
+        assert all(future.done() for future in futures)
+        assert temp_db_file.get_total_count() == 5
+        with pytest.raises(RuntimeError):
+            queue.submit(temp_db_file.add_item, "text", b"too late")
+
+
+class TestGroupCommit:
+    """ClipboardDB defers commits and post-commit actions inside a group."""
+
+    def test_blob_files_unlinked_after_commit(self, temp_db_file: ClipboardDB):
+        """A released blob file is kept until the group that released it commits."""
+        image = b"\x89PNG" * ClipboardDB.BLOB_MIN_SIZE
+        item_id = temp_db_file.add_item("image/png", image)
+        blob_key = temp_db_file.get_item(item_id)["blob_key"]
+
+        with temp_db_file.group_commit():
+            temp_db_file.delete_item(item_id)
+            assert temp_db_file.blob_store.exists(blob_key)
+
+        assert not temp_db_file.blob_store.exists(blob_key)
+
+    def test_blob_reused_in_same_group_is_kept(self, temp_db_file: ClipboardDB):
+        """Re-adding released content in the same group keeps its blob file."""
+        image = b"\x89PNG" * ClipboardDB.BLOB_MIN_SIZE
+        item_id = temp_db_file.add_item("image/png", image)
+
+        with temp_db_file.group_commit():
+            temp_db_file.delete_item(item_id)
+            new_id = temp_db_file.add_item("image/png", image)
+
+        assert temp_db_file.get_item(new_id)["data"] == image
+
+    def test_group_rolls_back_on_error(self, temp_db: ClipboardDB):
+        """An exception escaping the group discards all of its writes."""
+        with pytest.raises(RuntimeError):
+            with temp_db.group_commit():
+                temp_db.add_item("text", b"discarded")
+                raise RuntimeError("abort")
+
+        assert temp_db.get_total_count() == 0
@@ -0,0 +1 @@
+"""IPC framing tests."""
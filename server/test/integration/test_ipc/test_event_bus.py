@@ -0,0 +1,42 @@
+"""Tests for the in-process event bus of item changes."""
+
+from server.src.event_bus import ITEM_CREATED, ITEM_DELETED, EventBus
+
+
+class TestEventBus:
+    """Subscribers are called synchronously with the event and item ID."""
+
+    def test_publish_reaches_subscribers_of_that_event(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(ITEM_CREATED, lambda event, item_id: received.append((event, item_id)))
+        bus.subscribe(ITEM_DELETED, lambda event, item_id: received.append(("other", item_id)))
+
+        bus.publish(ITEM_CREATED, 5)
+
+        assert received == [(ITEM_CREATED, 5)]
+
+    def test_unsubscribe(self):
+        bus = EventBus()
+        received = []
+        unsubscribe = bus.subscribe(ITEM_CREATED, lambda event, item_id: received.append(item_id))
+
+        bus.publish(ITEM_CREATED, 1)
+        unsubscribe()
+        bus.publish(ITEM_CREATED, 2)
+
+        assert received == [1]
+
+    def test_failing_subscriber_does_not_stop_others(self):
+        bus = EventBus()
+        received = []
+
+        def fail(event, item_id):
+            raise RuntimeError("subscriber failed")
+
+        bus.subscribe(ITEM_CREATED, fail)
+        bus.subscribe(ITEM_CREATED, lambda event, item_id: received.append(item_id))
+
+        bus.publish(ITEM_CREATED, 3)
+
+        assert received == [3]
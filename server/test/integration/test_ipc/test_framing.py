@@ -0,0 +1,105 @@
+"""Tests for the JSON and binary IPC frames."""
+
+import asyncio
+import base64
+import json
+import struct
+
+import pytest
+
+from ipc_protocol import (
+    FRAMING_BINARY,
+    FRAMING_JSON,
+    HEADER,
+    MAGIC,
+    as_bytes,
+    binary_frame_head,
+    encode_binary_frame,
+    encode_frame,
+    encode_json_frame,
+    read_frame,
+)
+
+
+def _read(*frames: bytes) -> list:
+    """Decode frames as the receiving side of a connection would."""
+
+    async def read_all():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"".join(frames))
+        reader.feed_eof()
+        return [await read_frame(reader) for _ in frames]
+
+    return asyncio.run(read_all())
+
+
+MESSAGE = {
+    "type": "history",
+    "items": [
+        {"id": 1, "thumbnail": b"\x89PNG\x00\xff", "content": "text"},
+        {"id": 2, "thumbnail": None, "formatted_content": b"<b>hi</b>"},
+    ],
+}
+
+
+class TestBinaryFrames:
+    """Binary frames carry bytes values as raw attachments."""
+
+    def test_round_trip_keeps_bytes(self):
+        [(message, framing)] = _read(encode_binary_frame(MESSAGE))
+
+        assert framing == FRAMING_BINARY
+        assert message == MESSAGE
+
+    def test_attachments_are_not_encoded(self):
+        payload = bytes(range(256)) * 1024
+        frame = encode_binary_frame({"type": "full_image", "content": payload})
+
+        assert frame.startswith(MAGIC)
+        assert payload in frame
+        assert len(frame) < len(payload) + 100
+
+    def test_streamed_frame_matches_encoded_frame(self):
+        """A head written first and the payload after it is one valid frame."""
+        payload = b"x" * 1000
+        head = binary_frame_head({"type": "full_file", "id": 3, "content": {"$bin": 0}}, [len(payload)])
+
+        [(message, _)] = _read(head + payload[:400] + payload[400:])
+
+        assert message == {"type": "full_file", "id": 3, "content": payload}
+
+    def test_unknown_version_is_rejected(self):
+        frame = bytearray(encode_binary_frame({"type": "x"}))
+        struct.pack_into("!B", frame, 4, 99)
+
+        with pytest.raises(ValueError):
+            _read(bytes(frame))
+
+
+class TestJsonFrames:
+    """JSON frames stay readable by clients that never negotiate."""
+
+    def test_bytes_become_base64(self):
+        frame = encode_json_frame({"content": b"\x00\x01"})
+
+        length_line, body = frame.split(b"\n", 1)
+        assert int(length_line) == len(body)
+        assert json.loads(body) == {"content": base64.b64encode(b"\x00\x01").decode("ascii")}
+
+    def test_frames_of_both_framings_on_one_stream(self):
+        """A connection switches framing after hello; the reader follows."""
+        frames = _read(
+            encode_frame({"type": "hello", "framing": FRAMING_BINARY}, FRAMING_JSON),
+            encode_frame(MESSAGE, FRAMING_BINARY),
+        )
+
+        assert [framing for _, framing in frames] == [FRAMING_JSON, FRAMING_BINARY]
+        assert frames[1][0] == MESSAGE
+
+    def test_as_bytes_reads_either_framing(self):
+        assert as_bytes(b"raw") == b"raw"
+        assert as_bytes(base64.b64encode(b"raw").decode("ascii")) == b"raw"
+        assert as_bytes(None) is None
+
+    def test_header_size(self):
+        assert HEADER.size == 12
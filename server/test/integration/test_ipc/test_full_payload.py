@@ -0,0 +1,78 @@
+"""Tests that get_full_image always answers, with the content or an error."""
+
+import asyncio
+import os
+
+import pytest
+
+from server.src.database import ClipboardDB
+from server.src.ipc_protocol import FRAMING_BINARY, VERSION, encode_frame, read_frame
+from server.src.services.database_service import DatabaseService
+from server.src.services.ipc_service import IPCService
+
+
+@pytest.fixture
+def database_service(tmp_path):
+    database_service = DatabaseService(str(tmp_path / "clipboard.db"))
+    yield database_service
+    database_service.close()
+
+
+def _request(database_service, socket_path, item_id) -> dict:
+    """Send get_full_image with a request_id over a binary connection and read the reply."""
+    ipc_service = IPCService(database_service, settings_service=None, clipboard_service=None)
+
+    async def run():
+        server = await asyncio.start_unix_server(ipc_service.client_handler, str(socket_path))
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        try:
+            writer.write(encode_frame({"action": "hello", "framings": [FRAMING_BINARY], "version": VERSION}, "json"))
+            await read_frame(reader)
+            writer.write(encode_frame({"action": "get_full_image", "id": item_id, "request_id": 9}, FRAMING_BINARY))
+            await writer.drain()
+            return (await asyncio.wait_for(read_frame(reader), 5))[0]
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    try:
+        return asyncio.run(run())
+    finally:
+        ipc_service.pool.shutdown()
+
+
+class TestFullPayload:
+    """Full image requests are answered even when the payload cannot be read."""
+
+    def test_streams_image(self, database_service, tmp_path):
+        image = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 2)
+        item_id = database_service.add_item("image/png", image, timestamp="2025-01-01T10:00:00")
+
+        reply = _request(database_service, tmp_path / "ipc.sock", item_id)
+
+        assert reply["type"] == "full_image"
+        assert reply["request_id"] == 9
+        assert reply["content"] == image
+
+    def test_missing_blob_file_is_an_error(self, database_service, tmp_path):
+        image = os.urandom(ClipboardDB.BLOB_MIN_SIZE * 2)
+        item_id = database_service.add_item("image/png", image, timestamp="2025-01-01T10:00:00")
+        blob_key = database_service.get_item(item_id)["blob_key"]
+        database_service.db.blob_store.path(blob_key).unlink()
+
+        reply = _request(database_service, tmp_path / "ipc.sock", item_id)
+
+        assert reply["type"] == "error"
+        assert reply["request_id"] == 9
+        assert reply["id"] == item_id
+
+    @pytest.mark.parametrize("exists", [True, False])
+    def test_item_without_image_is_an_error(self, database_service, tmp_path, exists):
+        item_id = database_service.add_item("text", b"not an image", timestamp="2025-01-01T10:00:00")
+
+        reply = _request(database_service, tmp_path / "ipc.sock", item_id if exists else item_id + 1)
+
+        assert reply["type"] == "error"
+        assert reply["request_id"] == 9
+        assert reply["message"] == ("Item is not an image or file" if exists else "Item not found")
@@ -0,0 +1,130 @@
+"""Tests that stored clipboard items are pushed to clients as they are ingested."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from server.src.event_bus import ITEM_DELETED, EventBus
+from server.src.ipc_protocol import FRAMING_BINARY, VERSION, encode_frame, read_frame
+from server.src.services.clipboard_service import ClipboardService
+from server.src.services.database_service import DatabaseService
+from server.src.services.ipc_service import IPCService
+
+
+@pytest.fixture
+def database_service(tmp_path):
+    database_service = DatabaseService(str(tmp_path / "clipboard.db"))
+    yield database_service
+    database_service.close()
+
+
+def _ipc_service(database_service, max_items=None) -> IPCService:
+    event_bus = EventBus()
+    settings = SimpleNamespace(
+        retention_enabled=max_items is not None, retention_max_items=max_items, max_page_length=20
+    )
+    clipboard_service = ClipboardService(database_service, thumbnail_service=None, event_bus=event_bus)
+    return IPCService(database_service, settings, clipboard_service, event_bus=event_bus)
+
+
+async def _connect(socket_path):
+    reader, writer = await asyncio.open_unix_connection(str(socket_path))
+    writer.write(encode_frame({"action": "hello", "framings": [FRAMING_BINARY], "version": VERSION}, "json"))
+    await read_frame(reader)
+    return reader, writer
+
+
+def _copy_and_listen(ipc_service, socket_path, texts, broadcasts: int) -> list:
+    """Copy texts from one client and collect the broadcasts another client receives.
+
+    Each copy waits for its first broadcast, so an item is pushed before a
+    later copy can prune it.
+    """
+
+    async def run():
+        server = await asyncio.start_unix_server(ipc_service.client_handler, str(socket_path))
+        reader, listener = await _connect(socket_path)
+        _, copier = await _connect(socket_path)
+
+        async def receive():
+            return (await asyncio.wait_for(read_frame(reader), 5))[0]
+
+        try:
+            messages = []
+            for text in texts:
+                copier.write(encode_frame(
+                    {"action": "clipboard_event", "data": {"type": "text", "content": text}}, FRAMING_BINARY
+                ))
+                await copier.drain()
+                messages.append(await receive())
+            while len(messages) < broadcasts:
+                messages.append(await receive())
+            return messages
+        finally:
+            listener.close()
+            copier.close()
+            server.close()
+            await server.wait_closed()
+
+    try:
+        return asyncio.run(run())
+    finally:
+        ipc_service.pool.shutdown()
+
+
+class TestItemEvents:
+    """Ingest publishes item events; IPCService pushes the prepared items."""
+
+    def test_new_item_is_pushed_prepared(self, database_service, tmp_path):
+        [message] = _copy_and_listen(_ipc_service(database_service), tmp_path / "ipc.sock", ["hello"], 1)
+
+        assert message["type"] == "new_item"
+        assert message["item"]["content"] == "hello"
+        assert message["item"]["type"] == "text"
+        assert message["item"]["tags"] == []
+
+    def test_duplicate_is_pushed_as_update(self, database_service, tmp_path):
+        messages = _copy_and_listen(_ipc_service(database_service), tmp_path / "ipc.sock", ["same", "same"], 2)
+
+        assert [message["type"] for message in messages] == ["new_item", "item_updated"]
+        assert messages[1]["item_id"] == messages[0]["item"]["id"]
+        assert messages[1]["item"]["content"] == "same"
+
+    def test_retention_deletions_are_pushed_in_order(self, database_service, tmp_path):
+        messages = _copy_and_listen(
+            _ipc_service(database_service, max_items=1), tmp_path / "ipc.sock", ["first", "second"], 3
+        )
+
+        first_id = messages[0]["item"]["id"]
+        assert [message["type"] for message in messages] == ["new_item", "new_item", "item_deleted"]
+        assert messages[2]["id"] == first_id
+
+    def test_ipc_delete_is_pushed_through_the_bus(self, database_service, tmp_path):
+        item_id = database_service.add_item("text", b"to delete", None)
+        ipc_service = _ipc_service(database_service)
+        published = []
+        ipc_service.event_bus.subscribe(ITEM_DELETED, lambda event, deleted_id: published.append(deleted_id))
+        socket_path = tmp_path / "ipc.sock"
+
+        async def run():
+            server = await asyncio.start_unix_server(ipc_service.client_handler, str(socket_path))
+            reader, listener = await _connect(socket_path)
+            _, deleter = await _connect(socket_path)
+            try:
+                deleter.write(encode_frame({"action": "delete_item", "id": item_id}, FRAMING_BINARY))
+                await deleter.drain()
+                return (await asyncio.wait_for(read_frame(reader), 5))[0]
+            finally:
+                listener.close()
+                deleter.close()
+                server.close()
+                await server.wait_closed()
+
+        try:
+            message = asyncio.run(run())
+        finally:
+            ipc_service.pool.shutdown()
+
+        assert message == {"type": "item_deleted", "id": item_id}
+        assert published == [item_id]
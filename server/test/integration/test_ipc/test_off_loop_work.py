@@ -0,0 +1,92 @@
+"""Tests that blocking work of one request does not stall the others."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from server.src.ipc_protocol import FRAMING_BINARY, VERSION, encode_frame, read_frame
+from server.src.services.database_service import DatabaseService
+from server.src.services.ipc_service import IPCService
+
+INGEST_SECONDS = 2.0
+
+
+class _SlowClipboardService:
+    """Stands in for ClipboardService storing a very large file."""
+
+    def __init__(self):
+        self.started = threading.Event()
+
+    def handle_clipboard_event(self, event_data):
+        self.started.set()
+        time.sleep(INGEST_SECONDS)
+
+
+@pytest.fixture
+def ipc_service(tmp_path):
+    database_service = DatabaseService(str(tmp_path / "clipboard.db"))
+    database_service.add_item("text", b"hello", timestamp="2025-01-01T10:00:00")
+    service = IPCService(
+        database_service,
+        settings_service=SimpleNamespace(retention_enabled=False, max_page_length=20),
+        clipboard_service=_SlowClipboardService(),
+    )
+    yield service
+    service.pool.shutdown()
+    database_service.close()
+
+
+async def _connect(socket_path):
+    reader, writer = await asyncio.open_unix_connection(str(socket_path))
+    writer.write(encode_frame({"action": "hello", "framings": [FRAMING_BINARY], "version": VERSION}, "json"))
+    await read_frame(reader)
+    return reader, writer
+
+
+def _history_during_ingest(ipc_service, socket_path, same_connection: bool) -> float:
+    """Seconds get_history took to answer while a clipboard event was being ingested."""
+
+    async def run():
+        server = await asyncio.start_unix_server(ipc_service.client_handler, str(socket_path))
+        copier = await _connect(socket_path)
+        reader, writer = copier if same_connection else await _connect(socket_path)
+        try:
+            copier[1].write(encode_frame({"action": "clipboard_event", "data": {"type": "file"}}, FRAMING_BINARY))
+            await copier[1].drain()
+            started = ipc_service.clipboard_service.started
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+            start = time.perf_counter()
+            writer.write(encode_frame({"action": "get_history", "limit": 10, "request_id": 1}, FRAMING_BINARY))
+            await writer.drain()
+            reply, _ = await asyncio.wait_for(read_frame(reader), 5)
+            elapsed = time.perf_counter() - start
+
+            assert reply["type"] == "history"
+            assert reply["request_id"] == 1
+            assert len(reply["items"]) == 1
+            return elapsed
+        finally:
+            for _, client_writer in {copier, (reader, writer)}:
+                client_writer.close()
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(run())
+
+
+class TestOffLoopWork:
+    """A long clipboard ingest runs on its own lane, off the event loop."""
+
+    def test_ingest_does_not_delay_history_of_another_client(self, ipc_service, tmp_path):
+        elapsed = _history_during_ingest(ipc_service, tmp_path / "ipc.sock", same_connection=False)
+
+        assert elapsed < INGEST_SECONDS / 4
+
+    def test_ingest_does_not_delay_history_on_the_same_connection(self, ipc_service, tmp_path):
+        elapsed = _history_during_ingest(ipc_service, tmp_path / "ipc.sock", same_connection=True)
+
+        assert elapsed < INGEST_SECONDS / 4
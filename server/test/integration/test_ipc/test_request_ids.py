@@ -0,0 +1,101 @@
+"""Tests for request IDs, which let a client multiplex requests over one connection."""
+
+import asyncio
+import time
+
+import pytest
+
+from server.src.ipc_protocol import FRAMING_BINARY, VERSION, encode_frame, read_frame
+from server.src.services.database_service import DatabaseService
+from server.src.services.ipc_service import IPCService
+
+
+@pytest.fixture
+def ipc_service(tmp_path):
+    database_service = DatabaseService(str(tmp_path / "clipboard.db"))
+    yield IPCService(database_service, settings_service=None, clipboard_service=None)
+    database_service.close()
+
+
+def _exchange(ipc_service, socket_path, messages, replies: int, broadcast=None) -> list:
+    """Send messages over one binary connection and read the replies."""
+
+    async def run():
+        server = await asyncio.start_unix_server(ipc_service.client_handler, str(socket_path))
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        try:
+            writer.write(encode_frame({"action": "hello", "framings": [FRAMING_BINARY], "version": VERSION}, "json"))
+            hello, _ = await read_frame(reader)
+            assert hello["framing"] == FRAMING_BINARY
+            for message in messages:
+                writer.write(encode_frame(message, FRAMING_BINARY))
+            await writer.drain()
+            if broadcast:
+                while not ipc_service.clients:
+                    await asyncio.sleep(0.01)
+                await ipc_service.broadcast(broadcast)
+            return [(await asyncio.wait_for(read_frame(reader), 5))[0] for _ in range(replies)]
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(run())
+
+
+class TestRequestIds:
+    """Replies echo the request_id of the request they answer."""
+
+    def test_replies_echo_request_ids(self, ipc_service, tmp_path):
+        replies = _exchange(
+            ipc_service,
+            tmp_path / "ipc.sock",
+            [
+                {"action": "get_total_count", "request_id": 7},
+                {"action": "get_tags", "request_id": 8},
+            ],
+            replies=2,
+        )
+
+        # Requests with IDs are handled concurrently, so replies may come in any order
+        assert sorted((reply["request_id"], reply["type"]) for reply in replies) == [(7, "total_count"), (8, "tags")]
+
+    def test_requests_without_id_get_untagged_replies(self, ipc_service, tmp_path):
+        [reply] = _exchange(ipc_service, tmp_path / "ipc.sock", [{"action": "get_total_count"}], replies=1)
+
+        assert reply["type"] == "total_count"
+        assert "request_id" not in reply
+
+    def test_broadcasts_are_not_tagged(self, ipc_service, tmp_path):
+        replies = _exchange(
+            ipc_service,
+            tmp_path / "ipc.sock",
+            [{"action": "get_total_count", "request_id": 1}],
+            replies=2,
+            broadcast={"type": "item_deleted", "id": 3},
+        )
+
+        broadcasts = [reply for reply in replies if reply["type"] == "item_deleted"]
+        assert broadcasts == [{"type": "item_deleted", "id": 3}]
+
+    def test_slow_request_does_not_hold_up_later_ones(self, ipc_service, tmp_path, monkeypatch):
+        get_all_tags = ipc_service.db_service.get_all_tags
+
+        def slow_get_all_tags():
+            time.sleep(0.5)
+            return get_all_tags()
+
+        monkeypatch.setattr(ipc_service.db_service, "get_all_tags", slow_get_all_tags)
+
+        replies = _exchange(
+            ipc_service,
+            tmp_path / "ipc.sock",
+            [
+                {"action": "get_tags", "request_id": 1},
+                {"action": "get_total_count", "request_id": 2},
+            ],
+            replies=2,
+        )
+
+        # Requests with IDs run concurrently: the quick one answers first
+        assert [reply["request_id"] for reply in replies] == [2, 1]
@@ -0,0 +1,76 @@
+"""Tests for WorkPool, the bounded thread pools behind IPC requests."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from server.src.work_pool import WorkPool
+
+
+@pytest.fixture
+def pool():
+    pool = WorkPool({"requests": 2, "ingest": 1})
+    yield pool
+    pool.shutdown()
+
+
+class TestWorkPool:
+    """Blocking work runs on lane threads, never on the event loop."""
+
+    def test_runs_off_the_loop_and_returns_result(self, pool):
+        async def run():
+            loop_thread = threading.current_thread()
+            thread = await pool.run("requests", threading.current_thread)
+            return loop_thread, thread, await pool.run("requests", divmod, 7, 2)
+
+        loop_thread, thread, result = asyncio.run(run())
+
+        assert thread is not loop_thread
+        assert thread.name.startswith("ipc-requests")
+        assert result == (3, 1)
+
+    def test_exceptions_propagate(self, pool):
+        def fail():
+            raise ValueError("boom")
+
+        async def run():
+            await pool.run("requests", fail)
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(run())
+
+    def test_lane_runs_at_most_its_workers_at_once(self, pool):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        async def run():
+            await asyncio.gather(*(pool.run("requests", work) for _ in range(8)))
+
+        asyncio.run(run())
+
+        assert max(peak) == 2
+
+    def test_busy_lane_does_not_hold_up_others(self, pool):
+        release = threading.Event()
+
+        async def run():
+            ingest = asyncio.ensure_future(pool.run("ingest", release.wait, 5))
+            start = time.perf_counter()
+            assert await pool.run("requests", sum, [1, 2]) == 3
+            elapsed = time.perf_counter() - start
+            release.set()
+            await ingest
+            return elapsed
+
+        assert asyncio.run(run()) < 1
@@ -3,7 +3,7 @@
 import pytest
 from dataclasses import asdict
 
-from settings import Settings, DisplaySettings, RetentionSettings, ClipboardSettings
+from settings import Settings, DisplaySettings, RetentionSettings, ClipboardSettings, DatabaseSettings
 
 
 class TestSettingsModelValidation:
@@ -170,3 +170,20 @@ class TestSettingsModelValidation:
 
         assert "clipboard" in data
         assert data["clipboard"]["refocus_on_copy"] is False
+
+    def test_database_settings_defaults(self):
+        """Test default values for database settings."""
+        settings = Settings()
+
+        assert isinstance(settings.database, DatabaseSettings)
+        assert settings.database.read_pool_size == 4
+
+    def test_database_read_pool_size_validation(self):
+        """Test that read_pool_size must be between 0 and 16."""
+        assert DatabaseSettings(read_pool_size=0).read_pool_size == 0
+
+        with pytest.raises(ValueError):
+            DatabaseSettings(read_pool_size=-1)
+
+        with pytest.raises(ValueError):
+            DatabaseSettings(read_pool_size=32)
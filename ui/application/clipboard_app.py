@@ -113,28 +113,15 @@ class ClipboardApp(Gtk.Application):
 
     def _handle_clipboard_event(self, event_data):
         """Forward clipboard events to the server"""
-        import asyncio
-        from ui.services.ipc_helpers import connect as ipc_connect
-        import json
+        from ui.services.ipc_helpers import get_channel
 
-        async def send_to_server():
-            try:
-                async with ipc_connect() as conn:
-                    await conn.send(json.dumps({
-                        'action': 'clipboard_event',
-                        'data': event_data
-                    }))
-                    logger.info(f"Forwarded {event_data.get('type')} event to server")
-            except Exception as e:
-                logger.error(f"Failed to forward clipboard event to server: {e}")
-
-        # Run async task
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(send_to_server())
-        except Exception as e:
-            logger.error(f"Error handling clipboard event in UI: {e}")
+        # The shared channel uses binary frames, which carry images and
+        # HTML as raw bytes; events keep their order on the one connection
+        get_channel().send(
+            {'action': 'clipboard_event', 'data': event_data},
+            on_error=lambda e: logger.error(f"Failed to forward clipboard event to server: {e}"),
+        )
+        logger.info(f"Forwarding {event_data.get('type')} event to server")
 
     def _start_clipboard_monitor(self):
         """Start the DE-agnostic clipboard monitor."""
@@ -315,42 +302,21 @@ class ClipboardApp(Gtk.Application):
         logger.info("Requesting server shutdown via IPC")
 
         try:
-            import asyncio
-            import json
-            from ui.services.ipc_helpers import connect as ipc_connect
-
-            async def send_shutdown():
-                try:
-                    print(f"[CLEANUP] Connecting to IPC server to send shutdown")
-                    async with ipc_connect() as conn:
-                        print(f"[CLEANUP] Sending shutdown request")
-                        request = {"action": "shutdown"}
-                        await conn.send(json.dumps(request))
-
-                        print(f"[CLEANUP] Waiting for acknowledgment (timeout: 1s)")
-                        # Use wait_for with timeout to avoid hanging if server already died
-                        response = await asyncio.wait_for(conn.recv(), timeout=1.0)
-                        data = json.loads(response)
-
-                        if data.get("type") == "shutdown_acknowledged":
-                            print(f"[CLEANUP] Server acknowledged shutdown")
-                            logger.info("Server acknowledged shutdown request")
-                        else:
-                            print(f"[CLEANUP] Unexpected response: {data}")
-                except asyncio.TimeoutError:
-                    print(f"[CLEANUP] Timeout waiting for acknowledgment (server may have already exited)")
-                except Exception as e:
-                    print(f"[CLEANUP] Error sending shutdown via IPC: {e}")
-                    logger.error(f"Error sending shutdown via IPC: {e}")
-
-            # Run the shutdown request
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(send_shutdown())
-            finally:
-                loop.close()
-                print(f"[CLEANUP] Shutdown request completed")
+            from ui.services.ipc_helpers import get_channel
+
+            channel = get_channel()
+            print(f"[CLEANUP] Sending shutdown request (timeout: 1s)")
+            # Short timeout to avoid hanging if server already died
+            data = channel.call({"action": "shutdown"}, timeout=1.0)
+            if data is None:
+                print(f"[CLEANUP] No acknowledgment (server may have already exited)")
+            elif data.get("type") == "shutdown_acknowledged":
+                print(f"[CLEANUP] Server acknowledged shutdown")
+                logger.info("Server acknowledged shutdown request")
+            else:
+                print(f"[CLEANUP] Unexpected response: {data}")
+            channel.close()
+            print(f"[CLEANUP] Shutdown request completed")
 
         except Exception as e:
             print(f"[CLEANUP] Error during cleanup: {e}")
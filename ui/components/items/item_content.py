@@ -1,7 +1,5 @@
 """Item content display component."""
 
-import base64
-
 import gi
 
 gi.require_version("Gtk", "4.0")
@@ -9,6 +7,7 @@ gi.require_version("Gdk", "4.0")
 gi.require_version("GdkPixbuf", "2.0")
 from gi.repository import Gdk, GdkPixbuf, Gtk, Pango
 
+from server.src.ipc_protocol import as_bytes
 from ui.components.items.item_formatting_indicator import FormattingIndicator
 from ui.utils import format_size, get_file_icon, highlight_text
 
@@ -254,14 +253,14 @@ class ItemContent:
     def _build_image_content(self) -> Gtk.Widget:
         try:
             thumbnail_data = self.item.get("thumbnail")
-            image_data_b64 = (
+            # Raw bytes over binary IPC frames, base64 over JSON frames
+            image_data = as_bytes(
                 thumbnail_data if thumbnail_data else self.item["content"]
             )
 
-            if not image_data_b64:
+            if not image_data:
                 raise Exception("No image data available")
 
-            image_data = base64.b64decode(image_data_b64)
             loader = GdkPixbuf.PixbufLoader()
             loader.write(image_data)
             loader.close()
@@ -57,6 +57,10 @@ class ClipboardListManager:
         self.show_notification = show_notification
         self.window_instance = window_instance
 
+        # Keyset positions returned by the server for the next page
+        self.copied_cursor = None
+        self.pasted_cursor = None
+
     def load_initial_history(self):
         logger.info("Starting initial history load from ListManager...")
         GLib.idle_add(
@@ -90,12 +94,14 @@ class ClipboardListManager:
             self.copied_listbox
             loader = self.copied_loader
             ipc_method = self.ipc_client.get_history
+            cursor = self.copied_cursor
         else:  # pasted
             pagination_manager = self.pasted_pagination_manager
             sort_state = self.sort_manager.pasted_sort
             self.pasted_listbox
             loader = self.pasted_loader
             ipc_method = self.ipc_client.get_recently_pasted
+            cursor = self.pasted_cursor
 
         if pagination_manager.can_load_more():
             logger.info(f"[UI] Scrolled to bottom of {list_type} list, loading more...")
@@ -109,6 +115,7 @@ class ClipboardListManager:
                         limit=pagination_manager.page_size,
                         sort_order=sort_state.order,
                         filters=self.filter_manager.get_active_filters(),
+                        cursor=cursor,
                     )
                 )
             )
@@ -217,6 +224,7 @@ class ClipboardListManager:
             items = data.get("items", [])
             total_count = data.get("total_count", 0)
             offset = data.get("offset", 0)
+            self.copied_cursor = data.get("next_cursor")
             logger.debug(f"Received {len(items)} items from history (total: {total_count})")
             if offset == 0:  # Initial load
                 GLib.idle_add(
@@ -239,6 +247,7 @@ class ClipboardListManager:
             items = data.get("items", [])
             total_count = data.get("total_count", 0)
             offset = data.get("offset", 0)
+            self.pasted_cursor = data.get("next_cursor")
             logger.debug(f"Received {len(items)} pasted items (total: {total_count})")
             if offset == 0:  # Initial load
                 GLib.idle_add(
@@ -263,6 +272,11 @@ class ClipboardListManager:
                 logger.debug(f"New item received: {item['type']}")
                 GLib.idle_add(self.window_instance.add_item, item)  # Delegate to window to handle adding
 
+        elif msg_type == "item_updated":
+            item = data.get("item")
+            if item:
+                GLib.idle_add(self.window_instance.update_item, item)  # Delegate to window to move it to the top
+
         elif msg_type == "item_deleted":
             item_id = data.get("id")
             if item_id:
@@ -351,6 +365,7 @@ class ClipboardListManager:
         current_tab = self.get_current_tab()
         if current_tab == "copied":
             self.copied_pagination_manager.reset()
+            self.copied_cursor = None
             # Clear existing items
             while True:
                 row = self.copied_listbox.get_row_at_index(0)
@@ -360,6 +375,7 @@ class ClipboardListManager:
             self.load_initial_history()
         elif current_tab == "pasted":
             self.pasted_pagination_manager.reset()
+            self.pasted_cursor = None
             # Clear existing items
             while True:
                 row = self.pasted_listbox.get_row_at_index(0)
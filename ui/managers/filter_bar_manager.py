@@ -1,18 +1,15 @@
 """Manages the filter bar UI and filter state."""
 
-import asyncio
-import json
 import logging
-import threading
 from typing import Callable, Set
 
 import gi
-from ui.services.ipc_helpers import connect as ipc_connect
+from ui.services.ipc_helpers import get_channel
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
 
-from gi.repository import Gdk, GLib, Gtk
+from gi.repository import Gdk, Gtk
 
 logger = logging.getLogger("TFCBM.FilterBarManager")
 
@@ -281,46 +278,26 @@ class FilterBarManager:
     def load_file_extensions(self):
         """Load available file extensions from server (currently disabled)."""
 
-        async def fetch_extensions():
-            try:
-                async with ipc_connect() as conn:
-                    request = {"action": "get_file_extensions"}
-                    await conn.send(json.dumps(request))
-
-                    response = await conn.recv()
-                    data = json.loads(response)
-
-                    if data.get("type") == "file_extensions":
-                        extensions = data.get("extensions", [])
-
-                        def update_ui():
-                            self.file_extensions = extensions
-                            for ext in extensions:
-                                # Remove leading dot for display
-                                display_ext = ext.lstrip(".")
-                                # Get icon for this file type
-                                icon_name = self._get_icon_for_extension(ext)
-                                self._create_filter_chip(
-                                    f"file:{ext}",
-                                    display_ext.upper(),
-                                    icon_name,
-                                )
-                            return False
-
-                        GLib.idle_add(update_ui)
-
-            except Exception as e:
-                logger.error(f"Error loading file extensions: {e}")
-
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(fetch_extensions())
-            finally:
-                loop.close()
-
-        threading.Thread(target=run_async, daemon=True).start()
+        def on_response(data):
+            if data.get("type") == "file_extensions":
+                extensions = data.get("extensions", [])
+                self.file_extensions = extensions
+                for ext in extensions:
+                    # Remove leading dot for display
+                    display_ext = ext.lstrip(".")
+                    # Get icon for this file type
+                    icon_name = self._get_icon_for_extension(ext)
+                    self._create_filter_chip(
+                        f"file:{ext}",
+                        display_ext.upper(),
+                        icon_name,
+                    )
+
+        get_channel().request(
+            {"action": "get_file_extensions"},
+            on_response,
+            lambda e: logger.error(f"Error loading file extensions: {e}"),
+        )
 
     def _get_icon_for_extension(self, extension: str) -> str:
         """Get appropriate icon for file extension.
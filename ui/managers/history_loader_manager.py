@@ -1,7 +1,6 @@
 """History Loader Manager - Handles IPC data loading for clipboard history."""
 
 import asyncio
-import json
 import logging
 import subprocess
 import threading
@@ -10,7 +9,7 @@ import traceback
 from typing import Callable
 
 import gi
-from ui.services.ipc_helpers import connect as ipc_connect, ConnectionClosedError
+from ui.services.ipc_helpers import connect as ipc_connect, get_channel, ConnectionClosedError
 
 gi.require_version("Gtk", "4.0")
 from gi.repository import GLib, Gtk
@@ -75,16 +74,21 @@ class HistoryLoaderManager:
             socket_path = os.path.join(runtime_dir, "tfcbm-ipc.sock")
         self.socket_path = socket_path
 
-        # Pagination state
+        # Pagination state. The cursor is the server's keyset position after
+        # the last loaded row; the sort order is the one it was built for.
         self.copied_offset = 0
         self.copied_total = 0
         self.copied_has_more = True
         self.copied_loading = False
+        self.copied_cursor = None
+        self.copied_sort_order = "DESC"
 
         self.pasted_offset = 0
         self.pasted_total = 0
         self.pasted_has_more = True
         self.pasted_loading = False
+        self.pasted_cursor = None
+        self.pasted_sort_order = "DESC"
 
     def load_history(self):
         """Load clipboard history and listen for updates via IPC."""
@@ -131,7 +135,7 @@ class HistoryLoaderManager:
         print(f"Connecting to IPC server at {self.socket_path}...")
 
         try:
-            async with ipc_connect(self.socket_path) as conn:
+            async with ipc_connect(self.socket_path, binary=True) as conn:
                 print("Connected to IPC server")
 
                 # Request history
@@ -141,7 +145,7 @@ class HistoryLoaderManager:
                     print(
                         f"[FILTER] Sending filters to server: {list(self.get_active_filters())}"
                     )
-                await conn.send(json.dumps(request))
+                await conn.send_message(request)
                 print(
                     f"Requested history with filters: {request.get('filters', 'none')}"
                 )
@@ -153,15 +157,14 @@ class HistoryLoaderManager:
                 }
                 if self.get_active_filters():
                     pasted_request["filters"] = list(self.get_active_filters())
-                await conn.send(json.dumps(pasted_request))
+                await conn.send_message(pasted_request)
                 print(
                     f"Requested pasted items with filters: {pasted_request.get('filters', 'none')}"
                 )
 
                 # Listen for messages
                 logger.info("Starting message listener loop...")
-                async for message in conn:
-                    data = json.loads(message)
+                async for data in conn:
                     msg_type = data.get("type")
                     logger.debug(f"Received message type: {msg_type}")
 
@@ -178,6 +181,8 @@ class HistoryLoaderManager:
                             items,
                             total_count,
                             offset,
+                            data.get("next_cursor"),
+                            data.get("sort_order", "DESC"),
                         )
 
                     elif msg_type == "recently_pasted":
@@ -193,6 +198,8 @@ class HistoryLoaderManager:
                             items,
                             total_count,
                             offset,
+                            data.get("next_cursor"),
+                            data.get("sort_order", "DESC"),
                         )
 
                     elif msg_type == "new_item":
@@ -202,6 +209,12 @@ class HistoryLoaderManager:
                             print(f"New item received: {item['type']}")
                             GLib.idle_add(self.window.add_item, item)
 
+                    elif msg_type == "item_updated":
+                        # Recopied item, pushed with its new timestamp
+                        item = data.get("item")
+                        if item:
+                            GLib.idle_add(self.window.update_item, item)
+
                     elif msg_type == "item_deleted":
                         # Item deleted
                         item_id = data.get("id")
@@ -222,50 +235,29 @@ class HistoryLoaderManager:
 
     def load_pasted_history(self):
         """Load recently pasted items via IPC."""
-        page_size = self.page_size  # Capture for closure
-
-        def run_ipc():
-            try:
-
-                async def get_pasted():
-                    async with ipc_connect(self.socket_path) as conn:
-                        # Request pasted history
-                        request = {
-                            "action": "get_recently_pasted",
-                            "limit": page_size,
-                        }
-                        # Include active filters
-                        if self.get_active_filters():
-                            request["filters"] = list(self.get_active_filters())
-                            print(
-                                f"[FILTER] Requesting pasted items with filters: {list(self.get_active_filters())}"
-                            )
-                        await conn.send(json.dumps(request))
-
-                        # Wait for response
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "recently_pasted":
-                            items = data.get("items", [])
-                            print(f"Received {len(items)} pasted items")
-                            GLib.idle_add(self.update_pasted_history, items)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_pasted())
-                finally:
-                    loop.close()
+        # Request pasted history
+        request = {
+            "action": "get_recently_pasted",
+            "limit": self.page_size,
+        }
+        # Include active filters
+        if self.get_active_filters():
+            request["filters"] = list(self.get_active_filters())
+            print(
+                f"[FILTER] Requesting pasted items with filters: {list(self.get_active_filters())}"
+            )
 
-            except Exception as e:
-                print(f"Error loading pasted history: {e}")
+        def on_response(data):
+            if data.get("type") == "recently_pasted":
+                items = data.get("items", [])
+                print(f"Received {len(items)} pasted items")
+                self.update_pasted_history(items)
 
-        # Run in background thread
-        thread = threading.Thread(target=run_ipc, daemon=True)
-        thread.start()
+        get_channel().request(
+            request, on_response, lambda e: print(f"Error loading pasted history: {e}")
+        )
 
-    def initial_history_load(self, items, total_count, offset):
+    def initial_history_load(self, items, total_count, offset, next_cursor=None, sort_order="DESC"):
         """Initial load of copied history with pagination data."""
         if hasattr(self, "history_load_start_time"):
             duration = time.time() - self.history_load_start_time
@@ -275,7 +267,11 @@ class HistoryLoaderManager:
         # Update pagination state
         self.copied_offset = offset
         self.copied_total = total_count
-        self.copied_has_more = (offset + len(items)) < total_count
+        self.copied_cursor = next_cursor
+        self.copied_sort_order = sort_order
+        self.copied_has_more = (
+            next_cursor is not None and (offset + len(items)) < total_count
+        )
 
         # Clear existing items
         while True:
@@ -299,12 +295,16 @@ class HistoryLoaderManager:
 
         return False  # Don't repeat
 
-    def initial_pasted_load(self, items, total_count, offset):
+    def initial_pasted_load(self, items, total_count, offset, next_cursor=None, sort_order="DESC"):
         """Initial load of pasted history with pagination data."""
         # Update pagination state
         self.pasted_offset = offset
         self.pasted_total = total_count
-        self.pasted_has_more = (offset + len(items)) < total_count
+        self.pasted_cursor = next_cursor
+        self.pasted_sort_order = sort_order
+        self.pasted_has_more = (
+            next_cursor is not None and (offset + len(items)) < total_count
+        )
 
         # Clear existing items
         while True:
@@ -352,105 +352,66 @@ class HistoryLoaderManager:
 
     def load_more_copied_items(self):
         """Load more copied items via IPC."""
-
-        def run_ipc():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self._fetch_more_items("copied"))
-            finally:
-                loop.close()
-
-        threading.Thread(target=run_ipc, daemon=True).start()
+        self._fetch_more_items("copied")
         return False
 
     def load_more_pasted_items(self):
         """Load more pasted items via IPC."""
-
-        def run_ipc():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self._fetch_more_items("pasted"))
-            finally:
-                loop.close()
-
-        threading.Thread(target=run_ipc, daemon=True).start()
+        self._fetch_more_items("pasted")
         return False
 
-    async def _fetch_more_items(self, list_type):
+    def _fetch_more_items(self, list_type):
         """Fetch more items from backend via IPC."""
-        try:
-            async with ipc_connect(self.socket_path) as conn:
-                if list_type == "copied":
-                    request = {
-                        "action": "get_history",
-                        "offset": self.copied_offset + self.page_size,
-                        "limit": self.page_size,
-                    }
-                    if self.get_active_filters():
-                        request["filters"] = list(self.get_active_filters())
-                else:  # pasted
-                    request = {
-                        "action": "get_recently_pasted",
-                        "offset": self.pasted_offset + self.page_size,
-                        "limit": self.page_size,
-                    }
-                    # Include active filters for pasted items too
-                    if self.get_active_filters():
-                        request["filters"] = list(self.get_active_filters())
-
-                await conn.send(json.dumps(request))
-                response = await conn.recv()
-                data = json.loads(response)
-
-                if data.get("type") == "history" and list_type == "copied":
-                    items = data.get("items", [])
-                    total_count = data.get("total_count", 0)
-                    offset = data.get("offset", 0)
-                    GLib.idle_add(
-                        self._append_items_to_listbox,
-                        items,
-                        total_count,
-                        offset,
-                        "copied",
-                    )
-                elif (
-                    data.get("type") == "recently_pasted"
-                    and list_type == "pasted"
-                ):
-                    items = data.get("items", [])
-                    total_count = data.get("total_count", 0)
-                    offset = data.get("offset", 0)
-                    GLib.idle_add(
-                        self._append_items_to_listbox,
-                        items,
-                        total_count,
-                        offset,
-                        "pasted",
-                    )
+        # The cursor lets the server seek straight to the next page;
+        # the offset is kept for the has-more bookkeeping
+        if list_type == "copied":
+            request = {
+                "action": "get_history",
+                "offset": self.copied_offset + self.page_size,
+                "limit": self.page_size,
+                "sort_order": self.copied_sort_order,
+                "cursor": self.copied_cursor,
+            }
+            response_type = "history"
+        else:  # pasted
+            request = {
+                "action": "get_recently_pasted",
+                "offset": self.pasted_offset + self.page_size,
+                "limit": self.page_size,
+                "sort_order": self.pasted_sort_order,
+                "cursor": self.pasted_cursor,
+            }
+            response_type = "recently_pasted"
+        # Include active filters for pasted items too
+        if self.get_active_filters():
+            request["filters"] = list(self.get_active_filters())
+
+        def on_response(data):
+            if data.get("type") == response_type:
+                self._append_items_to_listbox(
+                    data.get("items", []),
+                    data.get("total_count", 0),
+                    data.get("offset", 0),
+                    list_type,
+                    data.get("next_cursor"),
+                )
+            else:
+                self.set_loading(list_type, False)
 
-        except Exception as e:
+        def on_error(e):
             print(f"IPC error fetching more {list_type} items: {e}")
-            traceback.print_exc()
-            GLib.idle_add(
-                lambda: print(f"Error loading more items: {str(e)}") or False
-            )
-        finally:
-            if list_type == "copied":
-                GLib.idle_add(lambda: self.copied_loader.set_visible(False))
-                self.copied_loading = False
-            else:
-                GLib.idle_add(lambda: self.pasted_loader.set_visible(False))
-                self.pasted_loading = False
+            self.set_loading(list_type, False)
 
-    def _append_items_to_listbox(self, items, total_count, offset, list_type):
+        get_channel().request(request, on_response, on_error)
+
+    def _append_items_to_listbox(self, items, total_count, offset, list_type, next_cursor=None):
         """Append new items to the respective listbox."""
         if list_type == "copied":
             listbox = self.copied_listbox
             self.copied_offset = offset
             self.copied_total = total_count
-            self.copied_has_more = (
+            self.copied_cursor = next_cursor
+            self.copied_has_more = next_cursor is not None and (
                 self.copied_offset + len(items)
             ) < self.copied_total
             self.copied_loader.set_visible(False)
@@ -459,7 +420,8 @@ class HistoryLoaderManager:
             listbox = self.pasted_listbox
             self.pasted_offset = offset
             self.pasted_total = total_count
-            self.pasted_has_more = (
+            self.pasted_cursor = next_cursor
+            self.pasted_has_more = next_cursor is not None and (
                 self.pasted_offset + len(items)
             ) < self.pasted_total
             self.pasted_loader.set_visible(False)
@@ -495,42 +457,26 @@ class HistoryLoaderManager:
     def reload_copied_with_filters(self):
         """Reload copied items with current filters."""
 
-        def reload_copied():
-            try:
-
-                async def get_history():
-                    async with ipc_connect(self.socket_path) as conn:
-                        request = {
-                            "action": "get_history",
-                            "limit": self.page_size,
-                        }
-                        if self.get_active_filters():
-                            request["filters"] = list(self.get_active_filters())
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "history":
-                            items = data.get("items", [])
-                            total_count = data.get("total_count", 0)
-                            offset = data.get("offset", 0)
-                            GLib.idle_add(
-                                self.initial_history_load,
-                                items,
-                                total_count,
-                                offset,
-                            )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_history())
-                finally:
-                    loop.close()
-            except Exception as e:
-                print(f"[UI] Error reloading history: {e}")
+        request = {
+            "action": "get_history",
+            "limit": self.page_size,
+        }
+        if self.get_active_filters():
+            request["filters"] = list(self.get_active_filters())
+
+        def on_response(data):
+            if data.get("type") == "history":
+                self.initial_history_load(
+                    data.get("items", []),
+                    data.get("total_count", 0),
+                    data.get("offset", 0),
+                    data.get("next_cursor"),
+                    data.get("sort_order", "DESC"),
+                )
 
-        threading.Thread(target=reload_copied, daemon=True).start()
+        get_channel().request(
+            request, on_response, lambda e: print(f"[UI] Error reloading history: {e}")
+        )
 
     def get_pagination_state(self, list_type: str):
         """Get pagination state for a list type.
@@ -579,6 +525,8 @@ class HistoryLoaderManager:
         if list_type == "copied":
             self.copied_offset = 0
             self.copied_has_more = True
+            self.copied_cursor = None
         else:  # pasted
             self.pasted_offset = 0
             self.pasted_has_more = True
+            self.pasted_cursor = None
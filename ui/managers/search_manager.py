@@ -1,14 +1,10 @@
 """Search manager - Handles search functionality with debouncing."""
 
-import asyncio
-import json
 import logging
-import threading
-import traceback
 from typing import Callable, Dict, List, Optional, Set
 
 import gi
-from ui.services.ipc_helpers import connect as ipc_connect
+from ui.services.ipc_helpers import get_channel
 
 gi.require_version("Gtk", "4.0")
 from gi.repository import GLib, Gtk
@@ -34,6 +30,7 @@ class SearchManager:
         socket_path: str = "",
         search_limit: int = 100,
         debounce_ms: int = 200,
+        search_mode: str = "token",
     ):
         """Initialize SearchManager.
 
@@ -49,6 +46,7 @@ class SearchManager:
             socket_path: IPC socket path
             search_limit: Maximum number of search results
             debounce_ms: Debounce delay in milliseconds (default 200ms)
+            search_mode: "token" for whole-word search, "substring" to match inside words
         """
         self.copied_listbox = copied_listbox
         self.pasted_listbox = pasted_listbox
@@ -61,6 +59,7 @@ class SearchManager:
         self.socket_path = socket_path
         self.search_limit = search_limit
         self.debounce_ms = debounce_ms
+        self.search_mode = search_mode
 
         # Search state
         self.query: str = ""
@@ -127,49 +126,33 @@ class SearchManager:
 
         active_filters = get_active_filters()
 
-        def run_search():
-            try:
-
-                async def search():
-                    async with ipc_connect(self.socket_path) as conn:
-                        request = {
-                            "action": "search",
-                            "query": query,
-                            "limit": self.search_limit,
-                        }
-                        # Include active filters in search request
-                        if active_filters:
-                            request["filters"] = list(active_filters)
-                            logger.info(f"Searching with filters: {list(active_filters)}")
-
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "search_results":
-                            items = data.get("items", [])
-                            result_count = data.get("count", 0)
-                            logger.info(f"Search results: {result_count} items")
-                            # Store results and mark search as active
-                            self.results = items
-                            self.active = True
-                            # Display results directly
-                            GLib.idle_add(self.display_results, items, query)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(search())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Search error: {e}")
-                traceback.print_exc()
-                GLib.idle_add(
-                    self.on_notification, f"Search error: {str(e)}"
-                )
-
-        threading.Thread(target=run_search, daemon=True).start()
+        request = {
+            "action": "search",
+            "query": query,
+            "limit": self.search_limit,
+            "mode": self.search_mode,
+        }
+        # Include active filters in search request
+        if active_filters:
+            request["filters"] = list(active_filters)
+            logger.info(f"Searching with filters: {list(active_filters)}")
+
+        def on_response(data):
+            if data.get("type") == "search_results":
+                items = data.get("items", [])
+                result_count = data.get("count", 0)
+                logger.info(f"Search results: {result_count} items")
+                # Store results and mark search as active
+                self.results = items
+                self.active = True
+                # Display results directly
+                self.display_results(items, query)
+
+        def on_error(e):
+            logger.error(f"Search error: {e}")
+            self.on_notification(f"Search error: {str(e)}")
+
+        get_channel().request(request, on_response, on_error)
         return False  # Don't repeat timer
 
     def display_results(self, items: List[Dict], query: str) -> bool:
@@ -1,16 +1,13 @@
 """Sort manager - Handles sort order state and operations."""
 
-import asyncio
-import json
 import logging
-import threading
 from typing import Callable
 
 import gi
-from ui.services.ipc_helpers import connect as ipc_connect
+from ui.services.ipc_helpers import get_channel
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import GLib, Gtk
+from gi.repository import Gtk
 
 logger = logging.getLogger("TFCBM.SortManager")
 
@@ -21,8 +18,8 @@ class SortManager:
     def __init__(
         self,
         sort_button: Gtk.Button,
-        on_history_load: Callable[[list, int, int], None],
-        on_pasted_load: Callable[[list, int, int], None],
+        on_history_load: Callable[[list, int, int, dict, str], None],
+        on_pasted_load: Callable[[list, int, int, dict, str], None],
         get_active_filters: Callable[[], set],
         page_size: int,
         socket_path: str = "",
@@ -31,8 +28,10 @@ class SortManager:
 
         Args:
             sort_button: Toolbar sort button widget
-            on_history_load: Callback to load copied history (items, total, offset)
-            on_pasted_load: Callback to load pasted history (items, total, offset)
+            on_history_load: Callback to load copied history
+                (items, total, offset, next_cursor, sort_order)
+            on_pasted_load: Callback to load pasted history
+                (items, total, offset, next_cursor, sort_order)
             get_active_filters: Callback to get active content filters
             page_size: Number of items per page
             socket_path: IPC socket path
@@ -106,85 +105,51 @@ class SortManager:
 
     def _reload_copied_with_sort(self):
         """Reload copied items with current sort order."""
-
-        def reload():
-            try:
-
-                async def get_sorted_history():
-                    async with ipc_connect(self.socket_path) as conn:
-                        request = {
-                            "action": "get_history",
-                            "limit": self.page_size,
-                            "sort_order": self.copied_sort_order,
-                        }
-                        active_filters = self.get_active_filters()
-                        if active_filters:
-                            request["filters"] = list(active_filters)
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "history":
-                            items = data.get("items", [])
-                            total_count = data.get("total_count", 0)
-                            offset = data.get("offset", 0)
-                            GLib.idle_add(
-                                self.on_history_load,
-                                items,
-                                total_count,
-                                offset,
-                            )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_sorted_history())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error reloading sorted history: {e}")
-
-        threading.Thread(target=reload, daemon=True).start()
+        request = {
+            "action": "get_history",
+            "limit": self.page_size,
+            "sort_order": self.copied_sort_order,
+        }
+        active_filters = self.get_active_filters()
+        if active_filters:
+            request["filters"] = list(active_filters)
+
+        def on_response(data):
+            if data.get("type") == "history":
+                self.on_history_load(
+                    data.get("items", []),
+                    data.get("total_count", 0),
+                    data.get("offset", 0),
+                    data.get("next_cursor"),
+                    data.get("sort_order", "DESC"),
+                )
+
+        get_channel().request(
+            request, on_response, lambda e: logger.error(f"Error reloading sorted history: {e}")
+        )
 
     def _reload_pasted_with_sort(self):
         """Reload pasted items with current sort order."""
-
-        def reload():
-            try:
-
-                async def get_sorted_pasted():
-                    async with ipc_connect(self.socket_path) as conn:
-                        request = {
-                            "action": "get_recently_pasted",
-                            "limit": self.page_size,
-                            "sort_order": self.pasted_sort_order,
-                        }
-                        # Include active filters
-                        active_filters = self.get_active_filters()
-                        if active_filters:
-                            request["filters"] = list(active_filters)
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "recently_pasted":
-                            items = data.get("items", [])
-                            total_count = data.get("total_count", 0)
-                            offset = data.get("offset", 0)
-                            GLib.idle_add(
-                                self.on_pasted_load,
-                                items,
-                                total_count,
-                                offset,
-                            )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_sorted_pasted())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error reloading sorted pasted: {e}")
-
-        threading.Thread(target=reload, daemon=True).start()
+        request = {
+            "action": "get_recently_pasted",
+            "limit": self.page_size,
+            "sort_order": self.pasted_sort_order,
+        }
+        # Include active filters
+        active_filters = self.get_active_filters()
+        if active_filters:
+            request["filters"] = list(active_filters)
+
+        def on_response(data):
+            if data.get("type") == "recently_pasted":
+                self.on_pasted_load(
+                    data.get("items", []),
+                    data.get("total_count", 0),
+                    data.get("offset", 0),
+                    data.get("next_cursor"),
+                    data.get("sort_order", "DESC"),
+                )
+
+        get_channel().request(
+            request, on_response, lambda e: logger.error(f"Error reloading sorted pasted: {e}")
+        )
@@ -1,17 +1,14 @@
 """Tag Dialog Manager - Handles tag creation and editing dialogs."""
 
-import asyncio
-import json
 import logging
-import threading
 from typing import Callable, List
 
 import gi
-from ui.services.ipc_helpers import connect as ipc_connect
+from ui.services.ipc_helpers import get_channel
 from ui.utils.color_utils import sanitize_color
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import GLib, Gtk
+from gi.repository import Gtk
 
 logger = logging.getLogger("TFCBM.TagDialogManager")
 
@@ -255,47 +252,20 @@ class TagDialogManager:
             color: Tag color (hex format)
         """
 
-        def run_create():
-            try:
+        def on_response(data):
+            if data.get("success"):
+                logger.info(f"Tag '{name}' created successfully")
+                self.on_tag_created()
+            else:
+                error_msg = data.get("error", "Unknown error")
+                logger.error(f"Failed to create tag: {error_msg}")
+                self._notify(f"Failed to create tag: {error_msg}")
 
-                async def create_tag():
-                    async with ipc_connect(self.socket_path) as conn:
-                        request = {
-                            "action": "create_tag",
-                            "name": name,
-                            "color": color,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("success"):
-                            logger.info(f"Tag '{name}' created successfully")
-                            GLib.idle_add(self.on_tag_created)
-                        else:
-                            error_msg = data.get("error", "Unknown error")
-                            logger.error(f"Failed to create tag: {error_msg}")
-                            if hasattr(self.parent_window, "show_notification"):
-                                GLib.idle_add(
-                                    self.parent_window.show_notification,
-                                    f"Failed to create tag: {error_msg}",
-                                )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(create_tag())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error creating tag: {e}")
-                if hasattr(self.parent_window, "show_notification"):
-                    GLib.idle_add(
-                        self.parent_window.show_notification,
-                        f"Error creating tag: {e}",
-                    )
+        def on_error(e):
+            logger.error(f"Error creating tag: {e}")
+            self._notify(f"Error creating tag: {e}")
 
-        threading.Thread(target=run_create, daemon=True).start()
+        get_channel().request({"action": "create_tag", "name": name, "color": color}, on_response, on_error)
 
     def _update_tag_on_server(self, tag_id: int, name: str, color: str):
         """Update a tag on the server.
@@ -306,53 +276,27 @@ class TagDialogManager:
             color: New tag color (hex format)
         """
 
-        def run_update():
-            try:
+        def on_response(data):
+            if data.get("type") == "tag_updated":
+                logger.info(f"Tag updated successfully")
+                self._notify("Tag updated")
+                self.on_tag_updated()
+            else:
+                error_msg = "Failed to update tag"
+                logger.error(error_msg)
+                self._notify(error_msg)
 
-                async def update_tag():
-                    async with ipc_connect(self.socket_path) as conn:
-                        request = {
-                            "action": "update_tag",
-                            "tag_id": tag_id,
-                            "name": name,
-                            "color": color,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "tag_updated":
-                            logger.info(f"Tag updated successfully")
-                            if hasattr(self.parent_window, "show_notification"):
-                                GLib.idle_add(
-                                    self.parent_window.show_notification,
-                                    "Tag updated",
-                                )
-                            GLib.idle_add(self.on_tag_updated)
-                        else:
-                            error_msg = "Failed to update tag"
-                            logger.error(error_msg)
-                            if hasattr(self.parent_window, "show_notification"):
-                                GLib.idle_add(
-                                    self.parent_window.show_notification,
-                                    error_msg,
-                                )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(update_tag())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error updating tag: {e}")
-                if hasattr(self.parent_window, "show_notification"):
-                    GLib.idle_add(
-                        self.parent_window.show_notification,
-                        f"Error updating tag: {e}",
-                    )
+        def on_error(e):
+            logger.error(f"Error updating tag: {e}")
+            self._notify(f"Error updating tag: {e}")
 
-        threading.Thread(target=run_update, daemon=True).start()
+        request = {"action": "update_tag", "tag_id": tag_id, "name": name, "color": color}
+        get_channel().request(request, on_response, on_error)
+
+    def _notify(self, message: str):
+        """Show a notification in the parent window, if it supports them."""
+        if hasattr(self.parent_window, "show_notification"):
+            self.parent_window.show_notification(message)
 
     def show_rename_dialog(self, tag):
         """Show dialog to rename a tag.
@@ -453,47 +397,18 @@ class TagDialogManager:
         Args:
             tag_id: Tag ID to delete
         """
-        def run_delete():
-            try:
-                async def delete_tag_async():
-                    async with ipc_connect(self.socket_path) as conn:
-                        request = {
-                            "action": "delete_tag",
-                            "tag_id": tag_id,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "tag_deleted" or data.get("success"):
-                            logger.info(f"Tag deleted successfully")
-                            if hasattr(self.parent_window, "show_notification"):
-                                GLib.idle_add(
-                                    self.parent_window.show_notification,
-                                    "Tag deleted",
-                                )
-                            GLib.idle_add(self.on_tag_updated)
-                        else:
-                            error_msg = data.get("error", "Failed to delete tag")
-                            logger.error(error_msg)
-                            if hasattr(self.parent_window, "show_notification"):
-                                GLib.idle_add(
-                                    self.parent_window.show_notification,
-                                    error_msg,
-                                )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(delete_tag_async())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error deleting tag: {e}")
-                if hasattr(self.parent_window, "show_notification"):
-                    GLib.idle_add(
-                        self.parent_window.show_notification,
-                        f"Error deleting tag: {e}",
-                    )
-
-        threading.Thread(target=run_delete, daemon=True).start()
+        def on_response(data):
+            if data.get("type") == "tag_deleted" or data.get("success"):
+                logger.info(f"Tag deleted successfully")
+                self._notify("Tag deleted")
+                self.on_tag_updated()
+            else:
+                error_msg = data.get("error", "Failed to delete tag")
+                logger.error(error_msg)
+                self._notify(error_msg)
+
+        def on_error(e):
+            logger.error(f"Error deleting tag: {e}")
+            self._notify(f"Error deleting tag: {e}")
+
+        get_channel().request({"action": "delete_tag", "tag_id": tag_id}, on_response, on_error)
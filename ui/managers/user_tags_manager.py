@@ -1,14 +1,11 @@
 """Manages user-defined tags (CRUD operations, drag-and-drop)."""
 
-import asyncio
-import json
 import logging
-import threading
 import time
 from typing import Any, Callable, Dict, List, Optional
 
 import gi
-from ui.services.ipc_helpers import connect as ipc_connect
+from ui.services.ipc_helpers import get_channel
 from ui.utils.color_utils import sanitize_color
 
 gi.require_version("Gtk", "4.0")
@@ -52,38 +49,20 @@ class UserTagsManager:
         self.user_tags_load_start_time = time.time()
         logger.info("Starting user tags load...")
 
-        def run_load():
-            try:
-
-                async def fetch_tags():
-                    uri = ""
-                    async with ipc_connect(uri) as conn:
-                        request = {"action": "get_tags"}
-                        await conn.send(json.dumps(request))
-
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "tags":
-                            all_tags = data.get("tags", [])
-                            # Only user-defined tags (filter out system tags)
-                            user_tags = [
-                                tag
-                                for tag in all_tags
-                                if not tag.get("is_system", False)
-                            ]
-                            GLib.idle_add(self._refresh_user_tags_display, user_tags)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(fetch_tags())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error loading user tags: {e}")
-
-        threading.Thread(target=run_load, daemon=True).start()
+        def on_response(data):
+            if data.get("type") == "tags":
+                all_tags = data.get("tags", [])
+                # Only user-defined tags (filter out system tags)
+                user_tags = [
+                    tag
+                    for tag in all_tags
+                    if not tag.get("is_system", False)
+                ]
+                self._refresh_user_tags_display(user_tags)
+
+        get_channel().request(
+            {"action": "get_tags"}, on_response, lambda e: logger.error(f"Error loading user tags: {e}")
+        )
 
     def create_tag(self, name: str, color: str, parent_window: Gtk.Window):
         """Create a new tag on the server.
@@ -94,56 +73,34 @@ class UserTagsManager:
             parent_window: Parent window for dialogs
         """
 
-        def run_create():
-            try:
-
-                async def create_tag_async():
-                    uri = ""
-                    async with ipc_connect(uri) as conn:
-                        request = {
-                            "action": "create_tag",
-                            "name": name,
-                            "color": color,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("success"):
-                            logger.info(f"Tag '{name}' created successfully")
-                            # Reload user tags display
-                            GLib.idle_add(self.load_user_tags)
-                            # Refresh tag filter display (via window callback)
-                            if hasattr(self.window, 'load_tags'):
-                                GLib.idle_add(self.window.load_tags)
-                        else:
-                            error_msg = data.get("error", "Unknown error")
-                            logger.error(f"Failed to create tag: {error_msg}")
-
-                            def show_error():
-                                dialog = Gtk.MessageDialog(
-                                    transient_for=parent_window,
-                                    modal=True,
-                                    message_type=Gtk.MessageType.ERROR,
-                                    buttons=Gtk.ButtonsType.OK,
-                                    text="Error Creating Tag",
-                                    secondary_text=f"Failed to create tag: {error_msg}",
-                                )
-                                dialog.connect("response", lambda d, r: d.close())
-                                dialog.present()
-
-                            GLib.idle_add(show_error)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(create_tag_async())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error creating tag: {e}")
+        def on_response(data):
+            if data.get("success"):
+                logger.info(f"Tag '{name}' created successfully")
+                # Reload user tags display
+                self.load_user_tags()
+                # Refresh tag filter display (via window callback)
+                if hasattr(self.window, 'load_tags'):
+                    self.window.load_tags()
+            else:
+                error_msg = data.get("error", "Unknown error")
+                logger.error(f"Failed to create tag: {error_msg}")
+
+                dialog = Gtk.MessageDialog(
+                    transient_for=parent_window,
+                    modal=True,
+                    message_type=Gtk.MessageType.ERROR,
+                    buttons=Gtk.ButtonsType.OK,
+                    text="Error Creating Tag",
+                    secondary_text=f"Failed to create tag: {error_msg}",
+                )
+                dialog.connect("response", lambda d, r: d.close())
+                dialog.present()
 
-        threading.Thread(target=run_create, daemon=True).start()
+        get_channel().request(
+            {"action": "create_tag", "name": name, "color": color},
+            on_response,
+            lambda e: logger.error(f"Error creating tag: {e}"),
+        )
 
     def delete_tag(self, tag_id: int, parent_window: Gtk.Window):
         """Delete a tag from the server.
@@ -153,59 +110,41 @@ class UserTagsManager:
             parent_window: Parent window for dialogs
         """
 
-        def run_delete():
-            try:
-
-                async def delete_tag_async():
-                    uri = ""
-                    async with ipc_connect(uri) as conn:
-                        request = {"action": "delete_tag", "tag_id": tag_id}
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("success"):
-                            logger.info(f"Tag {tag_id} deleted successfully")
-                            # Reload user tags display
-                            GLib.idle_add(self.load_user_tags)
-                            # Refresh tag filter display (via window callback)
-                            if hasattr(self.window, 'load_tags'):
-                                GLib.idle_add(self.window.load_tags)
-                            # Show success notification
-                            if hasattr(self.window, 'show_notification'):
-                                GLib.idle_add(self.window.show_notification, "Tag deleted")
-                            # Force reload of current tab to refresh item displays
-                            # Schedule with a delay to ensure load_tags completes first
-                            if hasattr(self.window, '_reload_current_tab'):
-                                GLib.timeout_add(500, self.window._reload_current_tab)
-                        else:
-                            error_msg = data.get("error", "Unknown error")
-                            logger.error(f"Failed to delete tag: {error_msg}")
-
-                            def show_error():
-                                dialog = Gtk.MessageDialog(
-                                    transient_for=parent_window,
-                                    modal=True,
-                                    message_type=Gtk.MessageType.ERROR,
-                                    buttons=Gtk.ButtonsType.OK,
-                                    text="Error Deleting Tag",
-                                    secondary_text=f"Failed to delete tag: {error_msg}",
-                                )
-                                dialog.connect("response", lambda d, r: d.close())
-                                dialog.present()
-
-                            GLib.idle_add(show_error)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(delete_tag_async())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error deleting tag: {e}")
+        def on_response(data):
+            if data.get("success"):
+                logger.info(f"Tag {tag_id} deleted successfully")
+                # Reload user tags display
+                self.load_user_tags()
+                # Refresh tag filter display (via window callback)
+                if hasattr(self.window, 'load_tags'):
+                    self.window.load_tags()
+                # Show success notification
+                if hasattr(self.window, 'show_notification'):
+                    self.window.show_notification("Tag deleted")
+                # Force reload of current tab to refresh item displays
+                # Schedule with a delay to ensure load_tags completes first
+                if hasattr(self.window, '_reload_current_tab'):
+                    GLib.timeout_add(500, self.window._reload_current_tab)
+            else:
+                error_msg = data.get("error", "Unknown error")
+                logger.error(f"Failed to delete tag: {error_msg}")
+
+                dialog = Gtk.MessageDialog(
+                    transient_for=parent_window,
+                    modal=True,
+                    message_type=Gtk.MessageType.ERROR,
+                    buttons=Gtk.ButtonsType.OK,
+                    text="Error Deleting Tag",
+                    secondary_text=f"Failed to delete tag: {error_msg}",
+                )
+                dialog.connect("response", lambda d, r: d.close())
+                dialog.present()
 
-        threading.Thread(target=run_delete, daemon=True).start()
+        get_channel().request(
+            {"action": "delete_tag", "tag_id": tag_id},
+            on_response,
+            lambda e: logger.error(f"Error deleting tag: {e}"),
+        )
 
     def add_tag_to_item(
         self, tag_id: int, item_id: int, copied_listbox: Gtk.ListBox, pasted_listbox: Gtk.ListBox
@@ -220,47 +159,23 @@ class UserTagsManager:
         """
         logger.info(f"Tag {tag_id} dropped on item {item_id}")
 
-        def run_add_tag():
-            try:
-
-                async def add_tag_async():
-                    uri = ""
-                    async with ipc_connect(uri) as conn:
-                        request = {
-                            "action": "add_item_tag",
-                            "item_id": item_id,
-                            "tag_id": int(tag_id),
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("success"):
-                            logger.info(
-                                f"Successfully added tag {tag_id} to item {item_id}"
-                            )
-                            # Reload item tags via callback
-                            GLib.idle_add(
-                                self.on_item_tag_reload,
-                                item_id,
-                                copied_listbox,
-                                pasted_listbox,
-                            )
-                        else:
-                            logger.error(
-                                f"Failed to add tag: {data.get('error', 'Unknown error')}"
-                            )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(add_tag_async())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error adding tag: {e}")
+        def on_response(data):
+            if data.get("success"):
+                logger.info(
+                    f"Successfully added tag {tag_id} to item {item_id}"
+                )
+                # Reload item tags via callback
+                self.on_item_tag_reload(item_id, copied_listbox, pasted_listbox)
+            else:
+                logger.error(
+                    f"Failed to add tag: {data.get('error', 'Unknown error')}"
+                )
 
-        threading.Thread(target=run_add_tag, daemon=True).start()
+        get_channel().request(
+            {"action": "add_item_tag", "item_id": item_id, "tag_id": int(tag_id)},
+            on_response,
+            lambda e: logger.error(f"Error adding tag: {e}"),
+        )
 
     def on_tag_drag_prepare(self, drag_source, x, y, tag) -> Gdk.ContentProvider:
         """Prepare data for tag drag operation.
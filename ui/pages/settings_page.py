@@ -411,42 +411,17 @@ class SettingsPage:
         """Handle refocus on copy toggle."""
         is_enabled = switch.get_active()
 
-        import threading
+        from ui.services.ipc_helpers import get_channel
 
-        def update_in_thread():
-            result = self._update_clipboard_settings_sync(is_enabled)
-            GLib.idle_add(self._handle_clipboard_settings_result, result, is_enabled)
+        def on_error(e):
+            print(f"Error updating clipboard settings: {e}")
+            self._handle_clipboard_settings_result({"status": "error", "message": str(e)}, is_enabled)
 
-        thread = threading.Thread(target=update_in_thread, daemon=True)
-        thread.start()
-
-    def _update_clipboard_settings_sync(self, refocus_on_copy: bool) -> dict:
-        """Update clipboard settings via IPC synchronously."""
-        import asyncio
-        import json
-        from ui.services.ipc_helpers import connect as ipc_connect
-
-        async def update_settings():
-            try:
-                async with ipc_connect() as conn:
-                    request = {
-                        "action": "update_clipboard_settings",
-                        "refocus_on_copy": refocus_on_copy
-                    }
-                    await conn.send(json.dumps(request))
-                    response = await conn.recv()
-                    return json.loads(response)
-            except Exception as e:
-                print(f"Error updating clipboard settings: {e}")
-                return {"status": "error", "message": str(e)}
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(update_settings())
-        finally:
-            loop.close()
-        return result
+        get_channel().request(
+            {"action": "update_clipboard_settings", "refocus_on_copy": is_enabled},
+            lambda result: self._handle_clipboard_settings_result(result, is_enabled),
+            on_error,
+        )
 
     def _handle_clipboard_settings_result(self, result: dict, refocus_on_copy: bool):
         """Handle clipboard settings update result in GTK main thread."""
@@ -678,47 +653,27 @@ class SettingsPage:
 
     def _on_apply_retention(self, button: Gtk.Button):
         """Handle retention settings apply button."""
-        import threading
+        from ui.services.ipc_helpers import get_channel
 
         new_enabled = self.retention_switch.get_active()
         new_max_items = int(self.max_items_spin.get_value())
         current_max_items = self.settings.retention_max_items
 
         if new_enabled and new_max_items < current_max_items:
-            def get_count_and_confirm():
-                total = self._get_total_count_sync()
-                GLib.idle_add(self._show_retention_confirmation_with_count, new_enabled, new_max_items, total)
-
-            thread = threading.Thread(target=get_count_and_confirm, daemon=True)
-            thread.start()
+            def on_error(e):
+                print(f"Error getting item count: {e}")
+                self._show_retention_confirmation_with_count(new_enabled, new_max_items, 0)
+
+            get_channel().request(
+                {"action": "get_total_count"},
+                lambda data: self._show_retention_confirmation_with_count(
+                    new_enabled, new_max_items, data.get("total", 0)
+                ),
+                on_error,
+            )
         else:
             self._save_retention_settings_threaded(new_enabled, new_max_items, delete_count=0)
 
-    def _get_total_count_sync(self) -> int:
-        """Get total item count synchronously."""
-        import asyncio
-        import json
-        from ui.services.ipc_helpers import connect as ipc_connect
-
-        async def get_count():
-            try:
-                async with ipc_connect() as conn:
-                    await conn.send(json.dumps({"action": "get_total_count"}))
-                    response = await conn.recv()
-                    data = json.loads(response)
-                    return data.get("total", 0)
-            except Exception as e:
-                print(f"Error getting item count: {e}")
-                return 0
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            total = loop.run_until_complete(get_count())
-        finally:
-            loop.close()
-        return total
-
     def _show_retention_confirmation_with_count(self, enabled: bool, max_items: int, total_items: int):
         """Show confirmation dialog with pre-calculated item count."""
         items_to_delete = max(0, total_items - max_items)
@@ -754,45 +709,24 @@ class SettingsPage:
         return False
 
     def _save_retention_settings_threaded(self, enabled: bool, max_items: int, delete_count: int):
-        """Save retention settings in background thread."""
-        import threading
-
-        def save_in_thread():
-            result = self._save_retention_settings_sync(enabled, max_items, delete_count)
-            GLib.idle_add(self._handle_retention_save_result, result, enabled, max_items)
-
-        thread = threading.Thread(target=save_in_thread, daemon=True)
-        thread.start()
-
-    def _save_retention_settings_sync(self, enabled: bool, max_items: int, delete_count: int) -> dict:
-        """Save retention settings synchronously."""
-        import asyncio
-        import json
-        from ui.services.ipc_helpers import connect as ipc_connect
-
-        async def save_settings():
-            try:
-                async with ipc_connect() as conn:
-                    request = {
-                        "action": "update_retention_settings",
-                        "enabled": enabled,
-                        "max_items": max_items,
-                        "delete_count": delete_count
-                    }
-                    await conn.send(json.dumps(request))
-                    response = await conn.recv()
-                    return json.loads(response)
-            except Exception as e:
-                print(f"Error saving retention settings: {e}")
-                return {"status": "error", "message": str(e)}
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(save_settings())
-        finally:
-            loop.close()
-        return result
+        """Save retention settings without blocking the GTK main thread."""
+        from ui.services.ipc_helpers import get_channel
+
+        def on_error(e):
+            print(f"Error saving retention settings: {e}")
+            self._handle_retention_save_result({"status": "error", "message": str(e)}, enabled, max_items)
+
+        request = {
+            "action": "update_retention_settings",
+            "enabled": enabled,
+            "max_items": max_items,
+            "delete_count": delete_count
+        }
+        get_channel().request(
+            request,
+            lambda result: self._handle_retention_save_result(result, enabled, max_items),
+            on_error,
+        )
 
     def _handle_retention_save_result(self, result: dict, enabled: bool, max_items: int):
         """Handle save result in GTK main thread."""
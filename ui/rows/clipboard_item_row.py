@@ -224,8 +224,9 @@ class ClipboardItemRow(Gtk.ListBoxRow):
 
         self.set_child(self.overlay)
 
-        # Load tags asynchronously from server
-        self.ipc_service.load_item_tags()
+        # List responses carry the tags; only fetch them for rows without
+        if "tags" not in self.item:
+            self.ipc_service.load_item_tags()
 
     def _load_item_tags(self):
         """Reload tags for this item - called by TagDisplayManager after drag-and-drop."""
@@ -6,14 +6,12 @@ This handler manages:
 - Fetching full content from server for images and files
 """
 
-import asyncio
-import base64
-import json
 import logging
 import threading
 from pathlib import Path
 
-from ui.services.ipc_helpers import connect as ipc_connect
+from server.src.ipc_protocol import as_bytes
+from ui.services.ipc_helpers import get_channel
 from gi.repository import Gdk, Gio, GLib
 
 logger = logging.getLogger("TFCBM.UI")
@@ -138,65 +136,32 @@ class ClipboardOperationsHandler:
             clipboard: Clipboard instance
         """
 
-        def fetch_and_copy():
+        def on_response(data):
+            if data.get("type") != "full_image" or data.get("id") != item_id:
+                return
             try:
-
-                async def get_full_image():
-                    async with ipc_connect() as conn:
-                        request = {"action": "get_full_image", "id": item_id}
-                        await conn.send(json.dumps(request))
-
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if (
-                            data.get("type") == "full_image"
-                            and data.get("id") == item_id
-                        ):
-                            image_b64 = data.get("content")
-                            image_data = base64.b64decode(image_b64)
-
-                            def copy_to_clipboard():
-                                try:
-                                    # Always use image/png — the stored data is
-                                    # PNG bytes (from texture.save_to_png_bytes).
-                                    # The item_type "image/generic" is not a real
-                                    # MIME type and nothing can read it back.
-                                    self._skip_monitor()
-                                    gbytes = GLib.Bytes.new(image_data)
-                                    content = Gdk.ContentProvider.new_for_bytes(
-                                        "image/png", gbytes
-                                    )
-                                    clipboard.set_content(content)
-
-                                    # Calculate size in KB
-                                    size_kb = len(image_data) / 1024
-                                    self.window.show_notification(
-                                        f"📷 Image copied ({size_kb:.1f} KB)"
-                                    )
-                                    self.ipc_service.record_paste(item_id)
-                                except Exception as e:
-                                    self.window.show_notification(
-                                        f"Error copying: {str(e)}"
-                                    )
-                                return False
-
-                            GLib.idle_add(copy_to_clipboard)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_full_image())
-                finally:
-                    loop.close()
-
+                image_data = as_bytes(data.get("content"))
+                # Always use image/png — the stored data is
+                # PNG bytes (from texture.save_to_png_bytes).
+                # The item_type "image/generic" is not a real
+                # MIME type and nothing can read it back.
+                self._skip_monitor()
+                gbytes = GLib.Bytes.new(image_data)
+                content = Gdk.ContentProvider.new_for_bytes("image/png", gbytes)
+                clipboard.set_content(content)
+
+                # Calculate size in KB
+                size_kb = len(image_data) / 1024
+                self.window.show_notification(f"📷 Image copied ({size_kb:.1f} KB)")
+                self.ipc_service.record_paste(item_id)
             except Exception as e:
-                GLib.idle_add(
-                    lambda: self.window.show_notification(f"Error: {str(e)}")
-                    or False
-                )
+                self.window.show_notification(f"Error copying: {str(e)}")
 
-        threading.Thread(target=fetch_and_copy, daemon=True).start()
+        get_channel().request(
+            {"action": "get_full_image", "id": item_id},
+            on_response,
+            lambda e: self.window.show_notification(f"Error: {str(e)}"),
+        )
 
     def _copy_file_to_clipboard(self, item_id, file_metadata, clipboard):
         """Copy file or folder to clipboard.
@@ -313,68 +278,55 @@ class ClipboardOperationsHandler:
         # Slow path: fetch from server, write to cache dir
         def fetch_and_copy():
             try:
+                # Blocks this worker thread, not the main loop, while
+                # the file is fetched and written
+                data = get_channel().call({"action": "get_full_image", "id": item_id}) or {}
+
+                if (
+                    data.get("type") == "full_file"
+                    and data.get("id") == item_id
+                ):
+                    file_data = as_bytes(data.get("content"))
 
-                async def get_full_file():
-                    async with ipc_connect() as conn:
-                        request = {"action": "get_full_image", "id": item_id}
-                        await conn.send(json.dumps(request))
+                    import os
 
-                        response = await conn.recv()
-                        data = json.loads(response)
+                    cache_home = os.environ.get(
+                        "XDG_CACHE_HOME",
+                        os.path.expanduser("~/.cache"),
+                    )
+                    cache_dir = Path(cache_home) / "tfcbm_files"
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    cached_path = cache_dir / file_name
 
-                        if (
-                            data.get("type") == "full_file"
-                            and data.get("id") == item_id
-                        ):
-                            file_b64 = data.get("content")
-                            file_data = base64.b64decode(file_b64)
+                    with open(cached_path, "wb") as f:
+                        f.write(file_data)
 
-                            import os
+                    def copy_to_clipboard():
+                        try:
+                            self._skip_monitor()
+                            uri = Gio.File.new_for_path(
+                                str(cached_path)
+                            ).get_uri()
+                            uri_bytes = f"{uri}\r\n".encode("utf-8")
+                            content_provider = (
+                                Gdk.ContentProvider.new_for_bytes(
+                                    "text/uri-list",
+                                    GLib.Bytes.new(uri_bytes),
+                                )
+                            )
+                            clipboard.set_content(content_provider)
 
-                            cache_home = os.environ.get(
-                                "XDG_CACHE_HOME",
-                                os.path.expanduser("~/.cache"),
+                            self.window.show_notification(
+                                f"📄 File copied: {file_name}"
                             )
-                            cache_dir = Path(cache_home) / "tfcbm_files"
-                            cache_dir.mkdir(parents=True, exist_ok=True)
-                            cached_path = cache_dir / file_name
-
-                            with open(cached_path, "wb") as f:
-                                f.write(file_data)
-
-                            def copy_to_clipboard():
-                                try:
-                                    self._skip_monitor()
-                                    uri = Gio.File.new_for_path(
-                                        str(cached_path)
-                                    ).get_uri()
-                                    uri_bytes = f"{uri}\r\n".encode("utf-8")
-                                    content_provider = (
-                                        Gdk.ContentProvider.new_for_bytes(
-                                            "text/uri-list",
-                                            GLib.Bytes.new(uri_bytes),
-                                        )
-                                    )
-                                    clipboard.set_content(content_provider)
-
-                                    self.window.show_notification(
-                                        f"📄 File copied: {file_name}"
-                                    )
-                                    self.ipc_service.record_paste(item_id)
-                                except Exception as e:
-                                    self.window.show_notification(
-                                        f"Error copying file: {str(e)}"
-                                    )
-                                return False
-
-                            GLib.idle_add(copy_to_clipboard)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_full_file())
-                finally:
-                    loop.close()
+                            self.ipc_service.record_paste(item_id)
+                        except Exception as e:
+                            self.window.show_notification(
+                                f"Error copying file: {str(e)}"
+                            )
+                        return False
+
+                    GLib.idle_add(copy_to_clipboard)
 
             except Exception as e:
                 GLib.idle_add(
@@ -7,7 +7,6 @@ This handler manages:
 - Authentication for secret items before dialogs
 """
 
-import base64
 import logging
 import re
 from pathlib import Path
@@ -21,6 +20,8 @@ gi.require_version("Gio", "2.0")
 
 from gi.repository import Gdk, GdkPixbuf, Gio, GLib, Gtk, Pango
 
+from server.src.ipc_protocol import as_bytes
+
 logger = logging.getLogger("TFCBM.UI")
 
 
@@ -179,45 +180,30 @@ class ItemDialogHandler:
                         )
                     elif item_type.startswith("image/") or item_type == "screenshot":
                         # Need to fetch full image from server
-                        import asyncio
-                        import json
-                        from ui.services.ipc_helpers import connect as ipc_connect
+                        from ui.services.ipc_helpers import get_channel
 
                         item_id = self.item.get("id")
 
                         def fetch_and_save():
                             try:
-                                async def get_full_image():
-                                    async with ipc_connect() as conn:
-                                        request = {"action": "get_full_image", "id": item_id}
-                                        await conn.send(json.dumps(request))
-                                        response = await conn.recv()
-                                        data = json.loads(response)
-
-                                        if data.get("type") == "full_image" and data.get("id") == item_id:
-                                            image_b64 = data.get("content")
-                                            if not image_b64:
-                                                raise Exception("No image data in response")
-
-                                            image_data = base64.b64decode(image_b64)
-                                            with open(path, "wb") as f:
-                                                f.write(image_data)
-                                            logger.info(f"Saved full image to {path}")
-
-                                            def show_success():
-                                                self.window.show_notification(f"Image saved to {Path(path).name}")
-                                                return False
-
-                                            GLib.idle_add(show_success)
-                                        else:
-                                            raise Exception("Invalid response from server")
-
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                                try:
-                                    loop.run_until_complete(get_full_image())
-                                finally:
-                                    loop.close()
+                                data = get_channel().call({"action": "get_full_image", "id": item_id}) or {}
+
+                                if data.get("type") == "full_image" and data.get("id") == item_id:
+                                    image_data = as_bytes(data.get("content"))
+                                    if not image_data:
+                                        raise Exception("No image data in response")
+
+                                    with open(path, "wb") as f:
+                                        f.write(image_data)
+                                    logger.info(f"Saved full image to {path}")
+
+                                    def show_success():
+                                        self.window.show_notification(f"Image saved to {Path(path).name}")
+                                        return False
+
+                                    GLib.idle_add(show_success)
+                                else:
+                                    raise Exception("Invalid response from server")
 
                             except Exception as e:
                                 logger.error(f"Error fetching/saving image: {e}")
@@ -295,12 +281,12 @@ class ItemDialogHandler:
         if item_type == "text" or item_type == "url":
             # Check if there's formatted content
             format_type = self.item.get("format_type")
-            formatted_content_b64 = self.item.get("formatted_content")
+            formatted_content = self.item.get("formatted_content")
 
-            if format_type and formatted_content_b64:
+            if format_type and formatted_content:
                 # Render formatted content
                 try:
-                    formatted_bytes = base64.b64decode(formatted_content_b64)
+                    formatted_bytes = as_bytes(formatted_content)
 
                     if format_type.lower() == "html":
                         # Use WebKit to render HTML
@@ -376,9 +362,7 @@ class ItemDialogHandler:
 
         elif item_type.startswith("image/") or item_type == "screenshot":
             # Need to fetch full image from server
-            import asyncio
-            import json
-            from ui.services.ipc_helpers import connect as ipc_connect
+            from ui.services.ipc_helpers import get_channel
 
             item_id = self.item.get("id")
             loading_label = Gtk.Label(label="Loading full image...")
@@ -386,44 +370,31 @@ class ItemDialogHandler:
 
             def fetch_and_display():
                 try:
-                    async def get_full_image():
-                        async with ipc_connect() as conn:
-                            request = {"action": "get_full_image", "id": item_id}
-                            await conn.send(json.dumps(request))
-                            response = await conn.recv()
-                            data = json.loads(response)
-
-                            if data.get("type") == "full_image" and data.get("id") == item_id:
-                                image_b64 = data.get("content")
-                                if not image_b64:
-                                    raise Exception("No image data in response")
-
-                                image_data = base64.b64decode(image_b64)
-                                loader = GdkPixbuf.PixbufLoader()
-                                loader.write(image_data)
-                                loader.close()
-                                pixbuf = loader.get_pixbuf()
-                                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-
-                                def display_image():
-                                    picture = Gtk.Picture.new_for_paintable(texture)
-                                    picture.set_halign(Gtk.Align.CENTER)
-                                    picture.set_valign(Gtk.Align.CENTER)
-                                    picture.set_content_fit(Gtk.ContentFit.CONTAIN)
-                                    content_scroll.set_child(picture)
-                                    logger.info(f"Displayed full image: {pixbuf.get_width()}x{pixbuf.get_height()}")
-                                    return False
-
-                                GLib.idle_add(display_image)
-                            else:
-                                raise Exception("Invalid response from server")
-
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(get_full_image())
-                    finally:
-                        loop.close()
+                    data = get_channel().call({"action": "get_full_image", "id": item_id}) or {}
+
+                    if data.get("type") == "full_image" and data.get("id") == item_id:
+                        image_data = as_bytes(data.get("content"))
+                        if not image_data:
+                            raise Exception("No image data in response")
+
+                        loader = GdkPixbuf.PixbufLoader()
+                        loader.write(image_data)
+                        loader.close()
+                        pixbuf = loader.get_pixbuf()
+                        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+
+                        def display_image():
+                            picture = Gtk.Picture.new_for_paintable(texture)
+                            picture.set_halign(Gtk.Align.CENTER)
+                            picture.set_valign(Gtk.Align.CENTER)
+                            picture.set_content_fit(Gtk.ContentFit.CONTAIN)
+                            content_scroll.set_child(picture)
+                            logger.info(f"Displayed full image: {pixbuf.get_width()}x{pixbuf.get_height()}")
+                            return False
+
+                        GLib.idle_add(display_image)
+                    else:
+                        raise Exception("Invalid response from server")
 
                 except Exception as e:
                     logger.error(f"Error fetching full image: {e}")
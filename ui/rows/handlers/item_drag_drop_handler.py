@@ -6,16 +6,14 @@ This handler manages:
 - File pre-fetching for drag-and-drop
 """
 
-import asyncio
-import base64
-import json
 import logging
 import os
 import tempfile
 import threading
 import traceback
 
-from ui.services.ipc_helpers import connect as ipc_connect
+from server.src.ipc_protocol import as_bytes
+from ui.services.ipc_helpers import get_channel
 from gi.repository import Gdk, GdkPixbuf, Gio, GLib, GObject, Gtk
 
 logger = logging.getLogger("TFCBM.UI")
@@ -71,14 +69,12 @@ class ItemDragDropHandler:
             # Image content - provide multiple formats for maximum compatibility
             try:
                 # Use thumbnail data (already loaded) instead of full image
-                thumbnail_b64 = self.item.get("thumbnail")
+                image_bytes = as_bytes(self.item.get("thumbnail"))
                 print(
-                    f"[DND] Thumbnail data available: {thumbnail_b64 is not None}, "
-                    f"length: {len(thumbnail_b64) if thumbnail_b64 else 0}"
+                    f"[DND] Thumbnail data available: {image_bytes is not None}, "
+                    f"length: {len(image_bytes) if image_bytes else 0}"
                 )
-                if thumbnail_b64:
-                    # Thumbnail is base64-encoded, decode it first
-                    image_bytes = base64.b64decode(thumbnail_b64)
+                if image_bytes:
 
                     # Convert PNG bytes to Gdk.Texture
                     pixbuf = GdkPixbuf.Pixbuf.new_from_stream(
@@ -206,96 +202,68 @@ class ItemDragDropHandler:
         def fetch_and_save():
             print("[DND] Background thread started for pre-fetch")
             try:
+                item_id = self.item.get("id")
+                print(f"[DND] Pre-fetching file for item {item_id}")
+
+                # Use same action as Save button: get_full_image
+                data = get_channel().call({"action": "get_full_image", "id": item_id}) or {}
+
+                if (
+                    data.get("type") == "full_file"
+                    and data.get("id") == item_id
+                ):
+                    file_bytes = as_bytes(data.get("content"))
+                    filename = data.get(
+                        "filename", f"file_{item_id}"
+                    )
 
-                async def get_file():
-                    item_id = self.item.get("id")
-                    print(f"[DND] Async get_file() started for item {item_id}")
-
-                    print(f"[DND] Pre-fetching file for item {item_id}")
-
-                    try:
-                        async with ipc_connect() as conn:
-                            # Use same action as Save button: get_full_image
-                            request = {
-                                "action": "get_full_image",
-                                "id": item_id,
-                            }
-                            await conn.send(json.dumps(request))
-
-                            # Wait for response
-                            response = await conn.recv()
-                            data = json.loads(response)
-
-                            if (
-                                data.get("type") == "full_file"
-                                and data.get("id") == item_id
-                            ):
-                                file_b64 = data.get("content")
-                                filename = data.get(
-                                    "filename", f"file_{item_id}"
-                                )
-
-                                if file_b64:
-                                    # Decode file content
-                                    file_bytes = base64.b64decode(file_b64)
-
-                                    # Create temp file with original filename
-                                    fd, temp_path = tempfile.mkstemp(
-                                        suffix=f"_{filename}"
-                                    )
-                                    try:
-                                        os.write(fd, file_bytes)
-                                    finally:
-                                        os.close(fd)
-
-                                    self._file_temp_path = temp_path
-                                    print(
-                                        f"[DND] Pre-fetched file to: {temp_path} "
-                                        f"({len(file_bytes)} bytes)"
-                                    )
-                                else:
-                                    # Empty content - likely a folder
-                                    # Check if item has original_path in metadata
-                                    file_metadata = self.item.get(
-                                        "content", {}
-                                    )
-                                    original_path = file_metadata.get(
-                                        "original_path"
-                                    )
-                                    print(
-                                        f"[DND] Checking for original_path in "
-                                        f"content field: {original_path}"
-                                    )
-                                    if original_path and os.path.exists(
-                                        original_path
-                                    ):
-                                        self._file_temp_path = original_path
-                                        print(
-                                            f"[DND] Using original folder path: "
-                                            f"{original_path}"
-                                        )
-                                    else:
-                                        print(
-                                            "[DND] No file content - original_path "
-                                            f"not available or doesn't exist: "
-                                            f"{original_path}"
-                                        )
-                            else:
-                                print(
-                                    f"[DND] Unexpected response type: "
-                                    f"{data.get('type')}"
-                                )
-
-                    except Exception as e:
-                        print(f"[DND] Websocket error during pre-fetch: {e}")
-                        traceback.print_exc()
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_file())
-                finally:
-                    loop.close()
+                    if file_bytes:
+                        # Create temp file with original filename
+                        fd, temp_path = tempfile.mkstemp(
+                            suffix=f"_{filename}"
+                        )
+                        try:
+                            os.write(fd, file_bytes)
+                        finally:
+                            os.close(fd)
+
+                        self._file_temp_path = temp_path
+                        print(
+                            f"[DND] Pre-fetched file to: {temp_path} "
+                            f"({len(file_bytes)} bytes)"
+                        )
+                    else:
+                        # Empty content - likely a folder
+                        # Check if item has original_path in metadata
+                        file_metadata = self.item.get(
+                            "content", {}
+                        )
+                        original_path = file_metadata.get(
+                            "original_path"
+                        )
+                        print(
+                            f"[DND] Checking for original_path in "
+                            f"content field: {original_path}"
+                        )
+                        if original_path and os.path.exists(
+                            original_path
+                        ):
+                            self._file_temp_path = original_path
+                            print(
+                                f"[DND] Using original folder path: "
+                                f"{original_path}"
+                            )
+                        else:
+                            print(
+                                "[DND] No file content - original_path "
+                                f"not available or doesn't exist: "
+                                f"{original_path}"
+                            )
+                else:
+                    print(
+                        f"[DND] Unexpected response type: "
+                        f"{data.get('type')}"
+                    )
 
             except Exception as e:
                 print(f"[DND] Failed to pre-fetch file: {e}")
@@ -7,15 +7,11 @@ This service manages:
 - Item deletion
 """
 
-import asyncio
-import json
 import logging
-import threading
 import time
 from typing import Callable, Optional
 
-from ui.services.ipc_helpers import connect as ipc_connect
-from gi.repository import GLib
+from ui.services.ipc_helpers import get_channel
 
 logger = logging.getLogger("TFCBM.UI")
 
@@ -56,38 +52,26 @@ class ItemIPCService:
         Returns:
             The full text content string, or None if fetch failed
         """
-        content = [None]  # Use list to allow modification in nested function
-
-        def fetch_content():
-            try:
-
-                async def get_content():
-                    async with ipc_connect() as conn:
-                        request = {"action": "get_full_text", "id": item_id}
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "full_text" and data.get("content"):
-                            content[0] = data["content"]
-                            logger.info(f"Fetched full text for item {item_id} ({len(content[0])} chars)")
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_content())
-                finally:
-                    loop.close()
-
-            except Exception as e:
-                logger.error(f"Error fetching full text content: {e}")
-
-        # Run synchronously in a thread and wait
-        thread = threading.Thread(target=fetch_content)
-        thread.start()
-        thread.join(timeout=5)  # Wait up to 5 seconds
-
-        return content[0]
+        data = get_channel().call({"action": "get_full_text", "id": item_id}, timeout=5)
+        if data and data.get("type") == "full_text" and data.get("content"):
+            logger.info(f"Fetched full text for item {item_id} ({len(data['content'])} chars)")
+            return data["content"]
+        return None
+
+    @staticmethod
+    def _text_page_request(item_id: int, page: int, page_size: int) -> dict:
+        return {"action": "get_text_page", "id": item_id, "page": page, "page_size": page_size}
+
+    @staticmethod
+    def _text_page_result(data: Optional[dict]) -> Optional[dict]:
+        if not data or data.get("type") != "text_page":
+            return None
+        return {
+            "content": data.get("content", ""),
+            "page": data.get("page", 0),
+            "total_pages": data.get("total_pages", 1),
+            "total_length": data.get("total_length", 0),
+        }
 
     def fetch_text_page(self, item_id: int, page: int, page_size: int = 500) -> Optional[dict]:
         """Fetch a single page of text content from the server.
@@ -100,50 +84,11 @@ class ItemIPCService:
         Returns:
             Dict with content, page, total_pages, total_length or None if fetch failed
         """
-        result = [None]
-
-        def fetch_content():
-            try:
-
-                async def get_content():
-                    async with ipc_connect() as conn:
-                        request = {
-                            "action": "get_text_page",
-                            "id": item_id,
-                            "page": page,
-                            "page_size": page_size,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "text_page":
-                            result[0] = {
-                                "content": data.get("content", ""),
-                                "page": data.get("page", 0),
-                                "total_pages": data.get("total_pages", 1),
-                                "total_length": data.get("total_length", 0),
-                            }
-                            logger.info(
-                                f"Fetched text page {page} for item {item_id} "
-                                f"({len(result[0]['content'])} chars)"
-                            )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_content())
-                finally:
-                    loop.close()
-
-            except Exception as e:
-                logger.error(f"Error fetching text page: {e}")
-
-        thread = threading.Thread(target=fetch_content)
-        thread.start()
-        thread.join(timeout=5)
-
-        return result[0]
+        data = get_channel().call(self._text_page_request(item_id, page, page_size), timeout=5)
+        result = self._text_page_result(data)
+        if result:
+            logger.info(f"Fetched text page {page} for item {item_id} ({len(result['content'])} chars)")
+        return result
 
     def fetch_text_page_async(self, item_id: int, page: int, callback, page_size: int = 500):
         """Fetch a single page of text content asynchronously.
@@ -155,44 +100,15 @@ class ItemIPCService:
             page_size: Characters per page
         """
 
-        def fetch_content():
-            try:
-
-                async def get_content():
-                    async with ipc_connect() as conn:
-                        request = {
-                            "action": "get_text_page",
-                            "id": item_id,
-                            "page": page,
-                            "page_size": page_size,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "text_page":
-                            result = {
-                                "content": data.get("content", ""),
-                                "page": data.get("page", 0),
-                                "total_pages": data.get("total_pages", 1),
-                                "total_length": data.get("total_length", 0),
-                            }
-                            GLib.idle_add(callback, result)
-                        else:
-                            GLib.idle_add(callback, None)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(get_content())
-                finally:
-                    loop.close()
-
-            except Exception as e:
-                logger.error(f"Error fetching text page async: {e}")
-                GLib.idle_add(callback, None)
-
-        threading.Thread(target=fetch_content, daemon=True).start()
+        def on_error(e):
+            logger.error(f"Error fetching text page async: {e}")
+            callback(None)
+
+        get_channel().request(
+            self._text_page_request(item_id, page, page_size),
+            lambda data: callback(self._text_page_result(data)),
+            on_error,
+        )
 
     def toggle_favorite(self, item_id: int, is_favorite: bool) -> None:
         """Send request to server to toggle favorite status.
@@ -203,88 +119,46 @@ class ItemIPCService:
         """
         logger.info(f"toggle_favorite called: item_id={item_id}, is_favorite={is_favorite}")
 
-        def send_toggle():
-            try:
-
-                async def toggle_fav():
-                    async with ipc_connect() as conn:
-                        request = {
-                            "action": "toggle_favorite",
-                            "item_id": item_id,
-                            "is_favorite": is_favorite,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-                        logger.info(f"Received response: {data}")
-
-                        if data.get("type") == "favorite_toggled":
-                            if data.get("success"):
-                                # Update local item data
-                                self.item["is_favorite"] = bool(is_favorite)
-                                logger.info(f"Item {item_id} favorite status updated: is_favorite={is_favorite}")
-                            else:
-                                error_msg = data.get("error", "Unknown error")
-                                logger.error(f"Failed to toggle favorite status: {error_msg}")
-                                GLib.idle_add(
-                                    self.window.show_notification,
-                                    f"Failed to update favorite: {error_msg}",
-                                )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(toggle_fav())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"Error toggling favorite status: {e}")
-                GLib.idle_add(
-                    self.window.show_notification,
-                    f"Error: {str(e)}",
-                )
-
-        threading.Thread(target=send_toggle, daemon=True).start()
+        def on_response(data):
+            logger.info(f"Received response: {data}")
+            if data.get("type") == "favorite_toggled":
+                if data.get("success"):
+                    # Update local item data
+                    self.item["is_favorite"] = bool(is_favorite)
+                    logger.info(f"Item {item_id} favorite status updated: is_favorite={is_favorite}")
+                else:
+                    error_msg = data.get("error", "Unknown error")
+                    logger.error(f"Failed to toggle favorite status: {error_msg}")
+                    self.window.show_notification(f"Failed to update favorite: {error_msg}")
+
+        def on_error(e):
+            logger.error(f"Error toggling favorite status: {e}")
+            self.window.show_notification(f"Error: {str(e)}")
+
+        request = {"action": "toggle_favorite", "item_id": item_id, "is_favorite": is_favorite}
+        get_channel().request(request, on_response, on_error)
 
     def load_item_tags(self) -> None:
         """Load and display tags for this item asynchronously."""
 
-        def run_load():
-            try:
-
-                async def fetch_tags():
-                    async with ipc_connect() as conn:
-                        request = {
-                            "action": "get_item_tags",
-                            "item_id": self.item.get("id"),
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "item_tags":
-                            tags = data.get("tags", [])
-
-                            # Filter out deleted tags by checking against window.all_tags
-                            if hasattr(self.window, 'all_tags'):
-                                valid_tag_ids = {tag.get('id') for tag in self.window.all_tags}
-                                tags = [tag for tag in tags if tag.get('id') in valid_tag_ids]
-
-                            # Store tags in item for filtering
-                            self.item["tags"] = tags
-                            # Update UI on main thread
-                            GLib.idle_add(self.on_display_tags, tags)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(fetch_tags())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"[UI] Error loading item tags: {e}")
-
-        threading.Thread(target=run_load, daemon=True).start()
+        def on_response(data):
+            if data.get("type") == "item_tags":
+                tags = data.get("tags", [])
+
+                # Filter out deleted tags by checking against window.all_tags
+                if hasattr(self.window, 'all_tags'):
+                    valid_tag_ids = {tag.get('id') for tag in self.window.all_tags}
+                    tags = [tag for tag in tags if tag.get('id') in valid_tag_ids]
+
+                # Store tags in item for filtering
+                self.item["tags"] = tags
+                self.on_display_tags(tags)
+
+        get_channel().request(
+            {"action": "get_item_tags", "item_id": self.item.get("id")},
+            on_response,
+            lambda e: logger.error(f"[UI] Error loading item tags: {e}"),
+        )
 
     def record_paste(self, item_id: int) -> None:
         """Record that this item was pasted.
@@ -298,25 +172,10 @@ class ItemIPCService:
 
         self._last_paste_time = current_time
 
-        def record():
-            try:
-
-                async def send_record():
-                    async with ipc_connect() as conn:
-                        request = {"action": "record_paste", "id": item_id}
-                        await conn.send(json.dumps(request))
-                        await conn.recv()
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(send_record())
-                finally:
-                    loop.close()
-            except Exception as e:
-                print(f"Error recording paste: {e}")
-
-        threading.Thread(target=record, daemon=True).start()
+        get_channel().request(
+            {"action": "record_paste", "id": item_id},
+            on_error=lambda e: logger.error(f"Error recording paste: {e}"),
+        )
 
     def update_item_name(self, item_id: int, name: str) -> None:
         """Update item name on server.
@@ -328,40 +187,22 @@ class ItemIPCService:
         # Update local item data immediately
         self.item["name"] = name
 
-        def update():
-            try:
-
-                async def send_update():
-                    async with ipc_connect() as conn:
-                        request = {
-                            "action": "update_item_name",
-                            "item_id": item_id,
-                            "name": name,
-                        }
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "item_name_updated":
-                            if data.get("success"):
-                                logger.info(f"[UI] Name updated for item {item_id}: '{name}'")
-                            else:
-                                logger.error(
-                                    f"[UI] Failed to update name for item {item_id}: {data.get('error', 'Unknown error')}"
-                                )
-                        else:
-                            logger.warning(f"[UI] Unexpected response updating name: {data}")
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(send_update())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"[UI] Error updating name: {e}")
-
-        threading.Thread(target=update, daemon=True).start()
+        def on_response(data):
+            if data.get("type") == "item_name_updated":
+                if data.get("success"):
+                    logger.info(f"[UI] Name updated for item {item_id}: '{name}'")
+                else:
+                    logger.error(
+                        f"[UI] Failed to update name for item {item_id}: {data.get('error', 'Unknown error')}"
+                    )
+            else:
+                logger.warning(f"[UI] Unexpected response updating name: {data}")
+
+        get_channel().request(
+            {"action": "update_item_name", "item_id": item_id, "name": name},
+            on_response,
+            lambda e: logger.error(f"[UI] Error updating name: {e}"),
+        )
 
     def delete_item_from_server(self, item_id: int) -> None:
         """Send delete request to server via IPC.
@@ -370,36 +211,14 @@ class ItemIPCService:
             item_id: ID of the item to delete
         """
 
-        def send_delete():
-            try:
-
-                async def delete_item():
-                    async with ipc_connect() as conn:
-                        request = {"action": "delete_item", "id": item_id}
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("status") == "success":
-                            GLib.idle_add(
-                                lambda: self.window.show_notification("Item deleted") or False
-                            )
-                        else:
-                            GLib.idle_add(
-                                lambda: self.window.show_notification("Failed to delete item")
-                                or False
-                            )
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(delete_item())
-                finally:
-                    loop.close()
-            except Exception as e:
-                print(f"Error deleting item: {e}")
-                GLib.idle_add(
-                    lambda: self.window.show_notification(f"Error deleting: {str(e)}") or False
-                )
-
-        threading.Thread(target=send_delete, daemon=True).start()
+        def on_response(data):
+            if data.get("status") == "success":
+                self.window.show_notification("Item deleted")
+            else:
+                self.window.show_notification("Failed to delete item")
+
+        def on_error(e):
+            logger.error(f"Error deleting item: {e}")
+            self.window.show_notification(f"Error deleting: {str(e)}")
+
+        get_channel().request({"action": "delete_item", "id": item_id}, on_response, on_error)
@@ -7,14 +7,11 @@ This handler manages:
 - Tag add/remove via checkboxes
 """
 
-import asyncio
-import json
 import logging
-import threading
 
-from ui.services.ipc_helpers import connect as ipc_connect
+from ui.services.ipc_helpers import get_channel
 from ui.utils.color_utils import sanitize_color
-from gi.repository import GLib, Gtk
+from gi.repository import Gtk
 
 from ui.components.items import ItemTags
 
@@ -243,53 +240,28 @@ class ItemTagManager:
         """
         is_active = checkbutton.get_active()
 
-        def send_tag_update():
-            try:
-                logger.info(f"[TAG_TOGGLE] Starting tag toggle - item_id={item_id}, tag_id={tag_id}, is_active={is_active}")
-
-                async def update_tag():
-                    logger.info(f"[TAG_TOGGLE] Connecting to IPC server...")
-                    async with ipc_connect() as conn:
-                        action = "add_item_tag" if is_active else "remove_item_tag"
-                        request = {
-                            "action": action,
-                            "item_id": item_id,
-                            "tag_id": tag_id,
-                        }
-                        logger.info(f"[TAG_TOGGLE] Sending request: {request}")
-                        await conn.send(json.dumps(request))
-
-                        logger.info(f"[TAG_TOGGLE] Waiting for response...")
-                        response = await conn.recv()
-                        data = json.loads(response)
-                        logger.info(f"[TAG_TOGGLE] Received response: {data}")
-
-                        if data.get("type") in ["item_tag_added", "item_tag_removed", "tag_added", "tag_removed"]:
-                            logger.info(f"[TAG_TOGGLE] Success! Reloading tags...")
-                            # Reload tags for this item
-                            GLib.idle_add(self.ipc_service.load_item_tags)
-                            # Notify window to refresh if needed
-                            if hasattr(self.window, "_on_item_tags_changed"):
-                                GLib.idle_add(
-                                    self.window._on_item_tags_changed, item_id
-                                )
-                        else:
-                            logger.warning(f"[TAG_TOGGLE] Unexpected response type: {data.get('type')}")
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(update_tag())
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.error(f"[TAG_TOGGLE] Error toggling tag: {e}")
-                import traceback
-                logger.error(f"[TAG_TOGGLE] Traceback:\n{traceback.format_exc()}")
-                # Revert checkbox on error
-                GLib.idle_add(lambda: checkbutton.set_active(not is_active))
-
-        threading.Thread(target=send_tag_update, daemon=True).start()
+        action = "add_item_tag" if is_active else "remove_item_tag"
+        request = {"action": action, "item_id": item_id, "tag_id": tag_id}
+        logger.info(f"[TAG_TOGGLE] Sending request: {request}")
+
+        def on_response(data):
+            logger.info(f"[TAG_TOGGLE] Received response: {data}")
+            if data.get("type") in ["item_tag_added", "item_tag_removed", "tag_added", "tag_removed"]:
+                logger.info(f"[TAG_TOGGLE] Success! Reloading tags...")
+                # Reload tags for this item
+                self.ipc_service.load_item_tags()
+                # Notify window to refresh if needed
+                if hasattr(self.window, "_on_item_tags_changed"):
+                    self.window._on_item_tags_changed(item_id)
+            else:
+                logger.warning(f"[TAG_TOGGLE] Unexpected response type: {data.get('type')}")
+
+        def on_error(e):
+            logger.error(f"[TAG_TOGGLE] Error toggling tag: {type(e).__name__}: {e}")
+            # Revert checkbox on error
+            checkbutton.set_active(not is_active)
+
+        get_channel().request(request, on_response, on_error)
 
     def set_tags_button(self, tags_button):
         """Set the tags button widget for popover anchoring.
@@ -1,7 +1,21 @@
-"""Business logic services."""
+"""Business logic services.
 
-from .clipboard_service import ClipboardService
-from .database_service import DatabaseService
-from .tag_service import TagService
+The services are imported on first access, so modules of this package that
+need no GTK (such as ipc_helpers) can be used without gi.
+"""
 
-__all__ = ["ClipboardService", "DatabaseService", "TagService"]
+import importlib
+
+_EXPORTS = {
+    "ClipboardService": ".clipboard_service",
+    "DatabaseService": ".database_service",
+    "TagService": ".tag_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
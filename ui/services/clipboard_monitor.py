@@ -9,9 +9,7 @@ returns False for everything on KDE Wayland.  Instead we try each read
 method and cascade on failure: texture → uri-list → text.
 """
 
-import base64
 import hashlib
-import json
 import logging
 
 import gi
@@ -194,14 +192,9 @@ class ClipboardMonitor:
         """Callback after async stream read for HTML content."""
         text = getattr(self, '_pending_html_text', None)
         self._pending_html_text = None
-        html_b64 = None
-
-        if raw:
-            html_b64 = base64.b64encode(raw).decode("ascii")
-
         if text:
-            self._handle_text(text, format_type="html" if html_b64 else None,
-                              formatted_content=html_b64)
+            self._handle_text(text, format_type="html" if raw else None,
+                              formatted_content=raw or None)
 
     # ── event builders ──────────────────────────────────────────────
 
@@ -218,10 +211,10 @@ class ClipboardMonitor:
         self._last_text_hash = None
         self._last_uri_hash = None
 
-        b64 = base64.b64encode(data).decode("ascii")
+        # Raw PNG bytes; the IPC connection sends them as a binary attachment
         event = {
             "type": "image/generic",
-            "content": json.dumps({"data": b64}),
+            "content": data,
             "formatted_content": None,
         }
         logger.info("Clipboard image detected: %dx%d, %d bytes",
@@ -1,7 +1,5 @@
 """Clipboard operations service."""
 
-import base64
-
 import gi
 
 gi.require_version("Gdk", "4.0")
@@ -9,6 +7,8 @@ gi.require_version("GLib", "2.0")
 gi.require_version("GObject", "2.0")
 from gi.repository import Gdk, GLib, GObject
 
+from server.src.ipc_protocol import as_bytes
+
 
 class ClipboardService:
     def __init__(self):
@@ -19,18 +19,17 @@ class ClipboardService:
         self.clipboard.set(text)
 
     def copy_formatted_text(
-        self, plain_text: str, formatted_content: str, format_type: str
+        self, plain_text: str, formatted_content, format_type: str
     ) -> None:
         """Copy formatted text (HTML/RTF) to clipboard with fallback to plain text.
 
         Args:
             plain_text: Plain text version
-            formatted_content: Base64-encoded formatted content
+            formatted_content: Formatted content, as bytes or base64
             format_type: Format type ('html' or 'rtf')
         """
         try:
-            # Decode the base64 formatted content
-            formatted_bytes = base64.b64decode(formatted_content)
+            formatted_bytes = as_bytes(formatted_content)
 
             # Create content provider with multiple formats
             # Map format type to MIME type
@@ -1,7 +1,6 @@
 """UNIX domain socket IPC client for TFCBM backend communication."""
 
 import asyncio
-import json
 import logging
 import os
 import threading
@@ -9,6 +8,14 @@ from typing import Callable, Optional, Set
 
 from gi.repository import GLib
 
+from server.src.ipc_protocol import (
+    FRAMING_BINARY,
+    FRAMING_JSON,
+    VERSION as FRAMING_VERSION,
+    encode_frame,
+    read_frame,
+)
+
 logger = logging.getLogger("TFCBM.IPCClient")
 
 
@@ -31,6 +38,8 @@ class IPCClient:
         self._is_connected = False
         self._reconnect_attempt = 0
         self._listener_running = False
+        # JSON until the server accepts binary frames in reply to "hello"
+        self._framing = FRAMING_JSON
 
     def _get_default_socket_path(self) -> str:
         """Get the default UNIX socket path."""
@@ -52,6 +61,9 @@ class IPCClient:
                 self._is_connected = True
                 logger.info("Connected to IPC server")
 
+                # History pages carry thumbnails; receive them as raw bytes
+                await self._negotiate_framing()
+
                 # Register UI PID with server for cleanup
                 await self._register_ui_pid()
 
@@ -78,6 +90,25 @@ class IPCClient:
                 GLib.idle_add(self.on_error, "Failed to connect to IPC server.")
             self.stop()  # Stop the client if unable to connect
 
+    async def _negotiate_framing(self):
+        """Ask the server for binary frames; JSON frames are kept if it declines"""
+        self._framing = FRAMING_JSON
+        await self._send_message({"action": "hello", "framings": [FRAMING_BINARY], "version": FRAMING_VERSION})
+        try:
+            while True:
+                message = await asyncio.wait_for(self._receive_message(), timeout=2.0)
+                if message is None:
+                    return
+                if message.get("type") == "hello":
+                    self._framing = message.get("framing", FRAMING_JSON)
+                    logger.info(f"Using {self._framing} IPC framing")
+                    return
+                # A broadcast sent before the reply
+                if self.on_message:
+                    GLib.idle_add(self.on_message, message)
+        except asyncio.TimeoutError:
+            logger.warning("IPC server did not answer hello, using JSON frames")
+
     async def _register_ui_pid(self):
         """Register UI process PID with server for cleanup when server exits"""
         try:
@@ -89,19 +120,13 @@ class IPCClient:
             logger.error(f"Failed to register UI PID: {e}")
 
     async def _receive_message(self) -> Optional[dict]:
-        """Receive a JSON message with length prefix."""
+        """Receive a message in either framing."""
         if not self._reader or self._reader.at_eof():
             return None
 
         try:
-            # Read length prefix
-            length_line = await self._reader.readuntil(b'\n')
-            message_length = int(length_line.decode('utf-8').strip())
-
-            # Read message
-            message_bytes = await self._reader.readexactly(message_length)
-            message_str = message_bytes.decode('utf-8').rstrip('\n')
-            return json.loads(message_str)
+            message, _ = await read_frame(self._reader)
+            return message
         except asyncio.IncompleteReadError:
             # Connection closed
             return None
@@ -110,16 +135,12 @@ class IPCClient:
             return None
 
     async def _send_message(self, data: dict):
-        """Send a JSON message with length prefix."""
+        """Send a message in the negotiated framing."""
         if not self._writer or self._writer.is_closing():
             raise ConnectionError("IPC connection is closed")
 
         try:
-            json_str = json.dumps(data)
-            message_bytes = json_str.encode('utf-8') + b'\n'
-            # Send length prefix followed by message
-            length_prefix = f"{len(message_bytes)}\n".encode('utf-8')
-            self._writer.write(length_prefix + message_bytes)
+            self._writer.write(encode_frame(data, self._framing))
             await self._writer.drain()
         except Exception as e:
             logger.error(f"Error sending message: {e}")
@@ -234,6 +255,7 @@ class IPCClient:
         limit: int,
         sort_order: str,
         filters: Optional[Set[str]] = None,
+        cursor: Optional[dict] = None,
     ):
         """Request clipboard history from server."""
         request = {
@@ -244,6 +266,8 @@ class IPCClient:
         }
         if filters:
             request["filters"] = list(filters)
+        if cursor:
+            request["cursor"] = cursor
         await self.send_request(request)
 
     async def get_recently_pasted(
@@ -252,6 +276,7 @@ class IPCClient:
         limit: int,
         sort_order: str,
         filters: Optional[Set[str]] = None,
+        cursor: Optional[dict] = None,
     ):
         """Request recently pasted items from server."""
         request = {
@@ -262,11 +287,15 @@ class IPCClient:
         }
         if filters:
             request["filters"] = list(filters)
+        if cursor:
+            request["cursor"] = cursor
         await self.send_request(request)
 
-    async def search(self, query: str, limit: int, filters: Optional[Set[str]] = None):
-        """Search clipboard items."""
-        request = {"action": "search", "query": query, "limit": limit}
+    async def search(
+        self, query: str, limit: int, filters: Optional[Set[str]] = None, mode: str = "token"
+    ):
+        """Search clipboard items by whole words ("token") or substrings ("substring")."""
+        request = {"action": "search", "query": query, "limit": limit, "mode": mode}
         if filters:
             request["filters"] = list(filters)
         await self.send_request(request)
@@ -1,10 +1,21 @@
 """Helper functions for IPC communication via UNIX domain sockets"""
 
 import asyncio
+import concurrent.futures
+import itertools
 import logging
 import os
+import threading
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+from server.src.ipc_protocol import (
+    FRAMING_BINARY,
+    FRAMING_JSON,
+    VERSION as FRAMING_VERSION,
+    encode_frame,
+    read_frame,
+)
 
 logger = logging.getLogger("TFCBM.IPC.Helpers")
 
@@ -12,8 +23,13 @@ logger = logging.getLogger("TFCBM.IPC.Helpers")
 class IPCConnection:
     """Context manager for IPC connections using UNIX domain sockets"""
 
-    def __init__(self, socket_path: Optional[str] = None):
+    # Seconds to wait for the reply to "hello" before staying on JSON frames
+    HELLO_TIMEOUT = 2.0
+
+    def __init__(self, socket_path: Optional[str] = None, binary: bool = False):
         self.socket_path = socket_path or self._get_default_socket_path()
+        self.binary = binary
+        self.framing = FRAMING_JSON
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
 
@@ -25,8 +41,27 @@ class IPCConnection:
     async def __aenter__(self):
         """Connect to IPC server"""
         self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+        if self.binary:
+            await self._negotiate()
         return self
 
+    async def _negotiate(self):
+        """Ask the server for binary frames; JSON frames are kept if it declines"""
+        await self.send_message({"action": "hello", "framings": [FRAMING_BINARY], "version": FRAMING_VERSION})
+        try:
+            reply = await asyncio.wait_for(self._recv_hello(), self.HELLO_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("IPC server did not answer hello, using JSON frames")
+            return
+        self.framing = reply.get("framing", FRAMING_JSON)
+
+    async def _recv_hello(self) -> dict:
+        """Wait for the hello reply, skipping broadcasts sent before it"""
+        while True:
+            message = await self.recv_message()
+            if message.get("type") == "hello":
+                return message
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Close IPC connection"""
         if self._writer:
@@ -37,10 +72,10 @@ class IPCConnection:
         """Make connection async iterable"""
         return self
 
-    async def __anext__(self) -> str:
+    async def __anext__(self) -> dict:
         """Receive next message in async iteration"""
         try:
-            return await self.recv()
+            return await self.recv_message()
         except (ConnectionError, asyncio.IncompleteReadError) as e:
             logger.debug(f"Stopping async iteration due to: {type(e).__name__}: {e}")
             raise StopAsyncIteration
@@ -48,6 +83,27 @@ class IPCConnection:
             logger.error(f"Unexpected error in async iteration: {type(e).__name__}: {e}")
             raise
 
+    async def send_message(self, message: dict):
+        """Send a message in the negotiated framing; bytes values are sent raw over binary frames"""
+        if not self._writer or self._writer.is_closing():
+            raise ConnectionError("IPC connection is closed")
+
+        self._writer.write(encode_frame(message, self.framing))
+        await self._writer.drain()
+
+    async def recv_message(self) -> dict:
+        """
+        Receive a message in either framing.
+
+        Bytes fields arrive as bytes over binary frames and as base64 over
+        JSON frames; read them with ipc_protocol.as_bytes.
+        """
+        if not self._reader or self._reader.at_eof():
+            raise ConnectionClosedError("IPC connection is closed")
+
+        message, _ = await read_frame(self._reader)
+        return message
+
     async def send(self, message: str):
         """Send a JSON string message"""
         if not self._writer or self._writer.is_closing():
@@ -60,6 +116,9 @@ class IPCConnection:
 
     async def recv(self) -> str:
         """Receive a JSON string message"""
+        if self.framing != FRAMING_JSON:
+            # Bytes values have no JSON form here; use recv_message()
+            raise TypeError("recv() needs JSON frames; use recv_message() on binary connections")
         if not self._reader or self._reader.at_eof():
             raise ConnectionClosedError("IPC connection is closed")
 
@@ -73,21 +132,245 @@ class IPCConnection:
 
 
 @asynccontextmanager
-async def connect(socket_path: str = None):
+async def connect(socket_path: str = None, binary: bool = False):
     """
     Connect to IPC server via UNIX domain socket
 
     Args:
         socket_path: Optional path to UNIX socket (uses default if not provided)
+        binary: Negotiate binary frames, for requests that carry images or
+            files; use send_message/recv_message on such connections
 
     Yields:
         IPCConnection object with send/recv methods
     """
-    conn = IPCConnection(socket_path)
+    conn = IPCConnection(socket_path, binary=binary)
     async with conn as connection:
         yield connection
 
 
+
+class IPCChannel:
+    """
+    One long-lived IPC connection shared by every request of the UI.
+
+    A single daemon thread runs the channel's event loop and owns a binary
+    connection to the server. Each request gets a request_id that the server
+    echoes in its reply, so requests from anywhere in the UI are multiplexed
+    over the one connection instead of each spawning a thread, an event loop
+    and a socket. The connection is opened on first use and reopened after
+    it drops; requests in flight when it drops fail with ConnectionError.
+    """
+
+    # Seconds to wait for the socket to open, and for a reply by default
+    CONNECT_TIMEOUT = 5.0
+    REQUEST_TIMEOUT = 30.0
+
+    def __init__(self, socket_path: Optional[str] = None, dispatch: Optional[Callable] = None):
+        """
+        Args:
+            socket_path: Optional path to UNIX socket (uses default if not provided)
+            dispatch: Runs callbacks as dispatch(fn, *args), e.g. GLib.idle_add
+                to run them on the GTK main loop; by default they run on the
+                channel's thread
+        """
+        self.socket_path = socket_path
+        self._dispatch = dispatch or (lambda fn, *args: fn(*args))
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # Owned by the channel's loop
+        self._connection: Optional[IPCConnection] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, concurrent.futures.Future] = {}
+        self._request_ids = itertools.count(1)
+
+    def request(self, message: dict, callback: Optional[Callable] = None,
+                on_error: Optional[Callable] = None, timeout: float = None) -> concurrent.futures.Future:
+        """
+        Send a request and resolve its reply.
+
+        Args:
+            message: Request message (an "action" and its fields)
+            callback: Called with the reply message
+            on_error: Called with the exception if the request fails or times
+                out; failures are logged when not given
+            timeout: Seconds to wait for the reply (REQUEST_TIMEOUT by default)
+
+        Returns:
+            Future of the reply message
+        """
+        future = concurrent.futures.Future()
+        self._submit(self._request(message, future, timeout or self.REQUEST_TIMEOUT))
+        self._add_callbacks(future, message, callback, on_error)
+        return future
+
+    def send(self, message: dict, on_error: Optional[Callable] = None) -> concurrent.futures.Future:
+        """
+        Send a message that gets no reply, such as a clipboard event.
+
+        Returns:
+            Future resolved with None once the message is written
+        """
+        future = concurrent.futures.Future()
+        self._submit(self._send(message, future))
+        self._add_callbacks(future, message, None, on_error)
+        return future
+
+    def call(self, message: dict, timeout: float = None) -> Optional[dict]:
+        """
+        Send a request and block until its reply, for synchronous callers.
+
+        Returns:
+            The reply message, or None if the request failed or timed out
+        """
+        timeout = timeout or self.REQUEST_TIMEOUT
+        try:
+            return self.request(message, timeout=timeout).result(timeout + 1)
+        except Exception:
+            # Already logged by the request's callbacks
+            return None
+
+    def close(self):
+        """Close the connection and stop the channel's thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._disconnect(), loop).result(self.CONNECT_TIMEOUT)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(self.CONNECT_TIMEOUT)
+        loop.close()
+
+    def _submit(self, coroutine):
+        """Schedule a coroutine on the channel's loop, starting it if needed."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="tfcbm-ipc-channel", daemon=True
+                )
+                self._thread.start()
+            asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def _add_callbacks(self, future, message, callback, on_error):
+        """Dispatch the outcome of a request to its callbacks."""
+        def done(f: concurrent.futures.Future):
+            error = f.exception()
+            if error is None:
+                if callback:
+                    self._dispatch(_run_once, callback, f.result())
+            elif on_error:
+                self._dispatch(_run_once, on_error, error)
+            else:
+                logger.error(f"IPC {message.get('action')} failed: {type(error).__name__}: {error}")
+
+        future.add_done_callback(done)
+
+    async def _connect(self) -> IPCConnection:
+        """The open connection, connecting first if there is none."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._connection is None:
+                connection = IPCConnection(self.socket_path, binary=True)
+                await asyncio.wait_for(connection.__aenter__(), self.CONNECT_TIMEOUT)
+                self._connection = connection
+                self._reader_task = asyncio.get_running_loop().create_task(self._read_replies(connection))
+            return self._connection
+
+    async def _request(self, message: dict, future: concurrent.futures.Future, timeout: float):
+        """Send a request and register its future under a new request_id."""
+        request_id = next(self._request_ids)
+        try:
+            connection = await self._connect()
+            self._pending[request_id] = future
+            await connection.send_message({**message, "request_id": request_id})
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            if not future.done():
+                future.set_exception(e)
+            return
+        asyncio.get_running_loop().call_later(timeout, self._expire, request_id, timeout)
+
+    async def _send(self, message: dict, future: concurrent.futures.Future):
+        """Send a message without waiting for a reply."""
+        try:
+            connection = await self._connect()
+            await connection.send_message(message)
+            future.set_result(None)
+        except Exception as e:
+            future.set_exception(e)
+
+    def _expire(self, request_id: int, timeout: float):
+        """Fail a request whose reply did not come in time."""
+        future = self._pending.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_exception(asyncio.TimeoutError(f"No reply within {timeout} seconds"))
+
+    async def _read_replies(self, connection: IPCConnection):
+        """Resolve the futures of replies until the connection drops."""
+        error: Exception = ConnectionClosedError("IPC connection is closed")
+        try:
+            while True:
+                message = await connection.recv_message()
+                request_id = message.pop("request_id", None)
+                future = self._pending.pop(request_id, None) if request_id is not None else None
+                if future is not None and not future.done():
+                    future.set_result(message)
+                # Broadcasts and late or extra replies are not for a pending request
+        except (ConnectionError, ConnectionClosedError, asyncio.IncompleteReadError) as e:
+            logger.info(f"IPC channel disconnected: {type(e).__name__}")
+        except Exception as e:
+            logger.error(f"IPC channel read error: {type(e).__name__}: {e}")
+            error = e
+        finally:
+            if self._connection is connection:
+                self._connection = None
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(str(error)))
+            await self._close(connection)
+
+    async def _disconnect(self):
+        """Close the connection; its reader fails the pending requests."""
+        if self._connection is not None:
+            await self._close(self._connection)
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+
+    @staticmethod
+    async def _close(connection: IPCConnection):
+        try:
+            await connection.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+
+def _run_once(fn: Callable, *args) -> bool:
+    """Run a callback once; returns False so GLib.idle_add does not repeat it."""
+    fn(*args)
+    return False
+
+
+_channel: Optional[IPCChannel] = None
+_channel_lock = threading.Lock()
+
+
+def get_channel() -> IPCChannel:
+    """The UI's shared IPC channel; its callbacks run on the GTK main loop."""
+    global _channel
+    with _channel_lock:
+        if _channel is None:
+            from gi.repository import GLib
+
+            _channel = IPCChannel(dispatch=GLib.idle_add)
+        return _channel
+
+
 # Exceptions for IPC communication
 class ConnectionClosedError(Exception):
     """Raised when connection is closed unexpectedly"""
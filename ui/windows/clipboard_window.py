@@ -1,20 +1,17 @@
 """ClipboardWindow - Main application window."""
 
-import asyncio
-import json
 import logging
 import os
 import re
 import signal
 import subprocess
 import sys
-import threading
 import time
 import traceback
 from pathlib import Path
 
 import gi
-from ui.services.ipc_helpers import connect as ipc_connect
+from ui.services.ipc_helpers import get_channel
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("GdkPixbuf", "2.0")
@@ -475,6 +472,24 @@ class ClipboardWindow(Gtk.ApplicationWindow):
         """Update the copied items status label"""
         pass
 
+    def update_item(self, item):
+        """Move a recopied item to the top of the copied list, showing its new data"""
+        item_id = item.get("id")
+        index = 0
+        while True:
+            row = self.copied_listbox.get_row_at_index(index)
+            if row is None:
+                break
+            if hasattr(row, "item") and row.item.get("id") == item_id:
+                self.copied_listbox.remove(row)
+                break
+            index += 1
+
+        # The item is counted already, even when it was not loaded yet
+        self.copied_listbox.prepend(ClipboardItemRow(item, self))
+        self.copied_listbox.queue_draw()
+        return False
+
     def remove_item(self, item_id):
         """Remove an item from both lists by ID"""
         # Remove from copied list
@@ -598,28 +613,11 @@ class ClipboardWindow(Gtk.ApplicationWindow):
 
     def _register_ui_pid_with_server(self):
         """Register UI PID with server so server can kill UI on exit"""
-        try:
-            from ui.services.ipc_helpers import connect as ipc_connect
-
-            async def register_pid():
-                try:
-                    uri = ""
-                    async with ipc_connect(uri) as conn:
-                        request = {"action": "register_ui_pid", "pid": os.getpid()}
-                        await conn.send(json.dumps(request))
-                        response = await conn.recv()
-                        logger.info(f"UI PID registration response: {response}")
-                except Exception as e:
-                    logger.error(f"Failed to register UI PID with server: {e}")
-
-            # Run in new event loop since we're in GTK main loop
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(register_pid())
-            loop.close()
-        except Exception as e:
-            logger.error(f"Error in PID registration: {e}")
+        get_channel().request(
+            {"action": "register_ui_pid", "pid": os.getpid()},
+            lambda response: logger.info(f"UI PID registration response: {response}"),
+            lambda e: logger.error(f"Failed to register UI PID with server: {e}"),
+        )
 
     def _on_close_request(self, window):
         """Handle window close request - quit the application"""
@@ -693,60 +691,42 @@ class ClipboardWindow(Gtk.ApplicationWindow):
         self.tags_load_start_time = time.time()
         logger.info("Starting tags load...")
 
-        def run_load():
-            try:
-
-                async def fetch_tags():
-                    uri = ""
-                    async with ipc_connect(uri) as conn:
-                        request = {"action": "get_tags"}
-                        await conn.send(json.dumps(request))
-
-                        response = await conn.recv()
-                        data = json.loads(response)
-
-                        if data.get("type") == "tags":
-                            tags = data.get("tags", [])
-                            # Add system tags based on item types
-                            system_tags = [
-                                {
-                                    "id": "system_text",
-                                    "name": "Text",
-                                    "color": "#3584e4",
-                                    "is_system": True,
-                                },
-                                {
-                                    "id": "system_image",
-                                    "name": "Image",
-                                    "color": "#33d17a",
-                                    "is_system": True,
-                                },
-                                {
-                                    "id": "system_screenshot",
-                                    "name": "Screenshot",
-                                    "color": "#e01b24",
-                                    "is_system": True,
-                                },
-                                {
-                                    "id": "system_url",
-                                    "name": "URL",
-                                    "color": "#c061cb",
-                                    "is_system": True,
-                                },
-                            ]
-                            all_tags = system_tags + tags
-                            GLib.idle_add(self._update_tags, all_tags)
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(fetch_tags())
-                finally:
-                    loop.close()
-            except Exception as e:
-                print(f"[UI] Error loading tags: {e}")
-
-        threading.Thread(target=run_load, daemon=True).start()
+        def on_response(data):
+            if data.get("type") == "tags":
+                tags = data.get("tags", [])
+                # Add system tags based on item types
+                system_tags = [
+                    {
+                        "id": "system_text",
+                        "name": "Text",
+                        "color": "#3584e4",
+                        "is_system": True,
+                    },
+                    {
+                        "id": "system_image",
+                        "name": "Image",
+                        "color": "#33d17a",
+                        "is_system": True,
+                    },
+                    {
+                        "id": "system_screenshot",
+                        "name": "Screenshot",
+                        "color": "#e01b24",
+                        "is_system": True,
+                    },
+                    {
+                        "id": "system_url",
+                        "name": "URL",
+                        "color": "#c061cb",
+                        "is_system": True,
+                    },
+                ]
+                all_tags = system_tags + tags
+                self._update_tags(all_tags)
+
+        get_channel().request(
+            {"action": "get_tags"}, on_response, lambda e: print(f"[UI] Error loading tags: {e}")
+        )
 
     def _update_tags(self, tags):
         """Update tags in UI thread"""